@@ -16,12 +16,17 @@ from botbuilder.core import (
     BotFrameworkAdapterSettings,
     ConversationState,
     MemoryStorage,
+    SamplingTelemetryClient,
     UserState,
     TelemetryLoggerMiddleware,
 )
-from botbuilder.core.integration import aiohttp_error_middleware
-from botbuilder.schema import Activity
-from botbuilder.applicationinsights import ApplicationInsightsTelemetryClient
+from botbuilder.core.integration import aiohttp_error_middleware, read_request_activity
+from botbuilder.dialogs import DialogProfiler
+from botbuilder.dialogs.choices import RecognizerModels
+from botbuilder.applicationinsights import (
+    ApplicationInsightsTelemetryClient,
+    AsyncTelemetryExporter,
+)
 from botbuilder.integration.applicationinsights.aiohttp import (
     AiohttpTelemetryProcessor,
     bot_telemetry_middleware,
@@ -50,18 +55,39 @@ CONVERSATION_STATE = ConversationState(MEMORY)
 ADAPTER = AdapterWithErrorHandler(SETTINGS, CONVERSATION_STATE)
 
 # Create telemetry client.
-# Note the small 'client_queue_size'.  This is for demonstration purposes.  Larger queue sizes
-# result in fewer calls to ApplicationInsights, improving bot performance at the expense of
-# less frequent updates.
+# Telemetry is sent by a background exporter, so tracking never waits on Application Insights.
+# Note the small 'client_queue_size'.  This is for demonstration purposes.  Larger batches
+# result in fewer calls to ApplicationInsights at the expense of less frequent updates.
 INSTRUMENTATION_KEY = CONFIG.APPINSIGHTS_INSTRUMENTATION_KEY
-TELEMETRY_CLIENT = ApplicationInsightsTelemetryClient(
-    INSTRUMENTATION_KEY, telemetry_processor=AiohttpTelemetryProcessor(), client_queue_size=10
+APPINSIGHTS_CLIENT = ApplicationInsightsTelemetryClient(
+    INSTRUMENTATION_KEY,
+    telemetry_processor=AiohttpTelemetryProcessor(),
+    client_queue_size=10,
+    telemetry_exporter=AsyncTelemetryExporter(),
+)
+
+# High-volume events are sampled per conversation; LUIS intents and waterfall steps are
+# counted before sampling so their totals stay exact.
+TELEMETRY_CLIENT = SamplingTelemetryClient(
+    APPINSIGHTS_CLIENT,
+    sampling_rates={"WaterfallStep": 0.2, "LuisResult": 0.2},
+    aggregated_events={"LuisResult": ["intent"], "WaterfallStep": ["DialogId", "StepName"]},
 )
+ADAPTER.use(TELEMETRY_CLIENT)
+
+# Per-turn timing of the dialogs, with histograms and a flame graph served on /api/profile.
+PROFILER = DialogProfiler() if CONFIG.PROFILE_DIALOGS else None
+if PROFILER:
+    ADAPTER.use(PROFILER)
 
 # Code for enabling activity and personal information logging.
 # TELEMETRY_LOGGER_MIDDLEWARE = TelemetryLoggerMiddleware(telemetry_client=TELEMETRY_CLIENT, log_personal_information=True)
 # ADAPTER.use(TELEMETRY_LOGGER_MIDDLEWARE)
 
+# Build the number, date and confirmation models of the prompts up front so the first
+# turn that reaches a prompt does not pay for compiling them.
+RecognizerModels.warm_up()
+
 # Create dialogs and Bot
 RECOGNIZER = FlightBookingRecognizer(CONFIG)
 BOOKING_DIALOG = BookingDialog()
@@ -72,12 +98,12 @@ BOT = DialogAndWelcomeBot(CONVERSATION_STATE, USER_STATE, DIALOG, TELEMETRY_CLIE
 # Listen for incoming requests on /api/messages.
 async def messages(req: Request) -> Response:
     # Main bot message handler.
+    # The body is parsed once per request and shared with the telemetry middleware.
     if "application/json" in req.headers["Content-Type"]:
-        body = await req.json()
+        activity = await read_request_activity(req)
     else:
         return Response(status=HTTPStatus.UNSUPPORTED_MEDIA_TYPE)
 
-    activity = Activity().deserialize(body)
     auth_header = req.headers["Authorization"] if "Authorization" in req.headers else ""
 
     response = await ADAPTER.process_activity(activity, auth_header, BOT.on_turn)
@@ -85,9 +111,23 @@ async def messages(req: Request) -> Response:
         return json_response(data=response.body, status=response.status)
     return Response(status=HTTPStatus.OK)
 
+# Collapsed stacks of the profiled turns, for flamegraph.pl or speedscope.
+async def profile(req: Request) -> Response:
+    if "histograms" in req.query:
+        return json_response(data=PROFILER.get_histograms())
+    return Response(text=PROFILER.export_flame_graph())
+
+async def close_telemetry(app: web.Application):
+    # Send the telemetry still queued before the process exits.
+    TELEMETRY_CLIENT.flush_aggregates()
+    await APPINSIGHTS_CLIENT.close()
+
 def init_func(argv):
     APP = web.Application(middlewares=[bot_telemetry_middleware, aiohttp_error_middleware])
     APP.router.add_post("/api/messages", messages)
+    if PROFILER:
+        APP.router.add_get("/api/profile", profile)
+    APP.on_cleanup.append(close_telemetry)
     return APP
 
 if __name__ == "__main__":
@@ -20,4 +20,6 @@ class DefaultConfig:
     APPINSIGHTS_INSTRUMENTATION_KEY = os.environ.get(
         "APPINSIGHTSINSTRUMENTATIONKEY", ""
     )
+    # Time dialog steps, prompts and component dialogs, see /api/profile
+    PROFILE_DIALOGS = os.environ.get("PROFILEDIALOGS", "") == "true"
 
@@ -9,16 +9,39 @@ from botbuilder.dialogs import (
     DialogTurnResult,
     DialogTurnStatus,
 )
-from botbuilder.schema import ActivityTypes
 
 from flight_booking_recognizer import FlightBookingRecognizer
-from helpers.luis_helper import LuisHelper, Intent
+from helpers.interruption_helper import (
+    GlobalIntents,
+    KeywordMatcher,
+    RecognizerMatcher,
+    RegexMatcher,
+)
+from helpers.luis_helper import Intent
 
 from config import DefaultConfig
 
+
+def create_global_intents(recognizer: FlightBookingRecognizer) -> GlobalIntents:
+    """Help, cancel and goodbye, matched by keywords before asking LUIS for goodbye."""
+    return (
+        GlobalIntents()
+        .register(Intent.HELP.value, KeywordMatcher("help", "?"))
+        .register(Intent.CANCEL.value, KeywordMatcher("cancel", "quit"))
+        .register(
+            Intent.GOODBYE.value,
+            RegexMatcher(r"^(good ?bye|bye( bye)?|see you( later)?)\W*$"),
+            RecognizerMatcher(recognizer, Intent.GOODBYE.value),
+        )
+    )
+
+
 class CancelAndHelpDialog(ComponentDialog):
     """Implementation of handling cancel and help."""
 
+    # Used by the dialogs that no root dialog configured, see set_global_intents.
+    _default_global_intents: GlobalIntents = None
+
     def __init__(
         self,
         dialog_id: str,
@@ -26,6 +49,17 @@ class CancelAndHelpDialog(ComponentDialog):
     ):
         super(CancelAndHelpDialog, self).__init__(dialog_id)
         self.telemetry_client = telemetry_client
+        self.global_intents: GlobalIntents = None
+
+    def set_global_intents(self, global_intents: GlobalIntents):
+        """
+        Sets the global intents of this dialog and of the CancelAndHelpDialogs it
+        contains, so the whole stack shares their per-turn evaluation.
+        """
+        self.global_intents = global_intents
+        for dialog in self._dialogs._dialogs.values():  # pylint: disable=protected-access
+            if isinstance(dialog, CancelAndHelpDialog):
+                dialog.set_global_intents(global_intents)
 
     async def on_begin_dialog(
         self, inner_dc: DialogContext, options: object
@@ -45,29 +79,28 @@ class CancelAndHelpDialog(ComponentDialog):
 
     async def interrupt(self, inner_dc: DialogContext) -> DialogTurnResult:
         """Detect interruptions."""
-        if inner_dc.context.activity.type == ActivityTypes.message:
-            text = inner_dc.context.activity.text.lower()
-
-            if text in ("help", "?"):
-                await inner_dc.context.send_activity("Show Help...")
-                return DialogTurnResult(DialogTurnStatus.Waiting)
-
-            if text in ("cancel", "quit"):
-                await inner_dc.context.send_activity("Cancelling")
-                return await inner_dc.cancel_all_dialogs()
-            
-            # Capture the response to the previous step's prompt
-            # previous_response = step_context.result
-            previous_response = inner_dc.context
-            mini_recognizer = FlightBookingRecognizer(DefaultConfig)
-            
-            mini_intent, mini_luis_result = await LuisHelper.execute_luis_query(
-                mini_recognizer, turn_context=previous_response
-            )
-            
-            if mini_intent == Intent.GOODBYE.value :
-                await inner_dc.context.send_activity("Have a nice day !")
-                await inner_dc.context.send_activity("This conversation is over. Retype something or refresh to restart.")
-                return await inner_dc.cancel_all_dialogs()         
-                
+        global_intents = self.global_intents
+        if global_intents is None:
+            if CancelAndHelpDialog._default_global_intents is None:
+                CancelAndHelpDialog._default_global_intents = create_global_intents(
+                    FlightBookingRecognizer(DefaultConfig)
+                )
+            global_intents = CancelAndHelpDialog._default_global_intents
+
+        # Evaluated by the outermost dialog of the stack, then read from the turn state.
+        intent = await global_intents.evaluate(inner_dc.context)
+
+        if intent == Intent.HELP.value:
+            await inner_dc.context.send_activity("Show Help...")
+            return DialogTurnResult(DialogTurnStatus.Waiting)
+
+        if intent == Intent.CANCEL.value:
+            await inner_dc.context.send_activity("Cancelling")
+            return await inner_dc.cancel_all_dialogs()
+
+        if intent == Intent.GOODBYE.value:
+            await inner_dc.context.send_activity("Have a nice day !")
+            await inner_dc.context.send_activity("This conversation is over. Retype something or refresh to restart.")
+            return await inner_dc.cancel_all_dialogs()
+
         return None
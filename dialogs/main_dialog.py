@@ -20,6 +20,7 @@ from booking_details import BookingDetails
 from flight_booking_recognizer import FlightBookingRecognizer
 from helpers.luis_helper import LuisHelper, Intent
 from .booking_dialog import BookingDialog
+from .cancel_and_help_dialog import create_global_intents
 
 
 class MainDialog(ComponentDialog):
@@ -36,6 +37,8 @@ class MainDialog(ComponentDialog):
         text_prompt.telemetry_client = self.telemetry_client
 
         booking_dialog.telemetry_client = self.telemetry_client
+        # Help, cancel and goodbye are registered once here for the whole booking stack.
+        booking_dialog.set_global_intents(create_global_intents(luis_recognizer))
 
         wf_dialog = WaterfallDialog(
             "WFDialog", [self.intro_step, self.act_step, self.final_step]
@@ -123,7 +126,7 @@ class MainDialog(ComponentDialog):
                 close_text, close_text, InputHints.ignoring_input
             )
             await step_context.context.send_activity(close_message)
-            return await inner_dc.cancel_all_dialogs()
+            return await step_context.cancel_all_dialogs()
             
         elif intent == Intent.THANKYOU.value:
             thank_text = (
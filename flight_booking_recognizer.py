@@ -14,10 +14,14 @@ from config import DefaultConfig
 
 
 class FlightBookingRecognizer(Recognizer):
+    # LUIS results of the turn, by application id, shared by every recognizer of the app.
+    TURN_RESULTS_KEY = "FlightBookingRecognizer.results"
+
     def __init__(
         self, configuration: DefaultConfig, telemetry_client: BotTelemetryClient = None
     ):
         self._recognizer = None
+        self._app_id = configuration.LUIS_APP_ID
 
         luis_is_configured = (
             configuration.LUIS_APP_ID
@@ -46,4 +50,9 @@ class FlightBookingRecognizer(Recognizer):
         return self._recognizer is not None
 
     async def recognize(self, turn_context: TurnContext) -> RecognizerResult:
-        return await self._recognizer.recognize(turn_context)
+        # The interruption checks and the dialog steps of a turn all recognize the
+        # same message, so LUIS is only called for the first of them.
+        results = turn_context.turn_state.setdefault(self.TURN_RESULTS_KEY, {})
+        if self._app_id not in results:
+            results[self._app_id] = await self._recognizer.recognize(turn_context)
+        return results[self._app_id]
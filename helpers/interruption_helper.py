@@ -0,0 +1,165 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+"""Global intents that can interrupt any dialog, evaluated once per turn."""
+
+import re
+from abc import ABC, abstractmethod
+from typing import Dict, List, Pattern, Tuple, Union
+
+from botbuilder.core import Recognizer, RecognizerResult, TurnContext
+from botbuilder.schema import ActivityTypes
+
+
+class IntentMatcher(ABC):
+    """
+    Decides whether a message expresses an intent: from its text for a
+    :class:`TextMatcher`, through a recognizer for a :class:`RecognizerMatcher`.
+    """
+
+    # Remote matchers call a service and are only tried when no local matcher matched.
+    is_remote = False
+
+
+class TextMatcher(IntentMatcher):
+    """Decides from the text of a message alone, without calling any service."""
+
+    @abstractmethod
+    def matches(self, text: str) -> bool:
+        """
+        :param text: The text of the message, stripped and lower cased.
+        """
+
+
+class KeywordMatcher(TextMatcher):
+    """Matches messages made of one of the keywords, ignoring case and surrounding spaces."""
+
+    def __init__(self, *keywords: str):
+        self.keywords = frozenset(keyword.strip().lower() for keyword in keywords)
+
+    def matches(self, text: str) -> bool:
+        return text in self.keywords
+
+
+class RegexMatcher(TextMatcher):
+    """Matches messages in which the pattern is found, ignoring case."""
+
+    def __init__(self, pattern: Union[str, Pattern]):
+        self.pattern = (
+            re.compile(pattern, re.IGNORECASE) if isinstance(pattern, str) else pattern
+        )
+
+    def matches(self, text: str) -> bool:
+        return self.pattern.search(text) is not None
+
+
+class RecognizerMatcher(IntentMatcher):
+    """
+    Matches messages whose top scoring intent, according to a recognizer, is the
+    given one. The recognizer is remote, such as LUIS, unless ``is_remote`` is False.
+    """
+
+    def __init__(
+        self,
+        recognizer: Recognizer,
+        intent: str,
+        min_score: float = 0.0,
+        is_remote: bool = True,
+    ):
+        self.recognizer = recognizer
+        self.intent = intent
+        self.min_score = min_score
+        self.is_remote = is_remote
+
+    @property
+    def is_configured(self) -> bool:
+        return getattr(self.recognizer, "is_configured", True)
+
+    def matches_result(self, result: RecognizerResult) -> bool:
+        if not result or not result.intents:
+            return False
+        top_intent = result.get_top_scoring_intent()
+        return top_intent.intent == self.intent and top_intent.score >= self.min_score
+
+
+class GlobalIntents:
+    """
+    Intents such as help or cancel, registered once and checked before any dialog
+    of the stack handles a message.
+
+    :meth:`evaluate` tries the keyword, regex and local matchers of every intent,
+    in registration order, before the remote ones, and calls each recognizer at most
+    once. The outcome is stored in ``turn_state``, so the dialogs of the stack that
+    evaluate it again during the turn get it without running the matchers.
+    """
+
+    TURN_STATE_KEY = "GlobalIntents.results"
+
+    def __init__(self):
+        self._intents: List[Tuple[str, IntentMatcher]] = []
+
+    def register(self, intent: str, *matchers: IntentMatcher) -> "GlobalIntents":
+        """Registers the matchers of an intent."""
+        for matcher in matchers:
+            self._intents.append((intent, matcher))
+        return self
+
+    @property
+    def intents(self) -> List[str]:
+        return list(dict.fromkeys(intent for intent, _ in self._intents))
+
+    async def evaluate(self, turn_context: TurnContext) -> Union[str, None]:
+        """
+        Gets the global intent expressed by the current message.
+
+        :return: The intent, or None if the activity isn't a message or matches none.
+        """
+        results: Dict[GlobalIntents, str] = turn_context.turn_state.setdefault(
+            GlobalIntents.TURN_STATE_KEY, {}
+        )
+        if self not in results:
+            results[self] = await self._evaluate(turn_context)
+        return results[self]
+
+    async def _evaluate(self, turn_context: TurnContext) -> Union[str, None]:
+        activity = turn_context.activity
+        if activity.type != ActivityTypes.message or not activity.text:
+            return None
+
+        text = activity.text.strip().lower()
+        recognized: Dict[Recognizer, RecognizerResult] = {}
+        remote: List[Tuple[str, RecognizerMatcher]] = []
+        for intent, matcher in self._intents:
+            if matcher.is_remote:
+                remote.append((intent, matcher))
+            elif isinstance(matcher, RecognizerMatcher):
+                if await self._matches_recognizer(turn_context, matcher, recognized):
+                    return intent
+            elif isinstance(matcher, TextMatcher) and matcher.matches(text):
+                return intent
+
+        for intent, matcher in remote:
+            if await self._matches_recognizer(turn_context, matcher, recognized):
+                return intent
+
+        return None
+
+    @staticmethod
+    async def _matches_recognizer(
+        turn_context: TurnContext,
+        matcher: RecognizerMatcher,
+        recognized: Dict[Recognizer, RecognizerResult],
+    ) -> bool:
+        if not matcher.is_configured:
+            return False
+
+        if matcher.recognizer not in recognized:
+            try:
+                recognized[matcher.recognizer] = await matcher.recognizer.recognize(
+                    turn_context
+                )
+            except Exception as exception:
+                # a recognizer failing must not break the dialog it would interrupt
+                print(exception)
+                recognized[matcher.recognizer] = None
+
+        return matcher.matches_result(recognized[matcher.recognizer])
@@ -14,6 +14,7 @@ class Intent(Enum):
     # BOOK_FLIGHT = "BookFlight"
     BOOK_FLIGHT = "BookingFlight"
     CANCEL = "Cancel"
+    HELP = "Help"
     GREETING = "greeting"
     GOODBYE = "goodbye"
     THANKYOU = "thankyou"
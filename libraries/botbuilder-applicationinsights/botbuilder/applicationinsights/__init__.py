@@ -9,11 +9,13 @@ from .application_insights_telemetry_client import (
     ApplicationInsightsTelemetryClient,
     bot_telemetry_processor,
 )
+from .async_telemetry_exporter import AsyncTelemetryExporter, urllib_transport
 from .bot_telemetry_processor import BotTelemetryProcessor
 
-
 __all__ = [
     "ApplicationInsightsTelemetryClient",
+    "AsyncTelemetryExporter",
     "BotTelemetryProcessor",
     "bot_telemetry_processor",
+    "urllib_transport",
 ]
@@ -6,12 +6,16 @@ import traceback
 from typing import Dict, Callable
 
 from applicationinsights import TelemetryClient  # pylint: disable=no-name-in-module
+from applicationinsights.channel import (  # pylint: disable=no-name-in-module
+    TelemetryChannel,
+)
 from botbuilder.core.bot_telemetry_client import (
     BotTelemetryClient,
     Severity,
     TelemetryDataPointType,
 )
 
+from .async_telemetry_exporter import AsyncTelemetryExporter
 from .bot_telemetry_processor import BotTelemetryProcessor
 
 
@@ -39,14 +43,28 @@ class ApplicationInsightsTelemetryClient(BotTelemetryClient):
         telemetry_client: TelemetryClient = None,
         telemetry_processor: Callable[[object, object], bool] = None,
         client_queue_size: int = None,
+        telemetry_exporter: AsyncTelemetryExporter = None,
     ):
+        """
+        :param instrumentation_key: The Application Insights instrumentation key.
+        :param telemetry_client: The underlying Application Insights client. (defaults to: a new TelemetryClient)
+        :param telemetry_processor: Filter applied to every telemetry item. (defaults to: bot_telemetry_processor)
+        :param client_queue_size: How many items are queued before they are sent.
+        :param telemetry_exporter: When set, telemetry is sent in the background by this exporter instead of
+         synchronously from the calling thread. Ignored if telemetry_client is provided.
+        """
         self._instrumentation_key = instrumentation_key
+        self._exporter = None
 
-        self._client = (
-            telemetry_client
-            if telemetry_client is not None
-            else TelemetryClient(self._instrumentation_key)
-        )
+        if telemetry_client is None:
+            self._exporter = telemetry_exporter
+            channel = (
+                TelemetryChannel(queue=telemetry_exporter)
+                if telemetry_exporter is not None
+                else None
+            )
+            telemetry_client = TelemetryClient(self._instrumentation_key, channel)
+        self._client = telemetry_client
         if client_queue_size:
             self._client.channel.queue.max_queue_length = client_queue_size
 
@@ -292,3 +310,12 @@ class ApplicationInsightsTelemetryClient(BotTelemetryClient):
         being used.
         """
         self._client.flush()
+
+    async def close(self):
+        """Sends the telemetry still queued by the background exporter and stops it. Call it on shutdown when a
+        telemetry_exporter is used.
+        """
+        if self._exporter is not None:
+            await self._exporter.close()
+        else:
+            self._client.flush()
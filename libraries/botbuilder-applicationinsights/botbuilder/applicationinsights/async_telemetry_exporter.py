@@ -0,0 +1,265 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+"""Asynchronous, batched export of Application Insights telemetry."""
+
+import asyncio
+import gzip
+import json
+import logging
+import urllib.request
+from collections import deque
+from typing import Awaitable, Callable, Dict, List
+from urllib.error import HTTPError
+
+from applicationinsights.channel import QueueBase  # pylint: disable=no-name-in-module
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_ENDPOINT_URL = "https://dc.services.visualstudio.com/v2/track"
+
+# Responses after which a batch is put back on the queue and retried.
+_RETRYABLE_STATUS_CODES = frozenset([408, 429, 439, 500, 502, 503, 504])
+
+
+async def urllib_transport(url: str, body: bytes, headers: Dict[str, str]) -> int:
+    """Posts a batch with urllib on the default executor, so the loop never waits
+    on the network.
+
+    :return: The HTTP status code, or 0 when the request could not be sent.
+    """
+
+    def post() -> int:
+        request = urllib.request.Request(url, body, headers)
+        try:
+            with urllib.request.urlopen(request, timeout=10) as response:
+                return response.getcode()
+        except HTTPError as error:
+            return error.getcode()
+        except Exception:  # pylint: disable=broad-except
+            return 0
+
+    return await asyncio.get_running_loop().run_in_executor(None, post)
+
+
+class AsyncTelemetryExporter(QueueBase):
+    """
+    Telemetry queue that exports envelopes from a background asyncio task.
+
+    Plug it in as the queue of the ``applicationinsights`` TelemetryChannel (see
+    ``ApplicationInsightsTelemetryClient(telemetry_exporter=...)``). Tracking a
+    telemetry item only appends it to a bounded in-memory queue; a background task
+    sends gzipped batches when ``max_batch_size`` items are waiting or every
+    ``max_batch_interval`` seconds. When the queue is full the oldest items are
+    dropped. Call :meth:`close` on shutdown to send what is left.
+
+    The background task is started by the first item tracked from a running event
+    loop, or by :meth:`start`.
+    """
+
+    def __init__(
+        self,
+        endpoint_url: str = DEFAULT_ENDPOINT_URL,
+        max_queue_size: int = 10000,
+        max_batch_size: int = 100,
+        max_batch_interval: float = 5.0,
+        max_retry_interval: float = 60.0,
+        compress_level: int = 6,
+        transport: Callable[[str, bytes, Dict[str, str]], Awaitable[int]] = None,
+    ):
+        """
+        :param endpoint_url: The ingestion endpoint telemetry is posted to.
+        :param max_queue_size: How many items are buffered before the oldest ones
+         are dropped.
+        :param max_batch_size: How many items are sent per request. Reaching it
+         triggers a send.
+        :param max_batch_interval: How long, in seconds, an item waits at most
+         before being sent.
+        :param max_retry_interval: The upper bound, in seconds, of the backoff
+         after a failed send.
+        :param compress_level: The gzip compression level of the batches.
+        :param transport: Coroutine function ``(url, body, headers) -> status code``
+         used to post batches. Defaults to :func:`urllib_transport`.
+        """
+        super().__init__(None)
+        self._queue = deque(maxlen=max(1, max_queue_size))
+        self.max_queue_length = max_batch_size
+        self.endpoint_url = endpoint_url
+        self.max_batch_interval = max_batch_interval
+        self.max_retry_interval = max_retry_interval
+        self.compress_level = compress_level
+        self.transport = transport or urllib_transport
+
+        self.sent_count = 0
+        self.dropped_count = 0
+        self.failed_count = 0
+
+        self._loop: asyncio.AbstractEventLoop = None
+        self._wake: asyncio.Event = None
+        self._task: asyncio.Task = None
+        self._send_lock: asyncio.Lock = None
+        self._closing = False
+
+    @property
+    def max_batch_size(self) -> int:
+        return self.max_queue_length
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._queue)
+
+    def put(self, item):
+        """Queues a telemetry envelope. Never blocks and never sends inline."""
+        if not item:
+            return
+        if len(self._queue) == self._queue.maxlen:
+            self.dropped_count += 1
+        self._queue.append(item)
+        if self._task is None and not self._closing:
+            try:
+                self.start()
+            except RuntimeError:
+                # No running loop yet; the item waits until the exporter is started.
+                return
+        if len(self._queue) >= self.max_queue_length:
+            self._notify()
+
+    def get(self):
+        try:
+            return self._queue.popleft()
+        except IndexError:
+            return None
+
+    def flush(self):
+        """Asks the background task to send the queued items now, without waiting."""
+        self._notify()
+
+    def start(self):
+        """Starts the background task on the running event loop."""
+        if self._task is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._wake = asyncio.Event()
+        self._send_lock = asyncio.Lock()
+        self._task = self._loop.create_task(self._run())
+
+    async def flush_async(self):
+        """Sends every queued item and returns once they have been posted."""
+        if self._send_lock is None:
+            self._send_lock = asyncio.Lock()
+        async with self._send_lock:
+            while self._queue:
+                if not await self._send_batch():
+                    break
+
+    async def close(self, timeout: float = 10.0):
+        """
+        Stops the background task after sending the queued items.
+
+        :param timeout: How long, in seconds, to wait for the final sends.
+        """
+        self._closing = True
+        task = self._task
+        if task is None:
+            await asyncio.wait_for(self.flush_async(), timeout)
+            return
+        self._notify()
+        try:
+            await asyncio.wait_for(task, timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            self._task = None
+
+    def _notify(self):
+        if self._wake is None:
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self._loop:
+            self._wake.set()
+        elif not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._wake.set)
+
+    async def _run(self):
+        retry_interval = 0.0
+        while not self._closing:
+            try:
+                await asyncio.wait_for(
+                    self._wake.wait(), retry_interval or self.max_batch_interval
+                )
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+
+            async with self._send_lock:
+                while self._queue and not self._closing:
+                    if not await self._try_send_batch():
+                        retry_interval = min(
+                            max(2 * retry_interval, self.max_batch_interval),
+                            self.max_retry_interval,
+                        )
+                        break
+                    retry_interval = 0.0
+                    if len(self._queue) < self.max_queue_length:
+                        break
+
+        # Closing: one last attempt for everything that is left.
+        async with self._send_lock:
+            while self._queue:
+                if not await self._try_send_batch(retry=False):
+                    break
+
+    async def _try_send_batch(self, retry: bool = True) -> bool:
+        # The background task must outlive a failing send, or nothing would be
+        # exported anymore.
+        try:
+            return await self._send_batch(retry)
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception("Sending a batch of telemetry failed")
+            return False
+
+    async def _send_batch(self, retry: bool = True) -> bool:
+        batch: List = []
+        while self._queue and len(batch) < self.max_queue_length:
+            batch.append(self._queue.popleft())
+
+        try:
+            body = await asyncio.get_running_loop().run_in_executor(
+                None, self._encode, batch
+            )
+            status = await self.transport(
+                self.endpoint_url,
+                body,
+                {
+                    "Accept": "application/json",
+                    "Content-Type": "application/json; charset=utf-8",
+                    "Content-Encoding": "gzip",
+                },
+            )
+        except Exception:
+            self.failed_count += len(batch)
+            raise
+
+        if 200 <= status < 300:
+            self.sent_count += len(batch)
+            return True
+        if retry and (status == 0 or status in _RETRYABLE_STATUS_CODES):
+            self._requeue(batch)
+            return False
+        self.failed_count += len(batch)
+        return status != 0 and status not in _RETRYABLE_STATUS_CODES
+
+    def _requeue(self, batch: List):
+        # The batch is older than anything queued since, so under pressure it is
+        # the first to go.
+        room = self._queue.maxlen - len(self._queue)
+        if room < len(batch):
+            self.dropped_count += len(batch) - room
+            batch = batch[len(batch) - room :] if room else []
+        self._queue.extendleft(reversed(batch))
+
+    def _encode(self, batch: List) -> bytes:
+        payload = json.dumps([envelope.write() for envelope in batch])
+        return gzip.compress(payload.encode("utf-8"), self.compress_level)
@@ -0,0 +1,229 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+import asyncio
+import gzip
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import aiounittest
+
+from botbuilder.applicationinsights import (
+    ApplicationInsightsTelemetryClient,
+    AsyncTelemetryExporter,
+)
+
+
+class CollectorStub:
+    """Local stand-in for the Application Insights ingestion endpoint."""
+
+    def __init__(self, statuses=None):
+        self.batches = []
+        self.headers = []
+        self.statuses = list(statuses or [])
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):  # pylint: disable=invalid-name
+                body = self.rfile.read(int(self.headers["Content-Length"]))
+                status = stub.statuses.pop(0) if stub.statuses else 200
+                if status == 200:
+                    stub.headers.append(dict(self.headers))
+                    stub.batches.append(json.loads(gzip.decompress(body)))
+                self.send_response(status)
+                self.end_headers()
+
+            def log_message(self, *args):  # pylint: disable=arguments-differ
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self._server.server_port}/v2/track"
+        self._thread = threading.Thread(target=self._server.serve_forever)
+        self._thread.daemon = True
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self._server.shutdown()
+        self._server.server_close()
+
+    @property
+    def event_names(self):
+        return [
+            item["data"]["baseData"]["name"] for batch in self.batches for item in batch
+        ]
+
+
+class RecordingTransport:
+    def __init__(self, statuses=None, delay: float = 0):
+        self.calls = []
+        self.times = []
+        self.statuses = list(statuses or [])
+        self.delay = delay
+
+    async def __call__(self, url, body, headers):
+        self.times.append(time.monotonic())
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        status = self.statuses.pop(0) if self.statuses else 200
+        if isinstance(status, Exception):
+            raise status
+        if status == 200:
+            self.calls.append(json.loads(gzip.decompress(body)))
+        return status
+
+    @property
+    def event_names(self):
+        return [
+            item["data"]["baseData"]["name"] for batch in self.calls for item in batch
+        ]
+
+
+def create_client(exporter):
+    return ApplicationInsightsTelemetryClient(
+        "instrumentation-key",
+        telemetry_processor=lambda data, context: True,
+        telemetry_exporter=exporter,
+    )
+
+
+class TestAsyncTelemetryExporter(aiounittest.AsyncTestCase):
+    async def test_batches_are_gzipped_and_sent_to_collector(self):
+        with CollectorStub() as collector:
+            exporter = AsyncTelemetryExporter(
+                endpoint_url=collector.url, max_batch_size=3
+            )
+            client = create_client(exporter)
+
+            for i in range(7):
+                client.track_event(f"event{i}")
+            await client.close()
+
+        self.assertEqual([f"event{i}" for i in range(7)], collector.event_names)
+        self.assertTrue(all(len(batch) <= 3 for batch in collector.batches))
+        self.assertEqual("gzip", collector.headers[0]["Content-Encoding"])
+        self.assertEqual(7, exporter.sent_count)
+
+    async def test_track_does_not_wait_for_the_network(self):
+        transport = RecordingTransport(delay=0.2)
+        exporter = AsyncTelemetryExporter(max_batch_size=5, transport=transport)
+        client = create_client(exporter)
+
+        start = time.perf_counter()
+        for i in range(20):
+            client.track_event(f"event{i}")
+        elapsed = time.perf_counter() - start
+
+        self.assertLess(elapsed, 0.25)
+        self.assertEqual([], transport.calls)
+        await client.close()
+        self.assertEqual(20, len(transport.event_names))
+
+    async def test_sends_partial_batch_after_interval(self):
+        transport = RecordingTransport()
+        exporter = AsyncTelemetryExporter(
+            max_batch_interval=0.05, max_batch_size=100, transport=transport
+        )
+        client = create_client(exporter)
+
+        client.track_event("lonely")
+        await asyncio.sleep(0.3)
+
+        self.assertEqual(["lonely"], transport.event_names)
+        await client.close()
+
+    async def test_drops_oldest_when_full(self):
+        transport = RecordingTransport()
+        exporter = AsyncTelemetryExporter(
+            max_queue_size=3, max_batch_size=100, transport=transport
+        )
+        client = create_client(exporter)
+
+        for i in range(5):
+            client.track_event(f"event{i}")
+        await client.close()
+
+        self.assertEqual(["event2", "event3", "event4"], transport.event_names)
+        self.assertEqual(2, exporter.dropped_count)
+
+    async def test_retries_after_server_error(self):
+        with CollectorStub(statuses=[503]) as collector:
+            exporter = AsyncTelemetryExporter(
+                endpoint_url=collector.url,
+                max_batch_size=2,
+                max_batch_interval=0.05,
+            )
+            client = create_client(exporter)
+
+            client.track_event("first")
+            client.track_event("second")
+            await asyncio.sleep(0.5)
+
+            self.assertEqual(["first", "second"], collector.event_names)
+            await client.close()
+
+        self.assertEqual(2, exporter.sent_count)
+        self.assertEqual(0, exporter.failed_count)
+
+    async def test_backs_off_while_sends_fail(self):
+        transport = RecordingTransport(statuses=[503, 503, 503])
+        exporter = AsyncTelemetryExporter(
+            max_batch_size=1, max_batch_interval=0.02, transport=transport
+        )
+        client = create_client(exporter)
+
+        client.track_event("event")
+        await asyncio.sleep(0.3)
+
+        self.assertEqual(["event"], transport.event_names)
+        gaps = [
+            later - earlier
+            for earlier, later in zip(transport.times, transport.times[1:])
+        ]
+        self.assertGreater(gaps[2], 2 * gaps[0])
+        await client.close()
+
+    async def test_failing_transport_does_not_stop_the_exporter(self):
+        transport = RecordingTransport(statuses=[ConnectionError()])
+        exporter = AsyncTelemetryExporter(
+            max_batch_size=1, max_batch_interval=0.02, transport=transport
+        )
+        client = create_client(exporter)
+
+        client.track_event("lost")
+        await asyncio.sleep(0.05)
+        client.track_event("sent")
+        await asyncio.sleep(0.05)
+
+        self.assertEqual(["sent"], transport.event_names)
+        self.assertEqual(1, exporter.failed_count)
+        self.assertFalse(exporter._task.done())
+        await client.close()
+
+    async def test_rejected_batch_is_not_retried(self):
+        transport = RecordingTransport(statuses=[400])
+        exporter = AsyncTelemetryExporter(max_batch_size=1, transport=transport)
+        client = create_client(exporter)
+
+        client.track_event("invalid")
+        client.track_event("valid")
+        await client.close()
+
+        self.assertEqual(["valid"], transport.event_names)
+        self.assertEqual(1, exporter.failed_count)
+
+    async def test_items_tracked_before_loop_starts_are_sent_on_close(self):
+        transport = RecordingTransport()
+        exporter = AsyncTelemetryExporter(transport=transport)
+        exporter.put(None)
+
+        await asyncio.get_running_loop().run_in_executor(
+            None, lambda: create_client(exporter).track_event("from thread")
+        )
+        await exporter.close()
+
+        self.assertEqual(["from thread"], transport.event_names)
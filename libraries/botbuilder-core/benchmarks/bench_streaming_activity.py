@@ -0,0 +1,119 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+"""
+Decoding of the Activity posted in a streaming request, and encoding of the Activity
+sent by StreamingRequestHandler.send_activity, against the earlier str and msrest
+based path. Runs over the captured activities of botbuilder-schema:
+
+    python benchmarks/bench_streaming_activity.py [--number N]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import time
+from uuid import uuid4
+
+from botbuilder.core.streaming import StreamingRequestHandler
+from botbuilder.schema import Activity, ModelCodec
+from botframework.streaming import ReceiveRequest, StreamingRequest
+from botframework.streaming.payloads import ContentStream
+from botframework.streaming.payloads.assemblers import PayloadStreamAssembler
+from botframework.streaming.transport import TransportConstants
+
+ACTIVITIES_DIR = os.path.join(
+    os.path.dirname(__file__),
+    "..",
+    "..",
+    "botbuilder-schema",
+    "tests",
+    "resources",
+    "activities",
+)
+
+
+def receive_request(body: bytes) -> ReceiveRequest:
+    """A request as received, its body split in payloads."""
+    assembler = PayloadStreamAssembler(None, uuid4(), length=len(body))
+    stream = assembler.get_payload_as_stream()
+    for offset in range(0, len(body), TransportConstants.MAX_PAYLOAD_LENGTH):
+        stream.give_buffer(
+            bytearray(body[offset : offset + TransportConstants.MAX_PAYLOAD_LENGTH])
+        )
+    return ReceiveRequest(
+        verb="POST", streams=[ContentStream(assembler.identifier, assembler)]
+    )
+
+
+async def decode_str(body: bytes) -> Activity:
+    body_str = await receive_request(body).read_body_as_str()
+    return Activity.deserialize(json.loads(body_str))
+
+
+async def decode_buffers(body: bytes) -> Activity:
+    # pylint: disable=protected-access
+    body = await receive_request(body).read_body()
+    return StreamingRequestHandler._decode_activity(body)
+
+
+def encode_msrest(activity: Activity):
+    StreamingRequest.create_post("/").set_body(activity)
+
+
+def encode_codec(activity: Activity):
+    StreamingRequest.create_post("/").set_body(
+        ModelCodec.get(Activity).to_json_bytes(activity)
+    )
+
+
+async def time_async(decode, body: bytes, number: int) -> float:
+    start = time.perf_counter()
+    for _ in range(number):
+        await decode(body)
+    return time.perf_counter() - start
+
+
+def time_sync(encode, activity: Activity, number: int) -> float:
+    start = time.perf_counter()
+    for _ in range(number):
+        encode(activity)
+    return time.perf_counter() - start
+
+
+def report(name: str, before: float, after: float, number: int):
+    print(
+        f"{name:<40} before {before / number * 1e6:9.1f} us"
+        f"   after {after / number * 1e6:9.1f} us   x{before / after:5.1f}"
+    )
+
+
+async def run(number: int):
+    for file_name in sorted(os.listdir(ACTIVITIES_DIR)):
+        with open(os.path.join(ACTIVITIES_DIR, file_name), "rb") as file:
+            body = file.read()
+        activity = await decode_str(body)
+
+        report(
+            f"{file_name} decode",
+            await time_async(decode_str, body, number),
+            await time_async(decode_buffers, body, number),
+            number,
+        )
+        report(
+            f"{file_name} encode",
+            time_sync(encode_msrest, activity, number),
+            time_sync(encode_codec, activity, number),
+            number,
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--number", type=int, default=2000)
+    asyncio.run(run(parser.parse_args().number))
+
+
+if __name__ == "__main__":
+    main()
@@ -36,6 +36,7 @@ from .private_conversation_state import PrivateConversationState
 from .queue_storage import QueueStorage
 from .recognizer import Recognizer
 from .recognizer_result import RecognizerResult, TopIntent
+from .sampling_telemetry_client import SamplingTelemetryClient
 from .show_typing_middleware import ShowTypingMiddleware
 from .state_property_accessor import StatePropertyAccessor
 from .state_property_info import StatePropertyInfo
@@ -85,6 +86,7 @@ __all__ = [
     "RegisterClassMiddleware",
     "Recognizer",
     "RecognizerResult",
+    "SamplingTelemetryClient",
     "Severity",
     "ShowTypingMiddleware",
     "StatePropertyAccessor",
@@ -7,8 +7,20 @@
 
 from .aiohttp_channel_service import aiohttp_channel_service_routes
 from .aiohttp_channel_service_exception_middleware import aiohttp_error_middleware
+from .aiohttp_request_body import (
+    clear_request_body,
+    get_request_activity,
+    get_request_body,
+    read_request_activity,
+    read_request_body,
+)
 
 __all__ = [
     "aiohttp_channel_service_routes",
     "aiohttp_error_middleware",
+    "clear_request_body",
+    "get_request_activity",
+    "get_request_body",
+    "read_request_activity",
+    "read_request_body",
 ]
@@ -0,0 +1,84 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+"""Request scoped cache for the parsed body of an inbound aiohttp request."""
+
+from contextvars import ContextVar
+
+from aiohttp.web import Request
+
+from botbuilder.schema import Activity, LazyActivity, ModelCodec, json_loads
+
+
+class _RequestBody:
+    """
+    The parsed JSON body of a request and its Activity, deserialized on first use.
+    Nested models of the Activity are only built when the bot reads them.
+    """
+
+    __slots__ = ("request", "body", "_activity")
+
+    def __init__(self, request: Request, body: dict):
+        self.request = request
+        self.body = body
+        self._activity = None
+
+    @property
+    def activity(self) -> Activity:
+        if self._activity is None:
+            self._activity = ModelCodec.get(LazyActivity).deserialize(self.body)
+        return self._activity
+
+
+# aiohttp serves every request from its own task, so each request sees its own value.
+_REQUEST_BODY: ContextVar = ContextVar("botbuilder_aiohttp_request_body", default=None)
+
+
+async def _get_or_parse(request: Request) -> _RequestBody:
+    cached = _REQUEST_BODY.get()
+    if cached is None or cached.request is not request:
+        cached = _RequestBody(request, await request.json(loads=json_loads))
+        _REQUEST_BODY.set(cached)
+    return cached
+
+
+async def read_request_body(request: Request) -> dict:
+    """
+    Returns the JSON body of the request, parsing it only once per request.
+
+    :param request: The inbound aiohttp request.
+    :return: The parsed body.
+    """
+    return (await _get_or_parse(request)).body
+
+
+async def read_request_activity(request: Request) -> Activity:
+    """
+    Returns the Activity posted in the request, deserializing it only once per request.
+
+    :param request: The inbound aiohttp request.
+    :return: The deserialized Activity.
+    """
+    return (await _get_or_parse(request)).activity
+
+
+def get_request_body() -> dict:
+    """
+    Returns the body already parsed for the current request, or None if the
+    body has not been read in this request scope.
+    """
+    cached = _REQUEST_BODY.get()
+    return cached.body if cached is not None else None
+
+
+def get_request_activity() -> Activity:
+    """
+    Returns the Activity of the current request, or None if the body has not
+    been read in this request scope.
+    """
+    cached = _REQUEST_BODY.get()
+    return cached.activity if cached is not None else None
+
+
+def clear_request_body():
+    """Drops the cached body once the current request is done."""
+    _REQUEST_BODY.set(None)
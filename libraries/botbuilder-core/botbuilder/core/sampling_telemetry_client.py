@@ -0,0 +1,342 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+"""Sampling and pre-aggregation in front of a BotTelemetryClient."""
+
+import math
+import time
+import traceback
+import zlib
+from bisect import bisect_left
+from contextvars import ContextVar
+from typing import Awaitable, Callable, Dict, Sequence, Tuple
+
+from .bot_telemetry_client import BotTelemetryClient, Severity, TelemetryDataPointType
+from .middleware_set import Middleware
+from .telemetry_constants import TelemetryConstants
+from .turn_context import TurnContext
+
+# Conversation of the turn being processed, set by SamplingTelemetryClient.on_turn.
+_CONVERSATION_ID: ContextVar[str] = ContextVar(
+    "telemetry_conversation_id", default=None
+)
+
+DEFAULT_LATENCY_BUCKETS = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class _Aggregate:
+    """Count and latency histogram of one event name and dimension values."""
+
+    __slots__ = ("count", "latency_count", "total", "squares", "min", "max", "buckets")
+
+    def __init__(self, bucket_count: int):
+        self.count = 0
+        self.latency_count = 0
+        self.total = 0.0
+        self.squares = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.buckets = [0] * (bucket_count + 1)
+
+    def add_latency(self, value: float, index: int):
+        self.latency_count += 1
+        self.total += value
+        self.squares += value * value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        self.buckets[index] += 1
+
+    @property
+    def std_dev(self) -> float:
+        mean = self.total / self.latency_count
+        return math.sqrt(max(self.squares / self.latency_count - mean * mean, 0.0))
+
+
+class SamplingTelemetryClient(BotTelemetryClient, Middleware):
+    """
+    A BotTelemetryClient that samples and pre-aggregates telemetry before handing it
+    to another client.
+
+    Items are kept or dropped per name (event, trace, request, dependency or page
+    view name) according to ``sampling_rates``. The decision hashes the conversation
+    id, so a conversation is either kept or dropped as a whole and sampling at a
+    lower rate keeps a subset of the conversations kept at a higher rate. The
+    conversation id is read from the ``conversationId`` property and, when the
+    client is also added to the adapter as middleware, from the turn being
+    processed. Items without a conversation are sampled at random.
+
+    Events listed in ``aggregated_events`` are counted before sampling, per value
+    of the given properties (for instance per intent of ``LuisResult`` events or
+    per dialog and step of ``WaterfallStep`` events), together with a histogram of
+    their ``latency_measurements``. The aggregates are sent as aggregated metrics
+    every ``flush_interval`` seconds and on :meth:`flush`, so counts stay exact at
+    any sampling rate.
+
+    Exceptions, metrics, failed requests and dependencies, and traces of warning
+    severity or above are never sampled out.
+    """
+
+    def __init__(
+        self,
+        telemetry_client: BotTelemetryClient,
+        sampling_rates: Dict[str, float] = None,
+        default_sampling_rate: float = 1.0,
+        aggregated_events: Dict[str, Sequence[str]] = None,
+        latency_measurements: Sequence[str] = ("duration", "latencyMs"),
+        latency_buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+        flush_interval: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        :param telemetry_client: The client the sampled items and aggregates are sent to.
+        :param sampling_rates: Fraction, between 0 and 1, of the items of a given name to keep.
+        :param default_sampling_rate: Fraction of the items to keep for names not in sampling_rates.
+        :param aggregated_events: Event names to aggregate, with the properties to group them by.
+        :param latency_measurements: Names of the measurements, in milliseconds, that feed the histograms.
+        :param latency_buckets: Upper bounds, in milliseconds, of the histogram buckets.
+        :param flush_interval: How often, in seconds, aggregates are sent.
+        :param clock: Monotonic clock, in seconds.
+        """
+        super(SamplingTelemetryClient, self).__init__()
+        self._telemetry_client = telemetry_client
+        self._sampling_rates = dict(sampling_rates or {})
+        self._default_sampling_rate = default_sampling_rate
+        self._aggregated_events = {
+            name: tuple(dimensions)
+            for name, dimensions in (aggregated_events or {}).items()
+        }
+        self._latency_measurements = tuple(latency_measurements)
+        self._latency_buckets = tuple(sorted(latency_buckets))
+        self._flush_interval = flush_interval
+        self._clock = clock
+        self._last_flush = clock()
+        self._aggregates: Dict[Tuple[str, tuple], _Aggregate] = {}
+        self._random_state = 0
+
+    @property
+    def telemetry_client(self) -> BotTelemetryClient:
+        """Gets the client sampled items are sent to."""
+        return self._telemetry_client
+
+    async def on_turn(
+        self, context: TurnContext, logic: Callable[[TurnContext], Awaitable]
+    ):
+        """Makes the conversation of the turn available to the sampling decisions."""
+        conversation = context.activity.conversation if context.activity else None
+        token = _CONVERSATION_ID.set(conversation.id if conversation else None)
+        try:
+            await logic()
+        finally:
+            _CONVERSATION_ID.reset(token)
+
+    def is_sampled(self, name: str, properties: Dict[str, object] = None) -> bool:
+        """
+        Returns whether an item of the given name and properties is kept.
+
+        :param name: The event, trace, request, dependency or page view name.
+        :param properties: The properties of the item.
+        """
+        rate = self._sampling_rates.get(name, self._default_sampling_rate)
+        if rate >= 1.0:
+            return True
+        if rate <= 0.0:
+            return False
+
+        conversation_id = (
+            properties.get(TelemetryConstants.CONVERSATION_ID_PROPERTY)
+            if properties
+            else None
+        ) or _CONVERSATION_ID.get()
+        if conversation_id:
+            score = zlib.crc32(str(conversation_id).encode("utf-8"))
+        else:
+            # Weyl sequence: cheap, evenly spread and good enough to thin out traffic.
+            self._random_state = (self._random_state + 0x9E3779B9) & 0xFFFFFFFF
+            score = self._random_state
+        return score < rate * 0x100000000
+
+    def flush_aggregates(self):
+        """Sends the aggregated counts and latency histograms, and resets them."""
+        aggregates, self._aggregates = self._aggregates, {}
+        self._last_flush = self._clock()
+
+        for (name, dimension_values), aggregate in aggregates.items():
+            properties = dict(zip(self._aggregated_events[name], dimension_values))
+            self._telemetry_client.track_metric(
+                f"{name}.count",
+                aggregate.count,
+                TelemetryDataPointType.aggregation,
+                properties=properties,
+            )
+            if aggregate.latency_count:
+                histogram = dict(properties)
+                bounds = [f"le{bound:g}" for bound in self._latency_buckets] + ["+Inf"]
+                histogram.update(zip(bounds, aggregate.buckets))
+                self._telemetry_client.track_metric(
+                    f"{name}.latency",
+                    aggregate.total,
+                    TelemetryDataPointType.aggregation,
+                    aggregate.latency_count,
+                    aggregate.min,
+                    aggregate.max,
+                    aggregate.std_dev,
+                    histogram,
+                )
+
+    def flush(self):
+        """Sends the aggregates, then flushes the wrapped client."""
+        self.flush_aggregates()
+        flush = getattr(self._telemetry_client, "flush", None)
+        if flush is not None:
+            flush()
+
+    def _aggregate(self, name: str, properties, measurements, duration=None):
+        dimensions = self._aggregated_events.get(name)
+        if dimensions is not None:
+            values = tuple(
+                str(properties.get(dimension, "")) if properties else ""
+                for dimension in dimensions
+            )
+            aggregate = self._aggregates.get((name, values))
+            if aggregate is None:
+                aggregate = self._aggregates[(name, values)] = _Aggregate(
+                    len(self._latency_buckets)
+                )
+            aggregate.count += 1
+
+            latency = duration
+            if latency is None and measurements:
+                latency = next(
+                    (
+                        measurements[key]
+                        for key in self._latency_measurements
+                        if measurements.get(key) is not None
+                    ),
+                    None,
+                )
+            if latency is not None:
+                latency = float(latency)
+                aggregate.add_latency(
+                    latency, bisect_left(self._latency_buckets, latency)
+                )
+
+        if self._clock() - self._last_flush >= self._flush_interval:
+            self.flush_aggregates()
+
+    def track_pageview(
+        self,
+        name: str,
+        url,
+        duration: int = 0,
+        properties: Dict[str, object] = None,
+        measurements: Dict[str, object] = None,
+    ) -> None:
+        self._aggregate(name, properties, measurements, duration)
+        if self.is_sampled(name, properties):
+            self._telemetry_client.track_pageview(
+                name, url, duration, properties, measurements
+            )
+
+    def track_exception(
+        self,
+        exception_type: type = None,
+        value: Exception = None,
+        trace: traceback = None,
+        properties: Dict[str, object] = None,
+        measurements: Dict[str, object] = None,
+    ) -> None:
+        self._telemetry_client.track_exception(
+            exception_type, value, trace, properties, measurements
+        )
+
+    def track_event(
+        self,
+        name: str,
+        properties: Dict[str, object] = None,
+        measurements: Dict[str, object] = None,
+    ) -> None:
+        self._aggregate(name, properties, measurements)
+        if self.is_sampled(name, properties):
+            self._telemetry_client.track_event(
+                name, properties=properties, measurements=measurements
+            )
+
+    def track_metric(
+        self,
+        name: str,
+        value: float,
+        tel_type: TelemetryDataPointType = None,
+        count: int = None,
+        min_val: float = None,
+        max_val: float = None,
+        std_dev: float = None,
+        properties: Dict[str, object] = None,
+    ) -> NotImplemented:
+        self._telemetry_client.track_metric(
+            name, value, tel_type, count, min_val, max_val, std_dev, properties
+        )
+
+    def track_trace(
+        self, name: str, properties: Dict[str, object] = None, severity: Severity = None
+    ):
+        if (
+            severity is not None
+            and severity.value >= Severity.warning.value
+            or self.is_sampled(name, properties)
+        ):
+            self._telemetry_client.track_trace(name, properties, severity)
+
+    def track_request(
+        self,
+        name: str,
+        url: str,
+        success: bool,
+        start_time: str = None,
+        duration: int = None,
+        response_code: str = None,
+        http_method: str = None,
+        properties: Dict[str, object] = None,
+        measurements: Dict[str, object] = None,
+        request_id: str = None,
+    ):
+        self._aggregate(name, properties, measurements, duration)
+        if not success or self.is_sampled(name, properties):
+            self._telemetry_client.track_request(
+                name,
+                url,
+                success,
+                start_time,
+                duration,
+                response_code,
+                http_method,
+                properties,
+                measurements,
+                request_id,
+            )
+
+    def track_dependency(
+        self,
+        name: str,
+        data: str,
+        type_name: str = None,
+        target: str = None,
+        duration: int = None,
+        success: bool = None,
+        result_code: str = None,
+        properties: Dict[str, object] = None,
+        measurements: Dict[str, object] = None,
+        dependency_id: str = None,
+    ):
+        self._aggregate(name, properties, measurements, duration)
+        if success is False or self.is_sampled(name, properties):
+            self._telemetry_client.track_dependency(
+                name,
+                data,
+                type_name,
+                target,
+                duration,
+                success,
+                result_code,
+                properties,
+                measurements,
+                dependency_id,
+            )
@@ -5,6 +5,9 @@ from .bot_framework_http_adapter_base import BotFrameworkHttpAdapterBase
 from .streaming_activity_processor import StreamingActivityProcessor
 from .streaming_http_client import StreamingHttpDriver
 from .streaming_request_handler import StreamingRequestHandler
+from .telemetry_streaming_metrics_sink import TelemetryStreamingMetricsSink
+from .turn_limiter import TurnLimiter, TurnRejectedError
+from .turn_limiter_metrics import TurnLimiterMetrics
 from .version_info import VersionInfo
 
 __all__ = [
@@ -12,5 +15,9 @@ __all__ = [
     "StreamingActivityProcessor",
     "StreamingHttpDriver",
     "StreamingRequestHandler",
+    "TelemetryStreamingMetricsSink",
+    "TurnLimiter",
+    "TurnLimiterMetrics",
+    "TurnRejectedError",
     "VersionInfo",
 ]
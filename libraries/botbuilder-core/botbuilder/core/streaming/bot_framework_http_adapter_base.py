@@ -19,10 +19,13 @@ from botframework.connector.auth import (
     MicrosoftAppCredentials,
     MicrosoftGovernmentAppCredentials,
 )
+from botframework.streaming import StreamingMetricsSink
+from botframework.streaming.payload_transport import ReceiveLimits
 
 from .streaming_activity_processor import StreamingActivityProcessor
 from .streaming_request_handler import StreamingRequestHandler
 from .streaming_http_client import StreamingHttpDriver
+from .turn_limiter import TurnLimiter
 
 
 class BotFrameworkHttpAdapterBase(BotFrameworkAdapter, StreamingActivityProcessor):
@@ -34,6 +37,30 @@ class BotFrameworkHttpAdapterBase(BotFrameworkAdapter, StreamingActivityProcesso
         self.claims_identity: ClaimsIdentity = None
         self.request_handlers: List[StreamingRequestHandler] = None
 
+        # limits on the turns run at once over each streaming connection, and over all
+        # of them, none by default
+        self.connection_turn_limit: int = None
+        self.turn_limiter: TurnLimiter = None
+
+        # limits on what the streaming connections buffer, the seconds to wait for the
+        # response to a request sent on them, and after which what they receive but gets
+        # nothing more is dropped, none by default
+        self.streaming_receive_limits: ReceiveLimits = None
+        self.streaming_request_timeout: float = None
+        self.streaming_idle_timeout: float = None
+
+        # where the streaming connections report their requests, metrics and
+        # disconnection, every metrics_interval seconds for the metrics
+        self.streaming_metrics_sink: StreamingMetricsSink = None
+        self.streaming_metrics_interval: float = None
+
+    def create_connection_turn_limiter(self) -> TurnLimiter:
+        """Creates the turn limiter of a new streaming connection, if turns are limited."""
+        if not self.connection_turn_limit and not self.turn_limiter:
+            return None
+
+        return TurnLimiter(self.connection_turn_limit, parent=self.turn_limiter)
+
     async def process_streaming_activity(
         self,
         activity: Activity,
@@ -6,13 +6,20 @@ import traceback
 from http import HTTPStatus
 from datetime import datetime
 from logging import Logger
-from json import loads
-from typing import Dict, List
+from typing import AsyncIterable, Dict, List, Union
 
 from botbuilder.core import Bot
-from botbuilder.schema import Activity, Attachment, ResourceResponse
+from botbuilder.schema import (
+    Activity,
+    Attachment,
+    LazyActivity,
+    ModelCodec,
+    ResourceResponse,
+    json_loads,
+)
 from botframework.streaming import (
     RequestHandler,
+    StreamingMetricsSink,
     ReceiveRequest,
     ReceiveResponse,
     StreamingRequest,
@@ -20,15 +27,24 @@ from botframework.streaming import (
     __title__,
     __version__,
 )
+from botframework.streaming.payload_transport import ReceiveLimits
 from botframework.streaming.transport import DisconnectedEventArgs
 from botframework.streaming.transport.web_socket import WebSocket, WebSocketServer
 
 from .streaming_activity_processor import StreamingActivityProcessor
+from .turn_limiter import TurnLimiter, TurnRejectedError
 from .version_info import VersionInfo
 
+_UTF8_BOM = b"\xef\xbb\xbf"
+
 
 class StreamContent:
-    def __init__(self, stream: List[int], *, headers: Dict[str, str] = None):
+    def __init__(
+        self,
+        stream: Union[bytes, List[int], AsyncIterable[bytes]],
+        *,
+        headers: Dict[str, str] = None,
+    ):
         self.stream = stream
         self.headers: Dict[str, str] = headers if headers is not None else {}
 
@@ -40,6 +56,12 @@ class StreamingRequestHandler(RequestHandler):
         activity_processor: StreamingActivityProcessor,
         web_socket: WebSocket,
         logger: Logger = None,
+        receive_limits: ReceiveLimits = None,
+        request_timeout: float = None,
+        idle_timeout: float = None,
+        turn_limiter: TurnLimiter = None,
+        metrics_sink: StreamingMetricsSink = None,
+        metrics_interval: float = None,
     ):
         if not bot:
             raise TypeError(f"'bot: {bot.__class__.__name__}' argument can't be None")
@@ -51,9 +73,18 @@ class StreamingRequestHandler(RequestHandler):
         self._bot = bot
         self._activity_processor = activity_processor
         self._logger = logger
+        self._turn_limiter = turn_limiter
         self._conversations: Dict[str, datetime] = {}
         self._user_agent = StreamingRequestHandler._get_user_agent()
-        self._server = WebSocketServer(web_socket, self)
+        self._server = WebSocketServer(
+            web_socket,
+            self,
+            receive_limits,
+            request_timeout=request_timeout,
+            idle_timeout=idle_timeout,
+            metrics_sink=metrics_sink,
+            metrics_interval=metrics_interval,
+        )
         self._server_is_connected = True
         self._server.disconnected_event_handler = self._server_disconnected
         self._service_url: str = None
@@ -96,7 +127,7 @@ class StreamingRequestHandler(RequestHandler):
 
         # Convert the StreamingRequest into an activity the adapter can understand.
         try:
-            body_str = await request.read_body_as_str()
+            body = await request.read_body()
         except Exception as error:
             traceback.print_exc()
             response.status_code = int(HTTPStatus.BAD_REQUEST)
@@ -105,9 +136,7 @@ class StreamingRequestHandler(RequestHandler):
             return response
 
         try:
-            # TODO: validate if should use deserialize or from_dict
-            body_dict = loads(body_str)
-            activity: Activity = Activity.deserialize(body_dict)
+            activity = StreamingRequestHandler._decode_activity(body)
 
             # All activities received by this StreamingRequestHandler will originate from the same channel, but we won't
             # know what that channel is until we've received the first request.
@@ -130,7 +159,7 @@ class StreamingRequestHandler(RequestHandler):
             if len(request.streams) > 1:
                 stream_attachments = [
                     Attachment(content_type=stream.content_type, content=stream.stream)
-                    for stream in request.streams
+                    for stream in request.streams[1:]
                 ]
 
                 if activity.attachments:
@@ -139,11 +168,11 @@ class StreamingRequestHandler(RequestHandler):
                     activity.attachments = stream_attachments
 
             # Now that the request has been converted into an activity we can send it to the adapter.
-            adapter_response = (
-                await self._activity_processor.process_streaming_activity(
-                    activity, self._bot.on_turn
-                )
-            )
+            try:
+                adapter_response = await self._process_activity(activity)
+            except TurnRejectedError:
+                response.status_code = int(HTTPStatus.SERVICE_UNAVAILABLE)
+                return response
 
             # Now we convert the invokeResponse returned by the adapter into a StreamingResponse we can send back
             # to the channel.
@@ -162,6 +191,18 @@ class StreamingRequestHandler(RequestHandler):
 
         return response
 
+    async def _process_activity(self, activity: Activity):
+        if not self._turn_limiter:
+            return await self._activity_processor.process_streaming_activity(
+                activity, self._bot.on_turn
+            )
+
+        # the turns of a conversation run one after the other
+        async with self._turn_limiter.turn(activity.conversation.id):
+            return await self._activity_processor.process_streaming_activity(
+                activity, self._bot.on_turn
+            )
+
     async def send_activity(self, activity: Activity) -> ResourceResponse:
         if activity.reply_to_id:
             request_path = (
@@ -173,11 +214,13 @@ class StreamingRequestHandler(RequestHandler):
 
         stream_attachments = self._update_attachment_streams(activity)
         request = StreamingRequest.create_post(request_path)
-        request.set_body(activity)
+        request.set_body(ModelCodec.get(Activity).to_json_bytes(activity))
         if stream_attachments:
             for attachment in stream_attachments:
-                # TODO: might be necessary to serialize this before adding
-                request.add_stream(attachment)
+                request.add_stream(
+                    attachment.stream,
+                    content_type=attachment.headers.get("Content-Type"),
+                )
 
         try:
             if not self._server_is_connected:
@@ -211,6 +254,14 @@ class StreamingRequestHandler(RequestHandler):
 
         return None
 
+    @staticmethod
+    def _decode_activity(body: Union[bytes, bytearray]) -> Activity:
+        # straight from the buffer received, the nested models are built when read
+        if body[:3] == _UTF8_BOM:
+            body = bytes(body[3:])
+
+        return ModelCodec.get(LazyActivity).deserialize(json_loads(body))
+
     @staticmethod
     def _get_user_agent() -> str:
         package_user_agent = f"{__title__}/{__version__}"
@@ -226,6 +277,11 @@ class StreamingRequestHandler(RequestHandler):
             return None
 
         def validate_int_list(obj: object) -> bool:
+            # async iterables, such as a received PayloadStream, are sent as they are read
+            if isinstance(obj, (bytes, bytearray, memoryview)) or hasattr(
+                obj, "__aiter__"
+            ):
+                return True
             if not isinstance(obj, list):
                 return False
 
@@ -0,0 +1,109 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+from typing import Dict
+
+from botbuilder.core import BotTelemetryClient, Severity
+from botframework.streaming import (
+    ReceiveRequest,
+    ReceiveResponse,
+    StreamingMetricsSink,
+    StreamingRequest,
+    StreamingResponse,
+)
+
+
+class TelemetryStreamingMetricsSink(StreamingMetricsSink):
+    """
+    Exports what goes through a streaming connection to a BotTelemetryClient: the
+    requests received as requests, those sent as dependencies, the metrics of the
+    connection as metrics named "Streaming.<name>" and its disconnection as an event.
+    """
+
+    DISCONNECTED_EVENT = "StreamingDisconnected"
+    METRIC_PREFIX = "Streaming."
+    DEPENDENCY_TYPE = "Streaming"
+
+    def __init__(
+        self, telemetry_client: BotTelemetryClient, properties: Dict[str, str] = None
+    ):
+        """
+        :param telemetry_client: The client the telemetry is sent to.
+        :param properties: (Optional) Properties attached to all the telemetry sent, to
+        tell the connection apart.
+        """
+        if not telemetry_client:
+            raise TypeError(
+                f"'telemetry_client: {telemetry_client.__class__.__name__}' argument can't be None"
+            )
+
+        self.telemetry_client = telemetry_client
+        self.properties = properties
+
+    def on_request_processed(
+        self,
+        request: ReceiveRequest,
+        response: StreamingResponse,
+        duration: float,
+        error: Exception = None,
+    ):
+        status_code = response.status_code if response else None
+        self.telemetry_client.track_request(
+            f"{request.verb} {request.path}",
+            request.path,
+            error is None and status_code is not None and status_code < 500,
+            duration=int(duration * 1000),
+            response_code=str(status_code),
+            http_method=request.verb,
+            properties=self._with_error(error),
+        )
+
+    def on_response_received(
+        self,
+        request: StreamingRequest,
+        response: ReceiveResponse,
+        duration: float,
+        error: Exception = None,
+    ):
+        status_code = response.status_code if response else None
+        self.telemetry_client.track_dependency(
+            f"{request.verb} {request.path}",
+            request.path,
+            type_name=self.DEPENDENCY_TYPE,
+            duration=int(duration * 1000),
+            success=error is None and status_code is not None and status_code < 500,
+            result_code=str(status_code),
+            properties=self._with_error(error),
+        )
+
+    def on_metrics(self, metrics: dict):
+        for name, value in self._flatten(metrics, self.METRIC_PREFIX):
+            self.telemetry_client.track_metric(name, value, properties=self.properties)
+
+    def on_disconnected(self, reason: str):
+        properties = dict(self.properties or {})
+        if reason:
+            properties["reason"] = reason
+            self.telemetry_client.track_trace(
+                f"Streaming connection closed: {reason}", properties, Severity.warning
+            )
+
+        self.telemetry_client.track_event(self.DISCONNECTED_EVENT, properties)
+
+    def _with_error(self, error: Exception) -> Dict[str, str]:
+        if not error:
+            return self.properties
+
+        properties = dict(self.properties or {})
+        properties["error"] = repr(error)
+        return properties
+
+    @staticmethod
+    def _flatten(metrics: dict, prefix: str):
+        for name, value in metrics.items():
+            if isinstance(value, dict):
+                yield from TelemetryStreamingMetricsSink._flatten(
+                    value, f"{prefix}{name}."
+                )
+            elif isinstance(value, (int, float)):
+                yield f"{prefix}{name}", value
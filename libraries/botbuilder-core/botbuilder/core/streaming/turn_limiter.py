@@ -0,0 +1,133 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+from asyncio import Lock, Semaphore
+from contextlib import asynccontextmanager
+from time import monotonic
+from typing import AsyncIterator, Dict
+
+from .turn_limiter_metrics import TurnLimiterMetrics
+
+
+class TurnRejectedError(Exception):
+    """Raised when a turn is shed because too many turns are queued."""
+
+
+class _Conversation:
+    def __init__(self):
+        self.lock = Lock()
+        # the turns of the conversation running or queued
+        self.turns = 0
+
+
+class TurnLimiter:
+    """
+    Limits the turns run at once, running those of a conversation one after the other
+    in the order they come in.
+
+    A StreamingRequestHandler takes a limiter for its connection, which can have a
+    parent limiter shared by all the connections of the worker. As a conversation only
+    runs one turn at a time, a burst in one conversation queues behind itself rather
+    than taking the slots of the others.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = None,
+        *,
+        max_queued: int = None,
+        max_queued_per_conversation: int = None,
+        parent: "TurnLimiter" = None,
+    ):
+        """
+        :param max_concurrent: (Optional) The number of turns run at once, no limit by
+        default.
+        :param max_queued: (Optional) The number of turns waiting to run, after which
+        new turns are rejected with a TurnRejectedError.
+        :param max_queued_per_conversation: (Optional) The number of turns of a single
+        conversation waiting to run, after which its new turns are rejected.
+        :param parent: (Optional) A limiter the turns also go through once they leave
+        the queue of this one.
+        """
+        self.max_queued = max_queued
+        self.max_queued_per_conversation = max_queued_per_conversation
+        self.metrics = TurnLimiterMetrics()
+        self._slots = Semaphore(max_concurrent) if max_concurrent else None
+        self._parent = parent
+        self._conversations: Dict[str, _Conversation] = {}
+
+    @asynccontextmanager
+    async def turn(self, conversation_id: str = None) -> AsyncIterator[None]:
+        """
+        Waits until a turn of the conversation can run, for as long as the context is
+        entered.
+
+        :raises TurnRejectedError: If too many turns are queued already.
+        """
+        conversation = self._enter(conversation_id)
+        queued_at = monotonic()
+        running = False
+
+        try:
+            if conversation:
+                await conversation.lock.acquire()
+            try:
+                if self._slots:
+                    await self._slots.acquire()
+                try:
+                    running = True
+                    self.metrics.queued -= 1
+                    self.metrics.running += 1
+                    self.metrics.admitted += 1
+                    self.metrics.wait_seconds += monotonic() - queued_at
+
+                    if self._parent:
+                        async with self._parent.turn():
+                            yield
+                    else:
+                        yield
+                finally:
+                    if self._slots:
+                        self._slots.release()
+            finally:
+                if conversation:
+                    conversation.lock.release()
+        finally:
+            if running:
+                self.metrics.running -= 1
+            else:
+                self.metrics.queued -= 1
+            self._exit(conversation_id, conversation)
+
+    def _enter(self, conversation_id: str) -> _Conversation:
+        conversation = self._conversations.get(conversation_id)
+
+        if self.max_queued is not None and self.metrics.queued >= self.max_queued:
+            self._reject(f"{self.metrics.queued} turns queued")
+        if (
+            conversation
+            and self.max_queued_per_conversation is not None
+            and conversation.turns > self.max_queued_per_conversation
+        ):
+            self._reject(f"{conversation.turns} turns of {conversation_id} queued")
+
+        if conversation_id is not None and not conversation:
+            conversation = _Conversation()
+            self._conversations[conversation_id] = conversation
+        if conversation:
+            conversation.turns += 1
+
+        self.metrics.queued += 1
+        self.metrics.max_queued = max(self.metrics.max_queued, self.metrics.queued)
+
+        return conversation
+
+    def _exit(self, conversation_id: str, conversation: _Conversation):
+        if conversation:
+            conversation.turns -= 1
+            if not conversation.turns:
+                del self._conversations[conversation_id]
+
+    def _reject(self, reason: str):
+        self.metrics.rejected += 1
+        raise TurnRejectedError(f"Turn rejected, {reason}")
@@ -0,0 +1,28 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+
+class TurnLimiterMetrics:
+    """Gauges and counters of the turns going through a TurnLimiter."""
+
+    def __init__(self):
+        self.running = 0
+        self.queued = 0
+        self.max_queued = 0
+        self.admitted = 0
+        self.rejected = 0
+        self.wait_seconds = 0.0
+
+    @property
+    def average_wait_seconds(self) -> float:
+        return self.wait_seconds / self.admitted if self.admitted else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "running": self.running,
+            "queued": self.queued,
+            "max_queued": self.max_queued,
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "average_wait_seconds": self.average_wait_seconds,
+        }
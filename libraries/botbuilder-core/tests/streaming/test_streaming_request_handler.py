@@ -1,12 +1,19 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # Licensed under the MIT License.
 
+import json
+from http import HTTPStatus
 from unittest.mock import Mock
 from typing import Any
+from uuid import uuid4
 
 import aiounittest
 
 from botbuilder.core.streaming import StreamingRequestHandler
+from botbuilder.schema import Activity, ConversationAccount, ModelCodec
+from botframework.streaming import ReceiveRequest
+from botframework.streaming.payloads import ContentStream
+from botframework.streaming.payloads.assemblers import PayloadStreamAssembler
 from botframework.streaming.transport.web_socket import (
     WebSocket,
     WebSocketState,
@@ -54,3 +61,52 @@ class TestStramingRequestHandler(aiounittest.AsyncTestCase):
         await sut.listen()
 
         assert mock_web_socket.receive_called
+
+    async def test_process_request_decodes_body_buffers(self):
+        received = []
+
+        class MockActivityProcessor:
+            async def process_streaming_activity(self, activity, bot_callback_handler):
+                received.append(activity)
+
+        body = (
+            b'\xef\xbb\xbf{"type": "message", "text": "hi", "serviceUrl": "urn:test", '
+        )
+        body += b'"conversation": {"id": "conversation"}}'
+        assembler = PayloadStreamAssembler(None, uuid4())
+        stream = assembler.get_payload_as_stream()
+        stream.give_buffer(body[:20])
+        stream.give_buffer(body[20:])
+        stream.done_producing()
+        request = ReceiveRequest(
+            verb="POST", streams=[ContentStream(assembler.identifier, assembler)]
+        )
+
+        sut = StreamingRequestHandler(Mock(), MockActivityProcessor(), MockWebSocket())
+        response = await sut.process_request(request, None, None)
+
+        self.assertEqual(HTTPStatus.OK, response.status_code)
+        self.assertEqual("hi", received[0].text)
+        self.assertEqual("conversation", received[0].conversation.id)
+        self.assertEqual("urn:test", sut.service_url)
+
+    async def test_send_activity_encodes_activity(self):
+        sent = []
+
+        async def mock_send(request):
+            sent.append(request)
+
+        sut = StreamingRequestHandler(Mock(), Mock(), MockWebSocket())
+        sut._server.send = mock_send  # pylint: disable=protected-access
+        activity = Activity(
+            type="message",
+            text="hi",
+            service_url="urn:test",
+            conversation=ConversationAccount(id="conversation"),
+        )
+        await sut.send_activity(activity)
+
+        body = json.loads(sent[0].streams[0].content)
+        self.assertEqual("/v3/conversations/conversation/activities", sent[0].path)
+        self.assertEqual(ModelCodec.get(Activity).serialize(activity), body)
+        self.assertEqual("urn:test", body["serviceUrl"])
@@ -0,0 +1,77 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+from unittest.mock import Mock
+
+import aiounittest
+
+from botbuilder.core import BotTelemetryClient
+from botbuilder.core.streaming import TelemetryStreamingMetricsSink
+from botframework.streaming import (
+    ReceiveRequest,
+    ReceiveResponse,
+    StreamingRequest,
+    StreamingResponse,
+)
+
+
+class TestTelemetryStreamingMetricsSink(aiounittest.AsyncTestCase):
+    def setUp(self):
+        self.client = Mock(spec=BotTelemetryClient)
+        self.sut = TelemetryStreamingMetricsSink(self.client, {"connection": "1"})
+
+    def test_tracks_requests_processed(self):
+        request = ReceiveRequest(verb="POST", path="/api/messages")
+        self.sut.on_request_processed(request, StreamingResponse.ok(), 0.25)
+
+        self.client.track_request.assert_called_once_with(
+            "POST /api/messages",
+            "/api/messages",
+            True,
+            duration=250,
+            response_code="200",
+            http_method="POST",
+            properties={"connection": "1"},
+        )
+
+    def test_tracks_responses_received_as_dependencies(self):
+        request = StreamingRequest.create_post("/v3/conversations")
+        error = TimeoutError()
+        self.sut.on_response_received(request, None, 1.0, error)
+
+        _, kwargs = self.client.track_dependency.call_args
+        self.assertFalse(kwargs["success"])
+        self.assertEqual(1000, kwargs["duration"])
+        self.assertEqual("TimeoutError()", kwargs["properties"]["error"])
+
+        self.sut.on_response_received(request, ReceiveResponse(status_code=503), 0.1)
+        _, kwargs = self.client.track_dependency.call_args
+        self.assertFalse(kwargs["success"])
+        self.assertEqual("503", kwargs["result_code"])
+
+    def test_tracks_flattened_metrics(self):
+        self.sut.on_metrics({"sent": {"packets": 3}, "open_streams": 1})
+
+        tracked = {
+            call.args[0]: call.args[1]
+            for call in self.client.track_metric.call_args_list
+        }
+        self.assertEqual(
+            {"Streaming.sent.packets": 3, "Streaming.open_streams": 1}, tracked
+        )
+
+    def test_tracks_disconnection_reason(self):
+        self.sut.on_disconnected("Payload too large")
+
+        self.client.track_event.assert_called_once_with(
+            "StreamingDisconnected",
+            {"connection": "1", "reason": "Payload too large"},
+        )
+        self.client.track_trace.assert_called_once()
+
+        self.client.reset_mock()
+        self.sut.on_disconnected(None)
+        self.client.track_event.assert_called_once_with(
+            "StreamingDisconnected", {"connection": "1"}
+        )
+        self.client.track_trace.assert_not_called()
@@ -0,0 +1,139 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+import asyncio
+import json
+from http import HTTPStatus
+from unittest.mock import Mock
+from uuid import uuid4
+
+import aiounittest
+
+from botbuilder.core.streaming import (
+    StreamingRequestHandler,
+    TurnLimiter,
+    TurnRejectedError,
+)
+from botframework.streaming import ReceiveRequest
+from botframework.streaming.payloads import ContentStream
+from botframework.streaming.payloads.assemblers import PayloadStreamAssembler
+
+
+class TestTurnLimiter(aiounittest.AsyncTestCase):
+    async def test_runs_turns_of_a_conversation_in_order(self):
+        sut = TurnLimiter()
+        events = []
+
+        async def turn(name: str, delay: float):
+            async with sut.turn("conversation"):
+                events.append(f"start {name}")
+                await asyncio.sleep(delay)
+                events.append(f"end {name}")
+
+        await asyncio.gather(turn("a", 0.02), turn("b", 0), turn("c", 0))
+
+        self.assertEqual(
+            ["start a", "end a", "start b", "end b", "start c", "end c"], events
+        )
+
+    async def test_limits_concurrent_turns(self):
+        sut = TurnLimiter(2)
+        running = 0
+        most_running = 0
+
+        async def turn(conversation_id: str):
+            nonlocal running, most_running
+            async with sut.turn(conversation_id):
+                running += 1
+                most_running = max(most_running, running)
+                await asyncio.sleep(0.01)
+                running -= 1
+
+        await asyncio.gather(*(turn(str(index)) for index in range(6)))
+
+        self.assertEqual(2, most_running)
+        self.assertEqual(6, sut.metrics.admitted)
+        self.assertEqual(4, sut.metrics.max_queued)
+        self.assertEqual(0, sut.metrics.running + sut.metrics.queued)
+
+    async def test_busy_conversation_does_not_take_all_slots(self):
+        sut = TurnLimiter(2)
+        started = []
+
+        async def turn(conversation_id: str):
+            async with sut.turn(conversation_id):
+                started.append(conversation_id)
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(*[turn("busy") for _ in range(5)], turn("quiet"))
+
+        # the quiet conversation runs alongside the first turn of the busy one
+        self.assertEqual(["busy", "quiet"], started[:2])
+
+    async def test_rejects_turns_over_the_queue_limits(self):
+        sut = TurnLimiter(1, max_queued=2, max_queued_per_conversation=1)
+        release = asyncio.Event()
+
+        async def turn(conversation_id: str):
+            async with sut.turn(conversation_id):
+                await release.wait()
+
+        tasks = [asyncio.ensure_future(turn("a")), asyncio.ensure_future(turn("a"))]
+        await asyncio.sleep(0)
+        with self.assertRaises(TurnRejectedError):
+            await turn("a")
+
+        tasks.append(asyncio.ensure_future(turn("b")))
+        await asyncio.sleep(0)
+        with self.assertRaises(TurnRejectedError):
+            await turn("c")
+
+        release.set()
+        await asyncio.gather(*tasks)
+        self.assertEqual(2, sut.metrics.rejected)
+        self.assertEqual(3, sut.metrics.admitted)
+
+    async def test_parent_limits_all_connections(self):
+        parent = TurnLimiter(1)
+        connections = [TurnLimiter(2, parent=parent), TurnLimiter(2, parent=parent)]
+        running = 0
+        most_running = 0
+
+        async def turn(sut: TurnLimiter, conversation_id: str):
+            nonlocal running, most_running
+            async with sut.turn(conversation_id):
+                running += 1
+                most_running = max(most_running, running)
+                await asyncio.sleep(0.01)
+                running -= 1
+
+        await asyncio.gather(
+            *(turn(sut, str(index)) for index in range(2) for sut in connections)
+        )
+
+        self.assertEqual(1, most_running)
+        self.assertEqual(4, parent.metrics.admitted)
+
+
+class TestStreamingRequestHandlerTurnLimiter(aiounittest.AsyncTestCase):
+    async def test_rejected_turn_is_service_unavailable(self):
+        activity = {
+            "type": "message",
+            "serviceUrl": "urn:test:streaming",
+            "conversation": {"id": "conversation"},
+        }
+        body = json.dumps(activity).encode()
+        assembler = PayloadStreamAssembler(None, uuid4(), length=len(body))
+        assembler.get_payload_as_stream().give_buffer(body)
+        request = ReceiveRequest(
+            verb="POST",
+            path="/api/messages",
+            streams=[ContentStream(assembler.identifier, assembler)],
+        )
+
+        limiter = TurnLimiter(max_queued=0)
+        sut = StreamingRequestHandler(Mock(), Mock(), Mock(), turn_limiter=limiter)
+        response = await sut.process_request(request, None, None)
+
+        self.assertEqual(HTTPStatus.SERVICE_UNAVAILABLE, response.status_code)
+        self.assertEqual(1, limiter.metrics.rejected)
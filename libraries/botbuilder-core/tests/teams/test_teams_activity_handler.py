@@ -13,6 +13,8 @@ from botbuilder.schema import (
     ChannelAccount,
     ConversationAccount,
     ConversationReference,
+    LazyActivity,
+    ModelCodec,
     ResourceResponse,
 )
 from botbuilder.schema.teams import (
@@ -601,6 +603,39 @@ class TestTeamsActivityHandler(aiounittest.AsyncTestCase):
         assert bot.record[0] == "on_conversation_update_activity"
         assert bot.record[1] == "on_teams_members_added"
 
+    async def test_on_teams_members_added_lazy_activity(self):
+        # arrange
+        activity = ModelCodec.get(LazyActivity).deserialize(
+            {
+                "type": "conversationUpdate",
+                "channelData": {
+                    "eventType": "teamMemberAdded",
+                    "team": {"id": "team_id_1", "name": "new_team_name"},
+                },
+                "membersAdded": [
+                    {
+                        "id": "123",
+                        "name": "test_user",
+                        "aadObjectId": "asdfqwerty",
+                        "role": "tester",
+                    }
+                ],
+                "channelId": Channels.ms_teams,
+                "conversation": {"id": "456"},
+            }
+        )
+
+        turn_context = TurnContext(SimpleAdapter(), activity)
+
+        # Act
+        bot = TestingTeamsActivityHandler()
+        await bot.on_turn(turn_context)
+
+        # Assert
+        assert len(bot.record) == 2
+        assert bot.record[0] == "on_conversation_update_activity"
+        assert bot.record[1] == "on_teams_members_added"
+
     async def test_bot_on_teams_members_added_activity(self):
         # arrange
         activity = Activity(
@@ -0,0 +1,181 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+from unittest.mock import MagicMock
+
+import aiounittest
+
+from botbuilder.core import (
+    BotTelemetryClient,
+    SamplingTelemetryClient,
+    Severity,
+    TurnContext,
+)
+from botbuilder.core.adapters import TestAdapter
+from botbuilder.core.bot_telemetry_client import TelemetryDataPointType
+from botbuilder.schema import Activity, ActivityTypes, ConversationAccount
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def sampled_conversations(client: SamplingTelemetryClient, name: str, count: int):
+    return {
+        f"conversation{i}"
+        for i in range(count)
+        if client.is_sampled(name, {"conversationId": f"conversation{i}"})
+    }
+
+
+class TestSamplingTelemetryClient(aiounittest.AsyncTestCase):
+    def setUp(self):
+        self.inner = MagicMock(spec=BotTelemetryClient)
+
+    def test_forwards_everything_by_default(self):
+        client = SamplingTelemetryClient(self.inner)
+
+        client.track_event("BotMessageReceived", {"conversationId": "a"})
+        client.track_trace("trace")
+
+        self.inner.track_event.assert_called_once_with(
+            "BotMessageReceived", properties={"conversationId": "a"}, measurements=None
+        )
+        self.inner.track_trace.assert_called_once_with("trace", None, None)
+
+    def test_sampling_rate_per_event_name(self):
+        client = SamplingTelemetryClient(
+            self.inner, sampling_rates={"BotMessageSend": 0.25, "Dropped": 0}
+        )
+
+        kept = sampled_conversations(client, "BotMessageSend", 4000)
+
+        self.assertAlmostEqual(0.25, len(kept) / 4000, delta=0.03)
+        self.assertEqual(4000, len(sampled_conversations(client, "Other", 4000)))
+        self.assertEqual(0, len(sampled_conversations(client, "Dropped", 4000)))
+
+    def test_sampling_is_deterministic_per_conversation(self):
+        client = SamplingTelemetryClient(
+            self.inner, sampling_rates={"BotMessageReceived": 0.1, "WaterfallStep": 0.3}
+        )
+
+        received = sampled_conversations(client, "BotMessageReceived", 1000)
+
+        self.assertEqual(
+            received, sampled_conversations(client, "BotMessageReceived", 1000)
+        )
+        self.assertTrue(
+            received.issubset(sampled_conversations(client, "WaterfallStep", 1000))
+        )
+
+    async def test_conversation_from_turn_when_not_in_properties(self):
+        client = SamplingTelemetryClient(self.inner, default_sampling_rate=0.5)
+        expected = client.is_sampled("WaterfallStep", {"conversationId": "convo1"})
+        context = TurnContext(
+            TestAdapter(),
+            Activity(
+                type=ActivityTypes.message,
+                conversation=ConversationAccount(id="convo1"),
+            ),
+        )
+        decisions = []
+
+        async def logic():
+            for _ in range(10):
+                decisions.append(client.is_sampled("WaterfallStep", {"StepName": "x"}))
+
+        await client.on_turn(context, logic)
+
+        self.assertEqual([expected] * 10, decisions)
+
+    def test_errors_are_never_sampled_out(self):
+        client = SamplingTelemetryClient(self.inner, default_sampling_rate=0)
+
+        client.track_exception(ValueError, ValueError("boom"))
+        client.track_trace("bad", severity=Severity.error)
+        client.track_trace("chatty", severity=Severity.information)
+        client.track_request("POST /api/messages", "url", False, duration=10)
+        client.track_request("POST /api/messages", "url", True, duration=10)
+        client.track_dependency("LUIS", "data", success=False)
+        client.track_metric("metric", 1.0)
+
+        self.inner.track_exception.assert_called_once()
+        self.inner.track_trace.assert_called_once_with("bad", None, Severity.error)
+        self.inner.track_request.assert_called_once()
+        self.inner.track_dependency.assert_called_once()
+        self.inner.track_metric.assert_called_once()
+
+    def test_aggregates_counts_and_latency_per_dimension(self):
+        clock = FakeClock()
+        client = SamplingTelemetryClient(
+            self.inner,
+            sampling_rates={"LuisResult": 0},
+            aggregated_events={"LuisResult": ["intent"]},
+            latency_buckets=[100, 500],
+            flush_interval=60,
+            clock=clock,
+        )
+
+        for latency in (50, 150, 700):
+            client.track_event(
+                "LuisResult", {"intent": "BookFlight"}, {"duration": latency}
+            )
+        client.track_event("LuisResult", {"intent": "Cancel"})
+        self.inner.track_event.assert_not_called()
+        self.inner.track_metric.assert_not_called()
+
+        clock.now = 61
+        client.track_event("LuisResult", {"intent": "Cancel"})
+
+        metrics = {
+            (call.args[0], call.kwargs.get("properties", call.args[-1])["intent"]): call
+            for call in self.inner.track_metric.call_args_list
+        }
+        self.assertEqual(
+            {
+                ("LuisResult.count", "BookFlight"),
+                ("LuisResult.latency", "BookFlight"),
+                ("LuisResult.count", "Cancel"),
+            },
+            set(metrics),
+        )
+        self.assertEqual(3, metrics[("LuisResult.count", "BookFlight")].args[1])
+        self.assertEqual(2, metrics[("LuisResult.count", "Cancel")].args[1])
+
+        name, total, tel_type, count, min_val, max_val, _, histogram = metrics[
+            ("LuisResult.latency", "BookFlight")
+        ].args
+        self.assertEqual("LuisResult.latency", name)
+        self.assertEqual(900, total)
+        self.assertEqual(TelemetryDataPointType.aggregation, tel_type)
+        self.assertEqual((3, 50, 700), (count, min_val, max_val))
+        self.assertEqual(
+            {"intent": "BookFlight", "le100": 1, "le500": 1, "+Inf": 1}, histogram
+        )
+
+    def test_flush_sends_aggregates_and_flushes_inner_client(self):
+        # ApplicationInsightsTelemetryClient and friends add flush() to the interface.
+        self.inner = MagicMock()
+        client = SamplingTelemetryClient(
+            self.inner, aggregated_events={"WaterfallStep": ["DialogId", "StepName"]}
+        )
+
+        client.track_event(
+            "WaterfallStep", {"DialogId": "BookingDialog", "StepName": "destination"}
+        )
+        client.flush()
+
+        self.inner.track_metric.assert_called_once_with(
+            "WaterfallStep.count",
+            1,
+            TelemetryDataPointType.aggregation,
+            properties={"DialogId": "BookingDialog", "StepName": "destination"},
+        )
+        self.inner.flush.assert_called_once()
+
+        client.flush()
+        self.inner.track_metric.assert_called_once()
@@ -10,7 +10,9 @@ from botbuilder.schema import (
     ChannelAccount,
     ConversationAccount,
     Entity,
+    LazyActivity,
     Mention,
+    ModelCodec,
     ResourceResponse,
 )
 from botbuilder.core import BotAdapter, MessageFactory, TurnContext
@@ -350,6 +352,27 @@ class TestBotContext(aiounittest.AsyncTestCase):
         assert text == " test activity"
         assert activity.text == " test activity"
 
+    def test_should_remove_at_mention_from_lazy_activity(self):
+        activity = ModelCodec.get(LazyActivity).deserialize(
+            {
+                "type": "message",
+                "text": "<at>TestOAuth619</at> test activity",
+                "recipient": {"id": "TestOAuth619"},
+                "entities": [
+                    {
+                        "type": "mention",
+                        "text": "<at>TestOAuth619</at>",
+                        "mentioned": {"name": "Bot", "id": "TestOAuth619"},
+                    }
+                ],
+            }
+        )
+
+        text = TurnContext.remove_recipient_mention(activity)
+
+        assert text == " test activity"
+        assert activity.text == " test activity"
+
     async def test_should_send_a_trace_activity(self):
         context = TurnContext(SimpleAdapter(), ACTIVITY)
         called = False
@@ -0,0 +1,127 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+"""
+Size and pickling time of the dialog state of a deep stack of component dialogs,
+such as a flight booking dialog running a resolver dialog that prompts, with
+DialogStateCodec disabled (legacy) and enabled (compact):
+
+    python benchmarks/bench_dialog_state.py [--number N] [--depth N]
+"""
+
+import argparse
+import asyncio
+import timeit
+
+import jsonpickle
+
+from botbuilder.core import ConversationState, MemoryStorage, MessageFactory
+from botbuilder.core.adapters import TestAdapter
+from botbuilder.dialogs import (
+    ComponentDialog,
+    DialogSet,
+    DialogStateCodec,
+    WaterfallDialog,
+    WaterfallStepContext,
+)
+from botbuilder.dialogs.choices import Choice
+from botbuilder.dialogs.prompts import ChoicePrompt, PromptOptions, TextPrompt
+
+
+class ResolverDialog(ComponentDialog):
+    def __init__(self, dialog_id: str, child: ComponentDialog = None):
+        super().__init__(dialog_id)
+        self._child_id = child.id if child else None
+        if child:
+            self.add_dialog(child)
+        self.add_dialog(TextPrompt(TextPrompt.__name__))
+        self.add_dialog(ChoicePrompt(ChoicePrompt.__name__))
+        self.add_dialog(
+            WaterfallDialog(WaterfallDialog.__name__, [self.ask_step, self.end_step])
+        )
+        self.initial_dialog_id = WaterfallDialog.__name__
+
+    async def ask_step(self, step_context: WaterfallStepContext):
+        step_context.values["asked"] = self.id
+        if self._child_id:
+            return await step_context.begin_dialog(
+                self._child_id, {"origin": "Paris", "adults": 2}
+            )
+        return await step_context.prompt(
+            ChoicePrompt.__name__,
+            PromptOptions(
+                prompt=MessageFactory.text(
+                    "Which class would you like to travel in?", input_hint=None
+                ),
+                retry_prompt=MessageFactory.text(
+                    "Please pick one of economy, business or first.", input_hint=None
+                ),
+                choices=[
+                    Choice("Economy", synonyms=["eco", "cheapest"]),
+                    Choice("Business"),
+                    Choice("First", synonyms=["first class"]),
+                ],
+            ),
+        )
+
+    async def end_step(self, step_context: WaterfallStepContext):
+        return await step_context.end_dialog(step_context.result)
+
+
+async def build_dialog_state(depth: int):
+    dialog = None
+    for level in reversed(range(depth)):
+        dialog = ResolverDialog(f"ResolverDialog{level}", dialog)
+
+    conversation_state = ConversationState(MemoryStorage())
+    accessor = conversation_state.create_property("DialogState")
+    dialogs = DialogSet(accessor)
+    dialogs.add(dialog)
+
+    captured = []
+
+    async def logic(turn_context):
+        dialog_context = await dialogs.create_context(turn_context)
+        await dialog_context.begin_dialog(dialog.id)
+        captured.append(await accessor.get(turn_context))
+
+    await TestAdapter(logic).send("book a flight")
+    return captured[0]
+
+
+def measure(dialog_state, number: int):
+    encoded = jsonpickle.encode(dialog_state)
+    encode_time = timeit.timeit(lambda: jsonpickle.encode(dialog_state), number=number)
+    decode_time = timeit.timeit(lambda: jsonpickle.decode(encoded), number=number)
+    return len(encoded), encode_time / number * 1e6, decode_time / number * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--number", type=int, default=500)
+    parser.add_argument("--depth", type=int, default=3)
+    args = parser.parse_args()
+
+    for depth in sorted({1, args.depth, args.depth * 2}):
+        dialog_state = asyncio.run(build_dialog_state(depth))
+
+        enabled = DialogStateCodec.enabled
+        try:
+            DialogStateCodec.enabled = False
+            legacy = measure(dialog_state, args.number)
+            DialogStateCodec.enabled = True
+            compact = measure(dialog_state, args.number)
+        finally:
+            DialogStateCodec.enabled = enabled
+
+        print(
+            f"depth {depth:2}   legacy {legacy[0]:7} bytes"
+            f" encode {legacy[1]:8.1f} us decode {legacy[2]:8.1f} us"
+            f"   compact {compact[0]:6} bytes"
+            f" encode {compact[1]:8.1f} us decode {compact[2]:8.1f} us"
+            f"   x{legacy[0] / compact[0]:5.1f} smaller"
+        )
+
+
+if __name__ == "__main__":
+    main()
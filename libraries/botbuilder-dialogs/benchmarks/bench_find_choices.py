@@ -0,0 +1,77 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+"""
+Microbenchmark of Find.find_choices over a large choice list with synonyms, such
+as an airport picker, with the ChoiceIndex cache enabled and disabled:
+
+    python benchmarks/bench_find_choices.py [--number N] [--choices N]
+"""
+
+import argparse
+import random
+import timeit
+
+from botbuilder.dialogs.choices import Choice, ChoiceIndex, Find
+
+SYLLABLES = ["san", "new", "ber", "lin", "par", "is", "to", "ky", "o", "mad", "rid"]
+
+UTTERANCES = [
+    "I want to fly from berlin to paris next week",
+    "new york",
+    "something completely different",
+]
+
+
+def airport_choices(count: int):
+    rng = random.Random(0)
+    choices = []
+    for i in range(count):
+        city = " ".join(
+            "".join(rng.choices(SYLLABLES, k=rng.randint(1, 3)))
+            for _ in range(rng.randint(1, 2))
+        )
+        code = "".join(rng.choices("ABCDEFGHIJKLMNOPQRSTUVWXYZ", k=3))
+        choices.append(
+            Choice(
+                value=f"{city} {i}",
+                synonyms=[code, f"{city} airport", f"{city} international"],
+            )
+        )
+    choices[0] = Choice("Berlin", synonyms=["BER", "berlin brandenburg"])
+    choices[1] = Choice("Paris", synonyms=["CDG", "ORY", "paris charles de gaulle"])
+    choices[2] = Choice("New York", synonyms=["JFK", "NYC", "new york city"])
+    return choices
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--number", type=int, default=50)
+    parser.add_argument("--choices", type=int, default=300)
+    args = parser.parse_args()
+    number = args.number
+    choices = airport_choices(args.choices)
+
+    for utterance in UTTERANCES:
+        cache_size = ChoiceIndex.max_cache_size
+        ChoiceIndex.max_cache_size = 0
+        ChoiceIndex.clear_cache()
+        uncached = timeit.timeit(
+            lambda: Find.find_choices(utterance, choices),  # pylint: disable=W0640
+            number=number,
+        )
+        ChoiceIndex.max_cache_size = cache_size
+        Find.find_choices(utterance, choices)
+        cached = timeit.timeit(
+            lambda: Find.find_choices(utterance, choices),  # pylint: disable=W0640
+            number=number,
+        )
+        print(
+            f"{utterance!r:<48} rebuilt {uncached / number * 1e3:8.2f} ms"
+            f"   cached {cached / number * 1e3:8.2f} ms"
+            f"   x{uncached / cached:6.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+"""
+Microbenchmark of ObjectPath over memory-like paths, parsing every call against
+the cache of compiled paths:
+
+    python benchmarks/bench_object_path.py [--number N]
+"""
+
+import argparse
+import timeit
+
+from botbuilder.dialogs import ObjectPath
+
+MEMORY = {
+    "dialog": {"_tracker": {"paths": {"user_name": 3}}, "index": 1},
+    "turn": {
+        "activity": {"text": "book a flight", "from": {"id": "user1"}},
+        "recognized": {"entities": {"city": ["Paris", "Berlin"]}},
+    },
+    "user": {"profile": {"name": "bill"}},
+}
+
+PATHS = [
+    "dialog._tracker.paths",
+    "turn.activity.from.id",
+    "turn.recognized.entities.city[dialog.index]",
+    "user.profile.name",
+]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--number", type=int, default=20000)
+    number = parser.parse_args().number
+
+    for path in PATHS:
+
+        def parsed():
+            ObjectPath.clear_cache()
+            ObjectPath.try_get_path_value(MEMORY, path)  # pylint: disable=W0640
+
+        parsed_time = timeit.timeit(parsed, number=number)
+        clear_time = timeit.timeit(ObjectPath.clear_cache, number=number)
+        cached_time = timeit.timeit(
+            lambda: ObjectPath.try_get_path_value(
+                MEMORY, path
+            ),  # pylint: disable=W0640
+            number=number,
+        )
+        parsed_time -= clear_time
+        print(
+            f"{path!r:<48} parsed {parsed_time / number * 1e6:6.2f} us"
+            f"   cached {cached_time / number * 1e6:6.2f} us"
+            f"   x{parsed_time / cached_time:5.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+"""
+Microbenchmark of the shared RecognizerModels against the Recognizers-Text
+functions the prompts used to call, over utterances of the flight booking flow:
+
+    python benchmarks/bench_recognizer_models.py [--number N] [--culture en-us]
+"""
+
+import argparse
+import time
+import timeit
+
+from recognizers_choice import recognize_boolean
+from recognizers_date_time import recognize_datetime
+from recognizers_number import recognize_number, recognize_ordinal
+
+from botbuilder.dialogs.choices import RecognizerModels
+
+UTTERANCES = {
+    RecognizerModels.NUMBER: (recognize_number, ["2", "I need 3 seats"]),
+    RecognizerModels.ORDINAL: (recognize_ordinal, ["the second one"]),
+    RecognizerModels.DATETIME: (
+        recognize_datetime,
+        ["tomorrow", "next friday", "on march 3rd 2022"],
+    ),
+    RecognizerModels.BOOLEAN: (recognize_boolean, ["yes", "no thanks"]),
+}
+
+
+def main():
+    # pylint: disable=cell-var-from-loop
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--number", type=int, default=200)
+    parser.add_argument("--culture", default="en-us")
+    args = parser.parse_args()
+    number, culture = args.number, args.culture
+
+    start = time.perf_counter()
+    RecognizerModels.warm_up([culture])
+    print(f"warm_up({culture!r}) {(time.perf_counter() - start) * 1e3:.1f} ms\n")
+
+    for kind, (recognize, utterances) in UTTERANCES.items():
+        for utterance in utterances:
+            model = RecognizerModels.get_model(kind, culture)
+            function_time = timeit.timeit(
+                lambda: recognize(utterance, culture), number=number
+            )
+            shared_time = timeit.timeit(lambda: model.parse(utterance), number=number)
+            print(
+                f"{kind:<9}{utterance!r:<22}"
+                f" recognize_* {function_time / number * 1e6:9.1f} us"
+                f"   shared {shared_time / number * 1e6:9.1f} us"
+                f"   x{function_time / shared_time:5.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
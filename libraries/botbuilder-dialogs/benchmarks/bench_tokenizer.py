@@ -0,0 +1,49 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+"""
+Throughput of Tokenizer.fast_tokenizer against Tokenizer.default_tokenizer:
+
+    python benchmarks/bench_tokenizer.py [--number N]
+"""
+
+import argparse
+import timeit
+
+from botbuilder.dialogs.choices import Tokenizer
+
+TEXTS = {
+    "short": "book a flight",
+    "utterance": "I'd like to book a flight from Paris to Berlin next Friday, please!",
+    "emoji": "yes 👍 that works 🎉🎉 see you in München",
+    "paragraph": " ".join(
+        ["The quick brown fox jumps over the lazy dog; it's 10:30 a.m."] * 20
+    ),
+}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--number", type=int, default=2000)
+    number = parser.parse_args().number
+
+    for name, text in TEXTS.items():
+        default_time = timeit.timeit(
+            lambda: Tokenizer.default_tokenizer(text),  # pylint: disable=W0640
+            number=number,
+        )
+        fast_time = timeit.timeit(
+            lambda: Tokenizer.fast_tokenizer(text),  # pylint: disable=W0640
+            number=number,
+        )
+        chars = len(text) * number
+        print(
+            f"{name:<10} {len(text):5} chars"
+            f"   default {chars / default_time / 1e6:6.2f} Mchar/s"
+            f"   fast {chars / fast_time / 1e6:6.2f} Mchar/s"
+            f"   x{default_time / fast_time:5.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
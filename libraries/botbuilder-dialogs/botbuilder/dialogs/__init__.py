@@ -13,12 +13,14 @@ from .dialog_event import DialogEvent
 from .dialog_events import DialogEvents
 from .dialog_instance import DialogInstance
 from .dialog_reason import DialogReason
+from .dialog_registry import DialogRegistry
 from .dialog_set import DialogSet
 from .dialog_state import DialogState
 from .dialog_turn_result import DialogTurnResult
 from .dialog_turn_status import DialogTurnStatus
 from .dialog_manager import DialogManager
 from .dialog_manager_result import DialogManagerResult
+from .dialog_profiler import DialogProfiler, DialogProfileSpan, DialogTurnProfile
 from .dialog import Dialog
 from .dialogs_component_registration import DialogsComponentRegistration
 from .persisted_state_keys import PersistedStateKeys
@@ -30,6 +32,7 @@ from .prompts import *
 from .choices import *
 from .skills import *
 from .object_path import ObjectPath
+from .dialog_state_codec import DialogStateCodec
 
 __all__ = [
     "ComponentDialog",
@@ -39,12 +42,17 @@ __all__ = [
     "DialogEvents",
     "DialogInstance",
     "DialogReason",
+    "DialogRegistry",
     "DialogSet",
     "DialogState",
+    "DialogStateCodec",
     "DialogTurnResult",
     "DialogTurnStatus",
     "DialogManager",
     "DialogManagerResult",
+    "DialogProfiler",
+    "DialogProfileSpan",
+    "DialogTurnProfile",
     "Dialog",
     "DialogsComponentRegistration",
     "WaterfallDialog",
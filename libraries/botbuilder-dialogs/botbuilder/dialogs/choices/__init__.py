@@ -9,6 +9,7 @@ from .channel import Channel
 from .choice import Choice
 from .choice_factory_options import ChoiceFactoryOptions
 from .choice_factory import ChoiceFactory
+from .choice_index import ChoiceIndex
 from .choice_recognizers import ChoiceRecognizers
 from .find import Find
 from .find_choices_options import FindChoicesOptions, FindValuesOptions
@@ -16,6 +17,7 @@ from .found_choice import FoundChoice
 from .found_value import FoundValue
 from .list_style import ListStyle
 from .model_result import ModelResult
+from .recognizer_models import RecognizerModels
 from .sorted_value import SortedValue
 from .token import Token
 from .tokenizer import Tokenizer
@@ -25,6 +27,7 @@ __all__ = [
     "Choice",
     "ChoiceFactory",
     "ChoiceFactoryOptions",
+    "ChoiceIndex",
     "ChoiceRecognizers",
     "Find",
     "FindChoicesOptions",
@@ -32,6 +35,7 @@ __all__ = [
     "FoundChoice",
     "ListStyle",
     "ModelResult",
+    "RecognizerModels",
     "SortedValue",
     "Token",
     "Tokenizer",
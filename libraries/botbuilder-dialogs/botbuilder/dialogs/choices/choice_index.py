@@ -0,0 +1,197 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+from bisect import bisect_left
+from collections import OrderedDict
+from threading import Lock
+from typing import Callable, Dict, List, Tuple, Union
+
+from .found_value import FoundValue
+from .model_result import ModelResult
+from .sorted_value import SortedValue
+from .token import Token
+
+
+class ChoiceIndex:
+    """
+    Pre-tokenized list of values searched by :meth:`Find.find_values`.
+
+    The values are sorted and tokenized once, and an inverted index maps every
+    normalized token to the values containing it. Matching an utterance then only
+    visits the values sharing at least one token with it, and finds token positions
+    by bisection instead of scanning. Results and scores are the same as matching
+    every value in turn.
+
+    Use :meth:`get` to share the index of identical value lists, such as the choices
+    of a prompt that is re-prompted or active in many conversations.
+    """
+
+    _cache: "OrderedDict[tuple, ChoiceIndex]" = OrderedDict()
+    _cache_lock = Lock()
+    max_cache_size: int = 256
+
+    def __init__(
+        self,
+        values: List[SortedValue],
+        tokenizer: Callable[[str, str], List[Token]],
+        locale: str = None,
+    ):
+        """
+        Parameters:
+        -----------
+
+        values: The values to search for, with the index reported for each of them.
+
+        tokenizer: Tokenizer used for the values. It must be the one used for utterances.
+
+        locale: (Optional) locale passed to the tokenizer.
+        """
+        # Longest values first, so they win overlaps against their own substrings.
+        sorted_values = sorted(
+            values, key=lambda sorted_val: len(sorted_val.value), reverse=True
+        )
+
+        self._entries: List[Tuple[int, str, Tuple[str, ...]]] = []
+        self._postings: Dict[str, List[int]] = {}
+        for position, entry in enumerate(sorted_values):
+            normalized = tuple(
+                token.normalized for token in tokenizer(entry.value.strip(), locale)
+            )
+            self._entries.append((entry.index, entry.value, normalized))
+            for token in set(normalized):
+                self._postings.setdefault(token, []).append(position)
+
+    @staticmethod
+    def get(
+        values: List[SortedValue],
+        tokenizer: Callable[[str, str], List[Token]],
+        locale: str = None,
+    ) -> "ChoiceIndex":
+        """
+        Gets the index of a list of values, building it if no identical list was
+        indexed recently with the same tokenizer and locale.
+        """
+        key = (
+            tuple((value.value, value.index) for value in values),
+            tokenizer,
+            locale,
+        )
+        with ChoiceIndex._cache_lock:
+            index = ChoiceIndex._cache.get(key)
+            if index is not None:
+                ChoiceIndex._cache.move_to_end(key)
+                return index
+
+        index = ChoiceIndex(values, tokenizer, locale)
+        with ChoiceIndex._cache_lock:
+            ChoiceIndex._cache[key] = index
+            while len(ChoiceIndex._cache) > ChoiceIndex.max_cache_size:
+                ChoiceIndex._cache.popitem(last=False)
+        return index
+
+    @staticmethod
+    def clear_cache():
+        """Drops the shared indexes."""
+        with ChoiceIndex._cache_lock:
+            ChoiceIndex._cache.clear()
+
+    def match(
+        self, tokens: List[Token], max_distance: int, allow_partial_matches: bool
+    ) -> List[ModelResult]:
+        """
+        Finds every match of the indexed values in the tokens of an utterance.
+
+        The matches are returned in the order values are searched, with token
+        positions as start and end.
+        """
+        positions: Dict[str, List[int]] = {}
+        for i, token in enumerate(tokens):
+            positions.setdefault(token.normalized, []).append(i)
+
+        candidates = set()
+        for token in positions:
+            candidates.update(self._postings.get(token, ()))
+
+        matches: List[ModelResult] = []
+        token_count = len(tokens)
+        for candidate in sorted(candidates):
+            index, value, searched = self._entries[candidate]
+
+            # To match "last one" in "the last time I chose the last one" the
+            # utterance is searched again from the end of the previous match.
+            start_pos = 0
+            while start_pos < token_count:
+                match = ChoiceIndex._match_value(
+                    positions,
+                    searched,
+                    max_distance,
+                    allow_partial_matches,
+                    index,
+                    value,
+                    start_pos,
+                )
+                if match is None:
+                    break
+                start_pos = match.end + 1
+                matches.append(match)
+
+        return matches
+
+    @staticmethod
+    def _match_value(
+        positions: Dict[str, List[int]],
+        searched: Tuple[str, ...],
+        max_distance: int,
+        allow_partial_matches: bool,
+        index: int,
+        value: str,
+        start_pos: int,
+    ) -> Union[ModelResult, None]:
+        # Match value to utterance and calculate total deviation.
+        # - The tokens are matched in order so "second last" will match in
+        #   "the second from last one" but not in "the last from the second one".
+        # - The total deviation is a count of the number of tokens skipped in the
+        #   match so for the example above the number of tokens matched would be
+        #   2 and the total deviation would be 1.
+        # - The positions of each token are sorted, so the first one at or after
+        #   start_pos is found by bisection.
+        matched = 0
+        total_deviation = 0
+        start = -1
+        end = -1
+
+        for token in searched:
+            token_positions = positions.get(token)
+            if not token_positions:
+                continue
+            i = bisect_left(token_positions, start_pos)
+            if i == len(token_positions):
+                continue
+            pos = token_positions[i]
+
+            distance = pos - start_pos if matched > 0 else 0
+            if distance <= max_distance:
+                matched += 1
+                total_deviation += distance
+                start_pos = pos + 1
+                if start < 0:
+                    start = pos
+                end = pos
+
+        # Score the match: the percentage of tokens matched (completeness),
+        # reduced by the tokens skipped in the utterance (accuracy). The start &
+        # end positions and the text field are corrected by the caller.
+        if matched > 0 and (matched == len(searched) or allow_partial_matches):
+            completeness = matched / len(searched)
+            accuracy = float(matched) / (matched + total_deviation)
+            return ModelResult(
+                text="",
+                start=start,
+                end=end,
+                type_name="value",
+                resolution=FoundValue(
+                    value=value, index=index, score=completeness * accuracy
+                ),
+            )
+
+        return None
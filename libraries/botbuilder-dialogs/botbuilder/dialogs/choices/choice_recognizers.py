@@ -2,7 +2,7 @@
 # Licensed under the MIT License.
 
 from typing import List, Union
-from recognizers_number import NumberModel, NumberRecognizer, OrdinalModel
+from recognizers_number import NumberModel, OrdinalModel
 from recognizers_text import Culture
 
 
@@ -11,6 +11,7 @@ from .find import Find
 from .find_choices_options import FindChoicesOptions
 from .found_choice import FoundChoice
 from .model_result import ModelResult
+from .recognizer_models import RecognizerModels
 
 
 class ChoiceRecognizers:
@@ -90,7 +91,7 @@ class ChoiceRecognizers:
 
     @staticmethod
     def _recognize_ordinal(utterance: str, culture: str) -> List[ModelResult]:
-        model: OrdinalModel = NumberRecognizer(culture).get_ordinal_model(culture)
+        model: OrdinalModel = RecognizerModels.get_ordinal_model(culture)
 
         return list(
             map(ChoiceRecognizers._found_choice_constructor, model.parse(utterance))
@@ -122,7 +123,7 @@ class ChoiceRecognizers:
 
     @staticmethod
     def _recognize_number(utterance: str, culture: str) -> List[ModelResult]:
-        model: NumberModel = NumberRecognizer(culture).get_number_model(culture)
+        model: NumberModel = RecognizerModels.get_number_model(culture)
 
         return list(
             map(ChoiceRecognizers._found_choice_constructor, model.parse(utterance))
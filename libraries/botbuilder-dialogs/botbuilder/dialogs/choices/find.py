@@ -4,9 +4,9 @@
 from typing import Callable, List, Union
 
 from .choice import Choice
+from .choice_index import ChoiceIndex
 from .find_choices_options import FindChoicesOptions, FindValuesOptions
 from .found_choice import FoundChoice
-from .found_value import FoundValue
 from .model_result import ModelResult
 from .sorted_value import SortedValue
 from .token import Token
@@ -84,13 +84,9 @@ class Find:
     def find_values(
         utterance: str, values: List[SortedValue], options: FindValuesOptions = None
     ) -> List[ModelResult]:
-        # Sort values in descending order by length, so that the longest value is searchd over first.
-        sorted_values = sorted(
-            values, key=lambda sorted_val: len(sorted_val.value), reverse=True
-        )
-
         # Search for each value within the utterance.
-        matches: [ModelResult] = []
+        # - The values are tokenized and indexed once per distinct list (see ChoiceIndex), and
+        #   only the values sharing a token with the utterance are searched, longest first.
         opt = options if options else FindValuesOptions()
         tokenizer: Callable[[str, str], List[Token]] = (
             opt.tokenizer if opt.tokenizer else Tokenizer.default_tokenizer
@@ -99,32 +95,9 @@ class Find:
         max_distance = (
             opt.max_token_distance if opt.max_token_distance is not None else 2
         )
-
-        for entry in sorted_values:
-
-            # Find all matches for a value
-            # - To match "last one" in "the last time I chose the last one" we need
-            #   to re-search the string starting from the end of the previous match.
-            # - The start & end position returned for the match are token positions.
-            start_pos = 0
-            searched_tokens = tokenizer(entry.value.strip(), opt.locale)
-
-            while start_pos < len(tokens):
-                match: Union[ModelResult, None] = Find._match_value(
-                    tokens,
-                    max_distance,
-                    opt,
-                    entry.index,
-                    entry.value,
-                    searched_tokens,
-                    start_pos,
-                )
-
-                if match is not None:
-                    start_pos = match.end + 1
-                    matches.append(match)
-                else:
-                    break
+        matches: [ModelResult] = ChoiceIndex.get(values, tokenizer, opt.locale).match(
+            tokens, max_distance, opt.allow_partial_matches
+        )
 
         # Sort matches by score descending
         sorted_matches = sorted(
@@ -166,83 +139,3 @@ class Find:
 
         # Return the results sorted by position in the utterance
         return sorted(results, key=lambda model_result: model_result.start)
-
-    @staticmethod
-    def _match_value(
-        source_tokens: List[Token],
-        max_distance: int,
-        options: FindValuesOptions,
-        index: int,
-        value: str,
-        searched_tokens: List[Token],
-        start_pos: int,
-    ) -> Union[ModelResult, None]:
-        # Match value to utterance and calculate total deviation.
-        # - The tokens are matched in order so "second last" will match in
-        #   "the second from last one" but not in "the last from the second one".
-        # - The total deviation is a count of the number of tokens skipped in the
-        #   match so for the example above the number of tokens matched would be
-        #   2 and the total deviation would be 1.
-        matched = 0
-        total_deviation = 0
-        start = -1
-        end = -1
-
-        for token in searched_tokens:
-            # Find the position of the token in the utterance.
-            pos = Find._index_of_token(source_tokens, token, start_pos)
-            if pos >= 0:
-                # Calculate the distance between the current token's position and the previous token's distance.
-                distance = pos - start_pos if matched > 0 else 0
-                if distance <= max_distance:
-                    # Update count of tokens matched and move start pointer to search for next token
-                    # after the current token
-                    matched += 1
-                    total_deviation += distance
-                    start_pos = pos + 1
-
-                    # Update start & end position that will track the span of the utterance that's matched.
-                    if start < 0:
-                        start = pos
-
-                    end = pos
-
-        # Calculate score and format result
-        # - The start & end positions and the results text field will be corrected by the caller.
-        result: ModelResult = None
-
-        if matched > 0 and (
-            matched == len(searched_tokens) or options.allow_partial_matches
-        ):
-            # Percentage of tokens matched. If matching "second last" in
-            # "the second form last one" the completeness would be 1.0 since
-            # all tokens were found.
-            completeness = matched / len(searched_tokens)
-
-            # Accuracy of the match. The accuracy is reduced by additional tokens
-            # occuring in the value that weren't in the utterance. So an utterance
-            # of "second last" matched against a value of "second from last" would
-            # result in an accuracy of 0.5.
-            accuracy = float(matched) / (matched + total_deviation)
-
-            # The final score is simply the compeleteness multiplied by the accuracy.
-            score = completeness * accuracy
-
-            # Format result
-            result = ModelResult(
-                text="",
-                start=start,
-                end=end,
-                type_name="value",
-                resolution=FoundValue(value=value, index=index, score=score),
-            )
-
-        return result
-
-    @staticmethod
-    def _index_of_token(tokens: List[Token], token: Token, start_pos: int) -> int:
-        for i in range(start_pos, len(tokens)):
-            if tokens[i].normalized == token.normalized:
-                return i
-
-        return -1
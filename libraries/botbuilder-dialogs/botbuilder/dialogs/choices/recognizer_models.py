@@ -0,0 +1,109 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+from threading import Lock
+from typing import Callable, Dict, Iterable, Tuple
+
+from recognizers_choice import ChoiceRecognizer
+from recognizers_date_time import DateTimeRecognizer
+from recognizers_number import NumberRecognizer
+from recognizers_text import Culture, Model
+
+
+class RecognizerModels:
+    """
+    Process-wide registry of the Recognizers-Text models used by the prompts and
+    ChoiceRecognizers.
+
+    ``recognize_number``, ``recognize_datetime`` and ``recognize_boolean`` build a
+    new recognizer, and register every model of every culture with it, for each
+    utterance. The registry builds each model once per culture and hands out the
+    same instance afterwards. Models are looked up exactly like those functions do,
+    falling back to English for unsupported cultures. Call :meth:`warm_up` at
+    startup so the first turn does not pay for compiling them.
+    """
+
+    NUMBER = "number"
+    ORDINAL = "ordinal"
+    DATETIME = "datetime"
+    BOOLEAN = "boolean"
+
+    _factories: Dict[str, Callable[[str], Model]] = {
+        NUMBER: lambda culture: NumberRecognizer(culture).get_number_model(culture),
+        ORDINAL: lambda culture: NumberRecognizer(culture).get_ordinal_model(culture),
+        DATETIME: lambda culture: DateTimeRecognizer(culture).get_datetime_model(
+            culture
+        ),
+        BOOLEAN: lambda culture: ChoiceRecognizer(culture).get_boolean_model(culture),
+    }
+
+    # Utterances parsed once by warm_up so lazily compiled patterns are ready too.
+    _warm_up_utterances: Dict[str, str] = {
+        NUMBER: "twenty 2",
+        ORDINAL: "the 2nd one",
+        DATETIME: "tomorrow at 5pm",
+        BOOLEAN: "yes",
+    }
+
+    _models: Dict[Tuple[str, str], Model] = {}
+    _lock = Lock()
+
+    @staticmethod
+    def get_model(kind: str, culture: str) -> Model:
+        """
+        Gets the shared model of a kind for a culture, building it on first use.
+
+        :param kind: One of NUMBER, ORDINAL, DATETIME or BOOLEAN.
+        :param culture: The culture, as given to the Recognizers-Text functions.
+        :return: The model.
+        """
+        key = (kind, culture)
+        model = RecognizerModels._models.get(key)
+        if model is None:
+            factory = RecognizerModels._factories.get(kind)
+            if factory is None:
+                raise ValueError(f"RecognizerModels: unknown model kind '{kind}'.")
+            with RecognizerModels._lock:
+                model = RecognizerModels._models.get(key)
+                if model is None:
+                    model = RecognizerModels._models[key] = factory(culture)
+        return model
+
+    @staticmethod
+    def get_number_model(culture: str) -> Model:
+        return RecognizerModels.get_model(RecognizerModels.NUMBER, culture)
+
+    @staticmethod
+    def get_ordinal_model(culture: str) -> Model:
+        return RecognizerModels.get_model(RecognizerModels.ORDINAL, culture)
+
+    @staticmethod
+    def get_datetime_model(culture: str) -> Model:
+        return RecognizerModels.get_model(RecognizerModels.DATETIME, culture)
+
+    @staticmethod
+    def get_boolean_model(culture: str) -> Model:
+        return RecognizerModels.get_model(RecognizerModels.BOOLEAN, culture)
+
+    @staticmethod
+    def warm_up(
+        cultures: Iterable[str] = (Culture.English,),
+        kinds: Iterable[str] = (NUMBER, ORDINAL, DATETIME, BOOLEAN),
+    ):
+        """
+        Builds the models of the given kinds and cultures, and runs each once.
+
+        :param cultures: The cultures the bot expects. (defaults to: English)
+        :param kinds: The model kinds to build. (defaults to: all of them)
+        """
+        for culture in cultures:
+            for kind in kinds:
+                RecognizerModels.get_model(kind, culture).parse(
+                    RecognizerModels._warm_up_utterances[kind]
+                )
+
+    @staticmethod
+    def clear():
+        """Drops the registered models. They are rebuilt on next use."""
+        with RecognizerModels._lock:
+            RecognizerModels._models.clear()
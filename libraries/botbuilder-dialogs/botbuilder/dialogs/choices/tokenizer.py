@@ -1,10 +1,29 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # Licensed under the MIT License.
 
-from typing import Union
+import re
+from typing import List, Union
 
 from .token import Token
 
+# Characters the default tokenizer breaks on, see Tokenizer._is_breaking_char.
+_BREAKING_RANGES = (
+    (0x0000, 0x002F),
+    (0x003A, 0x0040),
+    (0x005B, 0x0060),
+    (0x007B, 0x00BF),
+    (0x02B9, 0x036F),
+    (0x2000, 0x2BFF),
+    (0x2E00, 0x2E7F),
+)
+
+# A run of word characters, or a single character outside of Unicode Plane 0.
+_TOKEN_PATTERN = re.compile(
+    "([^"
+    + "".join(f"\\U{low:08x}-\\U{high:08x}" for low, high in _BREAKING_RANGES)
+    + "\\U00010000-\\U0010ffff]+)|([\\U00010000-\\U0010ffff])"
+)
+
 
 class Tokenizer:
     """Provides a default tokenizer implementation."""
@@ -60,6 +79,50 @@ class Tokenizer:
 
         return tokens
 
+    @staticmethod
+    def fast_tokenizer(  # pylint: disable=unused-argument
+        text: str, locale: str = None
+    ) -> List[Token]:
+        """
+        Same tokenizer as :meth:`default_tokenizer`, producing identical tokens, but
+        splitting the text with one precompiled regular expression instead of
+        walking it a character at a time. Pass it as ``FindValuesOptions.tokenizer``.
+
+        Parameter:
+        ---------
+
+        text: The input text.
+
+        locale: (Optional) Identifies the locale of the input text.
+        """
+        if not text:
+            return []
+
+        tokens: List[Token] = []
+        for match in _TOKEN_PATTERN.finditer(text):
+            word = match.group(1)
+            if word is not None:
+                tokens.append(
+                    Token(
+                        start=match.start(),
+                        end=match.end() - 1,
+                        text=word,
+                        normalized=word.lower(),
+                    )
+                )
+            else:
+                char = match.group(2)
+                tokens.append(
+                    Token(
+                        start=match.start(),
+                        end=match.start(),
+                        text=char,
+                        normalized=char,
+                    )
+                )
+
+        return tokens
+
     @staticmethod
     def _is_breaking_char(code_point) -> bool:
         return (
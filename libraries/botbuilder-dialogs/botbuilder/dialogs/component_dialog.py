@@ -11,6 +11,7 @@ from .dialog_turn_status import DialogTurnStatus
 from .dialog_reason import DialogReason
 from .dialog_set import DialogSet
 from .dialog_instance import DialogInstance
+from .dialog_profiler import DialogProfiler
 
 
 class ComponentDialog(Dialog):
@@ -64,7 +65,13 @@ class ComponentDialog(Dialog):
         dialog_context.active_dialog.state[self.persisted_dialog_state] = dialog_state
         inner_dc = DialogContext(self._dialogs, dialog_context.context, dialog_state)
         inner_dc.parent = dialog_context
-        turn_result = await self.on_begin_dialog(inner_dc, options)
+        turn_result = await DialogProfiler.profile(
+            dialog_context.context,
+            DialogProfiler.COMPONENT,
+            self.id,
+            "begin_dialog",
+            self.on_begin_dialog(inner_dc, options),
+        )
 
         # Check for end of inner dialog
         if turn_result.status != DialogTurnStatus.Waiting:
@@ -102,7 +109,13 @@ class ComponentDialog(Dialog):
         dialog_state = dialog_context.active_dialog.state[self.persisted_dialog_state]
         inner_dc = DialogContext(self._dialogs, dialog_context.context, dialog_state)
         inner_dc.parent = dialog_context
-        turn_result = await self.on_continue_dialog(inner_dc)
+        turn_result = await DialogProfiler.profile(
+            dialog_context.context,
+            DialogProfiler.COMPONENT,
+            self.id,
+            "continue_dialog",
+            self.on_continue_dialog(inner_dc),
+        )
 
         if turn_result.status != DialogTurnStatus.Waiting:
             return await self.end_component(dialog_context, turn_result.result)
@@ -133,7 +146,13 @@ class ComponentDialog(Dialog):
         :rtype: :class:`botbuilder.dialogs.Dialog.end_of_turn`
         """
 
-        await self.reprompt_dialog(dialog_context.context, dialog_context.active_dialog)
+        await DialogProfiler.profile(
+            dialog_context.context,
+            DialogProfiler.COMPONENT,
+            self.id,
+            "resume_dialog",
+            self.reprompt_dialog(dialog_context.context, dialog_context.active_dialog),
+        )
         return Dialog.end_of_turn
 
     async def reprompt_dialog(
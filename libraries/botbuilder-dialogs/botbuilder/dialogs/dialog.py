@@ -19,6 +19,8 @@ class Dialog(ABC):
 
         self._telemetry_client = NullTelemetryClient()
         self._id = dialog_id
+        # The registry of the root sets holding only this dialog, see DialogSet.get_registry.
+        self._root_registry = None
 
     @property
     def id(self) -> str:  # pylint: disable=invalid-name
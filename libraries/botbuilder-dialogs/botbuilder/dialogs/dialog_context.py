@@ -1,13 +1,14 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # Licensed under the MIT License.
 
-from typing import List, Optional
+from typing import List, Mapping, Optional
 
 from botbuilder.core.turn_context import TurnContext
 from botbuilder.dialogs.memory import DialogStateManager
 
 from .dialog_event import DialogEvent
 from .dialog_events import DialogEvents
+from .dialog_registry import DialogRegistry
 from .dialog_set import DialogSet
 from .dialog_state import DialogState
 from .dialog_turn_status import DialogTurnStatus
@@ -30,9 +31,25 @@ class DialogContext:
         self._dialogs = dialog_set
         self._stack = state.dialog_stack
         self.services = {}
-        self.parent: DialogContext = None
+        self._parent: DialogContext = None
+        self._dialog_scope: Mapping[str, Dialog] = None
+        self._dialog_scope_registry: DialogRegistry = None
         self.state = DialogStateManager(self)
 
+    @property
+    def parent(self) -> "DialogContext":
+        """Gets or sets the parent dialog context, searched for dialogs not in this context's set.
+
+        :param:
+        :return DialogContext:
+        """
+        return self._parent
+
+    @parent.setter
+    def parent(self, value: "DialogContext"):
+        self._parent = value
+        self._dialog_scope_registry = None
+
     @property
     def dialogs(self) -> DialogSet:
         """Gets the set of dialogs that can be called from this context.
@@ -267,6 +284,10 @@ class DialogContext:
         :return:
         """
         try:
+            scope = self._get_dialog_scope()
+            if scope is not None and dialog_id:
+                return scope.get(dialog_id)
+
             dialog = await self.dialogs.find(dialog_id)
 
             if dialog is None and self.parent is not None:
@@ -283,12 +304,38 @@ class DialogContext:
         :param dialog_id: ID of the dialog to search for.
         :return:
         """
+        scope = self._get_dialog_scope()
+        if scope is not None and dialog_id:
+            return scope.get(dialog_id)
+
         dialog = self.dialogs.find_dialog(dialog_id)
 
         if dialog is None and self.parent is not None:
             dialog = self.parent.find_dialog_sync(dialog_id)
         return dialog
 
+    def _get_dialog_scope(self) -> Mapping[str, Dialog]:
+        # The dialogs visible from this context, from the registry of the root set,
+        # or None when they must be searched through the parents.
+        registry = self._dialog_scope_registry
+        if registry is None or not registry.is_current:
+            chain = []
+            context = self
+            while context is not None:
+                chain.append(context.dialogs)
+                context = context.parent
+
+            root = chain[-1]
+            if isinstance(root, DialogSet):
+                registry = root.get_registry()
+                self._dialog_scope = registry.get_scope(tuple(chain[:-1]))
+            else:
+                registry = None
+                self._dialog_scope = None
+            self._dialog_scope_registry = registry
+
+        return self._dialog_scope
+
     async def replace_dialog(
         self, dialog_id: str, options: object = None
     ) -> DialogTurnResult:
@@ -408,9 +455,9 @@ class DialogContext:
                 current_dc = current_dc.parent
 
             exception.data[type(self).__name__] = {
-                "active_dialog": None
-                if self.active_dialog is None
-                else self.active_dialog.id,
+                "active_dialog": (
+                    None if self.active_dialog is None else self.active_dialog.id
+                ),
                 "parent": None if self.parent is None else self.parent.active_dialog.id,
                 "stack": self.stack,
             }
@@ -0,0 +1,344 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+"""Per-turn profiling of waterfall steps, prompt recognition and component dialogs."""
+
+import math
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from threading import Lock
+from typing import Awaitable, Callable, Dict, List, Sequence, Tuple
+
+from botbuilder.core import Middleware, TurnContext
+
+DEFAULT_LATENCY_BUCKETS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+# Span of the profiled call being executed.
+_CURRENT_SPAN: ContextVar["DialogProfileSpan"] = ContextVar(
+    "dialog_profile_span", default=None
+)
+
+
+class DialogProfileSpan:
+    """
+    Timing of one profiled call, in seconds.
+
+    ``wall_time`` runs from the call to its return. ``run_time`` is the part of it
+    spent executing, in the call or in the calls it awaited, and ``await_time`` the
+    rest, spent waiting on I/O such as LUIS or storage.
+    """
+
+    __slots__ = (
+        "kind",
+        "dialog_id",
+        "name",
+        "parent",
+        "children",
+        "start",
+        "wall_time",
+        "run_time",
+    )
+
+    def __init__(
+        self, kind: str, dialog_id: str, name: str, parent: "DialogProfileSpan"
+    ):
+        self.kind = kind
+        self.dialog_id = dialog_id
+        self.name = name
+        self.parent = parent
+        self.children: List[DialogProfileSpan] = []
+        self.start = 0.0
+        self.wall_time = 0.0
+        self.run_time = 0.0
+
+    @property
+    def label(self) -> str:
+        # step names from WaterfallDialog.get_step_name are already qualified
+        if self.kind == DialogProfiler.STEP:
+            return self.name
+        return f"{self.dialog_id}.{self.name}"
+
+    @property
+    def await_time(self) -> float:
+        return max(self.wall_time - self.run_time, 0.0)
+
+    @property
+    def self_time(self) -> float:
+        return max(
+            self.wall_time - sum(child.wall_time for child in self.children), 0.0
+        )
+
+    @property
+    def stack(self) -> Tuple[str, ...]:
+        """Labels of the enclosing calls, outermost first, ending with this one."""
+        labels = []
+        span = self
+        while span:
+            labels.append(span.label)
+            span = span.parent
+        return tuple(reversed(labels))
+
+
+class DialogTurnProfile:
+    """
+    The spans recorded during a turn.
+
+    :class:`DialogProfiler` stores it in ``turn_state`` under
+    :attr:`DialogProfiler.TURN_PROFILE_KEY` for the duration of the turn.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter):
+        self.clock = clock
+        self.start = clock()
+        self.wall_time = 0.0
+        self.spans: List[DialogProfileSpan] = []
+
+    @property
+    def roots(self) -> List[DialogProfileSpan]:
+        return [span for span in self.spans if span.parent is None]
+
+    @property
+    def unprofiled_time(self) -> float:
+        """Time of the turn outside of any profiled call, such as loading and saving state."""
+        return max(self.wall_time - sum(span.wall_time for span in self.roots), 0.0)
+
+    def breakdown(self) -> List[Dict[str, object]]:
+        """
+        Gets the spans of the turn in call order, with times in milliseconds.
+        """
+        return [
+            {
+                "kind": span.kind,
+                "dialog_id": span.dialog_id,
+                "name": span.name,
+                "depth": len(span.stack) - 1,
+                "wall_ms": span.wall_time * 1000,
+                "await_ms": span.await_time * 1000,
+                "self_ms": span.self_time * 1000,
+            }
+            for span in self.spans
+        ]
+
+    def start_span(self, kind: str, dialog_id: str, name: str) -> DialogProfileSpan:
+        parent = _CURRENT_SPAN.get()
+        span = DialogProfileSpan(kind, dialog_id, name, parent)
+        if parent:
+            parent.children.append(span)
+        self.spans.append(span)
+        return span
+
+
+class _ProfiledCall:
+    """Awaits an awaitable, timing how long it runs and how long it waits."""
+
+    __slots__ = ("_profile", "_span", "_awaitable")
+
+    def __init__(
+        self, profile: DialogTurnProfile, span: DialogProfileSpan, awaitable: Awaitable
+    ):
+        self._profile = profile
+        self._span = span
+        self._awaitable = awaitable
+
+    def __await__(self):
+        clock = self._profile.clock
+        span = self._span
+        iterator = self._awaitable.__await__()
+        value = error = None
+
+        token = _CURRENT_SPAN.set(span)
+        span.start = clock()
+        try:
+            while True:
+                resumed = clock()
+                try:
+                    if error is None:
+                        future = iterator.send(value)
+                    else:
+                        future = iterator.throw(error)
+                except StopIteration as stop:
+                    return stop.value
+                finally:
+                    span.run_time += clock() - resumed
+
+                try:
+                    value, error = (yield future), None
+                except GeneratorExit:
+                    iterator.close()
+                    raise
+                except BaseException as exception:  # pylint: disable=broad-except
+                    value, error = None, exception
+        finally:
+            span.wall_time = clock() - span.start
+            _CURRENT_SPAN.reset(token)
+
+
+class _Histogram:
+    """Wall time histogram of one profiled call."""
+
+    __slots__ = ("count", "wall", "run", "min", "max", "buckets")
+
+    def __init__(self, bucket_count: int):
+        self.count = 0
+        self.wall = 0.0
+        self.run = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.buckets = [0] * (bucket_count + 1)
+
+    def add(self, span: DialogProfileSpan, index: int):
+        wall = span.wall_time * 1000
+        self.count += 1
+        self.wall += wall
+        self.run += span.run_time * 1000
+        self.min = min(self.min, wall)
+        self.max = max(self.max, wall)
+        self.buckets[index] += 1
+
+
+class DialogProfiler(Middleware):
+    """
+    Middleware profiling the dialogs run during each turn.
+
+    While it is in the pipeline, :meth:`WaterfallDialog.on_step`, the recognition of
+    prompts and :class:`ComponentDialog` begin, continue and resume calls are timed
+    and attributed to their dialog id and step name. The spans of the current turn
+    are available from ``turn_state[DialogProfiler.TURN_PROFILE_KEY]`` as a
+    :class:`DialogTurnProfile`. Completed turns are aggregated into histograms
+    (:meth:`get_histograms`) and collapsed stacks for flame graphs
+    (:meth:`export_flame_graph`).
+
+    Without the middleware the dialogs check ``turn_state`` and run as before.
+    """
+
+    TURN_PROFILE_KEY = "DialogProfiler.turn_profile"
+
+    STEP = "step"
+    RECOGNIZE = "recognize"
+    COMPONENT = "component"
+
+    # Root frame of the flame graph, holding the time outside of the dialogs.
+    TURN_FRAME = "turn"
+
+    def __init__(
+        self,
+        latency_buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+        clock: Callable[[], float] = time.perf_counter,
+    ):
+        """
+        :param latency_buckets: Upper bounds, in milliseconds, of the wall time histograms.
+        :param clock: Clock returning seconds, for tests.
+        """
+        self._latency_buckets = tuple(latency_buckets)
+        self._clock = clock
+        self._lock = Lock()
+        self._histograms: Dict[Tuple[str, str, str], _Histogram] = {}
+        self._stacks: Dict[Tuple[str, ...], float] = {}
+        self.turn_count = 0
+
+    @staticmethod
+    def profile(
+        turn_context: TurnContext,
+        kind: str,
+        dialog_id: str,
+        name: str,
+        awaitable: Awaitable,
+    ) -> Awaitable:
+        """
+        Times an awaitable as a call of a dialog if the turn is profiled.
+
+        :return: The awaitable itself when the turn isn't profiled.
+        """
+        profile: DialogTurnProfile = turn_context.turn_state.get(
+            DialogProfiler.TURN_PROFILE_KEY
+        )
+        if profile is None:
+            return awaitable
+
+        return _ProfiledCall(
+            profile, profile.start_span(kind, dialog_id, name), awaitable
+        )
+
+    async def on_turn(
+        self, context: TurnContext, logic: Callable[[TurnContext], Awaitable]
+    ):
+        profile = DialogTurnProfile(self._clock)
+        context.turn_state[self.TURN_PROFILE_KEY] = profile
+        try:
+            await logic()
+        finally:
+            profile.wall_time = self._clock() - profile.start
+            self._add_turn(profile)
+
+    def get_histograms(self) -> Dict[str, Dict[str, object]]:
+        """
+        Gets the wall time histogram of every profiled call, by label.
+
+        Times are in milliseconds. ``buckets`` counts the calls at or below each
+        latency bucket, the last one, labelled ``"+Inf"``, counting the calls above
+        all of them, so that the histograms serialize to plain JSON.
+        """
+        with self._lock:
+            return {
+                f"{kind}:{dialog_id}:{name}": {
+                    "kind": kind,
+                    "dialog_id": dialog_id,
+                    "name": name,
+                    "count": histogram.count,
+                    "mean_ms": histogram.wall / histogram.count,
+                    "mean_await_ms": (histogram.wall - histogram.run) / histogram.count,
+                    "min_ms": histogram.min,
+                    "max_ms": histogram.max,
+                    "buckets": list(
+                        zip(self._latency_buckets + ("+Inf",), histogram.buckets)
+                    ),
+                }
+                for (kind, dialog_id, name), histogram in self._histograms.items()
+            }
+
+    def export_flame_graph(self, file=None) -> str:
+        """
+        Exports the profiled turns as collapsed stacks, one ``frame;frame;... self_time``
+        line per stack with the self time in microseconds, the input format of
+        flamegraph.pl, speedscope and similar tools.
+
+        :param file: Optional text file to write the stacks to.
+        :return: The collapsed stacks.
+        """
+        with self._lock:
+            lines = [
+                f"{';'.join(stack)} {round(self_time * 1e6)}"
+                for stack, self_time in sorted(self._stacks.items())
+            ]
+        text = "\n".join(lines) + "\n" if lines else ""
+        if file is not None:
+            file.write(text)
+        return text
+
+    def reset(self):
+        """Drops the aggregated histograms and stacks."""
+        with self._lock:
+            self._histograms.clear()
+            self._stacks.clear()
+            self.turn_count = 0
+
+    def _add_turn(self, profile: DialogTurnProfile):
+        turn_frame = (self.TURN_FRAME,)
+        with self._lock:
+            self.turn_count += 1
+            self._stacks[turn_frame] = (
+                self._stacks.get(turn_frame, 0.0) + profile.unprofiled_time
+            )
+            for span in profile.spans:
+                key = (span.kind, span.dialog_id, span.name)
+                histogram = self._histograms.get(key)
+                if histogram is None:
+                    histogram = self._histograms[key] = _Histogram(
+                        len(self._latency_buckets)
+                    )
+                histogram.add(
+                    span, bisect_left(self._latency_buckets, span.wall_time * 1000)
+                )
+
+                stack = turn_frame + span.stack
+                self._stacks[stack] = self._stacks.get(stack, 0.0) + span.self_time
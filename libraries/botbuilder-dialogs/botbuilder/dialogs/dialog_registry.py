@@ -0,0 +1,91 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, Mapping, Tuple
+
+from .dialog import Dialog
+
+if TYPE_CHECKING:
+    from .dialog_set import DialogSet
+
+
+class DialogRegistry:
+    """
+    Frozen lookup tables of the dialogs reachable from a root :class:`DialogSet`.
+
+    For every chain of dialog sets, from the set of a component dialog or container
+    up to the root set, the registry holds the dialogs visible from a dialog context
+    of that chain: its own dialogs, then those of the enclosing sets. Looking up a
+    dialog by id is then a single dictionary access, where
+    :meth:`DialogContext.find_dialog` would search the parent contexts one by one.
+
+    The chains leave the root set out, so a registry serves any root set holding the
+    same dialogs, such as the one DialogExtensions.run_dialog creates every turn.
+    Adding a dialog to a set invalidates the registries that contain it, which are
+    rebuilt on their next use by :meth:`DialogSet.get_registry`.
+    """
+
+    def __init__(self, root: "DialogSet"):
+        self._is_current = True
+        self._scopes: Dict[Tuple["DialogSet", ...], Mapping[str, Dialog]] = {}
+        self._add(root, (), (), {}, True)
+
+    def invalidate(self):
+        """Marks the registry as outdated, after a dialog was added to one of its sets."""
+        self._is_current = False
+
+    @property
+    def is_current(self) -> bool:
+        return self._is_current
+
+    def get_scope(self, chain: Tuple["DialogSet", ...]) -> Mapping[str, Dialog]:
+        """
+        Gets the dialogs visible from a dialog context, by id.
+
+        :param chain: The dialog sets of the context and of its parents, innermost first,
+        without the root set.
+        :return: A read-only mapping, or None if the chain isn't part of the registered tree.
+        """
+        return self._scopes.get(chain)
+
+    def _add(
+        self,
+        dialog_set: "DialogSet",
+        chain: Tuple["DialogSet", ...],
+        ancestors: Tuple["DialogSet", ...],
+        parent_scope: Dict[str, Dialog],
+        searchable: bool,
+    ):
+        # pylint: disable=import-outside-toplevel,protected-access
+        from .component_dialog import ComponentDialog
+        from .dialog_container import DialogContainer
+        from .dialog_set import DialogSet
+
+        dialog_set._registries.add(self)
+
+        # Sets that search differently, and the sets they contain, are left to
+        # DialogContext.find_dialog, but still invalidate the registry when they change.
+        searchable = (
+            searchable
+            and type(dialog_set).find is DialogSet.find
+            and type(dialog_set).find_dialog is DialogSet.find_dialog
+        )
+
+        ancestors += (dialog_set,)
+        scope = dict(parent_scope)
+        scope.update(dialog_set._dialogs)
+        if searchable:
+            self._scopes[chain] = MappingProxyType(scope)
+
+        for dialog in dialog_set._dialogs.values():
+            if isinstance(dialog, ComponentDialog):
+                child_set = dialog._dialogs
+            elif isinstance(dialog, DialogContainer):
+                child_set = dialog.dialogs
+            else:
+                continue
+
+            # a dialog can contain itself, directly or not
+            if isinstance(child_set, DialogSet) and child_set not in ancestors:
+                self._add(child_set, (child_set,) + chain, ancestors, scope, searchable)
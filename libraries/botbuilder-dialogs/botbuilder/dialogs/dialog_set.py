@@ -3,6 +3,7 @@
 import inspect
 from hashlib import sha256
 from typing import Dict
+from weakref import WeakSet
 
 from botbuilder.core import (
     NullTelemetryClient,
@@ -12,6 +13,7 @@ from botbuilder.core import (
     StatePropertyAccessor,
 )
 from .dialog import Dialog
+from .dialog_registry import DialogRegistry
 from .dialog_state import DialogState
 
 
@@ -44,6 +46,10 @@ class DialogSet:
 
         self._dialogs: Dict[str, Dialog] = {}
         self._version: str = None
+        self._version_registry: DialogRegistry = None
+        self._registry: DialogRegistry = None
+        # The registries this set is part of, invalidated when a dialog is added.
+        self._registries: "WeakSet[DialogRegistry]" = WeakSet()
 
     @property
     def telemetry_client(self) -> BotTelemetryClient:
@@ -70,17 +76,49 @@ class DialogSet:
         Gets a unique string which represents the combined versions of all dialogs in this this dialogset.
         <returns>Version will change when any of the child dialogs version changes.</returns>
         """
-        if not self._version:
+        # The registry of the set is current as long as no dialog was added to the set
+        # or to the sets it contains, and so is the version computed along with it.
+        registry = self.get_registry()
+        if not self._version or self._version_registry is not registry:
             version = ""
             for _, dialog in self._dialogs.items():
                 aux_version = dialog.get_version()
                 if aux_version:
                     version += aux_version
 
-            self._version = sha256(version)
+            self._version = sha256(version.encode("utf-8")).hexdigest()
+            self._version_registry = registry
 
         return self._version
 
+    def get_registry(self) -> DialogRegistry:
+        """
+        Gets the lookup tables of the dialogs reachable from this set, as the root set of
+        a dialog context. They are built on first use and again after dialogs are added
+        to this set or to one of the sets it contains.
+        """
+        if self._registry is None or not self._registry.is_current:
+            self._registry = self._get_root_registry()
+
+        return self._registry
+
+    def _get_root_registry(self) -> DialogRegistry:
+        # pylint: disable=protected-access
+        # DialogExtensions.run_dialog and DialogHelper create a root set holding the
+        # same dialog every turn. Its registry is kept by that dialog, so that it is
+        # only built again once the tree changes.
+        if type(self) is not DialogSet or len(self._dialogs) != 1:
+            return DialogRegistry(self)
+
+        dialog = next(iter(self._dialogs.values()))
+        registry = getattr(dialog, "_root_registry", None)
+        if registry is None or not registry.is_current:
+            registry = dialog._root_registry = DialogRegistry(self)
+        else:
+            # adding a dialog to this set must invalidate it too
+            self._registries.add(registry)
+        return registry
+
     def add(self, dialog: Dialog):
         """
         Adds a new dialog to the set and returns the added dialog.
@@ -99,6 +137,9 @@ class DialogSet:
 
         # dialog.telemetry_client = this._telemetry_client;
         self._dialogs[dialog.id] = dialog
+        for registry in self._registries:
+            registry.invalidate()
+        self._registries.clear()
 
         return self
 
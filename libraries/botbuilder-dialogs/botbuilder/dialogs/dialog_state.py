@@ -32,6 +32,23 @@ class DialogState:
         """
         return self._dialog_stack
 
+    def __getstate__(self):
+        # pylint: disable=import-outside-toplevel
+        from .dialog_state_codec import DialogStateCodec
+
+        if DialogStateCodec.enabled:
+            return DialogStateCodec.encode(self)
+        return self.__dict__
+
+    def __setstate__(self, state):
+        # pylint: disable=import-outside-toplevel
+        from .dialog_state_codec import DialogStateCodec
+
+        if DialogStateCodec.is_encoded(state):
+            self._dialog_stack = DialogStateCodec.decode(state)
+        else:
+            self.__dict__.update(state)
+
     def __str__(self):
         if not self._dialog_stack:
             return "dialog stack empty!"
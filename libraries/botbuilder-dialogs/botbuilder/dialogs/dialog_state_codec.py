@@ -0,0 +1,281 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+from typing import Dict, List
+
+from msrest.serialization import Model
+
+from botbuilder.schema import Activity, ModelCodec, json_dumps
+
+from .choices import Choice
+from .dialog_instance import DialogInstance
+from .dialog_state import DialogState
+from .prompts.prompt_options import PromptOptions
+
+# Kinds of the values of an encoded dialog instance state.
+_RAW = 0
+_DIALOG_STATE = 1
+_PROMPT_OPTIONS = 2
+_ACTIVITY = 3
+
+_PROMPT_OPTIONS_ATTRIBUTES = frozenset(vars(PromptOptions()))
+_JSON_SCALARS = (str, int, float, bool)
+
+
+def _is_json(value) -> bool:
+    if value is None or value.__class__ in _JSON_SCALARS:
+        return True
+    if value.__class__ is dict:
+        return all(
+            key.__class__ is str and _is_json(item) for key, item in value.items()
+        )
+    if value.__class__ is list:
+        return all(_is_json(item) for item in value)
+    return False
+
+
+def _is_json_model(model: Model) -> bool:
+    # Whether the JSON form of the model decodes back to an equal model: the values of
+    # its object typed attributes, such as a HeroCard as the content of an
+    # attachment, must be JSON types already.
+    for (
+        attr,
+        attr_desc,
+    ) in model._attribute_map.items():  # pylint: disable=protected-access
+        value = getattr(model, attr, None)
+        if value is None:
+            continue
+        if attr_desc["type"] == "object":
+            if not _is_json(value):
+                return False
+        elif isinstance(value, Model):
+            if not _is_json_model(value):
+                return False
+        elif value.__class__ is list:
+            if not all(
+                _is_json_model(item) for item in value if isinstance(item, Model)
+            ):
+                return False
+    return True
+
+
+class DialogStateCodec:
+    """
+    Compact encoding of a :class:`DialogState` and the dialog states nested in it,
+    used when the state is pickled by the storage layers (jsonpickle, pickle or
+    ``copy.deepcopy``).
+
+    By default every :class:`DialogInstance` of the stack is pickled by value,
+    including the full attribute set of the prompt activities of
+    :class:`PromptOptions`. When :attr:`enabled`, the whole tree of stacks is
+    encoded as one document instead:
+
+    - dialog ids and instance state keys, such as ``stepIndex`` or ``options``, are
+      interned in a table shared by every stack of the tree
+    - prompt and retry prompt activities are stored once, in their JSON form without
+      unset attributes, and referenced by index from the prompt options. Activities
+      holding objects that their JSON form would turn into dicts, such as the card of
+      an attachment or a custom channel_data object, are left to the pickler along
+      with their prompt options, so that they keep their types
+    - the document carries a schema version, :attr:`SCHEMA_VERSION`
+
+    Reading accepts both the legacy and the compact forms whether or not the codec
+    is enabled. A deployment can therefore read compact state before it writes it,
+    and disabling the codec goes back to the legacy form on the next save.
+    """
+
+    # 1 is the legacy form, DialogInstance objects pickled by value.
+    SCHEMA_VERSION = 2
+    VERSION_KEY = "$dialogState"
+
+    # Set to True to write the compact form.
+    enabled = False
+
+    @staticmethod
+    def is_encoded(data: Dict[str, object]) -> bool:
+        return DialogStateCodec.VERSION_KEY in data
+
+    @staticmethod
+    def encode(dialog_state: DialogState) -> Dict[str, object]:
+        """
+        Encodes a dialog state and the dialog states nested in its instances.
+
+        :param dialog_state: The dialog state.
+        :return: A dict of JSON types, except for the values of instance states that
+            the codec doesn't recognize, which are left to the pickler.
+        """
+        encoder = _Encoder()
+        stack = encoder.encode_stack(dialog_state)
+        return {
+            DialogStateCodec.VERSION_KEY: DialogStateCodec.SCHEMA_VERSION,
+            "names": encoder.names,
+            "activities": encoder.activities,
+            "stack": stack,
+        }
+
+    @staticmethod
+    def decode(data: Dict[str, object]) -> List[DialogInstance]:
+        """
+        Decodes the dialog stack encoded by :meth:`encode`.
+
+        :param data: The encoded dialog state, of any supported schema version.
+        :return: The dialog stack.
+        """
+        data = DialogStateCodec.migrate(data)
+        decoder = _Decoder(data["names"], data["activities"])
+        return decoder.decode_stack(data["stack"])
+
+    @staticmethod
+    def migrate(data: Dict[str, object]) -> Dict[str, object]:
+        """
+        Upgrades an encoded dialog state to :attr:`SCHEMA_VERSION`.
+
+        :raises ValueError: If the state was written by a newer version of the codec.
+        """
+        version = data.get(DialogStateCodec.VERSION_KEY)
+        if not isinstance(version, int) or version < 2:
+            raise ValueError(f"DialogStateCodec: invalid schema version {version!r}.")
+        if version > DialogStateCodec.SCHEMA_VERSION:
+            raise ValueError(
+                f"DialogStateCodec: schema version {version} is newer than the "
+                f"supported version {DialogStateCodec.SCHEMA_VERSION}."
+            )
+        # Later versions upgrade the older documents here, one version at a time.
+        return data
+
+
+class _Encoder:
+    def __init__(self):
+        self.names: List[str] = []
+        self.activities: List[dict] = []
+        self._name_refs: Dict[str, int] = {}
+        self._activity_refs: Dict[str, int] = {}
+
+    def encode_stack(self, dialog_state: DialogState) -> list:
+        stack = []
+        for instance in dialog_state.dialog_stack:
+            values = []
+            for key, value in instance.state.items():
+                kind, value = self._encode_value(value)
+                values.extend((self._intern(key), kind, value))
+            stack.append([self._intern(instance.id), values])
+        return stack
+
+    def _encode_value(self, value):
+        value_class = value.__class__
+        if value_class is DialogState:
+            return _DIALOG_STATE, self.encode_stack(value)
+        if value_class is PromptOptions:
+            encoded = self._encode_prompt_options(value)
+            if encoded is not None:
+                return _PROMPT_OPTIONS, encoded
+        elif value_class is Activity and _is_json_model(value):
+            return _ACTIVITY, self._add_activity(value)
+        return _RAW, value
+
+    def _encode_prompt_options(self, options: PromptOptions):
+        if vars(options).keys() != _PROMPT_OPTIONS_ATTRIBUTES:
+            return None
+
+        activities = []
+        for activity in (options.prompt, options.retry_prompt):
+            if activity is None:
+                activities.append(None)
+            elif activity.__class__ is Activity and _is_json_model(activity):
+                activities.append(self._add_activity(activity))
+            else:
+                return None
+
+        choices = options.choices
+        if choices is not None:
+            if not all(
+                choice.__class__ is Choice and choice.action is None
+                for choice in choices
+            ):
+                return None
+            choices = [[choice.value, choice.synonyms] for choice in choices]
+
+        return activities + [
+            choices,
+            options.style,
+            options.validations,
+            options.number_of_attempts,
+        ]
+
+    def _add_activity(self, activity: Activity) -> int:
+        serialized = ModelCodec.get(Activity).serialize(activity)
+        key = json_dumps(serialized)
+
+        ref = self._activity_refs.get(key)
+        if ref is None:
+            ref = self._activity_refs[key] = len(self.activities)
+            self.activities.append(serialized)
+        return ref
+
+    def _intern(self, name: str):
+        if name.__class__ is not str:
+            return [name]
+        ref = self._name_refs.get(name)
+        if ref is None:
+            ref = self._name_refs[name] = len(self.names)
+            self.names.append(name)
+        return ref
+
+
+class _Decoder:
+    def __init__(self, names: List[str], activities: List[dict]):
+        self._names = names
+        self._activities = activities
+
+    def decode_stack(self, stack: list) -> List[DialogInstance]:
+        instances = []
+        for name_ref, values in stack:
+            state = {}
+            for i in range(0, len(values), 3):
+                state[self._name(values[i])] = self._decode_value(
+                    values[i + 1], values[i + 2]
+                )
+            instances.append(DialogInstance(self._name(name_ref), state))
+        return instances
+
+    def _decode_value(self, kind: int, value):
+        if kind == _RAW:
+            return value
+        if kind == _DIALOG_STATE:
+            return DialogState(self.decode_stack(value))
+        if kind == _ACTIVITY:
+            return self._activity(value)
+        if kind == _PROMPT_OPTIONS:
+            (
+                prompt,
+                retry_prompt,
+                choices,
+                style,
+                validations,
+                number_of_attempts,
+            ) = value
+            return PromptOptions(
+                prompt=self._activity(prompt),
+                retry_prompt=self._activity(retry_prompt),
+                choices=(
+                    None
+                    if choices is None
+                    else [
+                        Choice(value, synonyms=synonyms) for value, synonyms in choices
+                    ]
+                ),
+                style=style,
+                validations=validations,
+                number_of_attempts=number_of_attempts,
+            )
+        raise ValueError(f"DialogStateCodec: unknown value kind {kind!r}.")
+
+    def _name(self, ref):
+        # names that aren't strings are stored in a list rather than interned
+        return ref[0] if ref.__class__ is list else self._names[ref]
+
+    def _activity(self, ref: int) -> Activity:
+        # every reference gets its own activity, prompts may modify the ones they send
+        if ref is None:
+            return None
+        return ModelCodec.get(Activity).deserialize(self._activities[ref])
@@ -10,6 +10,7 @@ from typing import (
     Iterable,
     Iterator,
     List,
+    Set,
     Tuple,
     Type,
     TypeVar,
@@ -17,7 +18,7 @@ from typing import (
 
 from botbuilder.core import ComponentRegistration
 
-from botbuilder.dialogs.memory.scopes import MemoryScope
+from botbuilder.dialogs.memory.scopes import BotStateMemoryScope, MemoryScope
 
 from .component_memory_scopes_base import ComponentMemoryScopesBase
 from .component_path_resolvers_base import ComponentPathResolversBase
@@ -39,6 +40,12 @@ class DialogStateManager:
 
     SEPARATORS = [",", "["]
 
+    TOUCHED_SCOPES_KEY = "DialogStateManager.touched_scopes"
+
+    # (ids of the registered components, sources of their memory scopes, sources of
+    # their path resolvers), see _get_component_configuration
+    _components: Tuple[tuple, tuple, tuple] = None
+
     def __init__(
         self,
         dialog_context: "DialogContext",
@@ -65,39 +72,92 @@ class DialogStateManager:
         self._dialog_context = dialog_context
         self._version: int = 0
 
-        ComponentRegistration.add(self._dialog_component_registration_cls())
+        if not any(
+            type(component)  # pylint: disable=unidiomatic-typecheck
+            is self._dialog_component_registration_cls
+            for component in ComponentRegistration.get_components()
+        ):
+            ComponentRegistration.add(self._dialog_component_registration_cls())
 
         if not dialog_context:
             raise TypeError(f"Expecting: DialogContext, but received None")
 
-        self._configuration = configuration or dialog_context.context.turn_state.get(
-            DialogStateManagerConfiguration.__name__, None
+        self._configuration = (
+            configuration
+            or dialog_context.context.turn_state.get(
+                DialogStateManagerConfiguration.__name__, None
+            )
+            or self._get_component_configuration()
         )
-        if not self._configuration:
-            self._configuration = DialogStateManagerConfiguration()
-
-            # get all of the component memory scopes
-            memory_component: ComponentMemoryScopesBase
-            for memory_component in filter(
-                lambda comp: isinstance(comp, ComponentMemoryScopesBase),
-                ComponentRegistration.get_components(),
-            ):
-                for memory_scope in memory_component.get_memory_scopes():
-                    self._configuration.memory_scopes.append(memory_scope)
-
-            # get all of the component path resolvers
-            path_component: ComponentPathResolversBase
-            for path_component in filter(
-                lambda comp: isinstance(comp, ComponentPathResolversBase),
-                ComponentRegistration.get_components(),
-            ):
-                for path_resolver in path_component.get_path_resolvers():
-                    self._configuration.path_resolvers.append(path_resolver)
 
         # cache for any other new dialog_state_manager instances in this turn.
-        dialog_context.context.turn_state[
-            self._configuration.__class__.__name__
-        ] = self._configuration
+        dialog_context.context.turn_state[self._configuration.__class__.__name__] = (
+            self._configuration
+        )
+
+    @staticmethod
+    def _get_component_configuration() -> DialogStateManagerConfiguration:
+        """
+        Gets the memory scopes and path resolvers of the registered components.
+
+        They are looked up once, until the registered components change. The scopes and
+        path resolvers of DialogsComponentRegistration keep no state and are created once,
+        those of other components are created again for each configuration, as they may
+        keep state that must not be shared between conversations.
+        """
+        # pylint: disable=import-outside-toplevel
+        from botbuilder.dialogs import DialogsComponentRegistration
+
+        components = tuple(ComponentRegistration.get_components())
+        key = tuple(map(id, components))
+        cached = DialogStateManager._components
+        if not cached or cached[0] != key:
+
+            def source(component, get_items):
+                if type(component) is DialogsComponentRegistration:
+                    items = tuple(get_items())
+                    return lambda: items
+                return get_items
+
+            cached = DialogStateManager._components = (
+                key,
+                tuple(
+                    source(comp, comp.get_memory_scopes)
+                    for comp in components
+                    if isinstance(comp, ComponentMemoryScopesBase)
+                ),
+                tuple(
+                    source(comp, comp.get_path_resolvers)
+                    for comp in components
+                    if isinstance(comp, ComponentPathResolversBase)
+                ),
+            )
+        _, memory_scope_sources, path_resolver_sources = cached
+
+        configuration = DialogStateManagerConfiguration()
+        for get_memory_scopes in memory_scope_sources:
+            configuration.memory_scopes.extend(get_memory_scopes())
+        for get_path_resolvers in path_resolver_sources:
+            configuration.path_resolvers.extend(get_path_resolvers())
+
+        return configuration
+
+    @property
+    def touched_scopes(self) -> Set[str]:
+        """
+        Gets the names of the memory scopes accessed through any DialogStateManager in this turn.
+        :return: Names of the memory scopes that save_all_changes persists.
+        """
+        turn_state = self._dialog_context.context.turn_state
+        touched = turn_state.get(self.TOUCHED_SCOPES_KEY)
+        if touched is None:
+            touched = turn_state[self.TOUCHED_SCOPES_KEY] = set()
+        return touched
+
+    def _touch_all(self) -> List[MemoryScope]:
+        memory_scopes = self.configuration.memory_scopes
+        self.touched_scopes.update(memory_scope.name for memory_scope in memory_scopes)
+        return memory_scopes
 
     def __len__(self) -> int:
         """
@@ -130,7 +190,7 @@ class DialogStateManager:
         """
         return [
             memory_scope.get_memory(self._dialog_context)
-            for memory_scope in self.configuration.memory_scopes
+            for memory_scope in self._touch_all()
         ]
 
     # <summary>
@@ -192,7 +252,7 @@ class DialogStateManager:
         if not name:
             raise TypeError(f"Expecting: {str.__name__}, but received None")
 
-        return next(
+        memory_scope = next(
             (
                 memory_scope
                 for memory_scope in self.configuration.memory_scopes
@@ -200,6 +260,10 @@ class DialogStateManager:
             ),
             None,
         )
+        if memory_scope:
+            self.touched_scopes.add(memory_scope.name)
+
+        return memory_scope
 
     def version(self) -> str:
         """
@@ -413,6 +477,8 @@ class DialogStateManager:
     def get_memory_snapshot(self) -> Dict[str, object]:
         """
         Gets all memoryscopes suitable for logging.
+
+        The snapshot is only read, so the scopes aren't marked as touched by it.
         :return: object which represents all memory scopes.
         """
         result = {}
@@ -428,19 +494,32 @@ class DialogStateManager:
 
     async def load_all_scopes(self):
         """
-        Load all of the scopes.
+        Load all of the scopes backed by storage.
+
+        Memory is read synchronously, so these scopes are still loaded up front. Scopes
+        that don't override MemoryScope.load have nothing to load and are skipped.
         :return:
         """
         for scope in self.configuration.memory_scopes:
-            await scope.load(self._dialog_context)
+            if type(scope).load is not MemoryScope.load:
+                await scope.load(self._dialog_context)
 
     async def save_all_changes(self):
         """
-        Save all changes for all scopes.
+        Save all changes for the scopes backed by a BotState, and for the other scopes
+        accessed through a DialogStateManager in this turn.
+
+        The state of a BotState, such as the dialog stack kept in ConversationState,
+        also changes without going through the manager, so those scopes are always
+        saved. BotState.save_changes only writes the state if it changed.
         :return:
         """
+        touched = self.touched_scopes
         for scope in self.configuration.memory_scopes:
-            await scope.save_changes(self._dialog_context)
+            if type(scope).save_changes is MemoryScope.save_changes:
+                continue
+            if scope.name in touched or isinstance(scope, BotStateMemoryScope):
+                await scope.save_changes(self._dialog_context)
 
     async def delete_scopes_memory_async(self, name: str):
         """
@@ -524,7 +603,7 @@ class DialogStateManager:
         :param array_index:
         :return:
         """
-        for memory_scope in self.configuration.memory_scopes:
+        for memory_scope in self._touch_all():
             array[array_index] = (
                 memory_scope.name,
                 memory_scope.get_memory(self._dialog_context),
@@ -548,7 +627,7 @@ class DialogStateManager:
         Returns an enumerator that iterates through the collection.
         :return: An enumerator that can be used to iterate through the collection.
         """
-        for memory_scope in self.configuration.memory_scopes:
+        for memory_scope in self._touch_all():
             yield (memory_scope.name, memory_scope.get_memory(self._dialog_context))
 
     def track_paths(self, paths: Iterable[str]) -> List[str]:
@@ -587,7 +666,7 @@ class DialogStateManager:
         return found
 
     def __iter__(self):
-        for memory_scope in self.configuration.memory_scopes:
+        for memory_scope in self._touch_all():
             yield (memory_scope.name, memory_scope.get_memory(self._dialog_context))
 
     @staticmethod
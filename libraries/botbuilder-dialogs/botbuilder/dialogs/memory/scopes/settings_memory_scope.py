@@ -7,9 +7,12 @@ from .memory_scope import MemoryScope
 
 
 class SettingsMemoryScope(MemoryScope):
+    # The settings of a turn without any, kept in its turn state as the scope is
+    # shared by every conversation.
+    EMPTY_SETTINGS_KEY = "SettingsMemoryScope.empty_settings"
+
     def __init__(self):
         super().__init__(scope_path.SETTINGS)
-        self._empty_settings = {}
         self.include_in_snapshot = False
 
     def get_memory(self, dialog_context: "DialogContext") -> object:
@@ -21,7 +24,9 @@ class SettingsMemoryScope(MemoryScope):
         )
 
         if not settings:
-            settings = self._empty_settings
+            settings = dialog_context.context.turn_state.setdefault(
+                self.EMPTY_SETTINGS_KEY, {}
+            )
 
         return settings
 
@@ -2,6 +2,7 @@
 # Licensed under the MIT License.
 
 import copy
+from functools import lru_cache
 from typing import Union, Callable
 
 
@@ -11,17 +12,27 @@ class ObjectPath:
     """
 
     @staticmethod
-    def assign(start_object, overlay_object, default: Union[Callable, object] = None):
+    def assign(
+        start_object,
+        overlay_object,
+        default: Union[Callable, object] = None,
+        in_place: bool = False,
+    ):
         """
         Creates a new object by overlaying values in start_object with non-null values from overlay_object.
 
         :param start_object: dict or typed object, the target object to set values on
         :param overlay_object: dict or typed object, the item to overlay values form
         :param default: Provides a default object if both source and overlay are None
-        :return: A copy of start_object, with values from overlay_object
+        :param in_place: Merge into start_object and share the overlay values instead of copying them.
+        The caller must own both objects, e.g. options created for a single dialog turn.
+        :return: A copy of start_object, with values from overlay_object, or start_object itself if in_place
         """
+        deep_copy = ObjectPath.__identity if in_place else copy.deepcopy
+        shallow_copy = ObjectPath.__identity if in_place else copy.copy
+
         if start_object and overlay_object:
-            merged = copy.deepcopy(start_object)
+            merged = deep_copy(start_object)
 
             def merge(target: dict, source: dict):
                 key_set = set(target).union(set(source))
@@ -35,16 +46,16 @@ class ObjectPath:
                         if isinstance(source_value, dict):
                             # merge dictionaries
                             if not target_value:
-                                target[key] = copy.deepcopy(source_value)
+                                target[key] = deep_copy(source_value)
                             else:
                                 merge(target_value, source_value)
                         elif not hasattr(source_value, "__dict__"):
                             # simple type.  just copy it.
-                            target[key] = copy.copy(source_value)
+                            target[key] = shallow_copy(source_value)
                         elif not target_value:
                             # the target doesn't have the value, but
                             # the overlay does.  just copy it.
-                            target[key] = copy.deepcopy(source_value)
+                            target[key] = deep_copy(source_value)
                         else:
                             # recursive class copy
                             merge(target_value.__dict__, source_value.__dict__)
@@ -60,7 +71,7 @@ class ObjectPath:
             return merged
 
         if overlay_object:
-            return copy.deepcopy(overlay_object)
+            return deep_copy(overlay_object)
 
         if start_object:
             return start_object
@@ -68,6 +79,20 @@ class ObjectPath:
             return default() if callable(default) else copy.deepcopy(default)
         return None
 
+    @staticmethod
+    def compile(path: str) -> "CompiledPath":
+        """
+        Parses a path expression, or returns it from the cache of recently used paths.
+
+        The result can be passed to the other methods in place of the path string.
+        """
+        return _compile_path(path)
+
+    @staticmethod
+    def clear_cache():
+        """Drops the cache of compiled path expressions."""
+        _compile_path.cache_clear()
+
     @staticmethod
     def set_path_value(obj, path: str, value: object):
         """
@@ -167,13 +192,27 @@ class ObjectPath:
         if not path:
             return obj
 
-        segments = ObjectPath.try_resolve_path(obj, path)
+        compiled = path if isinstance(path, CompiledPath) else _compile_path(path)
+        if compiled.lookups is not None:
+            # constant path, resolve the pre-parsed segments directly
+            if not compiled.lookups:
+                return None
+            result = ObjectPath.__resolve_lookups(obj, compiled.lookups)
+            return result if result else None
+
+        segments = ObjectPath.try_resolve_path(obj, compiled)
         if not segments:
             return None
 
-        result = ObjectPath.__resolve_segments(obj, segments)
-        if not result:
-            return None
+        result = obj
+        for segment, key in zip(segments, compiled.keys):
+            if key is None:
+                # evaluated indexer
+                result = ObjectPath.__resolve_segment(result, segment)
+            else:
+                result = ObjectPath.__resolve_key(result, key)
+            if not result:
+                return None
 
         return result
 
@@ -199,71 +238,48 @@ class ObjectPath:
         return value
 
     @staticmethod
-    def try_resolve_path(obj, property_path: str, evaluate: bool = False) -> []:
-        so_far = []
-        first = property_path[0] if property_path else " "
-        if first in ("'", '"'):
-            if not property_path.endswith(first):
-                return None
-
-            so_far.append(property_path[1 : len(property_path) - 2])
-        elif ObjectPath.is_int(property_path):
-            so_far.append(int(property_path))
-        else:
-            start = 0
-            i = 0
-
-            def emit():
-                nonlocal start, i
-                segment = property_path[start:i]
-                if segment:
-                    so_far.append(segment)
-                start = i + 1
+    def try_resolve_path(
+        obj, property_path: Union[str, "CompiledPath"], evaluate: bool = False
+    ) -> []:
+        compiled = (
+            property_path
+            if isinstance(property_path, CompiledPath)
+            else _compile_path(property_path)
+        )
+        if compiled.parts is None:
+            return None
 
-            while i < len(property_path):
-                char = property_path[i]
-                if char in (".", "["):
-                    emit()
+        if compiled.literal:
+            return list(compiled.parts)
 
-                if char == "[":
-                    nesting = 1
-                    i += 1
-                    while i < len(property_path):
-                        char = property_path[i]
-                        if char == "[":
-                            nesting += 1
-                        elif char == "]":
-                            nesting -= 1
-                            if nesting == 0:
-                                break
-                        i += 1
-
-                    if nesting > 0:
-                        return None
-
-                    expr = property_path[start:i]
-                    start = i + 1
-                    indexer = ObjectPath.try_resolve_path(obj, expr, True)
-                    if not indexer:
-                        return None
-
-                    result = indexer[0]
-                    if ObjectPath.is_int(result):
-                        so_far.append(int(result))
-                    else:
-                        so_far.append(result)
+        if compiled.lookups is not None:
+            if not evaluate:
+                return list(compiled.parts)
+            result = ObjectPath.__resolve_lookups(obj, compiled.lookups)
+            return [result] if result else None
 
-                i += 1
+        so_far = []
+        for part in compiled.parts:
+            if isinstance(part, CompiledPath):
+                indexer = ObjectPath.try_resolve_path(obj, part, True)
+                if not indexer:
+                    return None
 
-            emit()
+                result = indexer[0]
+                if ObjectPath.is_int(result):
+                    so_far.append(int(result))
+                else:
+                    so_far.append(result)
+            else:
+                so_far.append(part)
 
-            if evaluate:
-                result = ObjectPath.__resolve_segments(obj, so_far)
-                if not result:
-                    return None
+        if evaluate:
+            result = ObjectPath.__resolve_segments(obj, so_far)
+            if not result:
+                return None
 
-                so_far.clear()
-                so_far.append(result)
+            so_far.clear()
+            so_far.append(result)
 
         return so_far
 
@@ -297,12 +313,42 @@ class ObjectPath:
 
         return current
 
+    @staticmethod
+    def __resolve_lookups(current, lookups: tuple) -> object:
+        if not current:
+            return None
+
+        result = current
+
+        for key in lookups:
+            result = ObjectPath.__resolve_key(result, key)
+            if not result:
+                return None
+
+        return result
+
+    @staticmethod
+    def __resolve_key(current, key: tuple) -> object:
+        index, property_name_lower = key
+        if index is not None:
+            return current[index]
+        return ObjectPath.__get_lowered_property(current, property_name_lower)
+
     @staticmethod
     def __get_object_property(obj, property_name: str):
+        return ObjectPath.__get_lowered_property(obj, property_name.lower())
+
+    @staticmethod
+    def __get_lowered_property(obj, property_name_lower: str):
         # doing a case insensitive search
-        property_name_lower = property_name.lower()
-        matching = [obj[key] for key in obj if key.lower() == property_name_lower]
-        return matching[0] if matching else None
+        for key in obj:
+            if key.lower() == property_name_lower:
+                return obj[key]
+        return None
+
+    @staticmethod
+    def __identity(value):
+        return value
 
     @staticmethod
     def is_int(value: str) -> bool:
@@ -311,3 +357,100 @@ class ObjectPath:
             return True
         except ValueError:
             return False
+
+
+class CompiledPath:
+    """
+    A path expression parsed by :meth:`ObjectPath.compile`.
+
+    Segments are split once. Indexers such as ``[turn.index]`` are kept as compiled
+    paths and evaluated against the object on every resolution, everything else is
+    constant.
+    """
+
+    __slots__ = ("path", "parts", "literal", "keys", "lookups")
+
+    def __init__(self, path: str):
+        self.path = path
+        # segments, with a CompiledPath for every indexer, or None if invalid
+        self.parts: list = None
+        # quoted and int paths, which are never evaluated
+        self.literal = False
+        # (index, lower case name) of each segment, None for indexers
+        self.keys: tuple = None
+        # the keys of a constant path
+        self.lookups: tuple = None
+
+        first = path[0] if path else " "
+        if first in ("'", '"'):
+            if path.endswith(first):
+                self.parts = [path[1 : len(path) - 2]]
+                self.literal = True
+        elif ObjectPath.is_int(path):
+            self.parts = [int(path)]
+            self.literal = True
+        else:
+            self.parts = CompiledPath.__split(path)
+
+        if self.parts is not None:
+            self.keys = tuple(CompiledPath.__key(part) for part in self.parts)
+            if None not in self.keys:
+                self.lookups = self.keys
+
+    def __repr__(self) -> str:
+        return f"CompiledPath({self.path!r})"
+
+    @staticmethod
+    def __key(part) -> tuple:
+        if isinstance(part, CompiledPath):
+            return None
+        if ObjectPath.is_int(part):
+            return int(part), None
+        return None, part.lower()
+
+    @staticmethod
+    def __split(path: str) -> list:
+        parts = []
+        start = 0
+        i = 0
+
+        def emit():
+            nonlocal start
+            segment = path[start:i]
+            if segment:
+                parts.append(segment)
+            start = i + 1
+
+        while i < len(path):
+            char = path[i]
+            if char in (".", "["):
+                emit()
+
+            if char == "[":
+                nesting = 1
+                i += 1
+                while i < len(path):
+                    char = path[i]
+                    if char == "[":
+                        nesting += 1
+                    elif char == "]":
+                        nesting -= 1
+                        if nesting == 0:
+                            break
+                    i += 1
+
+                if nesting > 0:
+                    return None
+
+                parts.append(_compile_path(path[start:i]))
+                start = i + 1
+
+            i += 1
+
+        emit()
+        return parts
+
+
+@lru_cache(maxsize=1024)
+def _compile_path(path: str) -> CompiledPath:
+    return CompiledPath(path)
@@ -13,6 +13,7 @@ from botbuilder.dialogs import (
 )
 from botbuilder.schema import ActivityTypes, InputHints
 
+from ..dialog_profiler import DialogProfiler
 from .prompt import Prompt
 from .prompt_options import PromptOptions
 from .prompt_recognizer_result import PromptRecognizerResult
@@ -114,8 +115,12 @@ class ActivityPrompt(Dialog):
         instance = dialog_context.active_dialog
         state: Dict[str, object] = instance.state[self.persisted_state]
         options: Dict[str, object] = instance.state[self.persisted_options]
-        recognized: PromptRecognizerResult = await self.on_recognize(
-            dialog_context.context, state, options
+        recognized: PromptRecognizerResult = await DialogProfiler.profile(
+            dialog_context.context,
+            DialogProfiler.RECOGNIZE,
+            self.id,
+            "on_recognize",
+            self.on_recognize(dialog_context.context, state, options),
         )
 
         # Increment attempt count
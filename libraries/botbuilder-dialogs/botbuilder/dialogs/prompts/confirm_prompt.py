@@ -2,7 +2,6 @@
 # Licensed under the MIT License.
 
 from typing import Dict
-from recognizers_choice import recognize_boolean
 from botbuilder.core.turn_context import TurnContext
 from botbuilder.schema import ActivityTypes, Activity
 from botbuilder.dialogs.choices import (
@@ -10,6 +9,7 @@ from botbuilder.dialogs.choices import (
     ChoiceFactoryOptions,
     ChoiceRecognizers,
     ListStyle,
+    RecognizerModels,
 )
 from .prompt import Prompt
 from .prompt_culture_models import PromptCultureModels
@@ -99,7 +99,7 @@ class ConfirmPrompt(Prompt):
             if not utterance:
                 return result
             culture = self._determine_culture(turn_context.activity)
-            results = recognize_boolean(utterance, culture)
+            results = RecognizerModels.get_boolean_model(culture).parse(utterance)
             if results:
                 first = results[0]
                 if "value" in first.resolution:
@@ -3,12 +3,12 @@
 
 from typing import Callable, Dict
 
-from recognizers_number import recognize_number
 from recognizers_text import Culture, ModelResult
 from babel.numbers import parse_decimal
 
 from botbuilder.core.turn_context import TurnContext
 from botbuilder.schema import ActivityTypes
+from botbuilder.dialogs.choices import RecognizerModels
 
 from .prompt import Prompt, PromptValidatorContext
 from .prompt_options import PromptOptions
@@ -59,7 +59,9 @@ class NumberPrompt(Prompt):
             if not utterance:
                 return result
             culture = self._get_culture(turn_context)
-            results: [ModelResult] = recognize_number(utterance, culture)
+            results: [ModelResult] = RecognizerModels.get_number_model(culture).parse(
+                utterance
+            )
 
             if results:
                 result.succeeded = True
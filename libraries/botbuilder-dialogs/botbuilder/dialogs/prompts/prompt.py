@@ -20,6 +20,7 @@ from ..dialog import Dialog
 from ..dialog_instance import DialogInstance
 from ..dialog_turn_result import DialogTurnResult
 from ..dialog_context import DialogContext
+from ..dialog_profiler import DialogProfiler
 
 
 class Prompt(Dialog):
@@ -126,7 +127,13 @@ class Prompt(Dialog):
         instance = dialog_context.active_dialog
         state = instance.state[self.persisted_state]
         options = instance.state[self.persisted_options]
-        recognized = await self.on_recognize(dialog_context.context, state, options)
+        recognized = await DialogProfiler.profile(
+            dialog_context.context,
+            DialogProfiler.RECOGNIZE,
+            self.id,
+            "on_recognize",
+            self.on_recognize(dialog_context.context, state, options),
+        )
 
         # Validate the return value
         is_valid = False
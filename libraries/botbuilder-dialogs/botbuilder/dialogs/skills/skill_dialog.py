@@ -10,6 +10,7 @@ from botbuilder.schema import (
     ActivityTypes,
     ExpectedReplies,
     DeliveryModes,
+    ModelCodec,
     SignInConstants,
     TokenExchangeInvokeRequest,
 )
@@ -224,7 +225,9 @@ class SkillDialog(Dialog):
         if activity.delivery_mode == DeliveryModes.expect_replies and response.body:
             # Process replies in the response.Body.
             response.body: List[Activity]
-            response.body = ExpectedReplies().deserialize(response.body).activities
+            response.body = (
+                ModelCodec.get(ExpectedReplies).deserialize(response.body).activities
+            )
             # Track sent invoke responses, so more than one is not sent.
             sent_invoke_response = False
 
@@ -11,6 +11,7 @@ from .dialog import Dialog
 from .dialog_turn_result import DialogTurnResult
 from .dialog_context import DialogContext
 from .dialog_instance import DialogInstance
+from .dialog_profiler import DialogProfiler
 from .waterfall_step_context import WaterfallStepContext
 
 
@@ -129,7 +130,13 @@ class WaterfallDialog(Dialog):
             "InstanceId": instance_id,
         }
         self.telemetry_client.track_event("WaterfallStep", properties)
-        return await self._steps[step_context.index](step_context)
+        return await DialogProfiler.profile(
+            step_context.context,
+            DialogProfiler.STEP,
+            self.id,
+            step_name,
+            self._steps[step_context.index](step_context),
+        )
 
     async def run_step(
         self,
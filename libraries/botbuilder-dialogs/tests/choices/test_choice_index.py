@@ -0,0 +1,211 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+import random
+from typing import List
+
+import aiounittest
+
+from botbuilder.dialogs.choices import (
+    Choice,
+    ChoiceIndex,
+    Find,
+    FindChoicesOptions,
+    FindValuesOptions,
+    FoundValue,
+    ModelResult,
+    SortedValue,
+    Tokenizer,
+)
+
+WORDS = ["the", "red", "blue", "green", "one", "last", "second", "new", "york", "san"]
+
+
+def legacy_match_value(
+    source_tokens, max_distance, options, index, value, searched_tokens, start_pos
+):
+    """The token by token search Find.find_values made before values were indexed."""
+    matched = 0
+    total_deviation = 0
+    start = -1
+    end = -1
+
+    for token in searched_tokens:
+        pos = next(
+            (
+                i
+                for i in range(start_pos, len(source_tokens))
+                if source_tokens[i].normalized == token.normalized
+            ),
+            -1,
+        )
+        if pos >= 0:
+            distance = pos - start_pos if matched > 0 else 0
+            if distance <= max_distance:
+                matched += 1
+                total_deviation += distance
+                start_pos = pos + 1
+                if start < 0:
+                    start = pos
+                end = pos
+
+    if matched > 0 and (
+        matched == len(searched_tokens) or options.allow_partial_matches
+    ):
+        completeness = matched / len(searched_tokens)
+        accuracy = float(matched) / (matched + total_deviation)
+        return ModelResult(
+            text="",
+            start=start,
+            end=end,
+            type_name="value",
+            resolution=FoundValue(
+                value=value, index=index, score=completeness * accuracy
+            ),
+        )
+
+    return None
+
+
+def legacy_find_values(
+    utterance: str, values: List[SortedValue], options: FindValuesOptions = None
+):
+    """Find.find_values as it was before values were indexed."""
+    sorted_values = sorted(values, key=lambda value: len(value.value), reverse=True)
+    opt = options if options else FindValuesOptions()
+    tokenizer = opt.tokenizer if opt.tokenizer else Tokenizer.default_tokenizer
+    tokens = tokenizer(utterance, opt.locale)
+    max_distance = opt.max_token_distance if opt.max_token_distance is not None else 2
+
+    matches = []
+    for entry in sorted_values:
+        start_pos = 0
+        searched_tokens = tokenizer(entry.value.strip(), opt.locale)
+        while start_pos < len(tokens):
+            match = legacy_match_value(
+                tokens,
+                max_distance,
+                opt,
+                entry.index,
+                entry.value,
+                searched_tokens,
+                start_pos,
+            )
+            if match is None:
+                break
+            start_pos = match.end + 1
+            matches.append(match)
+
+    results = []
+    found_indexes = set()
+    used_tokens = set()
+    for match in sorted(matches, key=lambda m: m.resolution.score, reverse=True):
+        span = range(match.start, match.end + 1)
+        if match.resolution.index in found_indexes or any(
+            i in used_tokens for i in span
+        ):
+            continue
+        found_indexes.add(match.resolution.index)
+        used_tokens.update(span)
+        match.start = tokens[match.start].start
+        match.end = tokens[match.end].end
+        match.text = utterance[match.start : match.end + 1]
+        results.append(match)
+    return sorted(results, key=lambda m: m.start)
+
+
+def describe(results):
+    return [
+        (
+            result.start,
+            result.end,
+            result.text,
+            result.resolution.value,
+            result.resolution.index,
+            result.resolution.score,
+        )
+        for result in results
+    ]
+
+
+class ChoiceIndexTest(aiounittest.AsyncTestCase):
+    def test_matches_legacy_search(self):
+        rng = random.Random(7)
+        for _ in range(300):
+            values = [
+                SortedValue(
+                    value=" ".join(rng.choices(WORDS, k=rng.randint(1, 3))),
+                    index=rng.randint(0, 5),
+                )
+                for _ in range(rng.randint(1, 12))
+            ]
+            utterance = ", ".join(
+                " ".join(rng.choices(WORDS, k=rng.randint(1, 4)))
+                for _ in range(rng.randint(1, 3))
+            )
+            options = FindValuesOptions(
+                allow_partial_matches=rng.random() < 0.5,
+                max_token_distance=rng.choice([None, 0, 1, 3]),
+            )
+
+            with self.subTest(utterance=utterance):
+                self.assertEqual(
+                    describe(legacy_find_values(utterance, values, options)),
+                    describe(Find.find_values(utterance, values, options)),
+                )
+
+    def test_find_choices_with_synonyms(self):
+        choices = [
+            Choice("Seattle", synonyms=["SEA", "Seattle Tacoma"]),
+            Choice("New York", synonyms=["JFK", "NYC", "new york city"]),
+            Choice("San Francisco", synonyms=["SFO", "san fran"]),
+        ]
+
+        found = Find.find_choices("fly me from nyc to san fran", choices)
+
+        self.assertEqual(
+            [("New York", "NYC", 1.0), ("San Francisco", "san fran", 1.0)],
+            [
+                (
+                    result.resolution.value,
+                    result.resolution.synonym,
+                    result.resolution.score,
+                )
+                for result in found
+            ],
+        )
+        self.assertEqual(
+            ["New York"],
+            [
+                result.resolution.value
+                for result in Find.find_choices(
+                    "new york city please", choices, FindChoicesOptions(no_value=True)
+                )
+            ],
+        )
+
+    def test_index_is_shared_for_identical_values(self):
+        values = [SortedValue("red", 0), SortedValue("dark blue", 1)]
+        same = [SortedValue("red", 0), SortedValue("dark blue", 1)]
+        other = [SortedValue("red", 0), SortedValue("dark blue", 2)]
+
+        index = ChoiceIndex.get(values, Tokenizer.default_tokenizer)
+
+        self.assertIs(index, ChoiceIndex.get(same, Tokenizer.default_tokenizer))
+        self.assertIsNot(index, ChoiceIndex.get(other, Tokenizer.default_tokenizer))
+        self.assertIsNot(
+            index, ChoiceIndex.get(values, Tokenizer.default_tokenizer, "fr-fr")
+        )
+
+    def test_only_values_sharing_a_token_are_searched(self):
+        index = ChoiceIndex(
+            [SortedValue("red", 0), SortedValue("blue", 1)],
+            Tokenizer.default_tokenizer,
+        )
+        tokens = Tokenizer.default_tokenizer("a blue one")
+
+        matches = index.match(tokens, 2, False)
+
+        self.assertEqual(
+            [("blue", 1, 1)], [(m.resolution.value, m.start, m.end) for m in matches]
+        )
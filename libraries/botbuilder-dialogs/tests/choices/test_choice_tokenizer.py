@@ -1,8 +1,10 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # Licensed under the MIT License.
 
+import random
+
 import aiounittest
-from botbuilder.dialogs.choices import Tokenizer
+from botbuilder.dialogs.choices import Find, FindChoicesOptions, Tokenizer
 
 
 def _assert_token(token, start, end, text, normalized=None):
@@ -64,3 +66,57 @@ class AttachmentPromptTests(aiounittest.AsyncTestCase):
         _assert_token(tokens[1], 5, 5, "💥")
         _assert_token(tokens[2], 6, 6, "👍")
         _assert_token(tokens[3], 7, 7, "😀")
+
+
+def _describe(tokens):
+    return [(token.start, token.end, token.text, token.normalized) for token in tokens]
+
+
+class FastTokenizerTests(aiounittest.AsyncTestCase):
+    def test_should_match_default_tokenizer_on_samples(self):
+        samples = [
+            "how now brown cow",
+            "how-now.brown:cow?",
+            "a b c d",
+            "  leading and trailing  ",
+            "HeLLo WoRLD",
+            "i like 💎 and 😀🎉!",
+            "résumé, naïve café; ÉTÉ",
+            "quoteʼd’s ⸜text⸝",
+            "\U00010400\U00010428 deseret",
+            "",
+        ]
+        for sample in samples:
+            with self.subTest(sample=sample):
+                self.assertEqual(
+                    _describe(Tokenizer.default_tokenizer(sample)),
+                    _describe(Tokenizer.fast_tokenizer(sample)),
+                )
+        self.assertEqual([], Tokenizer.fast_tokenizer(None))
+
+    def test_should_match_default_tokenizer_at_range_boundaries(self):
+        boundaries = [
+            0x002F, 0x0030, 0x0039, 0x003A, 0x0040, 0x0041, 0x005A, 0x005B,
+            0x0060, 0x0061, 0x007A, 0x007B, 0x00BF, 0x00C0, 0x02B8, 0x02B9,
+            0x036F, 0x0370, 0x1FFF, 0x2000, 0x2BFF, 0x2C00, 0x2DFF, 0x2E00,
+            0x2E7F, 0x2E80, 0xFFFF, 0x10000, 0x1F600, 0x10FFFF,
+        ]  # fmt: skip
+        rng = random.Random(3)
+        for _ in range(500):
+            sample = "".join(
+                chr(rng.choice(boundaries)) for _ in range(rng.randint(1, 12))
+            )
+            with self.subTest(sample=ascii(sample)):
+                self.assertEqual(
+                    _describe(Tokenizer.default_tokenizer(sample)),
+                    _describe(Tokenizer.fast_tokenizer(sample)),
+                )
+
+    def test_should_be_usable_as_find_values_tokenizer(self):
+        found = Find.find_choices(
+            "I'd like the blue one",
+            ["red", "green", "blue"],
+            FindChoicesOptions(tokenizer=Tokenizer.fast_tokenizer),
+        )
+
+        self.assertEqual(["blue"], [result.resolution.value for result in found])
@@ -0,0 +1,67 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+import aiounittest
+from recognizers_choice import recognize_boolean
+from recognizers_date_time import recognize_datetime
+from recognizers_number import recognize_number, recognize_ordinal
+from recognizers_text import Culture
+
+from botbuilder.dialogs.choices import RecognizerModels
+
+
+def resolutions(results):
+    return [(result.text, result.resolution) for result in results]
+
+
+class RecognizerModelsTest(aiounittest.AsyncTestCase):
+    def test_model_is_built_once_per_culture(self):
+        model = RecognizerModels.get_number_model(Culture.English)
+
+        self.assertIs(model, RecognizerModels.get_number_model(Culture.English))
+        self.assertIsNot(model, RecognizerModels.get_number_model(Culture.French))
+        self.assertIsNot(model, RecognizerModels.get_ordinal_model(Culture.English))
+
+    def test_matches_recognizers_text_functions(self):
+        cases = [
+            (RecognizerModels.get_number_model, recognize_number, "I need 3 seats"),
+            (RecognizerModels.get_ordinal_model, recognize_ordinal, "the second one"),
+            (RecognizerModels.get_boolean_model, recognize_boolean, "yes please"),
+        ]
+        for culture in (Culture.English, Culture.Spanish, "English", "xx-unknown"):
+            for get_model, recognize, utterance in cases:
+                with self.subTest(culture=culture, utterance=utterance):
+                    self.assertEqual(
+                        resolutions(recognize(utterance, culture)),
+                        resolutions(get_model(culture).parse(utterance)),
+                    )
+
+    def test_datetime_matches_recognizers_text(self):
+        utterance = "a flight on march 3rd 2022"
+
+        self.assertEqual(
+            resolutions(recognize_datetime(utterance, Culture.English)),
+            resolutions(
+                RecognizerModels.get_datetime_model(Culture.English).parse(utterance)
+            ),
+        )
+
+    def test_warm_up_builds_requested_models(self):
+        RecognizerModels.clear()
+
+        RecognizerModels.warm_up(
+            [Culture.Dutch], [RecognizerModels.NUMBER, RecognizerModels.BOOLEAN]
+        )
+
+        # pylint: disable=protected-access
+        self.assertEqual(
+            {
+                (RecognizerModels.NUMBER, Culture.Dutch),
+                (RecognizerModels.BOOLEAN, Culture.Dutch),
+            },
+            set(RecognizerModels._models),
+        )
+
+    def test_unknown_kind_raises(self):
+        with self.assertRaises(ValueError):
+            RecognizerModels.get_model("currency", Culture.English)
@@ -0,0 +1,147 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+import aiounittest
+
+from botbuilder.core import ConversationState, MemoryStorage, MessageFactory
+from botbuilder.core import TurnContext
+from botbuilder.core.adapters import TestAdapter
+from botbuilder.dialogs import (
+    ComponentDialog,
+    DialogExtensions,
+    DialogSet,
+    DialogsComponentRegistration,
+    WaterfallDialog,
+    WaterfallStepContext,
+)
+from botbuilder.dialogs.prompts import PromptOptions, TextPrompt
+from botbuilder.dialogs.memory import DialogStateManagerConfiguration
+from botbuilder.dialogs.memory.scopes import MemoryScope
+from botbuilder.schema import (
+    Activity,
+    ActivityTypes,
+    ChannelAccount,
+    ConversationAccount,
+)
+
+
+class RecordingMemoryScope(MemoryScope):
+    def __init__(self, name: str, calls: list):
+        super().__init__(name)
+        self.memory = {}
+        self.calls = calls
+
+    def get_memory(self, dialog_context) -> object:
+        return self.memory
+
+    def set_memory(self, dialog_context, memory: object):
+        self.memory = memory
+
+    async def load(self, dialog_context, force: bool = False):
+        self.calls.append(("load", self.name))
+
+    async def save_changes(self, dialog_context, force: bool = False):
+        self.calls.append(("save", self.name))
+
+
+class DialogStateManagerTests(aiounittest.AsyncTestCase):
+    begin_message = Activity(
+        text="begin",
+        type=ActivityTypes.message,
+        channel_id="test",
+        from_property=ChannelAccount(id="user"),
+        recipient=ChannelAccount(id="bot"),
+        conversation=ConversationAccount(id="convo1"),
+    )
+
+    async def create_dialog_context(self):
+        dialogs = DialogSet(
+            ConversationState(MemoryStorage()).create_property("dialogs")
+        )
+        context = TurnContext(TestAdapter(), DialogStateManagerTests.begin_message)
+        return await dialogs.create_context(context)
+
+    async def test_settings_are_not_shared_between_turns(self):
+        first = await self.create_dialog_context()
+        second = await self.create_dialog_context()
+
+        first.state.get_memory_scope("settings").get_memory(first)["feature"] = "on"
+
+        # the scopes keep no state and are created once
+        self.assertIsNot(first.state.configuration, second.state.configuration)
+        self.assertEqual(
+            list(map(id, first.state.configuration.memory_scopes)),
+            list(map(id, second.state.configuration.memory_scopes)),
+        )
+        self.assertEqual({"feature": "on"}, first.state["settings"])
+        self.assertIsNone(second.state["settings"])
+
+    async def test_dialog_stack_is_saved_between_turns(self):
+        class NameDialog(ComponentDialog):
+            def __init__(self):
+                super().__init__("NameDialog")
+                self.add_dialog(TextPrompt(TextPrompt.__name__))
+                self.add_dialog(WaterfallDialog("steps", [self.step1, self.step2]))
+                self.initial_dialog_id = "steps"
+
+            async def step1(self, step_context: WaterfallStepContext):
+                await step_context.context.send_activity("step1")
+                return await step_context.prompt(
+                    TextPrompt.__name__,
+                    PromptOptions(prompt=MessageFactory.text("name?")),
+                )
+
+            async def step2(self, step_context: WaterfallStepContext):
+                await step_context.context.send_activity(f"step2 {step_context.result}")
+                return await step_context.end_dialog()
+
+        storage = MemoryStorage()
+        conversation_state = ConversationState(storage)
+        dialog = NameDialog()
+
+        async def logic(context: TurnContext):
+            context.turn_state[ConversationState.__name__] = conversation_state
+            await DialogExtensions.run_dialog(
+                dialog, context, conversation_state.create_property("dialogs")
+            )
+
+        replies = []
+
+        async def record(activity, description):  # pylint: disable=unused-argument
+            replies.append(activity.text)
+
+        step = await TestAdapter(logic).send("hi")
+        step = await step.assert_reply(record)
+        step = await step.assert_reply(record)
+        step = await step.send("bob")
+        await step.assert_reply(record)
+
+        self.assertEqual(["step1", "name?", "step2 bob"], replies)
+        self.assertIn("test/conversations/Convo1", storage.memory)
+
+    async def test_only_scopes_accessed_in_the_turn_are_saved(self):
+        calls = []
+        configuration = DialogStateManagerConfiguration()
+        configuration.memory_scopes.extend(
+            DialogsComponentRegistration().get_memory_scopes()
+        )
+        configuration.memory_scopes.append(RecordingMemoryScope("used", calls))
+        configuration.memory_scopes.append(RecordingMemoryScope("unused", calls))
+
+        async def step(step_context: WaterfallStepContext):
+            step_context.state["used"] = {"name": "bill"}
+            return await step_context.end_dialog()
+
+        dialog = WaterfallDialog("root", [step])
+        accessor = ConversationState(MemoryStorage()).create_property("dialogs")
+
+        async def logic(context: TurnContext):
+            context.turn_state[DialogStateManagerConfiguration.__name__] = configuration
+            await DialogExtensions.run_dialog(dialog, context, accessor)
+
+        # run_dialog sends a snapshot of every scope as a trace, which reads them all
+        await TestAdapter(logic).send("hi")
+
+        self.assertEqual(
+            [("load", "used"), ("load", "unused"), ("save", "used")], calls
+        )
@@ -0,0 +1,137 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+import asyncio
+import io
+import json
+
+import aiounittest
+from botbuilder.core import ConversationState, MemoryStorage, TurnContext
+from botbuilder.core.adapters import TestAdapter
+from botbuilder.dialogs import (
+    ComponentDialog,
+    DialogProfiler,
+    DialogSet,
+    DialogTurnStatus,
+    TextPrompt,
+    WaterfallDialog,
+    WaterfallStepContext,
+)
+from botbuilder.dialogs.prompts import PromptOptions
+from botbuilder.schema import Activity, ActivityTypes
+
+
+class BookingDialog(ComponentDialog):
+    def __init__(self):
+        super().__init__(BookingDialog.__name__)
+        self.add_dialog(TextPrompt(TextPrompt.__name__))
+        self.add_dialog(
+            WaterfallDialog(
+                WaterfallDialog.__name__, [self.destination_step, self.final_step]
+            )
+        )
+        self.initial_dialog_id = WaterfallDialog.__name__
+
+    async def destination_step(self, step_context: WaterfallStepContext):
+        # stands for a call to LUIS
+        await asyncio.sleep(0.05)
+        return await step_context.prompt(
+            TextPrompt.__name__,
+            PromptOptions(prompt=Activity(type=ActivityTypes.message, text="Where?")),
+        )
+
+    async def final_step(self, step_context: WaterfallStepContext):
+        await step_context.context.send_activity(f"Booked {step_context.result}")
+        return await step_context.end_dialog()
+
+
+class DialogProfilerTests(aiounittest.AsyncTestCase):
+    async def test_profiles_steps_prompts_and_components(self):
+        convo_state = ConversationState(MemoryStorage())
+        dialogs = DialogSet(convo_state.create_property("dialogState"))
+        dialogs.add(BookingDialog())
+        profiles = []
+
+        async def exec_test(turn_context: TurnContext):
+            dialog_context = await dialogs.create_context(turn_context)
+            results = await dialog_context.continue_dialog()
+            if results.status == DialogTurnStatus.Empty:
+                await dialog_context.begin_dialog(BookingDialog.__name__)
+            await convo_state.save_changes(turn_context)
+            profiles.append(turn_context.turn_state[DialogProfiler.TURN_PROFILE_KEY])
+
+        profiler = DialogProfiler()
+        adapter = TestAdapter(exec_test)
+        adapter.use(profiler)
+
+        step1 = await adapter.test("hi", "Where?")
+        await step1.test("Paris", "Booked Paris")
+
+        first, second = [
+            [(row["name"], row["depth"]) for row in profile.breakdown()]
+            for profile in profiles
+        ]
+        self.assertEqual(
+            [("begin_dialog", 0), ("BookingDialog.destination_step", 1)], first
+        )
+        self.assertEqual(
+            [
+                ("continue_dialog", 0),
+                ("on_recognize", 1),
+                ("BookingDialog.final_step", 1),
+            ],
+            second,
+        )
+
+        step = profiles[0].spans[1]
+        self.assertEqual(("BookingDialog.begin_dialog",), step.parent.stack)
+        self.assertGreaterEqual(step.wall_time, 0.05)
+        self.assertGreaterEqual(step.await_time, 0.04)
+        self.assertLess(step.run_time, step.wall_time)
+
+        histograms = profiler.get_histograms()
+        self.assertEqual(2, profiler.turn_count)
+        self.assertEqual(
+            1,
+            histograms["step:WaterfallDialog:BookingDialog.destination_step"]["count"],
+        )
+        self.assertEqual(
+            1, histograms["recognize:TextPrompt:on_recognize"]["buckets"][0][1]
+        )
+        self.assertEqual(
+            "+Inf", histograms["recognize:TextPrompt:on_recognize"]["buckets"][-1][0]
+        )
+        json.dumps(histograms, allow_nan=False)
+
+        output = io.StringIO()
+        flame_graph = profiler.export_flame_graph(output)
+        self.assertEqual(flame_graph, output.getvalue())
+        stacks = dict(line.rsplit(" ", 1) for line in flame_graph.splitlines())
+        self.assertIn("turn", stacks)
+        self.assertGreaterEqual(
+            int(
+                stacks["turn;BookingDialog.begin_dialog;BookingDialog.destination_step"]
+            ),
+            50000,
+        )
+
+        profiler.reset()
+        self.assertEqual({}, profiler.get_histograms())
+        self.assertEqual("", profiler.export_flame_graph())
+
+    async def test_dialogs_run_unprofiled_without_the_middleware(self):
+        async def step(step_context: WaterfallStepContext):
+            await step_context.context.send_activity("done")
+            return await step_context.end_dialog()
+
+        dialogs = DialogSet(
+            ConversationState(MemoryStorage()).create_property("dialogState")
+        )
+        dialogs.add(WaterfallDialog("test", [step]))
+
+        async def exec_test(turn_context: TurnContext):
+            dialog_context = await dialogs.create_context(turn_context)
+            await dialog_context.begin_dialog("test")
+            self.assertNotIn(DialogProfiler.TURN_PROFILE_KEY, turn_context.turn_state)
+
+        await TestAdapter(exec_test).test("hi", "done")
@@ -0,0 +1,156 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+# pylint: disable=protected-access
+
+import aiounittest
+from botbuilder.core import ConversationState, MemoryStorage, TurnContext
+from botbuilder.core.adapters import TestAdapter
+from botbuilder.dialogs import (
+    ComponentDialog,
+    DialogContext,
+    DialogSet,
+    DialogState,
+    TextPrompt,
+    WaterfallDialog,
+)
+from botbuilder.schema import Activity, ActivityTypes
+
+
+class ResolverDialog(ComponentDialog):
+    def __init__(self, dialog_id: str):
+        super().__init__(dialog_id)
+        self.add_dialog(TextPrompt(TextPrompt.__name__))
+        self.add_dialog(WaterfallDialog(WaterfallDialog.__name__, [self.step]))
+
+    async def step(self, step_context):
+        return await step_context.end_dialog()
+
+
+class BookingDialog(ComponentDialog):
+    def __init__(self):
+        super().__init__(BookingDialog.__name__)
+        self.add_dialog(WaterfallDialog(WaterfallDialog.__name__, [self.step]))
+        self.add_dialog(ResolverDialog("OriginResolverDialog"))
+        self.add_dialog(ResolverDialog("DestinationResolverDialog"))
+
+    async def step(self, step_context):
+        return await step_context.end_dialog()
+
+
+class DialogRegistryTests(aiounittest.AsyncTestCase):
+    def setUp(self):
+        self.dialogs = DialogSet(
+            ConversationState(MemoryStorage()).create_property("dialogState")
+        )
+        self.booking = BookingDialog()
+        self.dialogs.add(self.booking)
+        self.context = TurnContext(
+            TestAdapter(), Activity(type=ActivityTypes.message, text="hi")
+        )
+
+    def create_context(self, dialog_set: DialogSet, parent: DialogContext = None):
+        dialog_context = DialogContext(dialog_set, self.context, DialogState())
+        dialog_context.parent = parent
+        return dialog_context
+
+    async def test_finds_dialogs_of_the_context_and_its_parents(self):
+        origin = await self.booking.find_dialog("OriginResolverDialog")
+        root_dc = self.create_context(self.dialogs)
+        booking_dc = self.create_context(self.booking._dialogs, root_dc)
+        origin_dc = self.create_context(origin._dialogs, booking_dc)
+
+        self.assertIs(
+            await origin.find_dialog(TextPrompt.__name__),
+            await origin_dc.find_dialog(TextPrompt.__name__),
+        )
+        self.assertIs(
+            await origin.find_dialog(WaterfallDialog.__name__),
+            origin_dc.find_dialog_sync(WaterfallDialog.__name__),
+        )
+        self.assertIs(
+            await self.booking.find_dialog(WaterfallDialog.__name__),
+            await booking_dc.find_dialog(WaterfallDialog.__name__),
+        )
+        self.assertIs(self.booking, await origin_dc.find_dialog(BookingDialog.__name__))
+        self.assertIsNone(await origin_dc.find_dialog("MissingDialog"))
+        with self.assertRaises(TypeError):
+            origin_dc.find_dialog_sync(None)
+
+    async def test_registry_is_rebuilt_after_adding_a_dialog(self):
+        registry = self.dialogs.get_registry()
+        self.assertIs(registry, self.dialogs.get_registry())
+        root_dc = self.create_context(self.dialogs)
+        booking_dc = self.create_context(self.booking._dialogs, root_dc)
+        self.assertIsNone(await booking_dc.find_dialog("ReturnResolverDialog"))
+
+        version = self.booking._dialogs.get_version()
+        self.assertEqual(version, self.booking._dialogs.get_version())
+
+        self.booking.add_dialog(ResolverDialog("ReturnResolverDialog"))
+
+        self.assertIsNot(registry, self.dialogs.get_registry())
+        self.assertIsNotNone(await booking_dc.find_dialog("ReturnResolverDialog"))
+        self.assertNotEqual(version, self.booking._dialogs.get_version())
+
+    async def test_contexts_outside_of_the_tree_search_their_parents(self):
+        origin = await self.booking.find_dialog("OriginResolverDialog")
+        other = DialogSet(
+            ConversationState(MemoryStorage()).create_property("dialogState")
+        )
+        other.add(WaterfallDialog("OtherDialog"))
+
+        origin_dc = self.create_context(origin._dialogs, self.create_context(other))
+
+        self.assertIsNotNone(await origin_dc.find_dialog("OtherDialog"))
+        self.assertIsNone(await origin_dc.find_dialog(BookingDialog.__name__))
+
+    async def test_only_registries_containing_the_changed_set_are_rebuilt(self):
+        registry = self.dialogs.get_registry()
+        booking_version = self.booking._dialogs.get_version()
+
+        # the root set of every turn of DialogExtensions.run_dialog
+        turn_dialogs = DialogSet(
+            ConversationState(MemoryStorage()).create_property("dialogState")
+        )
+        turn_dialogs.add(self.booking)
+        turn_registry = turn_dialogs.get_registry()
+        DialogSet(turn_dialogs._dialog_state).add(BookingDialog())
+
+        self.assertIs(registry, self.dialogs.get_registry())
+        self.assertIs(turn_registry, turn_dialogs.get_registry())
+        self.assertEqual(booking_version, self.booking._dialogs.get_version())
+
+        origin = await self.booking.find_dialog("OriginResolverDialog")
+        origin.add_dialog(WaterfallDialog("ConfirmDialog"))
+
+        self.assertIsNot(registry, self.dialogs.get_registry())
+        self.assertIsNot(turn_registry, turn_dialogs.get_registry())
+
+    async def test_root_sets_of_the_same_dialog_share_their_registry(self):
+        def turn_dialogs():
+            dialogs = DialogSet(self.dialogs._dialog_state)
+            dialogs.add(self.booking)
+            return dialogs
+
+        first, second = turn_dialogs(), turn_dialogs()
+        registry = first.get_registry()
+        self.assertIs(registry, second.get_registry())
+
+        root_dc = self.create_context(second)
+        booking_dc = self.create_context(self.booking._dialogs, root_dc)
+        self.assertIs(
+            self.booking, await booking_dc.find_dialog(BookingDialog.__name__)
+        )
+
+        self.booking.add_dialog(ResolverDialog("ReturnResolverDialog"))
+        self.assertIsNot(registry, turn_dialogs().get_registry())
+
+        # a root set holding other dialogs gets a registry of its own
+        registry = first.get_registry()
+        second.add(WaterfallDialog("OtherDialog"))
+        self.assertIs(registry, first.get_registry())
+        self.assertIsNot(registry, second.get_registry())
+        self.assertIsNotNone(
+            await self.create_context(second).find_dialog("OtherDialog")
+        )
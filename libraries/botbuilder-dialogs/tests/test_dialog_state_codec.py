@@ -0,0 +1,180 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+import copy
+
+import jsonpickle
+
+import aiounittest
+from botbuilder.core import (
+    CardFactory,
+    ConversationState,
+    MemoryStorage,
+    MessageFactory,
+)
+from botbuilder.core.adapters import TestAdapter
+from botbuilder.dialogs import (
+    ComponentDialog,
+    DialogInstance,
+    DialogSet,
+    DialogState,
+    DialogStateCodec,
+    DialogTurnStatus,
+    WaterfallDialog,
+    WaterfallStepContext,
+)
+from botbuilder.dialogs.choices import Choice
+from botbuilder.dialogs.prompts import ChoicePrompt, PromptOptions, TextPrompt
+from botbuilder.schema import HeroCard
+
+
+class PassengerDialog(ComponentDialog):
+    def __init__(self):
+        super().__init__("PassengerDialog")
+        self.add_dialog(TextPrompt(TextPrompt.__name__))
+        self.add_dialog(ChoicePrompt(ChoicePrompt.__name__))
+        self.add_dialog(
+            WaterfallDialog(
+                WaterfallDialog.__name__,
+                [self.name_step, self.class_step, self.end_step],
+            )
+        )
+        self.initial_dialog_id = WaterfallDialog.__name__
+
+    async def name_step(self, step_context: WaterfallStepContext):
+        return await step_context.prompt(
+            TextPrompt.__name__,
+            PromptOptions(
+                prompt=MessageFactory.text("What is your name?"),
+                retry_prompt=MessageFactory.text("What is your name?"),
+            ),
+        )
+
+    async def class_step(self, step_context: WaterfallStepContext):
+        step_context.values["name"] = step_context.result
+        return await step_context.prompt(
+            ChoicePrompt.__name__,
+            PromptOptions(
+                prompt=MessageFactory.text("Which class?"),
+                choices=[Choice("Economy", synonyms=["eco"]), Choice("Business")],
+            ),
+        )
+
+    async def end_step(self, step_context: WaterfallStepContext):
+        return await step_context.end_dialog(
+            f"{step_context.values['name']}: {step_context.result.value}"
+        )
+
+
+class DialogStateCodecTests(aiounittest.AsyncTestCase):
+    def setUp(self):
+        self._enabled = DialogStateCodec.enabled
+        DialogStateCodec.enabled = True
+
+    def tearDown(self):
+        DialogStateCodec.enabled = self._enabled
+
+    async def test_multi_turn_conversation(self):
+        # MemoryStorage deep copies the state, which goes through the codec
+        convo_state = ConversationState(MemoryStorage())
+        dialogs = DialogSet(convo_state.create_property("dialogState"))
+        dialogs.add(PassengerDialog())
+
+        async def exec_test(turn_context):
+            dialog_context = await dialogs.create_context(turn_context)
+            results = await dialog_context.continue_dialog()
+            if results.status == DialogTurnStatus.Empty:
+                await dialog_context.begin_dialog("PassengerDialog")
+            elif results.status == DialogTurnStatus.Complete:
+                await turn_context.send_activity(results.result)
+            await convo_state.save_changes(turn_context)
+
+        adapter = TestAdapter(exec_test)
+        step = await adapter.send("hi")
+        step = await step.assert_reply("What is your name?")
+        step = await step.send("Ada")
+        step = await step.assert_reply("Which class? (1) Economy, or (2) Business")
+        step = await step.send("eco")
+        await step.assert_reply("Ada: Economy")
+
+    def test_round_trip(self):
+        options = PromptOptions(
+            prompt=MessageFactory.text("Which class?"),
+            retry_prompt=MessageFactory.text("Which class?"),
+            choices=[Choice("Economy", synonyms=["eco"]), Choice("Business")],
+            number_of_attempts=2,
+        )
+        inner = DialogState(
+            [DialogInstance("ChoicePrompt", {"options": options, "state": {}})]
+        )
+        state = DialogState(
+            [
+                DialogInstance(
+                    "BookingDialog",
+                    {"dialogs": inner, "values": {"dialogs": "not a stack"}},
+                )
+            ]
+        )
+
+        encoded = DialogStateCodec.encode(state)
+        self.assertEqual(1, len(encoded["activities"]))
+        self.assertEqual(1, encoded["names"].count("dialogs"))
+
+        decoded = jsonpickle.decode(jsonpickle.encode(state))
+        instance = decoded.dialog_stack[0]
+        self.assertEqual("BookingDialog", instance.id)
+        self.assertEqual({"dialogs": "not a stack"}, instance.state["values"])
+
+        prompt = instance.state["dialogs"].dialog_stack[0]
+        decoded_options = prompt.state["options"]
+        self.assertEqual("ChoicePrompt", prompt.id)
+        self.assertEqual("Which class?", decoded_options.prompt.text)
+        self.assertEqual("Which class?", decoded_options.retry_prompt.text)
+        self.assertIsNot(decoded_options.prompt, decoded_options.retry_prompt)
+        self.assertEqual(["eco"], decoded_options.choices[0].synonyms)
+        self.assertEqual("Business", decoded_options.choices[1].value)
+        self.assertEqual(2, decoded_options.number_of_attempts)
+
+    def test_typed_attachment_contents_keep_their_type(self):
+        card = CardFactory.hero_card(HeroCard(title="Which class?"))
+        options = PromptOptions(
+            prompt=MessageFactory.attachment(card),
+            retry_prompt=MessageFactory.text("Which class?"),
+        )
+        state = DialogState([DialogInstance("ChoicePrompt", {"options": options})])
+
+        # left to the pickler, along with the other prompt of the options
+        self.assertEqual([], DialogStateCodec.encode(state)["activities"])
+
+        for decoded in (
+            jsonpickle.decode(jsonpickle.encode(state)),
+            copy.deepcopy(state),
+        ):
+            decoded_options = decoded.dialog_stack[0].state["options"]
+            content = decoded_options.prompt.attachments[0].content
+            self.assertIsInstance(content, HeroCard)
+            self.assertEqual("Which class?", content.title)
+            self.assertEqual("Which class?", decoded_options.retry_prompt.text)
+
+    def test_reads_both_forms(self):
+        state = DialogState([DialogInstance("TextPrompt", {"state": {"count": 1}})])
+
+        DialogStateCodec.enabled = False
+        legacy = jsonpickle.encode(state)
+        DialogStateCodec.enabled = True
+        compact = jsonpickle.encode(state)
+        self.assertNotIn(DialogStateCodec.VERSION_KEY, legacy)
+        self.assertIn(DialogStateCodec.VERSION_KEY, compact)
+
+        for enabled in (True, False):
+            DialogStateCodec.enabled = enabled
+            for encoded in (legacy, compact):
+                instance = jsonpickle.decode(encoded).dialog_stack[0]
+                self.assertEqual("TextPrompt", instance.id)
+                self.assertEqual({"count": 1}, instance.state["state"])
+
+    def test_newer_schema_version(self):
+        encoded = DialogStateCodec.encode(DialogState())
+        encoded[DialogStateCodec.VERSION_KEY] = DialogStateCodec.SCHEMA_VERSION + 1
+        with self.assertRaises(ValueError):
+            DialogStateCodec.decode(encoded)
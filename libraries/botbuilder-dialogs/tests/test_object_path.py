@@ -252,3 +252,57 @@ class ObjectPathTests(aiounittest.AsyncTestCase):
         assert not ObjectPath.try_get_path_value(test, "x.a[1]")
 
         assert ObjectPath.try_get_path_value(test, "x.a[0]") == "dabba"
+
+    async def test_indexer_paths(self):
+        test = {
+            "Turn": {"index": 1, "key": "Seattle"},
+            "cities": {"seattle": {"zip": "98052"}},
+            "list": ["a", "b", ["c", "d"]],
+        }
+
+        assert ObjectPath.try_get_path_value(test, "list[turn.index]") == "b"
+        assert ObjectPath.try_get_path_value(test, "list[2][turn.index]") == "d"
+        assert ObjectPath.try_get_path_value(test, "cities[turn.key].zip") == "98052"
+        assert ObjectPath.try_resolve_path(test, "list[turn.index]") == ["list", 1]
+        assert ObjectPath.try_resolve_path(test, "list[turn.missing]") is None
+        assert ObjectPath.try_resolve_path(test, "list[turn.index") is None
+
+        # indexers are evaluated again on every call
+        test["Turn"]["index"] = 2
+        assert ObjectPath.try_get_path_value(test, "list[turn.index][0]") == "c"
+
+    async def test_compiled_paths_are_cached(self):
+        ObjectPath.clear_cache()
+        compiled = ObjectPath.compile("dialog._tracker.paths")
+
+        assert ObjectPath.compile("dialog._tracker.paths") is compiled
+        assert compiled.parts == ["dialog", "_tracker", "paths"]
+
+        test = {}
+        ObjectPath.set_path_value(test, compiled, 3)
+        assert test == {"dialog": {"_tracker": {"paths": 3}}}
+        assert ObjectPath.try_get_path_value(test, compiled) == 3
+        assert ObjectPath.try_resolve_path(test, compiled) == [
+            "dialog",
+            "_tracker",
+            "paths",
+        ]
+
+        # the segments returned are the caller's to modify
+        ObjectPath.try_resolve_path(test, compiled).append("x")
+        assert compiled.parts == ["dialog", "_tracker", "paths"]
+
+    async def test_assign_in_place(self):
+        location = Location(lat=1.0)
+        default_options = Options(first_name="bill", dictionary={"one": 1})
+        overlay = Options(age=15, dictionary={"two": 2}, location=location)
+
+        result = ObjectPath.assign(default_options, overlay, in_place=True)
+
+        assert result is default_options
+        assert result.first_name == "bill"
+        assert result.age == 15
+        assert result.dictionary == {"one": 1, "two": 2}
+        assert result.location is location
+
+        assert ObjectPath.assign(None, overlay, in_place=True) is overlay
@@ -14,6 +14,7 @@ from aiohttp.web import (
     HTTPUnsupportedMediaType,
 )
 from botbuilder.core import Bot, BotFrameworkAdapterSettings
+from botbuilder.core.integration import read_request_activity
 from botbuilder.core.streaming import (
     BotFrameworkHttpAdapterBase,
     StreamingRequestHandler,
@@ -47,11 +48,10 @@ class BotFrameworkHttpAdapter(BotFrameworkHttpAdapterBase):
         else:
             # Deserialize the incoming Activity
             if "application/json" in request.headers["Content-Type"]:
-                body = await request.json()
+                activity = await read_request_activity(request)
             else:
                 raise HTTPUnsupportedMediaType()
 
-            activity = Activity().deserialize(body)
             auth_header = (
                 request.headers["Authorization"]
                 if "Authorization" in request.headers
@@ -107,7 +107,17 @@ class BotFrameworkHttpAdapter(BotFrameworkHttpAdapterBase):
             session = ClientSession()
             aiohttp_ws = await session.ws_connect(protocol + host + "/api/messages")
             web_socket = AiohttpWebSocket(aiohttp_ws, session)
-            handler = StreamingRequestHandler(self.connected_bot, self, web_socket)
+            handler = StreamingRequestHandler(
+                self.connected_bot,
+                self,
+                web_socket,
+                receive_limits=self.streaming_receive_limits,
+                request_timeout=self.streaming_request_timeout,
+                idle_timeout=self.streaming_idle_timeout,
+                turn_limiter=self.create_connection_turn_limiter(),
+                metrics_sink=self.streaming_metrics_sink,
+                metrics_interval=self.streaming_metrics_interval,
+            )
 
             if self.request_handlers is None:
                 self.request_handlers = []
@@ -140,7 +150,17 @@ class BotFrameworkHttpAdapter(BotFrameworkHttpAdapterBase):
 
             bf_web_socket = AiohttpWebSocket(ws_response)
 
-            request_handler = StreamingRequestHandler(bot, self, bf_web_socket)
+            request_handler = StreamingRequestHandler(
+                bot,
+                self,
+                bf_web_socket,
+                receive_limits=self.streaming_receive_limits,
+                request_timeout=self.streaming_request_timeout,
+                idle_timeout=self.streaming_idle_timeout,
+                turn_limiter=self.create_connection_turn_limiter(),
+                metrics_sink=self.streaming_metrics_sink,
+                metrics_interval=self.streaming_metrics_interval,
+            )
 
             if self.request_handlers is None:
                 self.request_handlers = []
@@ -2,7 +2,6 @@
 # Licensed under the MIT License.
 # pylint: disable=no-member
 
-import json
 from typing import Dict, List, Tuple
 from logging import Logger
 
@@ -15,7 +14,9 @@ from botbuilder.schema import (
     ConversationReference,
     ConversationAccount,
     ChannelAccount,
+    ModelCodec,
     RoleTypes,
+    json_loads,
 )
 from botframework.connector.auth import (
     ChannelProvider,
@@ -126,7 +127,7 @@ class BotFrameworkHttpClient(BotFrameworkClient):
                 }
             )
 
-        json_content = json.dumps(activity.serialize())
+        json_content = ModelCodec.get(Activity).to_json(activity)
         resp = await self._session.post(
             to_url,
             data=json_content.encode("utf-8"),
@@ -134,7 +135,7 @@ class BotFrameworkHttpClient(BotFrameworkClient):
         )
         resp.raise_for_status()
         data = (await resp.read()).decode()
-        return resp.status, json.loads(data) if data else None
+        return resp.status, json_loads(data) if data else None
 
     async def post_buffered_activity(
         self,
@@ -154,7 +155,7 @@ class BotFrameworkHttpClient(BotFrameworkClient):
         )
         if not response or (response.status / 100) != 2:
             return []
-        return ExpectedReplies().deserialize(response.body).activities
+        return ModelCodec.get(ExpectedReplies).deserialize(response.body).activities
 
     async def _get_app_credentials(
         self, app_id: str, oauth_scope: str
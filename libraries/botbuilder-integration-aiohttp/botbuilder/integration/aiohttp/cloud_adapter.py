@@ -19,6 +19,7 @@ from botbuilder.core import (
     InvokeResponse,
     TurnContext,
 )
+from botbuilder.core.integration import read_request_activity
 from botbuilder.core.streaming import (
     StreamingActivityProcessor,
     StreamingHttpDriver,
@@ -77,12 +78,10 @@ class CloudAdapter(CloudAdapterBase, BotFrameworkHttpAdapterIntegrationBase):
             elif request.method == "POST":
                 # Deserialize the incoming Activity
                 if "application/json" in request.headers["Content-Type"]:
-                    body = await request.json()
+                    activity: Activity = await read_request_activity(request)
                 else:
                     raise HTTPUnsupportedMediaType()
 
-                activity: Activity = Activity().deserialize(body)
-
                 # A POST request must contain an Activity
                 if not activity.type:
                     raise HTTPBadRequest
@@ -0,0 +1,34 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+from unittest.mock import AsyncMock, Mock, patch
+
+import aiounittest
+
+from botbuilder.core import BotFrameworkAdapterSettings
+from botbuilder.integration.aiohttp import BotFrameworkHttpAdapter
+from botframework.streaming.payload_transport import ReceiveLimits
+
+ADAPTER_MODULE = "botbuilder.integration.aiohttp.bot_framework_http_adapter"
+
+
+class TestBotFrameworkHttpAdapter(aiounittest.AsyncTestCase):
+    async def test_streaming_settings_reach_the_request_handler(self):
+        adapter = BotFrameworkHttpAdapter(BotFrameworkAdapterSettings("", ""))
+        adapter.streaming_receive_limits = ReceiveLimits(max_connection_buffer=1024)
+        adapter.streaming_request_timeout = 30
+        adapter.streaming_idle_timeout = 60
+        adapter._http_authenticate_request = AsyncMock(return_value=True)
+
+        ws_response = Mock()
+        ws_response.prepare = AsyncMock()
+        with patch(f"{ADAPTER_MODULE}.AiohttpWebSocket"), patch(
+            f"{ADAPTER_MODULE}.StreamingRequestHandler"
+        ) as handler_class:
+            handler_class.return_value.listen = AsyncMock()
+            await adapter.process(Mock(method="GET"), ws_response, Mock())
+
+        _, kwargs = handler_class.call_args
+        self.assertIs(adapter.streaming_receive_limits, kwargs["receive_limits"])
+        self.assertEqual(30, kwargs["request_timeout"])
+        self.assertEqual(60, kwargs["idle_timeout"])
@@ -1,27 +1,29 @@
-from threading import current_thread
 from aiohttp.web import middleware
-
-# Map of thread id => POST body text
-_REQUEST_BODIES = {}
+from botbuilder.core.integration import (
+    clear_request_body,
+    get_request_body,
+    read_request_body,
+)
 
 
 def retrieve_aiohttp_body():
     """
-    Retrieve the POST body text from temporary cache.
+    Retrieve the POST body from the request scoped cache.
 
-    The POST body corresponds with the thread id and should resides in
-    cache just for lifetime of request.
+    The body is parsed once by the middleware and shared with the request
+    handler, and resides in cache just for lifetime of request.
     """
-    result = _REQUEST_BODIES.pop(current_thread().ident, None)
-    return result
+    return get_request_body()
 
 
 @middleware
 async def bot_telemetry_middleware(request, handler):
-    """Process the incoming Flask request."""
-    if "application/json" in request.headers["Content-Type"]:
-        body = await request.json()
-        _REQUEST_BODIES[current_thread().ident] = body
+    """Process the incoming aiohttp request."""
+    try:
+        if "application/json" in request.headers["Content-Type"]:
+            await read_request_body(request)
 
-    response = await handler(request)
-    return response
+        response = await handler(request)
+        return response
+    finally:
+        clear_request_body()
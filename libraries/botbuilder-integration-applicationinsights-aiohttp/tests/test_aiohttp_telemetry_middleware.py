@@ -2,34 +2,44 @@ from asyncio import Future
 from unittest.mock import Mock, MagicMock
 from aiounittest import AsyncTestCase
 
+from botbuilder.core.integration import get_request_body, read_request_body
 from botbuilder.integration.applicationinsights.aiohttp import (
     bot_telemetry_middleware,
     aiohttp_telemetry_middleware,
 )
 
 
+def _mock_request(body):
+    req = Mock()
+    req.headers = {"Content-Type": "application/json"}
+    req.json = MagicMock(return_value=Future())
+    req.json.return_value.set_result(body)
+    return req
+
+
 class TestAiohttpTelemetryMiddleware(AsyncTestCase):
-    # pylint: disable=protected-access
     async def test_bot_telemetry_middleware(self):
-        req = Mock()
-        req.headers = {"Content-Type": "application/json"}
-        req.json = MagicMock(return_value=Future())
-        req.json.return_value.set_result("mock body")
+        req = _mock_request("mock body")
 
         async def handler(value):
+            assert aiohttp_telemetry_middleware.retrieve_aiohttp_body() == "mock body"
             return value
 
         sut = await bot_telemetry_middleware(req, handler)
 
-        assert "mock body" in aiohttp_telemetry_middleware._REQUEST_BODIES.values()
-        aiohttp_telemetry_middleware._REQUEST_BODIES.clear()
         assert req == sut
+        assert get_request_body() is None
+
+    async def test_body_parsed_once(self):
+        req = _mock_request({"type": "message"})
+
+        async def handler(value):
+            assert await read_request_body(value) == {"type": "message"}
+            return value
+
+        await bot_telemetry_middleware(req, handler)
 
-    def test_retrieve_aiohttp_body(self):
-        aiohttp_telemetry_middleware._REQUEST_BODIES = Mock()
-        aiohttp_telemetry_middleware._REQUEST_BODIES.pop = Mock(
-            return_value="test body"
-        )
-        assert aiohttp_telemetry_middleware.retrieve_aiohttp_body() == "test body"
+        assert req.json.call_count == 1
 
-        aiohttp_telemetry_middleware._REQUEST_BODIES = {}
+    def test_retrieve_aiohttp_body_outside_request(self):
+        assert aiohttp_telemetry_middleware.retrieve_aiohttp_body() is None
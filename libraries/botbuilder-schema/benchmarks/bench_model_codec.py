@@ -0,0 +1,88 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+"""
+Microbenchmark of ModelCodec against msrest Model.deserialize/serialize.
+
+Runs over the captured activities in tests/resources/activities:
+
+    python benchmarks/bench_model_codec.py [--number N]
+"""
+
+import argparse
+import json
+import os
+import timeit
+
+from botbuilder.schema import (
+    Activity,
+    LazyActivity,
+    ModelCodec,
+    json_dumps,
+    json_loads,
+)
+
+ACTIVITIES_DIR = os.path.join(
+    os.path.dirname(__file__), "..", "tests", "resources", "activities"
+)
+
+
+def _report(name: str, msrest_time: float, codec_time: float, number: int):
+    print(
+        f"{name:<40} msrest {msrest_time / number * 1e6:9.1f} us"
+        f"   codec {codec_time / number * 1e6:9.1f} us"
+        f"   x{msrest_time / codec_time:5.1f}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--number", type=int, default=2000)
+    number = parser.parse_args().number
+
+    codec = ModelCodec.get(Activity)
+    lazy_codec = ModelCodec.get(LazyActivity)
+    for file_name in sorted(os.listdir(ACTIVITIES_DIR)):
+        with open(os.path.join(ACTIVITIES_DIR, file_name), encoding="utf-8") as file:
+            text = file.read()
+        body = json.loads(text)
+        activity = codec.deserialize(body)
+
+        _report(
+            f"{file_name} deserialize",
+            timeit.timeit(lambda: Activity().deserialize(body), number=number),
+            timeit.timeit(lambda: codec.deserialize(body), number=number),
+            number,
+        )
+        _report(
+            f"{file_name} deserialize lazy",
+            timeit.timeit(lambda: Activity().deserialize(body), number=number),
+            timeit.timeit(lambda: lazy_codec.deserialize(body), number=number),
+            number,
+        )
+        _report(
+            f"{file_name} serialize",
+            timeit.timeit(activity.serialize, number=number),
+            timeit.timeit(lambda: codec.serialize(activity), number=number),
+            number,
+        )
+        _report(
+            f"{file_name} json -> activity -> json",
+            timeit.timeit(
+                lambda: json.dumps(
+                    Activity().deserialize(json.loads(text)).serialize()
+                ),
+                number=number,
+            ),
+            timeit.timeit(
+                lambda: json_dumps(
+                    codec.serialize(codec.deserialize(json_loads(text)))
+                ),
+                number=number,
+            ),
+            number,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -73,6 +73,8 @@ from ._connector_client_enums import (
 
 from ._sign_in_enums import SignInConstants
 from .callerid_constants import CallerIdConstants
+from .model_codec import ModelCodec, json_dumps, json_dumps_bytes, json_loads
+from .lazy_activity import LazyActivity
 from .speech_constants import SpeechConstants
 
 __all__ = [
@@ -146,5 +148,10 @@ __all__ = [
     "ContactRelationUpdateActionTypes",
     "InstallationUpdateActionTypes",
     "CallerIdConstants",
+    "LazyActivity",
+    "ModelCodec",
+    "json_dumps",
+    "json_dumps_bytes",
+    "json_loads",
     "SpeechConstants",
 ]
@@ -0,0 +1,70 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+from ._models_py3 import Activity
+from .model_codec import ModelCodec
+
+
+class _LazyAttribute:
+    """
+    Non-data descriptor that decodes a pending attribute on first read. Once decoded
+    (or assigned) the value lives in the instance __dict__, which takes precedence
+    over this descriptor.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        return ModelCodec.get(owner).materialize_attribute(instance, self.name)
+
+
+class LazyActivity(Activity):
+    """
+    An Activity whose nested collections and models are kept as the raw JSON
+    received and only turned into Attachment, Entity, ChannelAccount, ... models
+    when first read.
+
+    Build it with ``ModelCodec.get(LazyActivity).deserialize(body)``. Constructed
+    with keyword arguments it behaves exactly like Activity. Note that ``vars()``
+    only lists the attributes already materialized; call :meth:`materialize` first
+    when all of them are needed.
+    """
+
+    _lazy_attributes = (
+        "members_added",
+        "members_removed",
+        "reactions_added",
+        "reactions_removed",
+        "suggested_actions",
+        "attachments",
+        "entities",
+        "relates_to",
+        "text_highlights",
+        "semantic_action",
+    )
+
+    def materialize(self) -> "LazyActivity":
+        """Decodes every pending attribute."""
+        if "_lazy_values" in self.__dict__:
+            for attr in self._lazy_attributes:
+                getattr(self, attr)
+            del self.__dict__["_lazy_values"]
+        return self
+
+    def __eq__(self, other):
+        if not isinstance(other, Activity):
+            return False
+        self.materialize()
+        if isinstance(other, LazyActivity):
+            other.materialize()
+        return self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+
+for _attr in LazyActivity._lazy_attributes:  # pylint: disable=protected-access
+    setattr(LazyActivity, _attr, _LazyAttribute(_attr))
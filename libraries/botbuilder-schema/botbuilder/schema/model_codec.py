@@ -0,0 +1,343 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+"""
+Specialized serializer/deserializer for the msrest models of this package.
+
+msrest walks a model's ``_attribute_map`` reflectively on every call, copying the
+attribute descriptions and running its key extractors for each attribute.
+ModelCodec compiles the attribute map of a model class once into per-key converters
+and produces the same models and dictionaries as ``Model.deserialize`` and
+``Model.serialize``. Anything the fast path does not recognize is handed to msrest,
+so malformed payloads fail with the same errors.
+"""
+
+import json
+from datetime import datetime
+from typing import Callable, Dict, Type
+
+from msrest.serialization import Deserializer, Model, Serializer
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+def json_loads(data):
+    """Parses JSON text, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj) -> str:
+    """Dumps an object to JSON text, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj)
+
+
+def json_dumps_bytes(obj) -> bytes:
+    """Dumps an object to UTF-8 encoded JSON, without going through a str with orjson."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+_BASIC_TYPES = {"str": str, "int": int, "float": float, "bool": bool}
+_JSON_SCALARS = frozenset(_BASIC_TYPES.values())
+
+
+class ModelCodec:
+    """
+    Compiled encoder/decoder for one msrest Model class.
+
+    Use :meth:`get` to obtain the shared codec of a class. Decoded models compare
+    equal to the ones built by ``Model.deserialize``, and encoded dictionaries are
+    identical to the ones built by ``Model.serialize``. Values of ``object`` typed
+    attributes are shared with the decoded payload rather than copied.
+
+    Attributes listed in the model class ``_lazy_attributes`` are kept as raw JSON
+    by :meth:`deserialize` and decoded by :meth:`materialize_attribute` when first
+    read (see LazyActivity).
+    """
+
+    _codecs: Dict[type, "ModelCodec"] = {}
+
+    def __init__(self, model_class: Type[Model]):
+        self.model_class = model_class
+        self._compiled = False
+        self._fast = False
+        self._decoders: Dict[str, tuple] = {}
+        self._encoders: list = []
+        self._lazy_decoders: Dict[str, Callable] = {}
+        self._template: dict = None
+        self._deserializer: Deserializer = None
+        self._serializer: Serializer = None
+
+    @staticmethod
+    def get(model_class: Type[Model]) -> "ModelCodec":
+        codec = ModelCodec._codecs.get(model_class)
+        if codec is None:
+            codec = ModelCodec._codecs.setdefault(model_class, ModelCodec(model_class))
+        return codec
+
+    def deserialize(self, data) -> Model:
+        """
+        Builds a model from its JSON (dict) representation.
+
+        :param data: The dict to deserialize. JSON text is parsed first.
+        :return: The model, or None if data is None.
+        """
+        if data is None:
+            return None
+        if not self._compiled:
+            self._compile()
+        if isinstance(data, (str, bytes)):
+            data = json_loads(data)
+        if not self._fast or data.__class__ is not dict:
+            return self.model_class.deserialize(data)
+
+        state = self._template.copy()
+        additional_properties = {}
+        lazy_values = {}
+        decoders = self._decoders
+        for key, value in data.items():
+            decoder = decoders.get(key)
+            if decoder is None:
+                additional_properties[key] = value
+            elif value is not None:
+                attr, convert, lazy = decoder
+                if lazy:
+                    lazy_values[attr] = value
+                else:
+                    state[attr] = value if convert is None else convert(value)
+        state["additional_properties"] = additional_properties
+        if lazy_values:
+            state["_lazy_values"] = lazy_values
+
+        model = self.model_class.__new__(self.model_class)
+        model.__dict__.update(state)
+        return model
+
+    def serialize(self, model: Model) -> dict:
+        """
+        Builds the JSON (dict) representation of a model.
+
+        :param model: The model to serialize.
+        :return: The dict, or None if model is None.
+        """
+        if model is None:
+            return None
+        if not self._compiled:
+            self._compile()
+        if model.__class__ is not self.model_class:
+            return ModelCodec.get(model.__class__).serialize(model)
+        if not self._fast:
+            return model.serialize()
+
+        serialized = {}
+        for attr, key, convert in self._encoders:
+            value = getattr(model, attr)
+            if value is not None:
+                serialized[key] = value if convert is None else convert(value)
+        return serialized
+
+    def materialize_attribute(self, model: Model, attr: str):
+        """
+        Decodes a lazy attribute of a model built by :meth:`deserialize` and stores
+        the result on the model, so later reads are plain attribute lookups.
+
+        :param model: The model.
+        :param attr: The name of one of the model class ``_lazy_attributes``.
+        :return: The decoded value.
+        """
+        if not self._compiled:
+            self._compile()
+        lazy_values = model.__dict__.get("_lazy_values")
+        value = lazy_values.get(attr) if lazy_values else None
+        if value is not None:
+            convert = self._lazy_decoders[attr]
+            if convert is not None:
+                value = convert(value)
+        model.__dict__[attr] = value
+        return value
+
+    def from_json(self, text) -> Model:
+        return self.deserialize(json_loads(text))
+
+    def to_json(self, model: Model) -> str:
+        return json_dumps(self.serialize(model))
+
+    def to_json_bytes(self, model: Model) -> bytes:
+        return json_dumps_bytes(self.serialize(model))
+
+    def _compile(self):
+        # pylint: disable=protected-access
+        model_class = self.model_class
+        dependencies = model_class._infer_class_models()
+        self._deserializer = Deserializer(dependencies)
+        self._serializer = Serializer(dependencies)
+        self._template = _plain_init_template(model_class)
+
+        attribute_map = model_class._attribute_map
+        lazy_attributes = set(getattr(model_class, "_lazy_attributes", ()))
+        keys = [desc["key"] for desc in attribute_map.values()]
+        self._fast = (
+            self._template is not None
+            and not getattr(model_class, "_subtype_map", None)
+            and not getattr(model_class, "_xml_map", None)
+            and not model_class._validation
+            and "additional_properties" not in attribute_map
+            and all(key and "." not in key for key in keys)
+            and all(isinstance(desc["type"], str) for desc in attribute_map.values())
+            and len(set(keys)) == len(keys)
+        )
+
+        if self._fast:
+            for attr in lazy_attributes:
+                del self._template[attr]
+            for attr, desc in attribute_map.items():
+                data_type = desc["type"]
+                decoder = self._decoder(data_type, dependencies)
+                self._decoders[desc["key"]] = (attr, decoder, attr in lazy_attributes)
+                if attr in lazy_attributes:
+                    self._lazy_decoders[attr] = decoder
+                self._encoders.append(
+                    (attr, desc["key"], self._encoder(data_type, dependencies))
+                )
+
+        self._compiled = True
+
+    def _decoder(self, data_type: str, dependencies: dict) -> Callable:
+        slow = self._deserializer.deserialize_data
+
+        if data_type in _BASIC_TYPES:
+            expected = _BASIC_TYPES[data_type]
+            return lambda value: (
+                value if value.__class__ is expected else slow(value, data_type)
+            )
+
+        if data_type == "object":
+            return None
+
+        if data_type == "iso-8601":
+            return lambda value: (
+                value if isinstance(value, datetime) else slow(value, data_type)
+            )
+
+        if data_type[0] + data_type[-1] in ("[]", "{}"):
+            item = self._decoder(data_type[1:-1], dependencies)
+            if data_type[0] == "[":
+                if item is None:
+                    return lambda value: (
+                        value if value.__class__ is list else slow(value, data_type)
+                    )
+                return lambda value: (
+                    [None if entry is None else item(entry) for entry in value]
+                    if value.__class__ is list
+                    else slow(value, data_type)
+                )
+            if item is None:
+                return lambda value: (
+                    value if value.__class__ is dict else slow(value, data_type)
+                )
+            return lambda value: (
+                {k: None if v is None else item(v) for k, v in value.items()}
+                if value.__class__ is dict
+                else slow(value, data_type)
+            )
+
+        model_class = dependencies.get(data_type)
+        if isinstance(model_class, type) and issubclass(model_class, Model):
+            codec = ModelCodec.get(model_class)
+            return lambda value: (
+                codec.deserialize(value)
+                if value.__class__ is dict
+                else slow(value, data_type)
+            )
+
+        return lambda value: slow(value, data_type)
+
+    def _encoder(self, data_type: str, dependencies: dict) -> Callable:
+        slow = self._serializer.serialize_data
+
+        if data_type == "str":
+            return lambda value: (
+                value if value.__class__ is str else Serializer.serialize_unicode(value)
+            )
+
+        if data_type in _BASIC_TYPES:
+            expected = _BASIC_TYPES[data_type]
+            return lambda value: (
+                value if value.__class__ is expected else slow(value, data_type)
+            )
+
+        if data_type == "object":
+            return self._encode_object
+
+        if data_type[0] + data_type[-1] in ("[]", "{}"):
+            item = self._encoder(data_type[1:-1], dependencies)
+            if data_type[0] == "[":
+                return lambda value: (
+                    [None if entry is None else item(entry) for entry in value]
+                    if value.__class__ is list
+                    else slow(value, data_type)
+                )
+            return lambda value: (
+                {k: None if v is None else item(v) for k, v in value.items()}
+                if value.__class__ is dict
+                else slow(value, data_type)
+            )
+
+        model_class = dependencies.get(data_type)
+        if isinstance(model_class, type) and issubclass(model_class, Model):
+            return lambda value: (
+                ModelCodec.get(value.__class__).serialize(value)
+                if isinstance(value, Model)
+                else slow(value, data_type)
+            )
+
+        return lambda value: slow(value, data_type)
+
+    def _encode_object(self, value):
+        value_class = value.__class__
+        if value_class in _JSON_SCALARS:
+            return value
+        if value_class is dict:
+            if all(key.__class__ is str for key in value):
+                return {
+                    key: None if item is None else self._encode_object(item)
+                    for key, item in value.items()
+                }
+        elif value_class is list:
+            return [
+                None if item is None else self._encode_object(item) for item in value
+            ]
+        elif isinstance(value, Model):
+            return ModelCodec.get(value_class).serialize(value)
+        return self._serializer.serialize_object(value)
+
+
+def _plain_init_template(model_class: Type[Model]) -> dict:
+    """
+    Returns the attribute dict of an instance built with every attribute set to
+    None, if the class __init__ only stores its keyword arguments. Such classes can
+    be instantiated by filling __dict__ directly. Returns None otherwise.
+    """
+    # pylint: disable=protected-access
+    attributes = list(model_class._attribute_map)
+    markers = {attr: object() for attr in attributes}
+    try:
+        with_markers = model_class(**markers).__dict__
+        with_none = model_class(**dict.fromkeys(attributes)).__dict__
+    except Exception:  # pylint: disable=broad-except
+        return None
+
+    expected = dict(markers, additional_properties={})
+    if with_markers != expected or set(with_none) != set(expected):
+        return None
+    if any(value is not None for key, value in with_none.items() if key in markers):
+        return None
+    return with_none
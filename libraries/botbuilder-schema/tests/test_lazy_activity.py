@@ -0,0 +1,105 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+from copy import copy, deepcopy
+
+import aiounittest
+
+from botbuilder.schema import (
+    Activity,
+    Attachment,
+    ChannelAccount,
+    Entity,
+    LazyActivity,
+    ModelCodec,
+)
+
+BODY = {
+    "type": "conversationUpdate",
+    "id": "activity-id",
+    "channelId": "msteams",
+    "conversation": {"id": "conversation-id"},
+    "membersAdded": [{"id": "user-1", "name": "User"}, {"id": "bot"}],
+    "attachments": [{"contentType": "text/html", "content": "<div>hi</div>"}],
+    "entities": [
+        {
+            "type": "mention",
+            "text": "<at>Bot</at>",
+            "mentioned": {"id": "bot", "name": "Bot"},
+        }
+    ],
+    "channelData": {"tenant": {"id": "tenant-id"}},
+}
+
+
+class TestLazyActivity(aiounittest.AsyncTestCase):
+    def setUp(self):
+        self.codec = ModelCodec.get(LazyActivity)
+
+    def test_nested_models_built_on_first_read(self):
+        activity = self.codec.deserialize(BODY)
+
+        self.assertNotIn("attachments", vars(activity))
+        self.assertNotIn("entities", vars(activity))
+
+        entity = activity.entities[0]
+        self.assertIsInstance(entity, Entity)
+        self.assertEqual("mention", entity.type)
+        self.assertIs(entity, activity.entities[0])
+        self.assertNotIn("attachments", vars(activity))
+
+    def test_absent_attributes_are_none(self):
+        activity = self.codec.deserialize({"type": "message"})
+
+        self.assertIsNone(activity.attachments)
+        self.assertIsNone(activity.members_added)
+
+    def test_equals_eager_activity(self):
+        eager = Activity().deserialize(BODY)
+
+        self.assertEqual(eager, self.codec.deserialize(BODY))
+        self.assertEqual(self.codec.deserialize(BODY), eager)
+        self.assertEqual(self.codec.deserialize(BODY), self.codec.deserialize(BODY))
+        self.assertNotEqual(self.codec.deserialize({"type": "message"}), eager)
+
+    def test_assignment_replaces_pending_value(self):
+        activity = self.codec.deserialize(BODY)
+
+        activity.attachments = [Attachment(content_type="text/plain")]
+
+        self.assertEqual("text/plain", activity.attachments[0].content_type)
+
+    def test_serialize_matches_msrest(self):
+        self.assertEqual(
+            Activity().deserialize(BODY).serialize(),
+            ModelCodec.get(Activity).serialize(self.codec.deserialize(BODY)),
+        )
+        self.assertEqual(
+            Activity().deserialize(BODY).serialize(),
+            self.codec.deserialize(BODY).serialize(),
+        )
+
+    def test_copies_materialize_independently(self):
+        activity = self.codec.deserialize(BODY)
+        shallow = copy(activity)
+        deep = deepcopy(activity)
+
+        self.assertEqual(
+            [ChannelAccount(id="user-1", name="User"), ChannelAccount(id="bot")],
+            shallow.members_added,
+        )
+        self.assertIsNot(shallow.members_added, activity.members_added)
+        self.assertEqual(activity.members_added, deep.members_added)
+
+    def test_materialize(self):
+        activity = self.codec.deserialize(BODY).materialize()
+
+        self.assertNotIn("_lazy_values", vars(activity))
+        self.assertEqual(vars(Activity().deserialize(BODY)), vars(activity))
+
+    def test_constructor_is_eager(self):
+        activity = LazyActivity(type="message", entities=[Entity(type="mention")])
+
+        self.assertEqual(
+            Activity(type="message", entities=[Entity(type="mention")]), activity
+        )
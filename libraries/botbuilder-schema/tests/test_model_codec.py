@@ -0,0 +1,128 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+import json
+import os
+from datetime import datetime, timezone
+
+import aiounittest
+from msrest.exceptions import DeserializationError
+
+from botbuilder.schema import (
+    Activity,
+    ActivityTypes,
+    Attachment,
+    ChannelAccount,
+    ExpectedReplies,
+    HeroCard,
+    ModelCodec,
+)
+
+ACTIVITIES_DIR = os.path.join(os.path.dirname(__file__), "resources", "activities")
+
+
+def load_activities():
+    activities = {}
+    for file_name in sorted(os.listdir(ACTIVITIES_DIR)):
+        with open(os.path.join(ACTIVITIES_DIR, file_name), encoding="utf-8") as file:
+            activities[file_name] = json.load(file)
+    return activities
+
+
+class TestModelCodec(aiounittest.AsyncTestCase):
+    def setUp(self):
+        self.codec = ModelCodec.get(Activity)
+
+    def test_get_returns_shared_codec(self):
+        self.assertIs(self.codec, ModelCodec.get(Activity))
+
+    def test_deserialize_matches_msrest(self):
+        for name, body in load_activities().items():
+            with self.subTest(name):
+                self.assertEqual(
+                    Activity().deserialize(body), self.codec.deserialize(body)
+                )
+
+    def test_serialize_matches_msrest(self):
+        for name, body in load_activities().items():
+            with self.subTest(name):
+                activity = Activity().deserialize(body)
+                expected = activity.serialize()
+                actual = self.codec.serialize(activity)
+
+                self.assertEqual(expected, actual)
+                self.assertEqual(list(expected), list(actual))
+
+    def test_round_trip(self):
+        for name, body in load_activities().items():
+            with self.subTest(name):
+                serialized = self.codec.serialize(self.codec.deserialize(body))
+                self.assertEqual(
+                    serialized,
+                    self.codec.serialize(self.codec.deserialize(serialized)),
+                )
+                self.assertEqual(
+                    Activity().deserialize(serialized).serialize(), serialized
+                )
+
+    def test_unknown_keys_go_to_additional_properties(self):
+        body = {"type": "message", "customField": {"a": 1}}
+
+        activity = self.codec.deserialize(body)
+
+        self.assertEqual({"customField": {"a": 1}}, activity.additional_properties)
+        self.assertEqual(Activity().deserialize(body), activity)
+
+    def test_coerces_like_msrest(self):
+        body = {
+            "type": 5,
+            "historyDisclosed": "true",
+            "timestamp": "2021-03-04T10:21:45Z",
+        }
+
+        activity = self.codec.deserialize(body)
+
+        self.assertEqual("5", activity.type)
+        self.assertTrue(activity.history_disclosed)
+        self.assertEqual(Activity().deserialize(body), activity)
+
+    def test_malformed_raises_like_msrest(self):
+        body = {"type": "message", "membersAdded": "not a list"}
+
+        with self.assertRaises(DeserializationError):
+            Activity().deserialize(body)
+        with self.assertRaises(DeserializationError):
+            self.codec.deserialize(body)
+
+    def test_serialize_enums_dates_and_nested_models(self):
+        activity = Activity(
+            type=ActivityTypes.message,
+            timestamp=datetime(2021, 3, 4, 10, 21, 45, 123000, tzinfo=timezone.utc),
+            from_property=ChannelAccount(id="user", name="User"),
+            members_added=[ChannelAccount(id="bot"), None],
+            attachments=[
+                Attachment(
+                    content_type="application/vnd.microsoft.card.hero",
+                    content=HeroCard(title="Paris to Berlin"),
+                )
+            ],
+            channel_data={"tenant": {"id": "tenant"}, "flags": [1, None, "x"]},
+        )
+
+        self.assertEqual(activity.serialize(), self.codec.serialize(activity))
+
+    def test_json(self):
+        body = load_activities()["teams_message.json"]
+
+        activity = self.codec.from_json(json.dumps(body))
+
+        self.assertEqual(Activity().deserialize(body), activity)
+        self.assertEqual(activity.serialize(), json.loads(self.codec.to_json(activity)))
+
+    def test_expected_replies(self):
+        body = {"activities": list(load_activities().values())}
+
+        self.assertEqual(
+            ExpectedReplies().deserialize(body),
+            ModelCodec.get(ExpectedReplies).deserialize(body),
+        )
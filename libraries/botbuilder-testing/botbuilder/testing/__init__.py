@@ -1,9 +1,23 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # Licensed under the MIT License.
 
+from .dialog_simulator import (
+    DialogSimulator,
+    SimulatedTurn,
+    SimulationReport,
+    SimulationScript,
+)
 from .dialog_test_client import DialogTestClient
 from .dialog_test_logger import DialogTestLogger
 from .storage_base_tests import StorageBaseTests
 
 
-__all__ = ["DialogTestClient", "DialogTestLogger", "StorageBaseTests"]
+__all__ = [
+    "DialogSimulator",
+    "DialogTestClient",
+    "DialogTestLogger",
+    "SimulatedTurn",
+    "SimulationReport",
+    "SimulationScript",
+    "StorageBaseTests",
+]
@@ -0,0 +1,306 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+import asyncio
+import json
+import math
+import time
+import tracemalloc
+from typing import Dict, Iterable, List, Union
+
+import jsonpickle
+
+from botbuilder.core import (
+    ConversationState,
+    MemoryStorage,
+    Middleware,
+    Storage,
+    TurnContext,
+    UserState,
+)
+from botbuilder.core.adapters import TestAdapter
+from botbuilder.dialogs import Dialog, DialogExtensions
+from botbuilder.schema import (
+    Activity,
+    ActivityTypes,
+    ChannelAccount,
+    ConversationAccount,
+)
+
+
+class SimulatedTurn:
+    """A message sent by a simulated user, with the replies expected from the bot."""
+
+    def __init__(self, text: str, expected: List[str] = None):
+        """
+        :param text: The text of the message.
+        :param expected: (Optional) The texts of the first message replies, in order.
+        """
+        self.text = text
+        self.expected = [expected] if isinstance(expected, str) else expected
+
+
+class SimulationScript:
+    """The turns of one simulated conversation."""
+
+    def __init__(self, turns: List[Union[str, SimulatedTurn]], name: str = None):
+        self.name = name
+        self.turns = [
+            turn if isinstance(turn, SimulatedTurn) else SimulatedTurn(turn)
+            for turn in turns
+        ]
+
+    @staticmethod
+    def from_dict(data: dict) -> "SimulationScript":
+        """
+        Creates a script from ``{"name": ..., "turns": [...]}``, each turn being a
+        text or ``{"text": ..., "expected": [...]}``. A dict without turns, such as
+        ``{"text": ...}``, is a conversation of one turn.
+        """
+        turns = data.get("turns")
+        if turns is None:
+            turns = [data]
+        return SimulationScript(
+            [
+                SimulatedTurn(turn.get("text"), turn.get("expected"))
+                if isinstance(turn, dict)
+                else turn
+                for turn in turns
+            ],
+            data.get("name"),
+        )
+
+    @staticmethod
+    def load_jsonl(lines: Union[str, Iterable[str]]) -> List["SimulationScript"]:
+        """
+        Loads the scripts of a JSON lines transcript, one conversation per line.
+
+        :param lines: The path of the file, or its lines.
+        """
+        if isinstance(lines, str):
+            with open(lines, encoding="utf-8") as file:
+                return SimulationScript.load_jsonl(file.readlines())
+        return [
+            SimulationScript.from_dict(json.loads(line)) for line in lines if line.strip()
+        ]
+
+
+class SimulationReport:
+    """Throughput, latency and state size of a simulation run."""
+
+    def __init__(self):
+        self.conversations = 0
+        self.turns = 0
+        self.errors = 0
+        self.mismatches = 0
+        self.failures: List[str] = []
+        self.duration = 0.0
+        self.latencies: List[float] = []
+        self.state_sizes: List[int] = []
+        self.memory_growth: int = None
+        self.memory_peak: int = None
+
+    @property
+    def turns_per_second(self) -> float:
+        return self.turns / self.duration if self.duration else 0.0
+
+    def latency_percentile(self, percentile: float) -> float:
+        """Gets a percentile of the turn latencies, in milliseconds (nearest rank)."""
+        if not self.latencies:
+            return 0.0
+        latencies = sorted(self.latencies)
+        rank = max(math.ceil(percentile / 100 * len(latencies)), 1)
+        return latencies[rank - 1] * 1000
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "conversations": self.conversations,
+            "turns": self.turns,
+            "errors": self.errors,
+            "mismatches": self.mismatches,
+            "duration_s": self.duration,
+            "turns_per_second": self.turns_per_second,
+            "p50_ms": self.latency_percentile(50),
+            "p99_ms": self.latency_percentile(99),
+            "max_ms": max(self.latencies) * 1000 if self.latencies else 0.0,
+            "mean_state_bytes": sum(self.state_sizes) / len(self.state_sizes)
+            if self.state_sizes
+            else 0,
+            "max_state_bytes": max(self.state_sizes, default=0),
+            "memory_growth_bytes": self.memory_growth,
+            "memory_peak_bytes": self.memory_peak,
+        }
+
+    def __str__(self):
+        lines = [f"{key}: {value}" for key, value in self.to_dict().items()]
+        lines.extend(f"failure: {failure}" for failure in self.failures)
+        return "\n".join(lines)
+
+
+class DialogSimulator:
+    """
+    Runs many synthetic conversations concurrently through a dialog, as a
+    performance gate or a regression run over recorded transcripts.
+
+    Each conversation has its own :class:`TestAdapter`, user and conversation ids,
+    and its turns are sent one after the other, while up to ``concurrency``
+    conversations run at the same time. Conversation and user state are kept in
+    the given storage, so the cost of reading and writing state is part of the
+    measured turns.
+
+    ```python
+    simulator = DialogSimulator(MAIN_DIALOG, MemoryStorage(), concurrency=200)
+    report = await simulator.run(SimulationScript.load_jsonl("transcripts.jsonl"), 5000)
+    print(report)
+    ```
+    """
+
+    MAX_FAILURES = 20
+
+    def __init__(
+        self,
+        dialog: Dialog,
+        storage: Storage = None,
+        concurrency: int = 100,
+        middlewares: List[Middleware] = None,
+        channel_id: str = "test",
+        track_memory: bool = False,
+    ):
+        """
+        :param dialog: The root dialog, run as a bot running it on every message would.
+        :param storage: (Optional) The storage of the bot state, a MemoryStorage by default.
+        :param concurrency: The number of conversations run at the same time.
+        :param middlewares: (Optional) Middlewares added to the adapter of every conversation.
+        :param channel_id: The channel id of the simulated activities.
+        :param track_memory: Whether to measure memory growth with tracemalloc, which
+        slows the run down noticeably.
+        """
+        if concurrency < 1:
+            raise TypeError("DialogSimulator: concurrency must be at least 1.")
+
+        self.dialog = dialog
+        self.storage = storage or MemoryStorage()
+        self.concurrency = concurrency
+        self.middlewares = middlewares or []
+        self.channel_id = channel_id
+        self.track_memory = track_memory
+        self.conversation_state = ConversationState(self.storage)
+        self.user_state = UserState(self.storage)
+        self._dialog_state = self.conversation_state.create_property("DialogState")
+        self._state_keys: Dict[str, str] = {}
+
+    async def run(
+        self, scripts: List[SimulationScript], conversations: int = None
+    ) -> SimulationReport:
+        """
+        Runs the scripts, assigned to the conversations in turn.
+
+        :param scripts: The scripts to run.
+        :param conversations: (Optional) The number of conversations, one per script by default.
+        :return: The report of the run.
+        """
+        if not scripts:
+            raise TypeError("DialogSimulator.run(): scripts cannot be empty.")
+
+        conversations = len(scripts) if conversations is None else conversations
+        report = SimulationReport()
+        report.conversations = conversations
+        semaphore = asyncio.Semaphore(self.concurrency)
+        self._state_keys.clear()
+
+        async def run_conversation(index: int):
+            async with semaphore:
+                await self._run_conversation(
+                    f"simulated-{index}", scripts[index % len(scripts)], report
+                )
+
+        if self.track_memory:
+            tracemalloc.start()
+        memory_before = tracemalloc.get_traced_memory()[0] if self.track_memory else 0
+        start = time.perf_counter()
+        try:
+            await asyncio.gather(*(run_conversation(i) for i in range(conversations)))
+            report.duration = time.perf_counter() - start
+            if self.track_memory:
+                current, peak = tracemalloc.get_traced_memory()
+                report.memory_growth = current - memory_before
+                report.memory_peak = peak
+        finally:
+            if self.track_memory:
+                tracemalloc.stop()
+
+        items = await self.storage.read(list(self._state_keys.values()))
+        report.state_sizes = [len(jsonpickle.encode(item)) for item in items.values()]
+        return report
+
+    async def _run_conversation(
+        self, conversation_id: str, script: SimulationScript, report: SimulationReport
+    ):
+        adapter = TestAdapter(
+            self._logic,
+            Activity(
+                channel_id=self.channel_id,
+                service_url="https://test.com",
+                from_property=ChannelAccount(id=f"user-{conversation_id}", name="user"),
+                recipient=ChannelAccount(id="bot", name="Bot"),
+                conversation=ConversationAccount(id=conversation_id),
+            ),
+        )
+        for middleware in self.middlewares:
+            adapter.use(middleware)
+
+        for turn_number, turn in enumerate(script.turns):
+            start = time.perf_counter()
+            try:
+                await adapter.receive_activity(
+                    Activity(type=ActivityTypes.message, text=turn.text)
+                )
+            except Exception as error:  # pylint: disable=broad-except
+                report.errors += 1
+                self._add_failure(
+                    report, script, conversation_id, turn_number, repr(error)
+                )
+                return
+            report.latencies.append(time.perf_counter() - start)
+            report.turns += 1
+
+            replies = [
+                activity.text
+                for activity in adapter.activity_buffer
+                if activity.type == ActivityTypes.message
+            ]
+            adapter.activity_buffer.clear()
+            if turn.expected is not None and replies[: len(turn.expected)] != list(
+                turn.expected
+            ):
+                report.mismatches += 1
+                self._add_failure(
+                    report,
+                    script,
+                    conversation_id,
+                    turn_number,
+                    f"expected {turn.expected!r}, got {replies!r}",
+                )
+
+    async def _logic(self, turn_context: TurnContext):
+        await DialogExtensions.run_dialog(
+            self.dialog, turn_context, self._dialog_state
+        )
+        await self.conversation_state.save_changes(turn_context, False)
+        await self.user_state.save_changes(turn_context, False)
+        self._state_keys[
+            turn_context.activity.conversation.id
+        ] = self.conversation_state.get_storage_key(turn_context)
+
+    def _add_failure(
+        self,
+        report: SimulationReport,
+        script: SimulationScript,
+        conversation_id: str,
+        turn_number: int,
+        message: str,
+    ):
+        if len(report.failures) < self.MAX_FAILURES:
+            report.failures.append(
+                f"{script.name or conversation_id} turn {turn_number}: {message}"
+            )
@@ -0,0 +1,84 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+from aiounittest import AsyncTestCase
+from botbuilder.core import MemoryStorage, MessageFactory
+from botbuilder.dialogs import (
+    ComponentDialog,
+    PromptOptions,
+    TextPrompt,
+    WaterfallDialog,
+    WaterfallStepContext,
+)
+from botbuilder.testing import DialogSimulator, SimulatedTurn, SimulationScript
+
+
+class NameDialog(ComponentDialog):
+    def __init__(self):
+        super().__init__("NameDialog")
+        self.add_dialog(TextPrompt(TextPrompt.__name__))
+        self.add_dialog(
+            WaterfallDialog(WaterfallDialog.__name__, [self.ask_step, self.end_step])
+        )
+        self.initial_dialog_id = WaterfallDialog.__name__
+
+    async def ask_step(self, step_context: WaterfallStepContext):
+        return await step_context.prompt(
+            TextPrompt.__name__,
+            PromptOptions(prompt=MessageFactory.text("What is your name?")),
+        )
+
+    async def end_step(self, step_context: WaterfallStepContext):
+        if step_context.result == "crash":
+            raise ValueError("crash")
+        await step_context.context.send_activity(f"Hello {step_context.result}")
+        return await step_context.end_dialog()
+
+
+class DialogSimulatorTest(AsyncTestCase):
+    async def test_run(self):
+        storage = MemoryStorage()
+        simulator = DialogSimulator(NameDialog(), storage, concurrency=10)
+        script = SimulationScript(
+            ["hi", SimulatedTurn("Ada", ["Hello Ada"])], name="greeting"
+        )
+
+        report = await simulator.run([script], conversations=50)
+
+        self.assertEqual(50, report.conversations)
+        self.assertEqual(100, report.turns)
+        self.assertEqual(0, report.errors)
+        self.assertEqual(0, report.mismatches)
+        self.assertEqual(100, len(report.latencies))
+        self.assertEqual(50, len(report.state_sizes))
+        self.assertGreater(report.turns_per_second, 0)
+        self.assertLessEqual(
+            report.latency_percentile(50), report.latency_percentile(99)
+        )
+        self.assertIsNone(report.memory_growth)
+
+    async def test_failures(self):
+        simulator = DialogSimulator(NameDialog(), track_memory=True)
+        scripts = SimulationScript.load_jsonl(
+            [
+                '{"name": "wrong", "turns": ["hi", {"text": "Bob", "expected": "Hi Bob"}]}',
+                '{"name": "crash", "turns": ["hi", "crash", "never sent"]}',
+                "",
+                '{"text": "hi", "expected": ["What is your name?"]}',
+            ]
+        )
+
+        report = await simulator.run(scripts)
+
+        self.assertEqual(3, report.conversations)
+        self.assertEqual(4, report.turns)
+        self.assertEqual(1, report.errors)
+        self.assertEqual(1, report.mismatches)
+        self.assertEqual(
+            [
+                "wrong turn 1: expected ['Hi Bob'], got ['Hello Bob']",
+                "crash turn 1: ValueError('crash')",
+            ],
+            sorted(report.failures, reverse=True),
+        )
+        self.assertIsNotNone(report.memory_growth)
@@ -0,0 +1,190 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+"""
+Throughput of a streaming connection: a client WebSocketServer sends many concurrent
+requests, with streams of varied sizes, to a server WebSocketServer that reads them
+and answers. The two are connected by an in-memory web socket, so only the streaming
+stack is measured:
+
+    python benchmarks/bench_connection.py [--requests N] [--concurrency N]
+                                          [--sizes BYTES,...] [--streams N]
+                                          [--seed N] [--memory] [--sink]
+
+Reports the frames (payloads) and bytes written per second in both directions, the
+latency percentiles of the requests and, with --memory, the peak memory allocated,
+the garbage collections and the memory blocks still allocated after the run. With
+--sink, both ends report to a StreamingMetricsSink that does nothing, which measures
+the cost of timing the requests.
+"""
+
+import argparse
+import asyncio
+import gc
+import random
+import sys
+import time
+import tracemalloc
+from typing import List
+
+from botframework.streaming import (
+    ReceiveRequest,
+    RequestHandler,
+    StreamingMetricsSink,
+    StreamingRequest,
+    StreamingResponse,
+)
+from botframework.streaming.transport.web_socket import (
+    WebSocket,
+    WebSocketCloseStatus,
+    WebSocketMessage,
+    WebSocketMessageType,
+    WebSocketServer,
+    WebSocketState,
+)
+
+
+class MemoryWebSocket(WebSocket):
+    """One end of an in-memory web socket, each message sent is a copy of the buffer."""
+
+    def __init__(self):
+        self.peer: "MemoryWebSocket" = None
+        self._messages: asyncio.Queue = asyncio.Queue()
+        self._state = WebSocketState.OPEN
+
+    @staticmethod
+    def pair() -> List["MemoryWebSocket"]:
+        client, server = MemoryWebSocket(), MemoryWebSocket()
+        client.peer, server.peer = server, client
+        return [client, server]
+
+    def dispose(self):
+        pass
+
+    async def close(self, close_status: WebSocketCloseStatus, status_description: str):
+        if self._state == WebSocketState.OPEN:
+            self._state = WebSocketState.CLOSED
+            self.peer._messages.put_nowait(
+                WebSocketMessage(message_type=WebSocketMessageType.CLOSE, data=b"")
+            )
+
+    async def receive(self) -> WebSocketMessage:
+        return await self._messages.get()
+
+    async def send(
+        self, buffer: object, message_type: WebSocketMessageType, end_of_message: bool
+    ):
+        self.peer._messages.put_nowait(
+            WebSocketMessage(message_type=message_type, data=bytes(buffer))
+        )
+
+    @property
+    def status(self) -> WebSocketState:
+        return self._state
+
+
+class ReadingRequestHandler(RequestHandler):
+    """Reads all the streams of a request before answering it."""
+
+    async def process_request(
+        self, request: ReceiveRequest, logger, context
+    ) -> StreamingResponse:
+        for content_stream in request.streams:
+            async for _ in content_stream:
+                pass
+
+        return StreamingResponse.ok()
+
+
+def percentile(latencies: List[float], percent: float) -> float:
+    ordered = sorted(latencies)
+    return ordered[min(int(len(ordered) * percent / 100), len(ordered) - 1)]
+
+
+async def run(args) -> List[float]:
+    rng = random.Random(args.seed)
+    client_socket, server_socket = MemoryWebSocket.pair()
+    sink = StreamingMetricsSink() if args.sink else None
+    client = WebSocketServer(client_socket, ReadingRequestHandler(), metrics_sink=sink)
+    server = WebSocketServer(server_socket, ReadingRequestHandler(), metrics_sink=sink)
+    tasks = [
+        asyncio.ensure_future(client.start()),
+        asyncio.ensure_future(server.start()),
+    ]
+    await asyncio.sleep(0)
+
+    # the content is built up front, so that only sending it is measured
+    requests = []
+    for _ in range(args.requests):
+        request = StreamingRequest.create_post("/api/messages")
+        for _ in range(args.streams):
+            request.add_stream(bytes(rng.choice(args.sizes)) or b"\0")
+        requests.append(request)
+
+    latencies = []
+    semaphore = asyncio.Semaphore(args.concurrency)
+
+    async def send(request: StreamingRequest):
+        async with semaphore:
+            start = time.perf_counter()
+            response = await client.send(request)
+            latencies.append(time.perf_counter() - start)
+            assert response.status_code == 200, response.status_code
+
+    if args.memory:
+        gc.collect()
+        tracemalloc.start()
+    collections = sum(stats["collections"] for stats in gc.get_stats())
+    blocks = sys.getallocatedblocks()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(send(request) for request in requests))
+    elapsed = time.perf_counter() - start
+
+    frames = client.send_metrics.packets + server.send_metrics.packets
+    written = client.send_metrics.bytes_written + server.send_metrics.bytes_written
+    writes = client.send_metrics.writes + server.send_metrics.writes
+    print(f"requests      {len(requests)} in {elapsed:.2f} s")
+    print(f"requests/s    {len(requests) / elapsed:10.0f}")
+    print(f"frames/s      {frames / elapsed:10.0f}  ({frames} frames, {writes} writes)")
+    print(f"MB/s          {written / elapsed / 1e6:10.2f}")
+    print(f"open streams  {server.open_streams:10}")
+    for percent in (50, 90, 99, 100):
+        print(f"latency p{percent:<3}  {percentile(latencies, percent) * 1e3:10.2f} ms")
+
+    if args.memory:
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        collected = sum(stats["collections"] for stats in gc.get_stats())
+        print(f"peak traced   {peak / 1e6:10.2f} MB")
+        print(f"gc runs       {collected - collections:10}")
+        print(f"blocks kept   {sys.getallocatedblocks() - blocks:10}")
+
+    await client.disconnect()
+    await server.disconnect()
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+    return latencies
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument(
+        "--sizes",
+        type=lambda value: [int(size) for size in value.split(",")],
+        default=[64, 1024, 16 * 1024, 256 * 1024],
+        help="stream sizes to pick from, in bytes",
+    )
+    parser.add_argument("--streams", type=int, default=1, help="streams per request")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--memory", action="store_true", help="trace allocations")
+    parser.add_argument("--sink", action="store_true", help="report to a no-op sink")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
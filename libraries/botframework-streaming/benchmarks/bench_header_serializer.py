@@ -0,0 +1,44 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+"""
+Time to serialize and deserialize a payload header, which is done for every
+payload sent or received. The header id is the same every time, as it is for
+the payloads of a stream:
+
+    python benchmarks/bench_header_serializer.py [--number N]
+"""
+
+import argparse
+import timeit
+from uuid import uuid4
+
+from botframework.streaming.payloads import HeaderSerializer
+from botframework.streaming.payloads.models import Header, PayloadTypes
+from botframework.streaming.transport import TransportConstants
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--number", type=int, default=100000)
+    args = parser.parse_args()
+
+    header = Header(type=PayloadTypes.STREAM, id=uuid4(), end=True)
+    header.payload_length = 4096
+    buffer = bytearray(TransportConstants.MAX_HEADER_LENGTH)
+    HeaderSerializer.serialize(header, buffer, 0)
+    received = bytes(buffer)
+
+    cases = {
+        "serialize": lambda: HeaderSerializer.serialize(header, buffer, 0),
+        "deserialize": lambda: HeaderSerializer.deserialize(
+            received, 0, TransportConstants.MAX_HEADER_LENGTH
+        ),
+    }
+    for name, case in cases.items():
+        elapsed = min(timeit.repeat(case, number=args.number, repeat=3))
+        print(f"{name:12} {elapsed / args.number * 1e6:6.2f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -13,6 +13,7 @@ from .receive_response import ReceiveResponse
 from .request_handler import RequestHandler
 from .streaming_request import StreamingRequest
 from .streaming_response import StreamingResponse
+from .streaming_metrics_sink import StreamingMetricsSink
 
 __all__ = [
     "ReceiveRequest",
@@ -20,6 +21,7 @@ __all__ = [
     "ReceiveResponse",
     "PayloadStream",
     "RequestHandler",
+    "StreamingMetricsSink",
     "StreamingRequest",
     "StreamingResponse",
     "__title__",
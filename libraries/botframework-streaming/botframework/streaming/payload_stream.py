@@ -2,75 +2,221 @@
 # Licensed under the MIT License.
 
 from asyncio import Lock, Semaphore
-from typing import List
+from collections import deque
+from typing import AsyncIterator, Callable, Deque, List, Union
 
+from botframework.streaming.payloads import BufferBudget
 from botframework.streaming.payloads.assemblers import PayloadStreamAssembler
+from botframework.streaming.transport import BufferLike, TransportBuffer
 
 
 class PayloadStream:
     def __init__(self, assembler: PayloadStreamAssembler):
         self._assembler = assembler
-        self._buffer_queue: List[List[int]] = []
+        self._buffer_queue: Deque[BufferLike] = deque()
         self._lock = Lock()
         self._data_available = Semaphore(0)
         self._producer_length = 0  # total length
         self._consumer_position = 0  # read position
-        self._active: List[int] = []
+        self._active: memoryview = None
         self._active_offset = 0
         self._end = False
 
+        # bytes received but not read yet, counted against the budgets they were reserved in
+        self._budget: BufferBudget = None
+        self._shared_budget: BufferBudget = None
+        self._reserved = 0
+        self._cancelled = False
+        self._error: Exception = None
+
     def __len__(self):
         return self._producer_length
 
-    def give_buffer(self, buffer: List[int]):
+    @property
+    def buffered_length(self) -> int:
+        """The number of bytes received but not read yet."""
+        return self._producer_length - self._consumer_position
+
+    @property
+    def limits_buffering(self) -> bool:
+        return self._assembler is None or self._assembler.limits_buffering
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self._cancelled
+
+    async def reserve(
+        self,
+        count: int,
+        limit: int = None,
+        shared_budget: BufferBudget = None,
+        can_wait: Callable[[], bool] = None,
+    ) -> bool:
+        """
+        Waits until ``count`` more bytes can be buffered, with at most ``limit`` unread
+        bytes in the stream and within a budget shared with other streams. The bytes
+        are released as they are read. Nothing is waited for while ``can_wait`` returns
+        False, the bytes are then counted over the limits.
+
+        :return: False if the stream is cancelled, and what it is given dropped.
+        """
+        if limit is not None:
+            if not self._budget:
+                self._budget = BufferBudget(limit)
+            await self._budget.acquire(count, can_wait)
+        if shared_budget:
+            self._shared_budget = shared_budget
+            await shared_budget.acquire(count, can_wait)
+        self._reserved += count
+
+        if self._cancelled:
+            self._release(self._reserved)
+            return False
+
+        return True
+
+    def wake(self):
+        """Has a reservation waiting on the stream check again whether it can wait."""
+        if self._budget:
+            self._budget.release(0)
+
+    def cancel(self, error: Exception = None):
+        """
+        Drops what the stream buffers and what it is given from now on. Reads then
+        raise the error if one is given, and end the stream otherwise.
+        """
+        if self._cancelled:
+            return
+
+        self._cancelled = True
+        self._error = error
+        self._buffer_queue.clear()
+        self._active = None
+        self._release(self._reserved)
+        if self._budget:
+            # a reservation waiting for the stream to be read can go on
+            self._budget.limit = None
+            self._budget.release(0)
+
+        self._data_available.release()
+
+    def abort(self, error: Exception):
+        """Cancels the stream, and asks the other end to stop sending it."""
+        self.cancel(error)
+        if self._assembler:
+            self._assembler.cancel()
+
+    def give_buffer(self, buffer: Union[BufferLike, List[int]]):
+        """Hands a buffer over to the stream, which keeps it rather than a copy of it."""
+        if self._cancelled:
+            return
+
+        buffer = TransportBuffer.from_data(buffer)
         self._buffer_queue.append(buffer)
         self._producer_length += len(buffer)
 
         self._data_available.release()
 
     def done_producing(self):
-        self.give_buffer([])
+        self.give_buffer(b"")
+
+    def write(self, buffer: Union[BufferLike, List[int]], offset: int, count: int):
+        # the caller may reuse its buffer, so this one is copied
+        self.give_buffer(bytes(TransportBuffer.view(buffer, offset, count)))
 
-    def write(self, buffer: List[int], offset: int, count: int):
-        buffer_copy = buffer[offset : offset + count]
-        self.give_buffer(buffer_copy)
+    async def read(self, buffer: bytearray, offset: int, count: int):
+        return TransportBuffer.copy_into(buffer, offset, await self.read_chunk(count))
 
-    async def read(self, buffer: List[int], offset: int, count: int):
+    async def read_chunk(self, count: int = None) -> memoryview:
+        """
+        Reads up to ``count`` bytes, as many as were received together by default, as a
+        view on the buffer they were received in rather than a copy of them.
+
+        :return: The bytes read, empty at the end of the stream.
+        """
+        if self._cancelled:
+            return self._read_cancelled()
         if self._end:
-            return 0
+            return memoryview(b"")
 
         if not self._active:
             await self._data_available.acquire()
+            if self._cancelled:
+                # let other readers see it too
+                self._data_available.release()
+                return self._read_cancelled()
             async with self._lock:
-                self._active = self._buffer_queue.pop(0)
-
-        available_count = min(len(self._active) - self._active_offset, count)
-
-        for index in range(available_count):
-            buffer[offset + index] = self._active[self._active_offset]
-            self._active_offset += 1
-
-        self._consumer_position += available_count
+                self._active = memoryview(self._buffer_queue.popleft())
+
+            if not self._active:
+                # the stream was done producing before reaching the expected length, if any
+                self._active = None
+                self._read_to_end()
+                return memoryview(b"")
+
+        if count is None:
+            count = len(self._active)
+        chunk = self._active[self._active_offset : self._active_offset + count]
+        self._active_offset += len(chunk)
+        self._consumer_position += len(chunk)
+        if self._reserved:
+            self._release(min(len(chunk), self._reserved))
 
         if self._active_offset >= len(self._active):
-            self._active = []
+            self._active = None
             self._active_offset = 0
 
         if (
             self._assembler
+            and self._assembler.content_length is not None
             and self._consumer_position >= self._assembler.content_length
         ):
-            self._end = True
-
-        return available_count
-
-    async def read_until_end(self):
-        result = [None] * self._assembler.content_length
+            self._read_to_end()
+
+        return chunk
+
+    def __aiter__(self) -> AsyncIterator[memoryview]:
+        return self._iter_chunks()
+
+    async def _iter_chunks(self) -> AsyncIterator[memoryview]:
+        while True:
+            chunk = await self.read_chunk()
+            if not chunk:
+                return
+            yield chunk
+
+    def _read_to_end(self):
+        self._end = True
+        if self._assembler:
+            # received and read, the stream no longer needs to be kept
+            self._assembler.on_read_to_end()
+
+    def _read_cancelled(self) -> memoryview:
+        if self._error:
+            raise self._error
+        self._end = True
+        return memoryview(b"")
+
+    def _release(self, count: int):
+        self._reserved -= count
+        if self._budget:
+            self._budget.release(count)
+        if self._shared_budget:
+            self._shared_budget.release(count)
+
+    async def read_until_end(self) -> bytearray:
+        if self._assembler.content_length is None:
+            result = bytearray()
+            async for chunk in self:
+                result += chunk
+            return result
+
+        result = bytearray(self._assembler.content_length)
         current_size = 0
 
         while not self._end:
             count = await self.read(
-                result, current_size, self._assembler.content_length
+                result, current_size, self._assembler.content_length - current_size
             )
             current_size += count
 
@@ -4,7 +4,17 @@
 
 from .payload_receiver import PayloadReceiver
 from .payload_sender import PayloadSender
+from .receive_metrics import ReceiveMetrics
+from .receive_limits import ReceiveLimits
+from .send_metrics import SendMetrics
 from .send_packet import SendPacket
 
 
-__all__ = ["PayloadReceiver", "PayloadSender", "SendPacket"]
+__all__ = [
+    "PayloadReceiver",
+    "PayloadSender",
+    "ReceiveLimits",
+    "ReceiveMetrics",
+    "SendMetrics",
+    "SendPacket",
+]
@@ -4,31 +4,47 @@
 import traceback
 
 from asyncio import iscoroutinefunction, isfuture
-from typing import Callable, List
+from typing import Callable, List, Union
 
 import botframework.streaming as streaming
-from botframework.streaming.payloads import HeaderSerializer
+from botframework.streaming.payloads import BufferBudget, HeaderSerializer
 from botframework.streaming.payloads.models import Header, PayloadTypes
 from botframework.streaming.transport import (
     DisconnectedEventArgs,
+    TransportBuffer,
     TransportConstants,
     TransportReceiverBase,
 )
 
+from .receive_limits import ReceiveLimits
+from .receive_metrics import ReceiveMetrics
+
 
 class PayloadReceiver:
-    def __init__(self):
-        self._get_stream: Callable[[Header], List[int]] = None
-        self._receive_action: Callable[[Header, List[int], int], None] = None
+    def __init__(self, limits: ReceiveLimits = None):
+        """
+        :param limits: (Optional) Limits on the payloads received and the stream content
+        buffered, only the payload length is limited by default.
+        """
+        self._get_stream: Callable[[Header], Union[bytearray, List[int]]] = None
+        self._receive_action: Callable[
+            [Header, Union[bytearray, List[int]], int], None
+        ] = None
         self._receiver: TransportReceiverBase = None
         self._is_disconnecting = False
 
-        self._receive_header_buffer: List[int] = [
-            None
-        ] * TransportConstants.MAX_HEADER_LENGTH
-        self._receive_content_buffer: List[int] = [
-            None
-        ] * TransportConstants.MAX_PAYLOAD_LENGTH
+        self._receive_header_buffer = bytearray(TransportConstants.MAX_HEADER_LENGTH)
+        self._receive_content_buffer = bytearray(TransportConstants.MAX_PAYLOAD_LENGTH)
+
+        self.limits = limits or ReceiveLimits()
+        self._buffered = BufferBudget(self.limits.max_connection_buffer)
+        self.metrics = ReceiveMetrics()
+        self._waiting_stream: "streaming.PayloadStream" = None
+
+        # whether the receiver can stop reading the connection to wait for buffer space:
+        # not while something on this end awaits what comes next on the connection, which
+        # the unread streams could then be waiting on
+        self.can_wait: Callable[[], bool] = None
 
         self.disconnected: Callable[[object, DisconnectedEventArgs], None] = None
 
@@ -36,6 +52,17 @@ class PayloadReceiver:
     def is_connected(self) -> bool:
         return self._receiver is not None
 
+    @property
+    def buffered_bytes(self) -> int:
+        """The number of stream bytes received but not read yet, when buffering is limited."""
+        return self._buffered.used
+
+    def wake(self):
+        """Has the receiver check again whether it can wait for buffer space."""
+        self._buffered.release(0)
+        if self._waiting_stream:
+            self._waiting_stream.wake()
+
     async def connect(self, receiver: TransportReceiverBase):
         if self._receiver:
             raise RuntimeError(f"{self.__class__.__name__} instance already connected.")
@@ -48,8 +75,8 @@ class PayloadReceiver:
 
     def subscribe(
         self,
-        get_stream: Callable[[Header], List[int]],
-        receive_action: Callable[[Header, List[int]], int],
+        get_stream: Callable[[Header], Union[bytearray, List[int]]],
+        receive_action: Callable[[Header, Union[bytearray, List[int]], int], None],
     ):
         self._get_stream = get_stream
         self._receive_action = receive_action
@@ -116,14 +143,39 @@ class PayloadReceiver:
                     self._receive_header_buffer, 0, TransportConstants.MAX_HEADER_LENGTH
                 )
 
+                if header.payload_length > self.limits.max_payload_length:
+                    raise ValueError(
+                        f"Payload of {header.payload_length} bytes exceeds the limit of "
+                        f"{self.limits.max_payload_length} bytes"
+                    )
+
                 # read the payload
                 content_stream = self._get_stream(header)
 
-                buffer = (
-                    [None] * header.payload_length
-                    if PayloadTypes.is_stream(header)
-                    else self._receive_content_buffer
-                )
+                is_stream = PayloadTypes.is_stream(header)
+                if is_stream and content_stream is None:
+                    # the payloads of a closed stream are skipped
+                    is_stream = False
+                    self.metrics.skipped_packets += 1
+                elif is_stream and isinstance(content_stream, streaming.PayloadStream):
+                    # a stream over its limit, or that nothing reads anymore, is dropped
+                    # from the connection and its payloads skipped
+                    is_stream = await self._reserve(header, content_stream)
+                    if not is_stream:
+                        self.metrics.skipped_packets += 1
+
+                # stream payloads are received in a buffer of their own that is then handed
+                # over to the content stream, other payloads straight into the content stream
+                # when it can hold them
+                if is_stream:
+                    buffer = bytearray(header.payload_length)
+                elif (
+                    isinstance(content_stream, bytearray)
+                    and len(content_stream) >= header.payload_length
+                ):
+                    buffer = content_stream
+                else:
+                    buffer = self._receive_content_buffer
                 offset = 0
 
                 if header.payload_length:
@@ -133,29 +185,45 @@ class PayloadReceiver:
                             TransportConstants.MAX_PAYLOAD_LENGTH,
                         )
 
+                        # the scratch buffer only ever holds the chunk being copied
+                        position = (
+                            0 if buffer is self._receive_content_buffer else offset
+                        )
+
                         # Send: Packet content
-                        length = await self._receiver.receive(buffer, offset, count)
+                        length = await self._receiver.receive(buffer, position, count)
                         if length == 0:
                             # TODO: make custom exception
                             raise Exception(
                                 "TransportDisconnectedException: Stream closed while reading header bytes"
                             )
 
-                        if content_stream is not None:
-                            # write chunks to the content_stream if it's not a stream type
-                            # TODO: this has to be improved in custom buffer class (validate buffer ended)
-                            if not PayloadTypes.is_stream(header):
-                                for index in range(offset, offset + length):
-                                    content_stream[index] = buffer[index]
+                        # write chunks to the content_stream if it's not a stream type
+                        if (
+                            content_stream is not None
+                            and not is_stream
+                            and not isinstance(content_stream, streaming.PayloadStream)
+                            and buffer is not content_stream
+                        ):
+                            TransportBuffer.copy_into(
+                                content_stream,
+                                offset,
+                                memoryview(buffer)[position : position + length],
+                            )
 
                         offset += length
 
                     # give the full payload buffer to the contentStream if it's a stream
-                    if PayloadTypes.is_stream(header) and isinstance(
+                    if is_stream and isinstance(
                         content_stream, streaming.PayloadStream
                     ):
                         content_stream.give_buffer(buffer)
 
+                self.metrics.packets += 1
+                self.metrics.bytes_read += header_offset + offset
+
+                # an empty stream payload can still be the end of the stream
+                if header.payload_length or PayloadTypes.is_stream(header):
                     self._receive_action(header, content_stream, offset)
             except Exception as exception:
                 traceback.print_exc()
@@ -163,3 +231,41 @@ class PayloadReceiver:
                 disconnect_args = DisconnectedEventArgs(reason=str(exception))
 
         await self.disconnect(disconnect_args)
+
+    async def _reserve(self, header: Header, stream: "streaming.PayloadStream") -> bool:
+        """
+        Checks a stream payload against the limits, waiting until it can be buffered.
+
+        :return: False if the payload is to be skipped.
+        """
+        max_stream_length = self.limits.max_stream_length
+        if max_stream_length is None and not self.limits.is_buffering_limited:
+            return True
+
+        if stream.is_cancelled:
+            return False
+
+        if (
+            max_stream_length is not None
+            and len(stream) + header.payload_length > max_stream_length
+        ):
+            stream.abort(
+                ValueError(
+                    f"Stream {header.id} exceeds the limit of {max_stream_length} bytes"
+                )
+            )
+            return False
+
+        if not self.limits.is_buffering_limited or not stream.limits_buffering:
+            return True
+
+        self._waiting_stream = stream
+        try:
+            return await stream.reserve(
+                header.payload_length,
+                self.limits.max_stream_buffer,
+                self._buffered,
+                self.can_wait,
+            )
+        finally:
+            self._waiting_stream = None
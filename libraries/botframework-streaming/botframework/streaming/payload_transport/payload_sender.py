@@ -1,35 +1,63 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # Licensed under the MIT License.
 
-from asyncio import Event, ensure_future, iscoroutinefunction, isfuture
+from asyncio import (
+    Event,
+    ensure_future,
+    get_running_loop,
+    iscoroutinefunction,
+    isfuture,
+    sleep,
+)
+from inspect import isawaitable
 from typing import Awaitable, Callable, List
 
 from botframework.streaming.transport import (
     DisconnectedEventArgs,
+    TransportBuffer,
     TransportSenderBase,
     TransportConstants,
 )
 from botframework.streaming.payloads import HeaderSerializer
 from botframework.streaming.payloads.models import Header
 
+from .send_metrics import SendMetrics
 from .send_queue import SendQueue
 from .send_packet import SendPacket
 
 
 # TODO: consider interface this class
 class PayloadSender:
-    def __init__(self):
+    """
+    Sends the packets of the payloads one after the other.
+
+    Packets are coalesced: their headers and contents are gathered in a buffer that
+    is written to the transport at once when it holds ``max_write_size`` bytes, or
+    when no packet is waiting to be sent and, if ``flush_delay`` is set, the first
+    buffered packet has waited that many seconds. Content chunks of
+    ``max_write_size`` bytes or more aren't copied into the buffer: it is written
+    first, then the chunk as a view on the payload. A ``max_write_size`` of 0 writes
+    every header and content chunk on its own.
+    """
+
+    DEFAULT_MAX_WRITE_SIZE = 16 * 1024
+
+    def __init__(
+        self, max_write_size: int = DEFAULT_MAX_WRITE_SIZE, flush_delay: float = 0
+    ):
         self._connected_event = Event()
         self._sender: TransportSenderBase = None
         self._is_disconnecting: bool = False
-        self._send_header_buffer: List[int] = [
-            None
-        ] * TransportConstants.MAX_HEADER_LENGTH
-        self._send_content_buffer: List[int] = [
-            None
-        ] * TransportConstants.MAX_PAYLOAD_LENGTH
+        self._send_header_buffer = bytearray(TransportConstants.MAX_HEADER_LENGTH)
+
+        self._max_write_size = max_write_size
+        self._flush_delay = flush_delay
+        self._write_buffer = bytearray()
+        self._buffered_packets: List[SendPacket] = []
+        self._buffered_since: float = None
 
-        self._send_queue = SendQueue(action=self._write_packet)
+        self.metrics = SendMetrics()
+        self._send_queue = SendQueue(action=self._write_packet, on_idle=self._on_idle)
 
         self.disconnected: Callable[[object, DisconnectedEventArgs], None] = None
 
@@ -37,6 +65,11 @@ class PayloadSender:
     def is_connected(self) -> bool:
         return self._sender is not None
 
+    @property
+    def queue_depth(self) -> int:
+        """The number of packets waiting to be sent."""
+        return self._send_queue.depth
+
     def connect(self, sender: TransportSenderBase):
         if self._sender:
             raise RuntimeError(f"{self.__class__.__name__} instance already connected.")
@@ -60,6 +93,9 @@ class PayloadSender:
         )
 
         self._send_queue.post(packet)
+        self.metrics.max_queue_depth = max(
+            self.metrics.max_queue_depth, self._send_queue.depth
+        )
 
     async def disconnect(self, event_args: DisconnectedEventArgs = None):
         did_disconnect = False
@@ -69,7 +105,10 @@ class PayloadSender:
             try:
                 try:
                     if self._sender:
-                        self._sender.close()
+                        # the transports of a web socket close asynchronously
+                        closed = self._sender.close()
+                        if isawaitable(closed):
+                            await closed
                         # TODO: investigate if 'dispose' is necessary
                         did_disconnect = True
                 except Exception:
@@ -108,50 +147,94 @@ class PayloadSender:
             )
 
             # Send: Packet Header
-            length = await self._sender.send(self._send_header_buffer, 0, header_length)
-            if not length:
-                # TODO: make custom exception
-                raise Exception("TransportDisconnectedException")
+            await self._write(self._send_header_buffer, header_length)
 
             offset = 0
 
-            # Send content in chunks
+            # Send content in chunks, as views on the payload rather than copies of it
             if packet.header.payload_length and packet.payload:
-                # If we already read the buffer, send that
-                # If we did not, read from the stream until we've sent that amount
-                if not packet.is_length_known:
-                    # Send: Packet content
-                    length = await self._sender.send(
-                        self._send_content_buffer, 0, packet.header.payload_length
+                payload = TransportBuffer.view(packet.payload)
+                while offset < packet.header.payload_length:
+                    count = min(
+                        packet.header.payload_length - offset,
+                        TransportConstants.MAX_PAYLOAD_LENGTH,
                     )
-                    if length == 0:
-                        # TODO: make custom exception
-                        raise Exception("TransportDisconnectedException")
-                else:
-                    while offset < packet.header.payload_length:
-                        count = min(
-                            packet.header.payload_length - offset,
-                            TransportConstants.MAX_PAYLOAD_LENGTH,
-                        )
-
-                        # copy the stream to the buffer
-                        # TODO: this has to be improved in custom buffer class (validate buffer ended)
-                        for index in range(count):
-                            self._send_content_buffer[index] = packet.payload[index]
-
-                        # Send: Packet content
-                        length = await self._sender.send(
-                            self._send_content_buffer, 0, count
-                        )
-                        if length == 0:
-                            # TODO: make custom exception
-                            raise Exception("TransportDisconnectedException")
-
-                        offset += count
-
-            if packet.sent_callback:
-                # TODO: should this really run in the background?
-                ensure_future(packet.sent_callback(packet.header))
+
+                    # Send: Packet content
+                    await self._write(payload[offset : offset + count], count)
+
+                    offset += count
+
+            self.metrics.packets += 1
+            if self._write_buffer:
+                self._buffered_packets.append(packet)
+                if len(self._write_buffer) >= self._max_write_size:
+                    await self._flush()
+            else:
+                self._on_sent(packet)
         except Exception as exception:
             disconnected_args = DisconnectedEventArgs(reason=str(exception))
             await self.disconnect(disconnected_args)
+
+    async def _write(self, data: memoryview, count: int):
+        if count >= self._max_write_size:
+            # too large to be worth a copy
+            await self._flush()
+            await self._send(data, count)
+            return
+
+        if count > self._max_write_size - len(self._write_buffer):
+            await self._flush()
+        if self._buffered_since is None:
+            self._buffered_since = get_running_loop().time()
+        self._write_buffer += data[:count]
+
+    async def _send(self, data: memoryview, count: int):
+        length = await self._sender.send(data, 0, count)
+        if not length:
+            # TODO: make custom exception
+            raise Exception("TransportDisconnectedException")
+
+        self.metrics.writes += 1
+        self.metrics.bytes_written += count
+
+    async def _on_idle(self):
+        if self._flush_delay > 0 and self._buffered_since is not None:
+            remaining = (
+                self._buffered_since + self._flush_delay - get_running_loop().time()
+            )
+            if remaining > 0:
+                await sleep(remaining)
+                if self._send_queue.depth:
+                    # the packets posted meanwhile are flushed along, once written
+                    return
+
+        try:
+            await self._flush()
+        except Exception as exception:
+            disconnected_args = DisconnectedEventArgs(reason=str(exception))
+            await self.disconnect(disconnected_args)
+
+    async def _flush(self):
+        if not self._write_buffer:
+            return
+
+        # hand the buffer over to the transport and start a new one, as the transport
+        # may still hold views on it
+        data, packets = self._write_buffer, self._buffered_packets
+        self._write_buffer = bytearray()
+        self._buffered_packets = []
+        self._buffered_since = None
+
+        if not self._sender:
+            return
+
+        await self._send(data, len(data))
+        for packet in packets:
+            self._on_sent(packet)
+
+    @staticmethod
+    def _on_sent(packet: SendPacket):
+        if packet.sent_callback:
+            # TODO: should this really run in the background?
+            ensure_future(packet.sent_callback(packet.header))
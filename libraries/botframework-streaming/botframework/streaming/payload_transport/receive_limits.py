@@ -0,0 +1,40 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+from botframework.streaming.transport import TransportConstants
+
+
+class ReceiveLimits:
+    """
+    Limits on the payloads a PayloadReceiver accepts and on the stream content it
+    buffers until it is read.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_payload_length: int = TransportConstants.MAX_LENGTH,
+        max_stream_length: int = None,
+        max_stream_buffer: int = None,
+        max_connection_buffer: int = None,
+    ):
+        """
+        :param max_payload_length: The longest payload accepted, the connection is
+        closed on a longer one.
+        :param max_stream_length: (Optional) The longest stream accepted. A longer
+        stream is cancelled, its reads raise a ValueError.
+        :param max_stream_buffer: (Optional) The number of unread bytes a stream can
+        buffer before the receiver stops reading the connection.
+        :param max_connection_buffer: (Optional) The number of unread bytes all the
+        streams of the connection can buffer before the receiver stops reading it.
+        """
+        self.max_payload_length = max_payload_length
+        self.max_stream_length = max_stream_length
+        self.max_stream_buffer = max_stream_buffer
+        self.max_connection_buffer = max_connection_buffer
+
+    @property
+    def is_buffering_limited(self) -> bool:
+        return (
+            self.max_stream_buffer is not None or self.max_connection_buffer is not None
+        )
@@ -0,0 +1,18 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+
+class ReceiveMetrics:
+    """Counters of the packets a PayloadReceiver reads from its transport."""
+
+    def __init__(self):
+        self.packets = 0
+        self.bytes_read = 0
+        self.skipped_packets = 0
+
+    def to_dict(self) -> dict:
+        return {
+            "packets": self.packets,
+            "bytes_read": self.bytes_read,
+            "skipped_packets": self.skipped_packets,
+        }
@@ -0,0 +1,30 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+
+class SendMetrics:
+    """Counters of the packets a PayloadSender writes to its transport."""
+
+    def __init__(self):
+        self.packets = 0
+        self.writes = 0
+        self.bytes_written = 0
+        self.max_queue_depth = 0
+
+    @property
+    def bytes_per_write(self) -> float:
+        return self.bytes_written / self.writes if self.writes else 0.0
+
+    @property
+    def packets_per_write(self) -> float:
+        return self.packets / self.writes if self.writes else 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "packets": self.packets,
+            "writes": self.writes,
+            "bytes_written": self.bytes_written,
+            "bytes_per_write": self.bytes_per_write,
+            "packets_per_write": self.packets_per_write,
+            "max_queue_depth": self.max_queue_depth,
+        }
@@ -8,8 +8,18 @@ from typing import Awaitable, Callable
 
 
 class SendQueue:
-    def __init__(self, action: Callable[[object], Awaitable], timeout: int = 30):
+    def __init__(
+        self,
+        action: Callable[[object], Awaitable],
+        timeout: int = 30,
+        on_idle: Callable[[], Awaitable] = None,
+    ):
+        """
+        :param action: Processes an item, one at a time.
+        :param on_idle: (Optional) Called whenever the queue has been emptied.
+        """
         self._action = action
+        self._on_idle = on_idle
 
         self._queue = Queue()
         self._timeout_seconds = timeout
@@ -17,6 +27,11 @@ class SendQueue:
         # TODO: this have to be abstracted so can remove asyncio dependency
         ensure_future(self._process())
 
+    @property
+    def depth(self) -> int:
+        """The number of items waiting to be processed."""
+        return self._queue.qsize()
+
     def post(self, item: object):
         self._post_internal(item)
 
@@ -24,16 +39,23 @@ class SendQueue:
         self._queue.put_nowait(item)
 
     async def _process(self):
-        while True:
-            try:
-                while True:
-                    item = await self._queue.get()
+        try:
+            while True:
+                item = await self._queue.get()
+                try:
+                    await self._action(item)
+                except Exception:
+                    traceback.print_exc()
+                finally:
+                    self._queue.task_done()
+
+                if self._on_idle and self._queue.empty():
                     try:
-                        await self._action(item)
+                        await self._on_idle()
                     except Exception:
                         traceback.print_exc()
-                    finally:
-                        self._queue.task_done()
-            except Exception:
-                # AppInsights.TrackException(e)
-                traceback.print_exc()
+        except Exception:
+            # AppInsights.TrackException(e)
+            # the queue can't be read anymore, such as once its event loop is closed,
+            # retrying would only spin
+            traceback.print_exc()
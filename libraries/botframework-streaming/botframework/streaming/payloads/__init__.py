@@ -1,6 +1,7 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # Licensed under the MIT License.
 
+from .buffer_budget import BufferBudget
 from .content_stream import ContentStream
 from .header_serializer import HeaderSerializer
 from .payload_assembler_manager import PayloadAssemblerManager
@@ -10,6 +11,7 @@ from .send_operations import SendOperations
 from .stream_manager import StreamManager
 
 __all__ = [
+    "BufferBudget",
     "ContentStream",
     "PayloadAssemblerManager",
     "RequestManager",
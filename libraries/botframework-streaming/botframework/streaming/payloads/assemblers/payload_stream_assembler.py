@@ -27,6 +27,8 @@ class PayloadStreamAssembler(Assembler):
         self.content_type = type
         self.content_length = length
         self.end: bool = None
+        # whether the receiver waits for the stream to be read when it buffers too much
+        self.limits_buffering = True
 
     def create_stream_from_payload(self) -> "streaming.PayloadStream":
         return streaming.PayloadStream(self)
@@ -44,3 +46,9 @@ class PayloadStreamAssembler(Assembler):
 
     def close(self):
         self._stream_manager.close_stream(self.identifier)
+
+    def on_read_to_end(self):
+        self._stream_manager.remove_stream(self.identifier)
+
+    def cancel(self):
+        self._stream_manager.cancel_stream(self.identifier)
@@ -3,10 +3,11 @@
 
 import asyncio
 from uuid import UUID
-from typing import Awaitable, Callable, List
+from typing import Awaitable, Callable, List, Union
 
 import botframework.streaming as streaming
 import botframework.streaming.payloads as payloads
+from botframework.streaming.transport import TransportBuffer
 from botframework.streaming.payloads.models import Header, ResponsePayload
 
 from .assembler import Assembler
@@ -31,31 +32,38 @@ class ReceiveResponseAssembler(Assembler):
         self._on_completed = on_completed
         self.identifier = header.id
         self._length = header.payload_length if header.end else None
-        self._stream: List[int] = None
+        self._stream: bytearray = None
 
-    def create_stream_from_payload(self) -> List[int]:
-        return [None] * (self._length or 0)
+    def create_stream_from_payload(self) -> bytearray:
+        return bytearray(self._length or 0)
 
-    def get_payload_as_stream(self) -> List[int]:
+    def get_payload_as_stream(self) -> bytearray:
         if self._stream is None:
             self._stream = self.create_stream_from_payload()
 
         return self._stream
 
-    def on_receive(self, header: Header, stream: List[int], content_length: int):
+    def on_receive(self, header: Header, stream: bytearray, content_length: int):
         if header.end:
             self.end = header.end
 
-            # Execute the response on a separate Task
-            # Execute the request on a separate Thread in the background
-            # Execute the request on a separate in the background
-            asyncio.ensure_future(self.process_response(stream))
+            # the streams of the response are set up before their payloads come in, then
+            # the response is executed on a separate Task
+            response = self._create_response(stream)
+            asyncio.ensure_future(self._on_completed(self.identifier, response))
 
     def close(self):
         self._stream_manager.close_stream(self.identifier)
 
-    async def process_response(self, stream: List[int]):
-        response_payload = ResponsePayload().from_json(bytes(stream).decode("utf8"))
+    async def process_response(self, stream: Union[bytearray, List[int]]):
+        await self._on_completed(self.identifier, self._create_response(stream))
+
+    def _create_response(
+        self, stream: Union[bytearray, List[int]]
+    ) -> "streaming.ReceiveResponse":
+        response_payload = ResponsePayload().from_json(
+            TransportBuffer.to_str(stream, "utf8")
+        )
 
         response = streaming.ReceiveResponse(
             status_code=response_payload.status_code, streams=[]
@@ -64,7 +72,7 @@ class ReceiveResponseAssembler(Assembler):
         if response_payload.streams:
             for stream_description in response_payload.streams:
                 try:
-                    identifier = UUID(int=int(stream_description.id))
+                    identifier = UUID(stream_description.id)
                 except Exception:
                     raise ValueError(
                         f"Stream description id '{stream_description.id}' is not a Guid"
@@ -75,6 +83,9 @@ class ReceiveResponseAssembler(Assembler):
                 )
                 stream_assembler.content_type = stream_description.content_type
                 stream_assembler.content_length = stream_description.length
+                # whoever awaits the response reads these, so waiting for buffer space
+                # for them could hold up the connection for good
+                stream_assembler.limits_buffering = False
 
                 content_stream = payloads.ContentStream(
                     identifier=identifier, assembler=stream_assembler
@@ -83,4 +94,4 @@ class ReceiveResponseAssembler(Assembler):
                 content_stream.content_type = stream_description.content_type
                 response.streams.append(content_stream)
 
-        await self._on_completed(self.identifier, response)
+        return response
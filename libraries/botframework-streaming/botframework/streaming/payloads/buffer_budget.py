@@ -0,0 +1,41 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+from asyncio import Event
+from typing import Callable
+
+
+class BufferBudget:
+    """
+    Counts the bytes received but not read yet, and makes the receiver wait while
+    they are at the limit.
+
+    A payload larger than the limit is let through once nothing is buffered, so
+    that it can't wait forever.
+    """
+
+    def __init__(self, limit: int = None):
+        """
+        :param limit: (Optional) The number of bytes that can be buffered, no limit by default.
+        """
+        self.limit = limit
+        self.used = 0
+        self._released = Event()
+
+    def fits(self, count: int) -> bool:
+        return self.limit is None or not self.used or self.used + count <= self.limit
+
+    async def acquire(self, count: int, can_wait: Callable[[], bool] = None):
+        """
+        Waits until ``count`` more bytes fit, unless ``can_wait`` tells otherwise. Once
+        it might, ``release(0)`` wakes the waiting up to check it again.
+        """
+        while not self.fits(count) and (can_wait is None or can_wait()):
+            self._released.clear()
+            await self._released.wait()
+
+        self.used += count
+
+    def release(self, count: int):
+        self.used = max(self.used - count, 0)
+        self._released.set()
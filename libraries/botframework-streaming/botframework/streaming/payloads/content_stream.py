@@ -2,6 +2,7 @@
 # Licensed under the MIT License.
 
 from uuid import UUID
+from typing import AsyncIterator
 
 from botframework.streaming.payloads.assemblers import PayloadStreamAssembler
 
@@ -19,5 +20,9 @@ class ContentStream:
         self.content_type: str = None
         self.length: int = None
 
+    def __aiter__(self) -> AsyncIterator[memoryview]:
+        """Iterates over the content as it is received, without buffering all of it."""
+        return self.stream.__aiter__()
+
     def cancel(self):
         self._assembler.close()
@@ -5,9 +5,13 @@ import json
 from asyncio import Future
 from abc import ABC, abstractmethod
 from uuid import UUID
-from typing import List
+from typing import AsyncIterator, List, Union
 
-from botframework.streaming.transport import TransportConstants
+from botframework.streaming.transport import (
+    BufferLike,
+    TransportBuffer,
+    TransportConstants,
+)
 from botframework.streaming.payload_transport import PayloadSender
 from botframework.streaming.payloads import ResponseMessageStream
 from botframework.streaming.payloads.models import (
@@ -23,41 +27,61 @@ class PayloadDisassembler(ABC):
         self.identifier = identifier
         self._task_completion_source = Future()
 
-        self._stream: List[int] = None
+        self._stream: BufferLike = None
         self._stream_length: int = None
         self._send_offset: int = None
         self._is_end: bool = False
         self._type: str = None
 
+        # iterated content: the chunks left, and the payload to send after this one
+        self._chunks: AsyncIterator[BufferLike] = None
+        self._pending: memoryview = None
+        self._next_payload: memoryview = None
+
     @property
     @abstractmethod
     def type(self) -> str:
         return self._type
 
-    async def get_stream(self) -> List[int]:
+    async def get_stream(self) -> Union[BufferLike, List[int]]:
         raise NotImplementedError()
 
     async def disassemble(self):
-        self._stream = await self.get_stream()
-        self._stream_length = len(self._stream)
+        stream = await self.get_stream()
         self._send_offset = 0
 
+        if hasattr(stream, "__aiter__"):
+            # sent as it is iterated, one payload ahead to know which is the last
+            self._chunks = stream.__aiter__()
+            self._next_payload = await self._read_payload()
+        else:
+            self._stream = TransportBuffer.from_data(stream)
+            self._stream_length = len(self._stream)
+
         await self._send()
 
     @staticmethod
     def get_stream_description(stream: ResponseMessageStream) -> StreamDescription:
-        description = StreamDescription(id=str(stream.id))
+        description = StreamDescription(
+            id=str(stream.id), content_type=stream.content_type, length=stream.length
+        )
+
+        if stream.is_iterated:
+            description.content_type = (
+                description.content_type or "application/octet-stream"
+            )
+            return description
 
         # TODO: This content type is hardcoded for POC, investigate how to proceed
-        content = bytes(stream.content).decode("utf8")
+        content = TransportBuffer.from_data(stream.content)
 
         try:
-            json.loads(content)
+            json.loads(TransportBuffer.to_str(content))
             content_type = "application/json"
         except ValueError:
             content_type = "text/plain"
 
-        description.content_type = content_type
+        description.content_type = description.content_type or content_type
         description.length = len(content)
 
         # TODO: validate statement below, also make the string a constant
@@ -71,21 +95,28 @@ class PayloadDisassembler(ABC):
         return description
 
     @staticmethod
-    def serialize(item: Serializable, stream: List[int], length: List[int]):
+    def serialize(
+        item: Serializable, stream: Union[bytearray, List[int]], length: List[int]
+    ):
         encoded_json = item.to_json().encode()
         stream.clear()
-        stream.extend(list(encoded_json))
+        stream.extend(encoded_json)
 
         length.clear()
         length.append(len(stream))
 
     async def _send(self):
+        if self._chunks is not None:
+            await self._send_chunk()
+            return
+
         # determine if we know the length we can send and whether we can tell if this is the end
         is_length_known = self._is_end
 
         header = Header(type=self.type, id=self.identifier, end=self._is_end)
 
         header.payload_length = 0
+        payload = self._stream
 
         if self._stream_length is not None:
             # determine how many bytes we can send and if we are at the end
@@ -98,7 +129,36 @@ class PayloadDisassembler(ABC):
             )
             is_length_known = True
 
-        self.sender.send_payload(header, self._stream, is_length_known, self._on_send)
+            # each packet carries a view on its own part of the stream
+            payload = memoryview(self._stream)[
+                self._send_offset : self._send_offset + header.payload_length
+            ]
+
+        self.sender.send_payload(header, payload, is_length_known, self._on_send)
+
+    async def _send_chunk(self):
+        payload = self._next_payload or memoryview(b"")
+        self._next_payload = await self._read_payload()
+
+        header = Header(
+            type=self.type, id=self.identifier, end=self._next_payload is None
+        )
+        header.payload_length = len(payload)
+
+        self.sender.send_payload(header, payload, True, self._on_send)
+
+    async def _read_payload(self) -> memoryview:
+        """Gets the next payload of iterated content, None once it is all read."""
+        while not self._pending:
+            try:
+                chunk = await self._chunks.__anext__()
+            except StopAsyncIteration:
+                return None
+            self._pending = TransportBuffer.view(chunk)
+
+        payload = self._pending[: TransportConstants.MAX_PAYLOAD_LENGTH]
+        self._pending = self._pending[TransportConstants.MAX_PAYLOAD_LENGTH :]
+        return payload
 
     async def _on_send(self, header: Header):
         self._send_offset += header.payload_length
@@ -25,7 +25,7 @@ class RequestDisassembler(PayloadDisassembler):
     def type(self) -> str:
         return PayloadTypes.REQUEST
 
-    async def get_stream(self) -> List[int]:
+    async def get_stream(self) -> bytearray:
         payload = RequestPayload(verb=self.request.verb, path=self.request.path)
 
         if self.request.streams:
@@ -34,7 +34,7 @@ class RequestDisassembler(PayloadDisassembler):
                 for content_stream in self.request.streams
             ]
 
-        memory_stream: List[int] = []
+        memory_stream = bytearray()
         stream_length: List[int] = []
         # TODO: high probability stream length is not necessary
         self.serialize(payload, memory_stream, stream_length)
@@ -25,7 +25,7 @@ class ResponseDisassembler(PayloadDisassembler):
     def type(self) -> str:
         return PayloadTypes.RESPONSE
 
-    async def get_stream(self) -> List[int]:
+    async def get_stream(self) -> bytearray:
         payload = ResponsePayload(status_code=self.response.status_code)
 
         if self.response.streams:
@@ -34,7 +34,7 @@ class ResponseDisassembler(PayloadDisassembler):
                 for content_stream in self.response.streams
             ]
 
-        memory_stream: List[int] = []
+        memory_stream = bytearray()
         stream_length: List[int] = []
         # TODO: high probability stream length is not necessary
         self.serialize(payload, memory_stream, stream_length)
@@ -1,22 +1,31 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # Licensed under the MIT License.
 
+from functools import lru_cache
+from struct import Struct, error as StructError
 from uuid import UUID
-from typing import List
+from typing import List, Union
 
-from botframework.streaming.transport import TransportConstants
+from botframework.streaming.transport import BufferLike, TransportConstants
 
 from .models import Header
 
-_CHAR_TO_BINARY_INT = {val.decode(): list(val)[0] for val in [b".", b"\n", b"1", b"0"]}
 
-
-# TODO: consider abstracting the binary int list logic into a class for easier handling
 class HeaderSerializer:
-    DELIMITER = _CHAR_TO_BINARY_INT["."]
-    TERMINATOR = _CHAR_TO_BINARY_INT["\n"]
-    END = _CHAR_TO_BINARY_INT["1"]
-    NOT_END = _CHAR_TO_BINARY_INT["0"]
+    """
+    Reads and writes the 48 ASCII bytes of a payload header, such as
+    ``A.000168.68e999ca-a651-40f4-ad8f-3aaf781862b4.1\\n``: the type, the payload
+    length on 6 digits, the id and whether this is the last payload of the stream,
+    separated by dots and terminated by a line feed.
+
+    All the fields are packed and unpacked at once with a precompiled struct. The
+    payloads of a stream share its id, so the ids last encoded and decoded are cached.
+    """
+
+    DELIMITER = ord(".")
+    TERMINATOR = ord("\n")
+    END = ord("1")
+    NOT_END = ord("0")
     TYPE_OFFSET = 0
     TYPE_DELIMITER_OFFSET = 1
     LENGTH_OFFSET = 2
@@ -28,143 +37,120 @@ class HeaderSerializer:
     END_OFFSET = 46
     TERMINATOR_OFFSET = 47
 
+    # type, delimiter, length, delimiter, id, delimiter, end, terminator
+    _LAYOUT = Struct(f"cc{LENGTH_LENGTH}sc{ID_LENGTH}sccc")
+    _DELIMITER = b"."
+    _TERMINATOR = b"\n"
+    _END = b"1"
+    _NOT_END = b"0"
+
     @staticmethod
     def serialize(
-        header: Header,
-        buffer: List[int],
-        offset: int,  # pylint: disable=unused-argument
+        header: Header, buffer: Union[bytearray, memoryview, List[int]], offset: int
     ) -> int:
+        """
+        Writes a header into a buffer.
 
-        # write type
-        buffer[HeaderSerializer.TYPE_OFFSET] = HeaderSerializer._char_to_binary_int(
-            header.type
-        )
-        buffer[HeaderSerializer.TYPE_DELIMITER_OFFSET] = HeaderSerializer.DELIMITER
+        :return: The number of bytes written, always TransportConstants.MAX_HEADER_LENGTH.
+        """
+        if len(header.type) != 1:
+            raise ValueError("Char to cast should be a str of exactly length 1")
+        try:
+            header_type = header.type.encode("ascii")
+        except UnicodeEncodeError:
+            raise ValueError("Char to cast should be in the ASCII domain")
 
-        # write length
-        length_binary_array: List[int] = list(
-            HeaderSerializer._int_to_formatted_encoded_str(
-                header.payload_length, "{:06d}"
-            )
-        )
-        HeaderSerializer._write_in_buffer(
-            length_binary_array, buffer, HeaderSerializer.LENGTH_OFFSET
-        )
-        buffer[HeaderSerializer.LENGTH_DELIMETER_OFFSET] = HeaderSerializer.DELIMITER
+        length = b"%06d" % header.payload_length
+        if len(length) != HeaderSerializer.LENGTH_LENGTH:
+            raise ValueError("Header length does not fit in the header")
 
-        # write id
-        id_binary_array: List[int] = list(
-            HeaderSerializer._uuid_to_numeric_encoded_str(header.id)
-        )
-        HeaderSerializer._write_in_buffer(
-            id_binary_array, buffer, HeaderSerializer.ID_OFFSET
-        )
-        buffer[HeaderSerializer.ID_DELIMETER_OFFSET] = HeaderSerializer.DELIMITER
+        identifier = _encode_id(header.id)
+        if len(identifier) != HeaderSerializer.ID_LENGTH:
+            raise ValueError("Header id is malformed")
 
-        # write terminator
-        buffer[HeaderSerializer.END_OFFSET] = (
-            HeaderSerializer.END if header.end else HeaderSerializer.NOT_END
+        fields = (
+            header_type,
+            HeaderSerializer._DELIMITER,
+            length,
+            HeaderSerializer._DELIMITER,
+            identifier,
+            HeaderSerializer._DELIMITER,
+            HeaderSerializer._END if header.end else HeaderSerializer._NOT_END,
+            HeaderSerializer._TERMINATOR,
         )
-        buffer[HeaderSerializer.TERMINATOR_OFFSET] = HeaderSerializer.TERMINATOR
+
+        if isinstance(buffer, list):
+            buffer[
+                offset : offset + TransportConstants.MAX_HEADER_LENGTH
+            ] = HeaderSerializer._LAYOUT.pack(*fields)
+        else:
+            HeaderSerializer._LAYOUT.pack_into(buffer, offset, *fields)
 
         return TransportConstants.MAX_HEADER_LENGTH
 
     @staticmethod
     def deserialize(
-        buffer: List[int], offset: int, count: int  # pylint: disable=unused-argument
+        buffer: Union[BufferLike, List[int]], offset: int, count: int
     ) -> Header:
+        """Reads the header at ``offset`` in a buffer, raising ValueError if it is malformed."""
         if count != TransportConstants.MAX_HEADER_LENGTH:
             raise ValueError("Cannot deserialize header, incorrect length")
 
-        header = Header(
-            type=HeaderSerializer._binary_int_to_char(
-                buffer[HeaderSerializer.TYPE_OFFSET]
-            )
-        )
+        if isinstance(buffer, list):
+            buffer = bytes(buffer[offset : offset + count])
+            offset = 0
 
-        if buffer[HeaderSerializer.TYPE_DELIMITER_OFFSET] != HeaderSerializer.DELIMITER:
-            raise ValueError("Header type delimeter is malformed")
+        try:
+            (
+                header_type,
+                type_delimiter,
+                length,
+                length_delimiter,
+                identifier,
+                id_delimiter,
+                end,
+                terminator,
+            ) = HeaderSerializer._LAYOUT.unpack_from(buffer, offset)
+        except StructError:
+            raise ValueError("Cannot deserialize header, incorrect length")
 
-        length_str = HeaderSerializer._binary_array_to_str(
-            buffer[
-                HeaderSerializer.LENGTH_OFFSET : HeaderSerializer.LENGTH_OFFSET
-                + HeaderSerializer.LENGTH_LENGTH
-            ]
-        )
+        header = Header(type=header_type.decode("ascii"))
+
+        if type_delimiter != HeaderSerializer._DELIMITER:
+            raise ValueError("Header type delimeter is malformed")
 
         try:
-            length = int(length_str)
+            header.payload_length = int(length.decode("ascii"))
         except Exception:
             raise ValueError("Header length is malformed")
 
-        header.payload_length = length
-
-        if (
-            buffer[HeaderSerializer.LENGTH_DELIMETER_OFFSET]
-            != HeaderSerializer.DELIMITER
-        ):
+        if length_delimiter != HeaderSerializer._DELIMITER:
             raise ValueError("Header length delimeter is malformed")
 
-        identifier_str = HeaderSerializer._binary_array_to_str(
-            buffer[
-                HeaderSerializer.ID_OFFSET : HeaderSerializer.ID_OFFSET
-                + HeaderSerializer.ID_LENGTH
-            ]
-        )
-
         try:
-            identifier = UUID(identifier_str)
+            header.id = _decode_id(identifier)
         except Exception:
             raise ValueError("Header id is malformed")
 
-        header.id = identifier
-
-        if buffer[HeaderSerializer.ID_DELIMETER_OFFSET] != HeaderSerializer.DELIMITER:
+        if id_delimiter != HeaderSerializer._DELIMITER:
             raise ValueError("Header id delimeter is malformed")
 
-        if buffer[HeaderSerializer.END_OFFSET] not in [
-            HeaderSerializer.END,
-            HeaderSerializer.NOT_END,
-        ]:
+        if end not in (HeaderSerializer._END, HeaderSerializer._NOT_END):
             raise ValueError("Header end is malformed")
 
-        header.end = buffer[HeaderSerializer.END_OFFSET] == HeaderSerializer.END
+        header.end = end == HeaderSerializer._END
 
-        if buffer[HeaderSerializer.TERMINATOR_OFFSET] != HeaderSerializer.TERMINATOR:
+        if terminator != HeaderSerializer._TERMINATOR:
             raise ValueError("Header terminator is malformed")
 
         return header
 
-    @staticmethod
-    def _char_to_binary_int(char: str) -> int:
-        if len(char) != 1:
-            raise ValueError("Char to cast should be a str of exactly length 1")
 
-        unicode_list = list(char.encode())
-
-        if len(unicode_list) != 1:
-            raise ValueError("Char to cast should be in the ASCII domain")
+@lru_cache(maxsize=1024)
+def _encode_id(identifier: UUID) -> bytes:
+    return str(identifier).encode("ascii")
 
-        return unicode_list[0]
 
-    @staticmethod
-    def _int_to_formatted_encoded_str(value: int, str_format: str) -> bytes:
-        return str_format.format(value).encode("ascii")
-
-    @staticmethod
-    def _uuid_to_numeric_encoded_str(value: UUID) -> bytes:
-        return str(value).encode("ascii")
-
-    @staticmethod
-    def _binary_int_to_char(binary_int: int) -> str:
-        return bytes([binary_int]).decode("ascii")
-
-    @staticmethod
-    def _binary_array_to_str(binary_array: List[int]) -> str:
-        return bytes(binary_array).decode("ascii")
-
-    @staticmethod
-    def _write_in_buffer(data: List[int], buffer: List[int], insert_index: int):
-        for byte_int in data:
-            buffer[insert_index] = byte_int
-            insert_index += 1
+@lru_cache(maxsize=1024)
+def _decode_id(identifier: bytes) -> UUID:
+    return UUID(identifier.decode("ascii"))
@@ -1,6 +1,7 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # Licensed under the MIT License.
 
+from time import monotonic
 from uuid import UUID
 from typing import Awaitable, Callable, Dict, List, Union
 
@@ -25,6 +26,16 @@ class PayloadAssemblerManager:
         self._on_receive_response = on_receive_response
         self._stream_manager = stream_manager
         self._active_assemblers: Dict[UUID, Assembler] = {}
+        self._last_active: Dict[UUID, float] = {}
+
+    @property
+    def pending_count(self) -> int:
+        """The number of requests and responses being received."""
+        return len(self._active_assemblers)
+
+    @property
+    def open_stream_count(self) -> int:
+        return self._stream_manager.open_stream_count
 
     def get_payload_stream(
         self, header: Header
@@ -37,6 +48,7 @@ class PayloadAssemblerManager:
             assembler = self._create_payload_assembler(header)
             if assembler:
                 self._active_assemblers[header.id] = assembler
+                self._last_active[header.id] = monotonic()
                 return assembler.get_payload_as_stream()
 
         return None
@@ -54,9 +66,38 @@ class PayloadAssemblerManager:
                 # remove them when we are done
                 if header.end:
                     del self._active_assemblers[header.id]
+                    self._last_active.pop(header.id, None)
+                else:
+                    self._last_active[header.id] = monotonic()
 
             # ignore unknown header ids
 
+    def sweep(self, max_idle: float, now: float = None) -> int:
+        """
+        Drops the requests, responses and streams that received nothing for more than
+        ``max_idle`` seconds.
+
+        :return: The number of assemblers dropped.
+        """
+        deadline = (monotonic() if now is None else now) - max_idle
+        idle = [
+            identifier
+            for identifier, last_active in self._last_active.items()
+            if last_active < deadline
+        ]
+
+        for identifier in idle:
+            del self._active_assemblers[identifier]
+            del self._last_active[identifier]
+
+        return len(idle) + self._stream_manager.sweep(max_idle, now)
+
+    def close_all(self, error: Exception = None):
+        """Drops all the assemblers as the connection is closed."""
+        self._active_assemblers.clear()
+        self._last_active.clear()
+        self._stream_manager.close_all(error)
+
     def _create_payload_assembler(self, header: Header) -> Assembler:
         if header.type == PayloadTypes.REQUEST:
             return ReceiveRequestAssembler(
@@ -1,7 +1,7 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # Licensed under the MIT License.
 
-from asyncio import Future, shield
+from asyncio import Future, shield, wait_for
 from uuid import UUID
 from typing import Dict
 
@@ -12,16 +12,28 @@ class RequestManager:
     def __init__(
         self,
         *,
-        pending_requests: Dict[UUID, "Future[streaming.ReceiveResponse]"] = None
+        pending_requests: Dict[UUID, "Future[streaming.ReceiveResponse]"] = None,
+        timeout: float = None,
     ):
+        """
+        :param timeout: (Optional) The seconds to wait for a response, after which
+        get_response raises an asyncio.TimeoutError. Responses are awaited until the
+        connection is closed by default.
+        """
         self._pending_requests = pending_requests or {}
+        self.timeout = timeout
+
+    @property
+    def pending_count(self) -> int:
+        """The number of requests waiting for their response."""
+        return len(self._pending_requests)
 
     async def signal_response(
         self, request_id: UUID, response: "streaming.ReceiveResponse"
     ) -> bool:
         # TODO: dive more into this logic
         signal: Future = self._pending_requests.get(request_id)
-        if signal:
+        if signal and not signal.done():
             signal.set_result(response)
             # TODO: double check this
             # del self._pending_requests[request_id]
@@ -38,8 +50,18 @@ class RequestManager:
         self._pending_requests[request_id] = pending_request
 
         try:
-            response: streaming.ReceiveResponse = await shield(pending_request)
+            response: streaming.ReceiveResponse = await wait_for(
+                shield(pending_request), self.timeout
+            )
             return response
 
         finally:
-            del self._pending_requests[request_id]
+            self._pending_requests.pop(request_id, None)
+
+    def cancel_all(self, error: Exception = None):
+        """Fails the requests waiting for their response, as the connection is closed."""
+        for pending_request in self._pending_requests.values():
+            if not pending_request.done():
+                pending_request.set_exception(
+                    error or ConnectionResetError("The connection was closed")
+                )
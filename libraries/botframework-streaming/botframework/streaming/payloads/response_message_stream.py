@@ -5,7 +5,30 @@ from uuid import uuid4, UUID
 
 
 class ResponseMessageStream:
+    """
+    A stream sent along a request or response. Its content is a bytes-like object, or
+    an async iterable of them that is sent chunk by chunk as it is iterated.
+    """
+
     # pylint: disable=invalid-name
-    def __init__(self, *, id: UUID = None, content: object = None):
+    def __init__(
+        self,
+        *,
+        id: UUID = None,
+        content: object = None,
+        content_type: str = None,
+        length: int = None,
+    ):
+        """
+        :param content_type: (Optional) The content type, found out from bytes content
+        and application/octet-stream for iterated content by default.
+        :param length: (Optional) The length of iterated content, if it is known.
+        """
         self.id = id or uuid4()
         self.content = content
+        self.content_type = content_type
+        self.length = length
+
+    @property
+    def is_iterated(self) -> bool:
+        return hasattr(self.content, "__aiter__")
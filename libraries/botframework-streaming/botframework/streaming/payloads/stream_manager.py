@@ -1,6 +1,8 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # Licensed under the MIT License.
 
+from collections import OrderedDict
+from time import monotonic
 from uuid import UUID
 from typing import Callable, Dict, List
 
@@ -9,20 +11,43 @@ from botframework.streaming.payloads.models import Header
 
 
 class StreamManager:
+    """
+    Keeps the assemblers of the streams being received, until they are closed, swept
+    after being idle for too long or the connection is closed.
+    """
+
+    # the closed streams remembered, so that the payloads still coming in for them are
+    # skipped rather than starting them anew
+    MAX_CLOSED_STREAMS = 1024
+
     def __init__(
         self, on_cancel_stream: Callable[[PayloadStreamAssembler], None] = None
     ):
         self._on_cancel_stream = on_cancel_stream or (lambda ocs: None)
         self._active_assemblers: Dict[UUID, PayloadStreamAssembler] = {}
+        # when each stream last received a payload, or was asked for
+        self._last_active: Dict[UUID, float] = {}
+        self._closed_streams: Dict[UUID, None] = OrderedDict()
+
+    @property
+    def open_stream_count(self) -> int:
+        """The number of streams kept, being received or not read yet."""
+        return len(self._active_assemblers)
 
     def get_payload_assembler(self, identifier: UUID) -> PayloadStreamAssembler:
-        self._active_assemblers[identifier] = self._active_assemblers.get(
-            identifier, PayloadStreamAssembler(self, identifier)
-        )
+        assembler = self._active_assemblers.get(identifier)
+        if not assembler:
+            assembler = PayloadStreamAssembler(self, identifier)
+            self._active_assemblers[identifier] = assembler
+        self._last_active[identifier] = monotonic()
 
-        return self._active_assemblers[identifier]
+        return assembler
 
     def get_payload_stream(self, header: Header) -> "streaming.PayloadStream":
+        """:return: None for a stream closed already."""
+        if header.id in self._closed_streams:
+            return None
+
         assembler = self.get_payload_assembler(header.id)
 
         return assembler.get_payload_as_stream()
@@ -33,17 +58,79 @@ class StreamManager:
         assembler = self._active_assemblers.get(header.id)
 
         if assembler:
+            self._last_active[header.id] = monotonic()
             assembler.on_receive(header, content_stream, content_length)
+        elif header.end:
+            self._closed_streams.pop(header.id, None)
 
     def close_stream(self, identifier: UUID):
         assembler = self._active_assemblers.get(identifier)
 
         if assembler:
             del self._active_assemblers[identifier]
+            self._last_active.pop(identifier, None)
             stream = assembler.get_payload_as_stream()
+            # nothing reads it anymore, release what it buffers
+            stream.cancel()
             if (
                 assembler.content_length
                 and len(stream) < assembler.content_length
                 or not assembler.end
             ):
+                self._remember_closed(identifier)
+                self._on_cancel_stream(assembler)
+
+    def remove_stream(self, identifier: UUID):
+        """Drops a stream that was received and read to its end."""
+        self._active_assemblers.pop(identifier, None)
+        self._last_active.pop(identifier, None)
+
+    def cancel_stream(self, identifier: UUID):
+        """Asks the other end to stop sending a stream that is still being received."""
+        assembler = self._active_assemblers.get(identifier)
+
+        if assembler:
+            self._on_cancel_stream(assembler)
+
+    def sweep(self, max_idle: float, now: float = None) -> int:
+        """
+        Drops the streams idle for more than ``max_idle`` seconds. Those still being
+        received are cancelled, their reads raise a TimeoutError.
+
+        :return: The number of streams dropped.
+        """
+        deadline = (monotonic() if now is None else now) - max_idle
+        idle = [
+            identifier
+            for identifier, last_active in self._last_active.items()
+            if last_active < deadline
+        ]
+
+        for identifier in idle:
+            assembler = self._active_assemblers.pop(identifier)
+            del self._last_active[identifier]
+            if not assembler.end:
+                assembler.get_payload_as_stream().cancel(
+                    TimeoutError(f"Stream {identifier} idle for over {max_idle} s")
+                )
+                self._remember_closed(identifier)
                 self._on_cancel_stream(assembler)
+
+        return len(idle)
+
+    def close_all(self, error: Exception = None):
+        """Drops all the streams as the connection is closed, failing those not received."""
+        for assembler in self._active_assemblers.values():
+            if not assembler.end:
+                assembler.get_payload_as_stream().cancel(
+                    error or ConnectionResetError("The connection was closed")
+                )
+
+        self._active_assemblers.clear()
+        self._last_active.clear()
+        self._closed_streams.clear()
+
+    def _remember_closed(self, identifier: UUID):
+        self._closed_streams[identifier] = None
+        if len(self._closed_streams) > self.MAX_CLOSED_STREAMS:
+            self._closed_streams.popitem(last=False)
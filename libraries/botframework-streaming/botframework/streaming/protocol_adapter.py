@@ -1,6 +1,7 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # Licensed under the MIT License.
 import asyncio
+from time import perf_counter
 from uuid import UUID, uuid4
 
 from botframework.streaming.payloads import (
@@ -15,7 +16,9 @@ from botframework.streaming.payload_transport import PayloadSender, PayloadRecei
 from .receive_request import ReceiveRequest
 from .receive_response import ReceiveResponse
 from .request_handler import RequestHandler
+from .streaming_metrics_sink import StreamingMetricsSink, call_sink
 from .streaming_request import StreamingRequest
+from .streaming_response import StreamingResponse
 
 
 class ProtocolAdapter:
@@ -26,12 +29,18 @@ class ProtocolAdapter:
         payload_sender: PayloadSender,
         payload_receiver: PayloadReceiver,
         handler_context: object = None,
+        metrics_sink: StreamingMetricsSink = None,
     ):
+        """
+        :param metrics_sink: (Optional) Where the requests received and sent are
+        reported, with their duration.
+        """
         self._request_handler = request_handler
         self._request_manager = request_manager
         self._payload_sender = payload_sender
         self._payload_receiver = payload_receiver
         self._handler_context = handler_context
+        self._metrics_sink = metrics_sink
 
         self._send_operations = SendOperations(self._payload_sender)
         # TODO: might be able to remove
@@ -45,23 +54,97 @@ class ProtocolAdapter:
             self._assembler_manager.on_receive,
         )
 
+        # the receiver holding up the connection while a response is awaited could wait
+        # on a handler that awaits the response
+        self._awaited_responses = 0
+        self._payload_receiver.can_wait = lambda: not self._awaited_responses
+
     async def send_request(self, request: StreamingRequest) -> ReceiveResponse:
         if not request:
             raise TypeError(
                 f"'request: {request.__class__.__name__}' argument can't be None"
             )
 
+        if self._metrics_sink:
+            return await self._send_request_measured(request)
+
+        return await self._send_request(request)
+
+    @property
+    def pending_request_count(self) -> int:
+        """The number of requests sent and waiting for their response."""
+        return self._request_manager.pending_count
+
+    @property
+    def receiving_count(self) -> int:
+        """The number of requests and responses being received."""
+        return self._assembler_manager.pending_count
+
+    @property
+    def open_stream_count(self) -> int:
+        """The number of streams received and kept until they are read."""
+        return self._assembler_manager.open_stream_count
+
+    def sweep(self, max_idle: float) -> int:
+        """
+        Drops what is being received and got nothing for more than ``max_idle`` seconds.
+
+        :return: The number of requests, responses and streams dropped.
+        """
+        return self._assembler_manager.sweep(max_idle)
+
+    def close(self, error: Exception = None):
+        """Fails what waits on the connection and drops what it was receiving."""
+        self._request_manager.cancel_all(error)
+        self._assembler_manager.close_all(error)
+
+    async def _send_request(self, request: StreamingRequest) -> ReceiveResponse:
         request_id = uuid4()
         response_task = self._request_manager.get_response(request_id)
         request_task = self._send_operations.send_request(request_id, request)
 
-        [_, response] = await asyncio.gather(request_task, response_task)
+        self._awaited_responses += 1
+        self._payload_receiver.wake()
+        try:
+            [_, response] = await asyncio.gather(request_task, response_task)
+        finally:
+            self._awaited_responses -= 1
 
         return response
 
+    async def _send_request_measured(
+        self, request: StreamingRequest
+    ) -> ReceiveResponse:
+        start = perf_counter()
+        response = None
+        error = None
+        try:
+            response = await self._send_request(request)
+            return response
+        except Exception as exception:
+            error = exception
+            raise
+        finally:
+            call_sink(
+                self._metrics_sink.on_response_received,
+                request,
+                response,
+                perf_counter() - start,
+                error,
+            )
+
     async def _on_receive_request(self, identifier: UUID, request: ReceiveRequest):
         # request is done, we can handle it
         if self._request_handler:
+            if self._metrics_sink:
+                await self._process_request_measured(identifier, request)
+            else:
+                await self._process_request(identifier, request)
+
+    async def _process_request(
+        self, identifier: UUID, request: ReceiveRequest
+    ) -> StreamingResponse:
+        try:
             response = await self._request_handler.process_request(
                 request, None, self._handler_context
             )
@@ -69,6 +152,33 @@ class ProtocolAdapter:
             if response:
                 await self._send_operations.send_response(identifier, response)
 
+            return response
+        finally:
+            # the streams the handler left unread are dropped, rather than holding the
+            # buffer space of the connection until it is closed
+            for content_stream in request.streams:
+                content_stream.cancel()
+
+    async def _process_request_measured(
+        self, identifier: UUID, request: ReceiveRequest
+    ):
+        start = perf_counter()
+        response = None
+        error = None
+        try:
+            response = await self._process_request(identifier, request)
+        except Exception as exception:
+            error = exception
+            raise
+        finally:
+            call_sink(
+                self._metrics_sink.on_request_processed,
+                request,
+                response,
+                perf_counter() - start,
+                error,
+            )
+
     async def _on_receive_response(self, identifier: UUID, response: ReceiveResponse):
         # we received the response to something, signal it
         await self._request_manager.signal_response(identifier, response)
@@ -1,9 +1,10 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # Licensed under the MIT License.
 
-from typing import List
+from typing import AsyncIterator, List
 
 from botframework.streaming.payloads import ContentStream
+from botframework.streaming.transport import BufferLike, TransportBuffer
 
 
 class ReceiveRequest:
@@ -24,6 +25,29 @@ class ReceiveRequest:
 
             # TODO: encoding double check
             stream = await content_stream.stream.read_until_end()
-            return bytes(stream).decode("utf-8-sig")
+            return TransportBuffer.to_str(stream, "utf-8-sig")
         except Exception as error:
             raise error
+
+    async def read_body(self) -> BufferLike:
+        """
+        Reads the body as the buffer it was received in when it came in a single payload,
+        as most bodies do, rather than as a copy of it.
+        """
+        chunks = [chunk async for chunk in self.read_body_chunks()]
+
+        if len(chunks) == 1 and chunks[0].nbytes == len(chunks[0].obj):
+            return chunks[0].obj
+
+        return b"".join(chunks)
+
+    async def read_body_chunks(self) -> AsyncIterator[memoryview]:
+        """
+        Iterates over the body as it is received, so that a large body can be processed
+        or piped somewhere else without holding all of it.
+        """
+        content_stream = self.streams[0] if self.streams else None
+
+        if content_stream:
+            async for chunk in content_stream:
+                yield chunk
@@ -0,0 +1,81 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+import logging
+from typing import Callable
+
+from .receive_request import ReceiveRequest
+from .receive_response import ReceiveResponse
+from .streaming_request import StreamingRequest
+from .streaming_response import StreamingResponse
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def call_sink(report: Callable, *args):
+    """
+    Calls a method of a sink, logging what it raises rather than raising it, so that a
+    failing sink can't affect the connection.
+    """
+    try:
+        report(*args)
+    except Exception:
+        _LOGGER.exception("%s failed", getattr(report, "__qualname__", report))
+
+
+class StreamingMetricsSink:
+    """
+    Where a streaming connection reports what goes through it. Every method does nothing
+    by default, a sink overrides the ones it exports.
+
+    A connection without a sink does not time its requests nor report anything, only
+    its counters are kept, so the reporting costs nothing until a sink is given.
+    """
+
+    # pylint: disable=unused-argument
+
+    def on_request_processed(
+        self,
+        request: ReceiveRequest,
+        response: StreamingResponse,
+        duration: float,
+        error: Exception = None,
+    ):
+        """
+        A request received on the connection was processed and answered.
+
+        :param response: The response sent, None if the handler gave none or failed.
+        :param duration: The seconds from the request being received to its response
+        being sent.
+        :param error: The exception the handler raised, if it failed.
+        """
+
+    def on_response_received(
+        self,
+        request: StreamingRequest,
+        response: ReceiveResponse,
+        duration: float,
+        error: Exception = None,
+    ):
+        """
+        A request sent on the connection got its response.
+
+        :param response: The response received, None if none came.
+        :param duration: The seconds from the request being sent to its response being
+        received.
+        :param error: The exception raised while waiting, if no response came.
+        """
+
+    def on_metrics(self, metrics: dict):
+        """
+        A snapshot of the counters and gauges of the connection, as given by
+        WebSocketServer.get_metrics: reported periodically if asked for, and once the
+        connection is closed.
+        """
+
+    def on_disconnected(self, reason: str):
+        """
+        The connection was closed.
+
+        :param reason: Why, None for a close without an error.
+        """
@@ -75,10 +75,25 @@ class StreamingRequest:
 
             body = body.encode("ascii")
 
-        self.add_stream(list(body))
+        self.add_stream(body)
 
-    def add_stream(self, content: object, stream_id: UUID = None):
-        if not content:
+    def add_stream(
+        self,
+        content: object,
+        stream_id: UUID = None,
+        *,
+        content_type: str = None,
+        length: int = None,
+    ):
+        """
+        Adds a stream to the request.
+
+        :param content: A bytes-like object, or an async iterable of them, such as a
+        ContentStream being received, to send the stream as it is iterated.
+        :param content_type: (Optional) The content type of the stream.
+        :param length: (Optional) The length of iterated content, if it is known.
+        """
+        if content is None or (not content and not hasattr(content, "__aiter__")):
             raise TypeError(
                 f"'content: {content.__class__.__name__}' argument can't be None"
             )
@@ -86,5 +101,10 @@ class StreamingRequest:
             self.streams = []
 
         self.streams.append(
-            ResponseMessageStream(id=stream_id or uuid4(), content=content)
+            ResponseMessageStream(
+                id=stream_id or uuid4(),
+                content=content,
+                content_type=content_type,
+                length=length,
+            )
         )
@@ -18,15 +18,35 @@ class StreamingResponse:
         self.status_code = status_code
         self.streams = streams
 
-    def add_stream(self, content: object, identifier: UUID = None):
-        if not content:
+    def add_stream(
+        self,
+        content: object,
+        identifier: UUID = None,
+        *,
+        content_type: str = None,
+        length: int = None,
+    ):
+        """
+        Adds a stream to the response.
+
+        :param content: A bytes-like object, or an async iterable of them to send the
+        stream as it is iterated.
+        :param content_type: (Optional) The content type of the stream.
+        :param length: (Optional) The length of iterated content, if it is known.
+        """
+        if content is None or (not content and not hasattr(content, "__aiter__")):
             raise TypeError("content can't be None")
 
         if self.streams is None:
             self.streams: List[ResponseMessageStream] = []
 
         self.streams.append(
-            ResponseMessageStream(id=identifier or uuid4(), content=content)
+            ResponseMessageStream(
+                id=identifier or uuid4(),
+                content=content,
+                content_type=content_type,
+                length=length,
+            )
         )
 
     def set_body(self, body: Union[str, Serializable, Model]):
@@ -39,7 +59,7 @@ class StreamingResponse:
         elif isinstance(body, Model):
             body = json.dumps(body.as_dict())
 
-        self.add_stream(list(body.encode()))
+        self.add_stream(body.encode())
 
     @staticmethod
     def create_response(status_code: int, body: object) -> "StreamingResponse":
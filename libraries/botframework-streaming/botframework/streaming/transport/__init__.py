@@ -2,16 +2,25 @@
 # Licensed under the MIT License.
 
 from .disconnected_event_args import DisconnectedEventArgs
+from .list_buffer_transport import (
+    ListBufferTransportReceiver,
+    ListBufferTransportSender,
+)
 from .streaming_transport_service import StreamingTransportService
 from .transport_base import TransportBase
 from .transport_constants import TransportConstants
 from .transport_receiver_base import TransportReceiverBase
 from .transport_sender_base import TransportSenderBase
+from .transport_buffer import BufferLike, TransportBuffer
 
 __all__ = [
+    "BufferLike",
     "DisconnectedEventArgs",
+    "ListBufferTransportReceiver",
+    "ListBufferTransportSender",
     "StreamingTransportService",
     "TransportBase",
+    "TransportBuffer",
     "TransportConstants",
     "TransportReceiverBase",
     "TransportSenderBase",
@@ -0,0 +1,63 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+from typing import List
+
+from .transport_buffer import BufferLike, TransportBuffer
+from .transport_receiver_base import TransportReceiverBase
+from .transport_sender_base import TransportSenderBase
+
+
+class ListBufferTransportSender(TransportSenderBase):
+    """
+    Adapts a sender written for the List[int] buffers of earlier versions, which
+    is given a list holding only the bytes to send.
+    """
+
+    # pylint: disable=super-init-not-called
+    def __init__(self, sender: TransportSenderBase):
+        if not sender:
+            raise TypeError(
+                f"'sender: {sender.__class__.__name__}' argument can't be None"
+            )
+
+        self._sender = sender
+
+    @property
+    def is_connected(self) -> bool:
+        return self._sender.is_connected
+
+    def close(self):
+        return self._sender.close()
+
+    async def send(self, buffer: BufferLike, offset: int, count: int) -> int:
+        data: List[int] = list(TransportBuffer.view(buffer, offset, count))
+        return await self._sender.send(data, 0, len(data))
+
+
+class ListBufferTransportReceiver(TransportReceiverBase):
+    """
+    Adapts a receiver written for the List[int] buffers of earlier versions, which
+    receives into a list that is then copied into the buffer of the caller.
+    """
+
+    # pylint: disable=super-init-not-called
+    def __init__(self, receiver: TransportReceiverBase):
+        if not receiver:
+            raise TypeError(
+                f"'receiver: {receiver.__class__.__name__}' argument can't be None"
+            )
+
+        self._receiver = receiver
+
+    @property
+    def is_connected(self) -> bool:
+        return self._receiver.is_connected
+
+    def close(self):
+        return self._receiver.close()
+
+    async def receive(self, buffer: bytearray, offset: int, count: int) -> int:
+        data: List[int] = [0] * count
+        length = await self._receiver.receive(data, 0, count)
+        return TransportBuffer.copy_into(buffer, offset, data, length)
@@ -0,0 +1,59 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+from typing import List, Union
+
+BufferLike = Union[bytes, bytearray, memoryview]
+
+
+class TransportBuffer:
+    """
+    Helpers for the binary buffers handed between transports, payloads and assemblers.
+
+    Buffers are bytes, bytearray or memoryview objects: slices of them are taken as
+    memoryviews and copied with slice assignment, so a payload is never copied one
+    byte at a time. Lists of ints, the buffers of earlier versions, are still
+    accepted wherever data comes in, and can still be written into.
+    """
+
+    @staticmethod
+    def from_data(data: Union[BufferLike, List[int]]) -> BufferLike:
+        """
+        Gets data as a bytes-like object, without copying it if it already is one.
+
+        :param data: A bytes-like object, or a list of ints from 0 to 255.
+        """
+        if data is None:
+            return b""
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            return data
+        return bytes(data)
+
+    @staticmethod
+    def view(
+        data: Union[BufferLike, List[int]], offset: int = 0, count: int = None
+    ) -> memoryview:
+        """Gets a view on ``count`` bytes of data from ``offset``, all of them by default."""
+        view = memoryview(TransportBuffer.from_data(data))
+        return view[offset:] if count is None else view[offset : offset + count]
+
+    @staticmethod
+    def copy_into(
+        buffer: Union[bytearray, memoryview, List[int]],
+        offset: int,
+        data: Union[BufferLike, List[int]],
+        count: int = None,
+    ) -> int:
+        """
+        Copies up to ``count`` bytes of data into a buffer at ``offset``.
+
+        :return: The number of bytes copied.
+        """
+        source = TransportBuffer.view(data, 0, count)
+        buffer[offset : offset + len(source)] = source
+        return len(source)
+
+    @staticmethod
+    def to_str(data: Union[BufferLike, List[int]], encoding: str = "utf8") -> str:
+        """Decodes data without copying it first."""
+        return str(TransportBuffer.from_data(data), encoding)
@@ -1,17 +1,25 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # Licensed under the MIT License.
 
-from asyncio import Future, iscoroutinefunction, isfuture
+from asyncio import Future, Task, ensure_future, iscoroutinefunction, isfuture, sleep
 from typing import Callable
 
 from botframework.streaming import (
     ProtocolAdapter,
     ReceiveResponse,
     RequestHandler,
+    StreamingMetricsSink,
     StreamingRequest,
 )
 from botframework.streaming.payloads import RequestManager
-from botframework.streaming.payload_transport import PayloadSender, PayloadReceiver
+from botframework.streaming.streaming_metrics_sink import call_sink
+from botframework.streaming.payload_transport import (
+    PayloadSender,
+    PayloadReceiver,
+    ReceiveLimits,
+    ReceiveMetrics,
+    SendMetrics,
+)
 from botframework.streaming.transport import DisconnectedEventArgs
 
 from .web_socket import WebSocket
@@ -19,7 +27,27 @@ from .web_socket_transport import WebSocketTransport
 
 
 class WebSocketServer:
-    def __init__(self, socket: WebSocket, request_handler: RequestHandler):
+    def __init__(
+        self,
+        socket: WebSocket,
+        request_handler: RequestHandler,
+        receive_limits: ReceiveLimits = None,
+        request_timeout: float = None,
+        idle_timeout: float = None,
+        metrics_sink: StreamingMetricsSink = None,
+        metrics_interval: float = None,
+    ):
+        """
+        :param receive_limits: (Optional) Limits on the payloads received.
+        :param request_timeout: (Optional) The seconds to wait for the response to a
+        request sent, until the connection is closed by default.
+        :param idle_timeout: (Optional) The seconds after which the requests, responses
+        and streams that receive nothing are dropped, never by default.
+        :param metrics_sink: (Optional) Where the requests, metrics and disconnection of
+        the connection are reported, nothing is reported by default.
+        :param metrics_interval: (Optional) The seconds between the metrics reported to
+        the sink, only once the connection is closed by default.
+        """
         if socket is None:
             raise TypeError(
                 f"'socket: {socket.__class__.__name__}' argument can't be None"
@@ -35,23 +63,83 @@ class WebSocketServer:
 
         self._web_socket_transport = WebSocketTransport(socket)
         self._request_handler = request_handler
-        self._request_manager = RequestManager()
+        self._request_manager = RequestManager(timeout=request_timeout)
         self._sender = PayloadSender()
         self._sender.disconnected = self._on_connection_disconnected
-        self._receiver = PayloadReceiver()
+        self._receiver = PayloadReceiver(receive_limits)
         self._receiver.disconnected = self._on_connection_disconnected
         self._protocol_adapter = ProtocolAdapter(
-            self._request_handler, self._request_manager, self._sender, self._receiver
+            self._request_handler,
+            self._request_manager,
+            self._sender,
+            self._receiver,
+            metrics_sink=metrics_sink,
         )
         self._closed_signal: Future = None
         self._is_disconnecting: bool = False
+        self._idle_timeout = idle_timeout
+        self._sweeper: Task = None
+        self._metrics_sink = metrics_sink
+        self._metrics_interval = metrics_interval
+        self._reporter: Task = None
+
+        self._is_disconnected = False
+
+        # why the connection was closed, None while open or when closed without an error
+        self.disconnect_reason: str = None
 
     @property
     def is_connected(self) -> bool:
         return self._sender.is_connected and self._receiver.is_connected
 
+    @property
+    def pending_requests(self) -> int:
+        """The number of requests sent on the connection and waiting for their response."""
+        return self._protocol_adapter.pending_request_count
+
+    @property
+    def open_streams(self) -> int:
+        """The number of streams received on the connection and kept until read."""
+        return self._protocol_adapter.open_stream_count
+
+    @property
+    def send_queue_depth(self) -> int:
+        """The number of packets waiting to be sent on the connection."""
+        return self._sender.queue_depth
+
+    @property
+    def send_metrics(self) -> SendMetrics:
+        """The counters of the packets sent on the connection."""
+        return self._sender.metrics
+
+    @property
+    def receive_buffered_bytes(self) -> int:
+        """The number of stream bytes received on the connection but not read yet."""
+        return self._receiver.buffered_bytes
+
+    @property
+    def receive_metrics(self) -> ReceiveMetrics:
+        """The counters of the packets received on the connection."""
+        return self._receiver.metrics
+
+    def get_metrics(self) -> dict:
+        """A snapshot of the counters and gauges of the connection."""
+        return {
+            "sent": self._sender.metrics.to_dict(),
+            "received": self._receiver.metrics.to_dict(),
+            "send_queue_depth": self._sender.queue_depth,
+            "receive_buffered_bytes": self._receiver.buffered_bytes,
+            "pending_requests": self._protocol_adapter.pending_request_count,
+            "receiving": self._protocol_adapter.receiving_count,
+            "open_streams": self._protocol_adapter.open_stream_count,
+        }
+
     async def start(self):
         self._closed_signal = Future()
+        if self._idle_timeout:
+            self._sweeper = ensure_future(self._sweep())
+        if self._metrics_sink and self._metrics_interval:
+            self._reporter = ensure_future(self._report())
         self._sender.connect(self._web_socket_transport)
         await self._receiver.connect(self._web_socket_transport)
 
@@ -77,11 +165,28 @@ class WebSocketServer:
     ):
         if not self._is_disconnecting:
             self._is_disconnecting = True
+            # the sender and receiver each report their disconnection, the first tells why
+            is_first = not self._is_disconnected
+            if is_first:
+                self._is_disconnected = True
+                self.disconnect_reason = getattr(event_args, "reason", None)
 
             if self._closed_signal:
                 self._closed_signal.set_result("close")
                 self._closed_signal = None
 
+            if self._sweeper:
+                self._sweeper.cancel()
+                self._sweeper = None
+            if self._reporter:
+                self._reporter.cancel()
+                self._reporter = None
+            if self._metrics_sink and is_first:
+                # reported before the pending requests and open streams are dropped
+                call_sink(self._metrics_sink.on_metrics, self.get_metrics())
+                call_sink(self._metrics_sink.on_disconnected, self.disconnect_reason)
+            self._protocol_adapter.close()
+
             if sender in [self._sender, self._receiver]:
                 if iscoroutinefunction(sender.disconnect) or isfuture(
                     sender.disconnect
@@ -95,3 +200,13 @@ class WebSocketServer:
                 self.disconnected_event_handler(self, DisconnectedEventArgs.empty)
 
             self._is_disconnecting = False
+
+    async def _sweep(self):
+        while True:
+            await sleep(self._idle_timeout / 2)
+            self._protocol_adapter.sweep(self._idle_timeout)
+
+    async def _report(self):
+        while True:
+            await sleep(self._metrics_interval)
+            call_sink(self._metrics_sink.on_metrics, self.get_metrics())
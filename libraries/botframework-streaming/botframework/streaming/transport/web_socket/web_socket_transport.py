@@ -2,9 +2,13 @@
 # Licensed under the MIT License.
 
 import traceback
-from typing import List
 
-from botframework.streaming.transport import TransportReceiverBase, TransportSenderBase
+from botframework.streaming.transport import (
+    BufferLike,
+    TransportBuffer,
+    TransportReceiverBase,
+    TransportSenderBase,
+)
 
 from .web_socket import WebSocket
 from .web_socket_message_type import WebSocketMessageType
@@ -15,6 +19,8 @@ from .web_socket_state import WebSocketState
 class WebSocketTransport(TransportReceiverBase, TransportSenderBase):
     def __init__(self, web_socket: WebSocket):
         self._socket = web_socket
+        # the part of the last message not read yet
+        self._received = memoryview(b"")
 
     @property
     def is_connected(self):
@@ -39,28 +45,29 @@ class WebSocketTransport(TransportReceiverBase, TransportSenderBase):
                 """
                 traceback.print_exc()
 
-    # TODO: might need to remove offset and count if no segmentation possible
-    # TODO: considering to create a BFTransportBuffer class to abstract the logic of binary buffers adapting to
-    #  current interfaces
+    # A message can hold several packets, or a part of one: the bytes of a message
+    # that don't fit in the buffer are returned by the next calls.
     async def receive(
-        self, buffer: List[int], offset: int = 0, count: int = None
+        self, buffer: bytearray, offset: int = 0, count: int = None
     ) -> int:
         try:
             if self._socket:
-                result = await self._socket.receive()
-                buffer_index = offset
-                result_length = count if count is not None else len(result.data)
-                for result_index in range(result_length):
-                    buffer[buffer_index] = result.data[result_index]
-                    buffer_index += 1
-                if result.message_type == WebSocketMessageType.CLOSE:
-                    await self._socket.close(
-                        WebSocketCloseStatus.NORMAL_CLOSURE, "Socket closed"
-                    )
+                if not self._received:
+                    result = await self._socket.receive()
+                    self._received = TransportBuffer.view(result.data)
+                    if result.message_type == WebSocketMessageType.CLOSE:
+                        await self._socket.close(
+                            WebSocketCloseStatus.NORMAL_CLOSURE, "Socket closed"
+                        )
+
+                        # Depending on ws implementation library next line might not be necessary
+                        if self._socket.status == WebSocketState.CLOSED:
+                            self._socket.dispose()
 
-                    # Depending on ws implementation library next line might not be necessary
-                    if self._socket.status == WebSocketState.CLOSED:
-                        self._socket.dispose()
+                result_length = TransportBuffer.copy_into(
+                    buffer, offset, self._received, count
+                )
+                self._received = self._received[result_length:]
 
                 return result_length
         except Exception as error:
@@ -69,16 +76,13 @@ class WebSocketTransport(TransportReceiverBase, TransportSenderBase):
             # be thrown to cause a non-transport-connectivity failure.
             raise error
 
-    # TODO: might need to remove offset and count if no segmentation possible (or put them in BFTransportBuffer)
-    async def send(self, buffer: List[int], offset: int = 0, count: int = None) -> int:
+    # TODO: might need to remove offset and count if no segmentation possible
+    async def send(self, buffer: BufferLike, offset: int = 0, count: int = None) -> int:
         try:
             if self._socket:
-                await self._socket.send(
-                    buffer[offset:count] if count is not None else buffer,
-                    WebSocketMessageType.BINARY,
-                    True,
-                )
-                return count or len(buffer)
+                data = TransportBuffer.view(buffer, offset, count)
+                await self._socket.send(data, WebSocketMessageType.BINARY, True)
+                return len(data)
         except Exception as error:
             # Exceptions of the three types below will also have set the socket's state to closed, which fires an
             # event consumers of this class are subscribed to and have handling around. Any other exception needs to
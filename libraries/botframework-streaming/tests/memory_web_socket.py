@@ -0,0 +1,47 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+import asyncio
+from typing import List
+
+from botframework.streaming.transport.web_socket import (
+    WebSocket,
+    WebSocketMessage,
+    WebSocketMessageType,
+    WebSocketState,
+)
+
+
+class MemoryWebSocket(WebSocket):
+    def __init__(self):
+        self.peer: "MemoryWebSocket" = None
+        self._messages: asyncio.Queue = asyncio.Queue()
+        self._state = WebSocketState.OPEN
+
+    @staticmethod
+    def pair() -> List["MemoryWebSocket"]:
+        client, server = MemoryWebSocket(), MemoryWebSocket()
+        client.peer, server.peer = server, client
+        return [client, server]
+
+    def dispose(self):
+        pass
+
+    async def close(self, close_status, status_description):
+        if self._state == WebSocketState.OPEN:
+            self._state = WebSocketState.CLOSED
+            self.peer._messages.put_nowait(
+                WebSocketMessage(message_type=WebSocketMessageType.CLOSE, data=b"")
+            )
+
+    async def receive(self) -> WebSocketMessage:
+        return await self._messages.get()
+
+    async def send(self, buffer, message_type, end_of_message):
+        self.peer._messages.put_nowait(
+            WebSocketMessage(message_type=message_type, data=bytes(buffer))
+        )
+
+    @property
+    def status(self) -> WebSocketState:
+        return self._state
@@ -0,0 +1,150 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+from uuid import uuid4
+
+import aiounittest
+
+from botframework.streaming import PayloadStream, ReceiveRequest, StreamingRequest
+from botframework.streaming.payloads import ContentStream, ResponseMessageStream
+from botframework.streaming.payloads.assemblers import PayloadStreamAssembler
+from botframework.streaming.payloads.disassemblers import (
+    PayloadDisassembler,
+    RequestDisassembler,
+    ResponseMessageStreamDisassembler,
+)
+from botframework.streaming.payloads.models import RequestPayload
+from botframework.streaming.transport import TransportConstants
+
+
+class MockPayloadSender:
+    """Sends the payloads one at a time, handing them to the stream on the other end."""
+
+    def __init__(self, stream: PayloadStream = None):
+        self.stream = stream
+        self.headers = []
+        self._pending = []
+
+    def send_payload(self, header, payload, is_length_known, sent_callback):
+        self._pending.append((header, payload, sent_callback))
+
+    async def send_all(self, disassembler: PayloadDisassembler):
+        await disassembler.disassemble()
+        while self._pending:
+            header, payload, sent_callback = self._pending.pop(0)
+            self.on_send(header, payload)
+            await sent_callback(header)
+
+    def on_send(self, header, payload):
+        self.headers.append(header)
+        if self.stream is not None:
+            if header.payload_length:
+                self.stream.give_buffer(bytes(payload))
+            if header.end:
+                self.stream.done_producing()
+
+
+async def generate(chunks, produced: list = None):
+    for chunk in chunks:
+        if produced is not None:
+            produced.append(len(chunk))
+        yield chunk
+
+
+class TestChunkedStreams(aiounittest.AsyncTestCase):
+    async def test_payload_stream_iterates_received_buffers(self):
+        stream = PayloadStream(PayloadStreamAssembler(None, None))
+        first = bytearray(b"abc")
+        stream.give_buffer(first)
+        stream.give_buffer(b"de")
+        stream.done_producing()
+
+        chunks = [chunk async for chunk in stream]
+
+        self.assertEqual([b"abc", b"de"], chunks)
+        self.assertIsInstance(chunks[0], memoryview)
+        self.assertIs(first, chunks[0].obj)
+        self.assertEqual(0, await stream.read(bytearray(1), 0, 1))
+
+    async def test_read_until_end_of_unknown_length(self):
+        stream = PayloadStream(PayloadStreamAssembler(None, None))
+        stream.give_buffer(b"abc")
+        stream.give_buffer(b"de")
+        stream.done_producing()
+
+        self.assertEqual(b"abcde", await stream.read_until_end())
+
+    async def test_sends_iterated_content_lazily(self):
+        chunk = bytes(range(256)) * 20
+        produced = []
+        stream = PayloadStream(PayloadStreamAssembler(None, None))
+        sender = MockPayloadSender(stream)
+        content = ResponseMessageStream(content=generate([chunk] * 50, produced))
+
+        sut = ResponseMessageStreamDisassembler(sender, content)
+        await sender.send_all(sut)
+
+        # a chunk larger than a payload is split, the last payload ends the stream
+        self.assertEqual(100, len(sender.headers))
+        self.assertEqual(
+            TransportConstants.MAX_PAYLOAD_LENGTH, sender.headers[0].payload_length
+        )
+        self.assertEqual([False] * 99 + [True], [h.end for h in sender.headers])
+        self.assertEqual(chunk * 50, await stream.read_until_end())
+
+    async def test_reads_one_chunk_ahead(self):
+        produced = []
+        sent = []
+
+        class Sender(MockPayloadSender):
+            def on_send(self, header, payload):
+                sent.append(header.payload_length)
+                # the chunk sent and the one after it, to know if this is the end
+                assert len(produced) <= len(sent) + 1
+                super().on_send(header, payload)
+
+        sender = Sender()
+        content = ResponseMessageStream(content=generate([b"a"] * 10, produced))
+        await sender.send_all(ResponseMessageStreamDisassembler(sender, content))
+
+        self.assertEqual([1] * 10, sent)
+
+    async def test_sends_empty_iterated_content(self):
+        stream = PayloadStream(PayloadStreamAssembler(None, None))
+        sender = MockPayloadSender(stream)
+        content = ResponseMessageStream(content=generate([]))
+
+        await sender.send_all(ResponseMessageStreamDisassembler(sender, content))
+
+        self.assertEqual(1, len(sender.headers))
+        self.assertEqual(0, sender.headers[0].payload_length)
+        self.assertTrue(sender.headers[0].end)
+        self.assertEqual(b"", await stream.read_until_end())
+
+    async def test_describes_iterated_content(self):
+        request = StreamingRequest.create_post("/api/messages")
+        request.add_stream(generate([b"abc"]))
+        request.add_stream(generate([b"abc"]), content_type="image/png", length=3)
+
+        sut = RequestDisassembler(MockPayloadSender(), uuid4(), request)
+        payload = RequestPayload().from_json(bytes(await sut.get_stream()).decode())
+
+        self.assertEqual("application/octet-stream", payload.streams[0].content_type)
+        self.assertIsNone(payload.streams[0].length)
+        self.assertEqual("image/png", payload.streams[1].content_type)
+        self.assertEqual(3, payload.streams[1].length)
+
+    async def test_receive_request_body_chunks(self):
+        assembler = PayloadStreamAssembler(None, uuid4())
+        request = ReceiveRequest(
+            verb="POST", streams=[ContentStream(assembler.identifier, assembler)]
+        )
+        stream = assembler.get_payload_as_stream()
+        stream.give_buffer(b"abc")
+        stream.give_buffer(b"def")
+        stream.done_producing()
+
+        chunks = [bytes(chunk) async for chunk in request.read_body_chunks()]
+
+        self.assertEqual([b"abc", b"def"], chunks)
+        self.assertEqual([], [c async for c in ReceiveRequest().read_body_chunks()])
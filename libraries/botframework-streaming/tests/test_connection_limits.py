@@ -0,0 +1,109 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+import asyncio
+
+import aiounittest
+
+from botframework.streaming import (
+    ReceiveRequest,
+    RequestHandler,
+    StreamingRequest,
+    StreamingResponse,
+)
+from botframework.streaming.payload_transport import ReceiveLimits
+from botframework.streaming.transport.web_socket import WebSocketServer
+
+from memory_web_socket import MemoryWebSocket
+
+ATTACHMENT = bytes(100 * 1024)
+LIMITS = [
+    ReceiveLimits(max_connection_buffer=64 * 1024),
+    ReceiveLimits(max_stream_buffer=64 * 1024),
+]
+
+
+class BodyOnlyRequestHandler(RequestHandler):
+    """Answers with the body of the request, leaving its attachments unread."""
+
+    def __init__(self):
+        self.server: WebSocketServer = None
+
+    async def process_request(self, request: ReceiveRequest, logger, context):
+        response = StreamingResponse.ok()
+        response.add_stream(bytes(await request.read_body()))
+        return response
+
+
+class CallbackRequestHandler(BodyOnlyRequestHandler):
+    """Sends a request back and awaits its response before reading the attachment."""
+
+    async def process_request(self, request: ReceiveRequest, logger, context):
+        # the attachment takes up the buffer space first
+        await asyncio.sleep(0.05)
+
+        callback = StreamingRequest.create_post("/v3/conversations")
+        callback.set_body(b"callback")
+        callback_response = await self.server.send(callback)
+        body = await callback_response.streams[0].stream.read_until_end()
+
+        attachment = await request.streams[1].stream.read_until_end()
+
+        response = StreamingResponse.ok()
+        response.add_stream(bytes(body) + str(len(attachment)).encode())
+        return response
+
+
+class TestConnectionLimits(aiounittest.AsyncTestCase):
+    async def connect(self, server_handler: BodyOnlyRequestHandler, limits):
+        client_socket, server_socket = MemoryWebSocket.pair()
+        client = WebSocketServer(client_socket, BodyOnlyRequestHandler())
+        server = WebSocketServer(server_socket, server_handler, limits)
+        server_handler.server = server
+        tasks = [
+            asyncio.ensure_future(client.start()),
+            asyncio.ensure_future(server.start()),
+        ]
+        await asyncio.sleep(0)
+        return client, server, tasks
+
+    @staticmethod
+    async def send(client: WebSocketServer, body: bytes, attachment: bytes = None):
+        request = StreamingRequest.create_post("/api/messages")
+        request.set_body(body)
+        if attachment is not None:
+            request.add_stream(attachment)
+
+        response = await asyncio.wait_for(client.send(request), 5)
+        return await response.streams[0].stream.read_until_end()
+
+    async def close(self, client: WebSocketServer, tasks):
+        await client.disconnect()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def test_unread_attachments_do_not_stall_the_connection(self):
+        for limits in LIMITS:
+            with self.subTest(limits=limits.__dict__):
+                client, server, tasks = await self.connect(
+                    BodyOnlyRequestHandler(), limits
+                )
+
+                for index in range(3):
+                    body = f"request {index}".encode()
+                    self.assertEqual(body, await self.send(client, body, ATTACHMENT))
+                self.assertEqual(b"plain", await self.send(client, b"plain"))
+
+                self.assertEqual(0, server.receive_buffered_bytes)
+                self.assertEqual(0, server.open_streams)
+                await self.close(client, tasks)
+
+    async def test_response_awaited_before_reading_the_attachment(self):
+        for limits in LIMITS:
+            with self.subTest(limits=limits.__dict__):
+                client, _, tasks = await self.connect(CallbackRequestHandler(), limits)
+
+                self.assertEqual(
+                    b"callback" + str(len(ATTACHMENT)).encode(),
+                    await self.send(client, b"message", ATTACHMENT),
+                )
+                await self.close(client, tasks)
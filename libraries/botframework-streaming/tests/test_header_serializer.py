@@ -1,3 +1,5 @@
+import random
+import string
 from typing import List
 from unittest import TestCase
 from uuid import uuid4, UUID
@@ -134,3 +136,140 @@ class TestHeaderSerializer(TestCase):
 
         with pytest.raises(ValueError):
             HeaderSerializer.deserialize(buffer, 0, len(buffer))
+
+
+class LegacyHeaderSerializer:
+    """The list based implementation HeaderSerializer is checked against."""
+
+    @staticmethod
+    def serialize(header: Header) -> bytes:
+        buffer = [None] * TransportConstants.MAX_HEADER_LENGTH
+        buffer[0] = list(header.type.encode())[0]
+        buffer[1] = ord(".")
+        buffer[2:8] = list("{:06d}".format(header.payload_length).encode("ascii"))
+        buffer[8] = ord(".")
+        buffer[9:45] = list(str(header.id).encode("ascii"))
+        buffer[45] = ord(".")
+        buffer[46] = ord("1") if header.end else ord("0")
+        buffer[47] = ord("\n")
+        return bytes(buffer)
+
+    @staticmethod
+    def deserialize(buffer: List[int]) -> Header:
+        header = Header(type=bytes([buffer[0]]).decode("ascii"))
+        if buffer[1] != ord("."):
+            raise ValueError()
+        try:
+            length = int(bytes(buffer[2:8]).decode("ascii"))
+        except Exception:
+            raise ValueError()
+        header.payload_length = length
+        if buffer[8] != ord("."):
+            raise ValueError()
+        try:
+            header.id = UUID(bytes(buffer[9:45]).decode("ascii"))
+        except Exception:
+            raise ValueError()
+        if buffer[45] != ord("."):
+            raise ValueError()
+        if buffer[46] not in [ord("1"), ord("0")]:
+            raise ValueError()
+        header.end = buffer[46] == ord("1")
+        if buffer[47] != ord("\n"):
+            raise ValueError()
+        return header
+
+
+class TestHeaderSerializerRoundTrip(TestCase):
+    def setUp(self):
+        self.random = random.Random(42)
+
+    def random_header(self) -> Header:
+        header = Header(
+            type=self.random.choice(string.ascii_letters),
+            id=UUID(int=self.random.getrandbits(128)),
+            end=self.random.random() < 0.5,
+        )
+        header.payload_length = self.random.choice(
+            [0, TransportConstants.MAX_LENGTH, self.random.randint(0, 999999)]
+        )
+        return header
+
+    def assert_headers_equal(self, expected: Header, actual: Header):
+        self.assertEqual(
+            (expected.type, expected.payload_length, expected.id, expected.end),
+            (actual.type, actual.payload_length, actual.id, actual.end),
+        )
+
+    def test_matches_legacy_serializer(self):
+        for _ in range(500):
+            header = self.random_header()
+            buffer = bytearray(TransportConstants.MAX_HEADER_LENGTH)
+
+            HeaderSerializer.serialize(header, buffer, 0)
+            self.assertEqual(LegacyHeaderSerializer.serialize(header), buffer)
+
+            for data in (buffer, memoryview(buffer), bytes(buffer), list(buffer)):
+                result = HeaderSerializer.deserialize(
+                    data, 0, TransportConstants.MAX_HEADER_LENGTH
+                )
+                self.assert_headers_equal(header, result)
+
+    def test_offset(self):
+        header = self.random_header()
+        buffer = bytearray(100)
+        view = memoryview(buffer)
+
+        HeaderSerializer.serialize(header, view, 50)
+        result = HeaderSerializer.deserialize(
+            buffer, 50, TransportConstants.MAX_HEADER_LENGTH
+        )
+
+        self.assertEqual(bytes(50), buffer[:50])
+        self.assert_headers_equal(header, result)
+
+        with self.assertRaises(ValueError):
+            HeaderSerializer.deserialize(
+                buffer, 60, TransportConstants.MAX_HEADER_LENGTH
+            )
+
+    def test_malformed_headers_match_legacy_serializer(self):
+        candidates = list(b"0123456789abcdefABCDEF.-+_ \n\x00\xff") + [
+            self.random.randrange(256) for _ in range(10)
+        ]
+        rejected = 0
+
+        for _ in range(3000):
+            buffer = bytearray(LegacyHeaderSerializer.serialize(self.random_header()))
+            for _ in range(self.random.randint(1, 2)):
+                index = self.random.randrange(TransportConstants.MAX_HEADER_LENGTH)
+                buffer[index] = self.random.choice(candidates)
+
+            try:
+                expected = LegacyHeaderSerializer.deserialize(list(buffer))
+            except ValueError:
+                expected = None
+
+            if expected is None:
+                rejected += 1
+                with self.assertRaises(ValueError, msg=bytes(buffer)):
+                    HeaderSerializer.deserialize(
+                        buffer, 0, TransportConstants.MAX_HEADER_LENGTH
+                    )
+            else:
+                result = HeaderSerializer.deserialize(
+                    buffer, 0, TransportConstants.MAX_HEADER_LENGTH
+                )
+                self.assert_headers_equal(expected, result)
+
+        self.assertGreater(rejected, 1000)
+
+    def test_serialize_invalid_type_throws(self):
+        for header_type in ("", "AB", "\u00e9"):
+            header = self.random_header()
+            header.type = header_type
+
+            with self.assertRaises(ValueError):
+                HeaderSerializer.serialize(
+                    header, bytearray(TransportConstants.MAX_HEADER_LENGTH), 0
+                )
@@ -1,10 +1,21 @@
+import asyncio
 from typing import List
+from uuid import UUID
 
 import aiounittest
 
 from botframework.streaming import PayloadStream
-from botframework.streaming.payload_transport import PayloadReceiver
+from botframework.streaming.payloads import BufferBudget, StreamManager
+from botframework.streaming.payloads.assemblers import PayloadStreamAssembler
+from botframework.streaming.payload_transport import PayloadReceiver, ReceiveLimits
 from botframework.streaming.transport import TransportReceiverBase
+from botframework.streaming.transport.web_socket import (
+    WebSocket,
+    WebSocketMessage,
+    WebSocketMessageType,
+    WebSocketState,
+    WebSocketTransport,
+)
 
 
 class MockTransportReceiver(TransportReceiverBase):
@@ -34,6 +45,24 @@ class MockTransportReceiver(TransportReceiverBase):
         return len(resp_buffer)
 
 
+class MockWebSocket(WebSocket):
+    def __init__(self, messages: List[bytes]):
+        self.messages = messages
+        self.closed = False
+
+    async def close(self, close_status, status_description):
+        self.closed = True
+
+    async def receive(self) -> WebSocketMessage:
+        return WebSocketMessage(
+            message_type=WebSocketMessageType.BINARY, data=self.messages.pop(0)
+        )
+
+    @property
+    def status(self) -> WebSocketState:
+        return WebSocketState.CLOSED if self.closed else WebSocketState.OPEN
+
+
 class MockStream(PayloadStream):
     # pylint: disable=super-init-not-called
     def __init__(self):
@@ -69,3 +98,185 @@ class TestBotFrameworkHttpClient(aiounittest.AsyncTestCase):
 
         assert bytes(mock_stream.buffer) == mock_payload
         assert receive_action_called
+
+    async def test_receives_coalesced_packets(self):
+        header = b"S.000004.e35ed534-0808-4acf-af1e-24aa81d2b31d.0\n"
+        last_header = b"S.000002.e35ed534-0808-4acf-af1e-24aa81d2b31d.1\n"
+        # a message holds several packets, and a packet spans two messages
+        socket = MockWebSocket(
+            [header + b"test" + last_header[:10], last_header[10:] + b"ab"]
+        )
+        stream = PayloadStream(PayloadStreamAssembler(None, None, length=6))
+        received = []
+
+        def mock_receive_action(
+            header, stream, offset
+        ):  # pylint: disable=unused-argument
+            received.append((header.end, offset))
+            socket.closed = header.end
+
+        sut = PayloadReceiver()
+        sut.subscribe(lambda header: stream, mock_receive_action)
+        await sut.connect(WebSocketTransport(socket))
+
+        self.assertEqual([(False, 4), (True, 2)], received)
+        self.assertEqual(b"testab", await stream.read_until_end())
+
+
+STREAM_ID = "e35ed534-0808-4acf-af1e-24aa81d2b31d"
+
+
+def stream_packet(payload: bytes, end: bool) -> bytes:
+    return b"S.%06d.%s.%d\n" % (len(payload), STREAM_ID.encode(), end) + payload
+
+
+class TestPayloadReceiverLimits(aiounittest.AsyncTestCase):
+    async def test_buffer_budget(self):
+        budget = BufferBudget(4)
+        await budget.acquire(3)
+
+        acquired = asyncio.ensure_future(budget.acquire(3))
+        await asyncio.sleep(0)
+        self.assertFalse(acquired.done())
+
+        budget.release(3)
+        await acquired
+        self.assertEqual(3, budget.used)
+
+        # larger than the limit, let through once nothing is buffered
+        budget.release(3)
+        await budget.acquire(10)
+        self.assertEqual(10, budget.used)
+
+    async def test_waits_for_stream_to_be_read(self):
+        socket = MockWebSocket(
+            [
+                stream_packet(b"abcd", False),
+                stream_packet(b"efgh", False),
+                stream_packet(b"ij", True),
+            ]
+        )
+        stream = PayloadStream(PayloadStreamAssembler(None, None, length=10))
+        received = []
+
+        def mock_receive_action(header, stream, offset):
+            # pylint: disable=unused-argument
+            received.append(offset)
+            socket.closed = header.end
+
+        sut = PayloadReceiver(ReceiveLimits(max_stream_buffer=4))
+        sut.subscribe(lambda header: stream, mock_receive_action)
+        receiving = asyncio.ensure_future(sut.connect(WebSocketTransport(socket)))
+
+        await asyncio.sleep(0.01)
+        self.assertEqual([4], received)
+        self.assertEqual(4, sut.buffered_bytes)
+
+        buffer = bytearray(10)
+        self.assertEqual(4, await stream.read(buffer, 0, 10))
+        await asyncio.sleep(0.01)
+        self.assertEqual([4, 4], received)
+
+        self.assertEqual(4, await stream.read(buffer, 4, 6))
+        await receiving
+        self.assertEqual([4, 4, 2], received)
+        self.assertEqual(2, await stream.read(buffer, 8, 2))
+        self.assertEqual(b"abcdefghij", buffer)
+        self.assertEqual(0, sut.buffered_bytes)
+
+    async def test_does_not_wait_for_response_streams(self):
+        socket = MockWebSocket(
+            [stream_packet(b"abcd", False), stream_packet(b"efgh", True)]
+        )
+        assembler = PayloadStreamAssembler(None, None, length=8)
+        assembler.limits_buffering = False
+        stream = PayloadStream(assembler)
+
+        def mock_receive_action(header, stream, offset):
+            # pylint: disable=unused-argument
+            socket.closed = header.end
+
+        sut = PayloadReceiver(ReceiveLimits(max_connection_buffer=4))
+        sut.subscribe(lambda header: stream, mock_receive_action)
+        await asyncio.wait_for(sut.connect(WebSocketTransport(socket)), 1)
+
+        self.assertEqual(b"abcdefgh", await stream.read_until_end())
+
+    async def test_stops_waiting_once_a_response_is_awaited(self):
+        socket = MockWebSocket(
+            [
+                stream_packet(b"abcd", False),
+                stream_packet(b"efgh", False),
+                stream_packet(b"ij", True),
+            ]
+        )
+        stream = PayloadStream(PayloadStreamAssembler(None, None, length=10))
+        received = []
+        awaiting = False
+
+        def mock_receive_action(header, stream, offset):
+            # pylint: disable=unused-argument
+            received.append(offset)
+            socket.closed = header.end
+
+        sut = PayloadReceiver(ReceiveLimits(max_stream_buffer=4))
+        sut.can_wait = lambda: not awaiting
+        sut.subscribe(lambda header: stream, mock_receive_action)
+        receiving = asyncio.ensure_future(sut.connect(WebSocketTransport(socket)))
+
+        await asyncio.sleep(0.01)
+        self.assertEqual([4], received)
+
+        awaiting = True
+        sut.wake()
+        await asyncio.wait_for(receiving, 1)
+        self.assertEqual([4, 4, 2], received)
+        self.assertEqual(10, sut.buffered_bytes)
+
+        self.assertEqual(b"abcdefghij", await stream.read_until_end())
+        self.assertEqual(0, sut.buffered_bytes)
+
+    async def test_cancels_stream_over_limit(self):
+        socket = MockWebSocket(
+            [
+                stream_packet(b"abcd", False),
+                stream_packet(b"efgh", False),
+                stream_packet(b"ij", True),
+            ]
+        )
+        cancelled = []
+        manager = StreamManager(
+            lambda assembler: cancelled.append(assembler.identifier)
+        )
+        assembler = manager.get_payload_assembler(UUID(STREAM_ID))
+        assembler.content_length = 10
+        stream = assembler.get_payload_as_stream()
+
+        def mock_receive_action(header, stream, offset):
+            manager.on_receive(header, stream, offset)
+            socket.closed = header.end
+
+        sut = PayloadReceiver(ReceiveLimits(max_stream_length=6))
+        sut.subscribe(lambda header: stream, mock_receive_action)
+        await sut.connect(WebSocketTransport(socket))
+
+        self.assertEqual([UUID(STREAM_ID)], cancelled)
+        self.assertTrue(stream.is_cancelled)
+        with self.assertRaises(ValueError):
+            await stream.read(bytearray(10), 0, 10)
+
+    async def test_disconnects_on_payload_over_limit(self):
+        socket = MockWebSocket([stream_packet(b"abcd", True)])
+        disconnected = []
+
+        def mock_receive_action(header, stream, offset):
+            raise AssertionError("payload over the limit received")
+
+        sut = PayloadReceiver(ReceiveLimits(max_payload_length=3))
+        sut.subscribe(lambda header: None, mock_receive_action)
+        sut.disconnected = lambda sender, args: disconnected.append(args.reason)
+        await sut.connect(WebSocketTransport(socket))
+
+        self.assertTrue(socket.closed)
+        self.assertEqual(1, len(disconnected))
+        self.assertIn("exceeds the limit", disconnected[0])
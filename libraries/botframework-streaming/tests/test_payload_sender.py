@@ -1,4 +1,4 @@
-from asyncio import Semaphore
+from asyncio import Semaphore, sleep
 from typing import List
 from uuid import UUID, uuid4
 
@@ -36,7 +36,7 @@ class MockTransportSender(TransportSenderBase):
 class TestPayloadSender(aiounittest.AsyncTestCase):
     async def test_send(self):
         # Arrange
-        sut = PayloadSender()
+        sut = PayloadSender(max_write_size=0)
         sender = MockTransportSender()
         sut.connect(sender)
 
@@ -58,3 +58,102 @@ class TestPayloadSender(aiounittest.AsyncTestCase):
         # Assert
         await sender.send_called.acquire()
         await sut.disconnect()
+
+
+class MockBufferingTransportSender(TransportSenderBase):
+    def __init__(self):
+        super().__init__()
+        self.writes: List[bytes] = []
+        self.buffers: List[object] = []
+
+    async def send(self, buffer: memoryview, offset: int, count: int) -> int:
+        self.writes.append(bytes(buffer[offset : offset + count]))
+        self.buffers.append(buffer.obj if isinstance(buffer, memoryview) else buffer)
+        return count
+
+    def close(self):
+        pass
+
+
+class TestPayloadSenderCoalescing(aiounittest.AsyncTestCase):
+    async def send_packets(self, sut: PayloadSender, payloads: List[bytes], delay=0):
+        sent = Semaphore(0)
+
+        async def sent_callback(header: Header):  # pylint: disable=unused-argument
+            sent.release()
+
+        for payload in payloads:
+            header = Header(type="S", id=uuid4(), end=True)
+            header.payload_length = len(payload)
+            sut.send_payload(header, payload, True, sent_callback)
+            if delay:
+                await sleep(delay)
+
+        for _ in payloads:
+            await sent.acquire()
+
+    async def test_small_packets_share_a_write(self):
+        sut = PayloadSender()
+        sender = MockBufferingTransportSender()
+        sut.connect(sender)
+
+        await self.send_packets(sut, [b"abc", b"de"])
+
+        self.assertEqual(1, len(sender.writes))
+        self.assertEqual(48 + 3 + 48 + 2, len(sender.writes[0]))
+        header = HeaderSerializer.deserialize(sender.writes[0], 51, 48)
+        self.assertEqual(2, header.payload_length)
+        self.assertEqual(b"de", sender.writes[0][-2:])
+        self.assertEqual(2, sut.metrics.packets)
+        self.assertEqual(1, sut.metrics.writes)
+        self.assertEqual(101, sut.metrics.bytes_per_write)
+        self.assertEqual(0, sut.queue_depth)
+        await sut.disconnect()
+
+    async def test_max_write_size(self):
+        sut = PayloadSender(max_write_size=50)
+        sender = MockBufferingTransportSender()
+        sut.connect(sender)
+
+        await self.send_packets(sut, [b"abc", b"de"])
+
+        # a chunk is only added to the buffer if it fits in what is left of it
+        self.assertEqual([48, 3, 50], [len(write) for write in sender.writes])
+        await sut.disconnect()
+
+    async def test_large_chunks_are_not_copied(self):
+        sut = PayloadSender()
+        sender = MockBufferingTransportSender()
+        sut.connect(sender)
+        attachment = bytes(PayloadSender.DEFAULT_MAX_WRITE_SIZE)
+
+        await self.send_packets(sut, [b"abc", attachment])
+
+        self.assertEqual(
+            [48 + 3 + 48, len(attachment)], [len(write) for write in sender.writes]
+        )
+        self.assertIs(attachment, sender.buffers[1])
+        self.assertEqual(2, sut.metrics.packets)
+        await sut.disconnect()
+
+    async def test_flush_delay(self):
+        sut = PayloadSender(flush_delay=0.05)
+        sender = MockBufferingTransportSender()
+        sut.connect(sender)
+
+        await self.send_packets(sut, [b"abc", b"de", b"f"], delay=0.01)
+
+        self.assertEqual(1, len(sender.writes))
+        self.assertEqual(3, sut.metrics.packets_per_write)
+        await sut.disconnect()
+
+    async def test_without_coalescing(self):
+        sut = PayloadSender(max_write_size=0)
+        sender = MockBufferingTransportSender()
+        sut.connect(sender)
+
+        await self.send_packets(sut, [b"abc", b"de"])
+
+        self.assertEqual([48, 3, 48, 2], [len(write) for write in sender.writes])
+        self.assertEqual(4, sut.metrics.writes)
+        await sut.disconnect()
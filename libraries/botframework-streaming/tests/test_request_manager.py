@@ -117,3 +117,27 @@ class TestRequestManager(aiounittest.AsyncTestCase):
         response = await manager.get_response(request_id)
 
         self.assertIsNone(response)
+
+    async def test_get_response_times_out(self):
+        request_id: UUID = uuid4()
+        manager = RequestManager(timeout=0.01)
+
+        with self.assertRaises(asyncio.TimeoutError):
+            await manager.get_response(request_id)
+
+        # the request that timed out is not pending anymore
+        self.assertEqual(0, manager.pending_count)
+        self.assertFalse(await manager.signal_response(request_id, ReceiveResponse()))
+
+    async def test_cancel_all_fails_pending_responses(self):
+        manager = RequestManager()
+        responses = [ensure_future(manager.get_response(uuid4())) for _ in range(3)]
+        await asyncio.sleep(0)
+        self.assertEqual(3, manager.pending_count)
+
+        manager.cancel_all()
+
+        for response in responses:
+            with self.assertRaises(ConnectionResetError):
+                await response
+        self.assertEqual(0, manager.pending_count)
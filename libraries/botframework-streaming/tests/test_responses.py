@@ -96,8 +96,7 @@ class TestResponses(aiounittest.AsyncTestCase):
 
         self.assertIsNotNone(sut.streams)
         self.assertEqual(1, len(sut.streams))
-        self.assertIsInstance(sut.streams[0].content, list)
-        self.assertIsInstance(sut.streams[0].content[0], int)
+        self.assertIsInstance(sut.streams[0].content, bytes)
         self.assertEqual("123", bytes(sut.streams[0].content).decode("utf-8-sig"))
 
     async def test_streaming_response_set_body_none_does_not_throw(self):
@@ -113,8 +112,7 @@ class TestResponses(aiounittest.AsyncTestCase):
 
         self.assertIsNotNone(sut.streams)
         self.assertEqual(1, len(sut.streams))
-        self.assertIsInstance(sut.streams[0].content, list)
-        self.assertIsInstance(sut.streams[0].content[0], int)
+        self.assertIsInstance(sut.streams[0].content, bytes)
 
         assert_activity = Activity.deserialize(
             json.loads(bytes(sut.streams[0].content).decode("utf-8-sig"))
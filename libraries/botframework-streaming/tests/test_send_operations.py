@@ -1,7 +1,6 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # Licensed under the MIT License.
 
-from typing import List
 from uuid import uuid4
 
 import aiounittest
@@ -20,15 +19,15 @@ class MockTransportSender(TransportSenderBase):
         self.is_connected = True
         self.buffers = []
 
-    async def send(self, buffer: List[int], offset: int, count: int) -> int:
-        self.buffers.append(buffer.copy())
+    async def send(self, buffer: memoryview, offset: int, count: int) -> int:
+        self.buffers.append(bytes(buffer[offset : offset + count]))
 
         return count
 
 
 class TestSendOperations(aiounittest.AsyncTestCase):
     async def test_request_dissasembler_with_variable_stream_send(self):
-        sender = PayloadSender()
+        sender = PayloadSender(max_write_size=0)
         transport = MockTransportSender()
         sender.connect(transport)
 
@@ -43,7 +42,7 @@ class TestSendOperations(aiounittest.AsyncTestCase):
         self.assertEqual(4, len(transport.buffers))
 
     async def test_request_dissasembler_with_json_stream_send(self):
-        sender = PayloadSender()
+        sender = PayloadSender(max_write_size=0)
         transport = MockTransportSender()
         sender.connect(transport)
 
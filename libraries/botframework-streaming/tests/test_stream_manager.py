@@ -1,6 +1,9 @@
+from time import monotonic
 from unittest import TestCase
 from uuid import UUID, uuid4
 
+import aiounittest
+
 from botframework.streaming.payloads import StreamManager
 from botframework.streaming.payloads.assemblers import PayloadStreamAssembler
 from botframework.streaming.payloads.models import Header
@@ -110,3 +113,50 @@ class TestStreamManager(TestCase):
         manager.close_stream(identifier)
 
         self.assertFalse(closed)
+
+    def test_sweep_drops_idle_streams(self):
+        cancelled = []
+        manager = StreamManager(
+            on_cancel_stream=lambda assembler: cancelled.append(assembler.identifier)
+        )
+        receiving = manager.get_payload_assembler(uuid4())
+        received = manager.get_payload_assembler(uuid4())
+        received.get_payload_as_stream()
+        received.on_receive(Header(end=True), [], 1)
+        self.assertEqual(2, manager.open_stream_count)
+
+        self.assertEqual(0, manager.sweep(60))
+        self.assertEqual(2, manager.sweep(60, now=monotonic() + 61))
+
+        # only the stream still being received is cancelled
+        self.assertEqual([receiving.identifier], cancelled)
+        self.assertTrue(receiving.get_payload_as_stream().is_cancelled)
+        self.assertFalse(received.get_payload_as_stream().is_cancelled)
+        self.assertEqual(0, manager.open_stream_count)
+
+    def test_close_all_cancels_streams(self):
+        manager = StreamManager()
+        streams = [manager.get_payload_stream(Header(id=uuid4())) for _ in range(3)]
+
+        manager.close_all()
+
+        self.assertEqual(0, manager.open_stream_count)
+        self.assertTrue(all(stream.is_cancelled for stream in streams))
+
+
+class TestStreamManagerReading(aiounittest.AsyncTestCase):
+    async def test_stream_read_to_end_is_dropped(self):
+        manager = StreamManager()
+        identifier = uuid4()
+        header = Header(type="S", id=identifier, end=True)
+        header.payload_length = 3
+        assembler = manager.get_payload_assembler(identifier)
+        assembler.content_length = 3
+
+        stream = manager.get_payload_stream(header)
+        stream.give_buffer(b"abc")
+        manager.on_receive(header, stream, 3)
+        self.assertEqual(1, manager.open_stream_count)
+
+        self.assertEqual(b"abc", await stream.read_until_end())
+        self.assertEqual(0, manager.open_stream_count)
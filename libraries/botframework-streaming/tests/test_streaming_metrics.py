@@ -0,0 +1,162 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+import asyncio
+
+import aiounittest
+
+from botframework.streaming import (
+    ReceiveRequest,
+    RequestHandler,
+    StreamingMetricsSink,
+    StreamingRequest,
+    StreamingResponse,
+)
+from botframework.streaming.payload_transport import ReceiveLimits
+from botframework.streaming.transport.web_socket import WebSocketServer
+
+from memory_web_socket import MemoryWebSocket
+
+
+class EchoRequestHandler(RequestHandler):
+    async def process_request(self, request: ReceiveRequest, logger, context):
+        response = StreamingResponse.ok()
+        response.add_stream(bytes(await request.read_body()))
+        return response
+
+
+class RecordingSink(StreamingMetricsSink):
+    def __init__(self):
+        self.processed = []
+        self.received = []
+        self.metrics = []
+        self.disconnects = []
+
+    def on_request_processed(self, request, response, duration, error=None):
+        self.processed.append((request.path, response, duration, error))
+
+    def on_response_received(self, request, response, duration, error=None):
+        self.received.append((request.path, response, duration, error))
+
+    def on_metrics(self, metrics: dict):
+        self.metrics.append(metrics)
+
+    def on_disconnected(self, reason: str):
+        self.disconnects.append(reason)
+
+
+class FailingSink(StreamingMetricsSink):
+    def __init__(self):
+        self.calls = 0
+
+    def fail(self, *args):
+        self.calls += 1
+        raise RuntimeError("exporter down")
+
+    on_request_processed = on_response_received = fail
+    on_metrics = on_disconnected = fail
+
+
+class TestStreamingMetrics(aiounittest.AsyncTestCase):
+    async def connect(self, client_sink, server_sink, **kwargs):
+        client_socket, server_socket = MemoryWebSocket.pair()
+        client = WebSocketServer(
+            client_socket, EchoRequestHandler(), metrics_sink=client_sink
+        )
+        server = WebSocketServer(
+            server_socket, EchoRequestHandler(), metrics_sink=server_sink, **kwargs
+        )
+        tasks = [
+            asyncio.ensure_future(client.start()),
+            asyncio.ensure_future(server.start()),
+        ]
+        await asyncio.sleep(0)
+        return client, server, tasks
+
+    async def test_reports_requests_and_disconnection(self):
+        client_sink, server_sink = RecordingSink(), RecordingSink()
+        client, server, tasks = await self.connect(client_sink, server_sink)
+
+        request = StreamingRequest.create_post("/api/messages")
+        request.set_body(b"hello")
+        response = await client.send(request)
+        self.assertEqual(200, response.status_code)
+
+        self.assertEqual(1, len(server_sink.processed))
+        self.assertEqual("/api/messages", server_sink.processed[0][0])
+        self.assertIsNone(server_sink.processed[0][3])
+        self.assertEqual(1, len(client_sink.received))
+        self.assertIs(response, client_sink.received[0][1])
+        self.assertGreaterEqual(client_sink.received[0][2], 0)
+
+        metrics = client.get_metrics()
+        self.assertGreater(metrics["sent"]["packets"], 0)
+        self.assertGreater(metrics["received"]["packets"], 0)
+        self.assertEqual(
+            server.send_metrics.bytes_written, client.receive_metrics.bytes_read
+        )
+        self.assertEqual(0, metrics["pending_requests"])
+
+        await client.disconnect()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        self.assertEqual([None], client_sink.disconnects)
+        self.assertEqual(1, len(client_sink.metrics))
+        self.assertEqual(1, len(server_sink.disconnects))
+        self.assertIsNone(client.disconnect_reason)
+
+    async def test_reports_disconnect_reason(self):
+        server_sink = RecordingSink()
+        client, server, tasks = await self.connect(
+            None, server_sink, receive_limits=ReceiveLimits(max_payload_length=2)
+        )
+
+        request = StreamingRequest.create_post("/api/messages")
+        request.set_body(b"too long")
+        sent = asyncio.ensure_future(client.send(request))
+        await asyncio.gather(*tasks, return_exceptions=True)
+        sent.cancel()
+
+        self.assertEqual(1, len(server_sink.disconnects))
+        self.assertIn("exceeds the limit", server_sink.disconnects[0])
+        self.assertEqual(server_sink.disconnects[0], server.disconnect_reason)
+
+    async def test_reports_metrics_periodically(self):
+        server_sink = RecordingSink()
+        client, _, tasks = await self.connect(None, server_sink, metrics_interval=0.01)
+
+        await asyncio.sleep(0.035)
+        self.assertGreaterEqual(len(server_sink.metrics), 2)
+        self.assertIn("open_streams", server_sink.metrics[0])
+
+        await client.disconnect()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def test_failing_sink_does_not_affect_the_connection(self):
+        client_sink, server_sink = FailingSink(), FailingSink()
+        client, server, tasks = await self.connect(
+            client_sink, server_sink, metrics_interval=0.01
+        )
+
+        with self.assertLogs("botframework.streaming", "ERROR"):
+            request = StreamingRequest.create_post("/api/messages")
+            request.set_body(b"hello")
+            response = await client.send(request)
+            self.assertEqual(200, response.status_code)
+
+            await asyncio.sleep(0.035)
+            reported = server_sink.calls
+            await asyncio.sleep(0.02)
+            # the periodic report goes on
+            self.assertGreater(server_sink.calls, reported)
+
+            # a request pending on disconnect still fails
+            pending = asyncio.ensure_future(server.send(request))
+            while not server.pending_requests:
+                await asyncio.sleep(0)
+            await server.disconnect()
+            with self.assertRaises(ConnectionError):
+                await asyncio.wait_for(pending, 1)
+
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self.assertEqual(0, server.pending_requests)
@@ -0,0 +1,152 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+from typing import List
+
+import aiounittest
+
+from botframework.streaming import PayloadStream
+from botframework.streaming.payloads import ResponseMessageStream
+from botframework.streaming.payloads.assemblers import PayloadStreamAssembler
+from botframework.streaming.payloads.disassemblers import (
+    ResponseMessageStreamDisassembler,
+)
+from botframework.streaming.transport import (
+    ListBufferTransportReceiver,
+    ListBufferTransportSender,
+    TransportBuffer,
+    TransportConstants,
+    TransportReceiverBase,
+    TransportSenderBase,
+)
+from botframework.streaming.transport.web_socket import (
+    WebSocket,
+    WebSocketMessage,
+    WebSocketMessageType,
+    WebSocketState,
+    WebSocketTransport,
+)
+
+
+class MockWebSocket(WebSocket):
+    def __init__(self, messages: List[bytes]):
+        self.messages = messages
+        self.sent = []
+
+    async def receive(self) -> WebSocketMessage:
+        return WebSocketMessage(
+            message_type=WebSocketMessageType.BINARY, data=self.messages.pop(0)
+        )
+
+    async def send(
+        self, buffer: object, message_type: WebSocketMessageType, end_of_message: bool
+    ):
+        self.sent.append(buffer)
+
+    @property
+    def status(self) -> WebSocketState:
+        return WebSocketState.OPEN
+
+
+class MockListSender(TransportSenderBase):
+    def __init__(self):
+        super().__init__()
+        self.buffers = []
+
+    async def send(self, buffer: List[int], offset: int, count: int) -> int:
+        self.buffers.append(buffer[offset : offset + count])
+        return count
+
+
+class MockListReceiver(TransportReceiverBase):
+    async def receive(self, buffer: List[int], offset: int, count: int) -> int:
+        for index, val in enumerate(b"abc"):
+            buffer[offset + index] = val
+        return 3
+
+
+class MockPayloadSender:
+    def __init__(self):
+        self.payloads = []
+
+    def send_payload(self, header, payload, is_length_known, sent_callback):
+        self.payloads.append((header, payload, sent_callback))
+
+
+class TestTransportBuffer(aiounittest.AsyncTestCase):
+    def test_from_data(self):
+        data = bytearray(b"abc")
+
+        self.assertIs(data, TransportBuffer.from_data(data))
+        self.assertEqual(b"abc", TransportBuffer.from_data([97, 98, 99]))
+        self.assertEqual(b"", TransportBuffer.from_data(None))
+        with self.assertRaises(TypeError):
+            TransportBuffer.from_data([None])
+
+    def test_view_and_copy_into(self):
+        data = bytearray(b"abcdef")
+        view = TransportBuffer.view(data, 1, 3)
+
+        data[1] = ord("B")
+        self.assertEqual(b"Bcd", view)
+
+        buffer = bytearray(5)
+        self.assertEqual(3, TransportBuffer.copy_into(buffer, 1, view))
+        self.assertEqual(b"\x00Bcd\x00", buffer)
+
+        legacy = [0] * 5
+        self.assertEqual(2, TransportBuffer.copy_into(legacy, 3, b"xyz", 2))
+        self.assertEqual([0, 0, 0, 120, 121], legacy)
+
+    async def test_payload_stream_read(self):
+        stream = PayloadStream(PayloadStreamAssembler(None, None, length=6))
+        first = bytearray(b"abc")
+        stream.give_buffer(first)
+        stream.write([100, 101, 102, 0], 0, 3)
+
+        first[0] = ord("A")
+        self.assertEqual(b"Abcdef", await stream.read_until_end())
+        self.assertEqual(0, await stream.read(bytearray(1), 0, 1))
+
+    async def test_web_socket_transport(self):
+        socket = MockWebSocket([b"abc", b"defgh"])
+        sut = WebSocketTransport(socket)
+        buffer = bytearray(6)
+
+        self.assertEqual(3, await sut.receive(buffer, 0, 3))
+        self.assertEqual(3, await sut.receive(buffer, 3, 3))
+        self.assertEqual(b"abcdef", buffer)
+
+        self.assertEqual(2, await sut.send(buffer, 2, 2))
+        self.assertIsInstance(socket.sent[0], memoryview)
+        self.assertEqual(b"cd", socket.sent[0])
+
+    async def test_disassembler_sends_views(self):
+        sender = MockPayloadSender()
+        content = bytes(range(256)) * 20
+        sut = ResponseMessageStreamDisassembler(
+            sender, ResponseMessageStream(content=content)
+        )
+
+        await sut.disassemble()
+        header, payload, sent_callback = sender.payloads[0]
+        await sent_callback(header)
+
+        self.assertEqual(2, len(sender.payloads))
+        self.assertIsInstance(payload, memoryview)
+        self.assertEqual(content[: TransportConstants.MAX_PAYLOAD_LENGTH], payload)
+        self.assertFalse(header.end)
+        header, payload, _ = sender.payloads[1]
+        self.assertEqual(content[TransportConstants.MAX_PAYLOAD_LENGTH :], payload)
+        self.assertTrue(header.end)
+
+    async def test_list_buffer_transports(self):
+        legacy_sender = MockListSender()
+        sender = ListBufferTransportSender(legacy_sender)
+        self.assertEqual(2, await sender.send(b"abcd", 1, 2))
+        self.assertEqual([[98, 99]], legacy_sender.buffers)
+
+        receiver = ListBufferTransportReceiver(MockListReceiver())
+        buffer = bytearray(5)
+        self.assertEqual(3, await receiver.receive(buffer, 2, 3))
+        self.assertEqual(b"\x00\x00abc", buffer)
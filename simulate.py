@@ -0,0 +1,118 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License.
+
+"""
+Pre-release performance gate: runs many concurrent synthetic conversations through
+MainDialog and BookingDialog, with a local keyword recognizer in place of LUIS.
+
+    python simulate.py [--transcripts FILE] [--conversations N] [--concurrency N]
+                       [--memory] [--max-p99-ms MS]
+
+Exits with status 1 if a turn failed, a reply didn't match the transcript or the
+p99 turn latency exceeded --max-p99-ms.
+"""
+
+import argparse
+import asyncio
+import os
+import re
+import sys
+
+from botbuilder.core import (
+    IntentScore,
+    MemoryStorage,
+    Middleware,
+    RecognizerResult,
+    TurnContext,
+)
+from botbuilder.schema import ActivityTypes
+from botbuilder.testing import DialogSimulator, SimulationScript
+
+from config import DefaultConfig
+from dialogs import MainDialog, BookingDialog
+from flight_booking_recognizer import FlightBookingRecognizer
+from helpers.luis_helper import Intent
+
+TRANSCRIPTS = os.path.join(
+    os.path.dirname(os.path.realpath(__file__)), "test", "transcripts", "booking.jsonl"
+)
+
+
+class LocalFlightBookingRecognizer(FlightBookingRecognizer):
+    """Recognizes the intents of the flight booking LUIS app with regular expressions."""
+
+    RULES = [
+        (Intent.BOOK_FLIGHT.value, re.compile(r"\b(book|flight|fly|travel|trip)\b")),
+        (Intent.GREETING.value, re.compile(r"^(hi|hello|hey)\b")),
+        (Intent.GOODBYE.value, re.compile(r"\b(bye|goodbye)\b")),
+        (Intent.THANKYOU.value, re.compile(r"\bthanks?( you)?\b")),
+    ]
+
+    @property
+    def is_configured(self) -> bool:
+        return True
+
+    async def recognize(self, turn_context: TurnContext) -> RecognizerResult:
+        results = turn_context.turn_state.setdefault(self.TURN_RESULTS_KEY, {})
+        if self._app_id not in results:
+            text = (turn_context.activity.text or "").lower()
+            intent = next(
+                (name for name, rule in self.RULES if rule.search(text)),
+                Intent.NONE_INTENT.value,
+            )
+            results[self._app_id] = RecognizerResult(
+                text=turn_context.activity.text,
+                intents={intent: IntentScore(1.0)},
+                entities={},
+            )
+        return results[self._app_id]
+
+
+class LocalRecognizerMiddleware(Middleware):
+    """
+    Recognizes every message up front. The resolver dialogs create their own
+    FlightBookingRecognizer, which then reads the local result of the turn.
+    """
+
+    def __init__(self, recognizer: LocalFlightBookingRecognizer):
+        self._recognizer = recognizer
+
+    async def on_turn(self, context: TurnContext, logic):
+        if context.activity.type == ActivityTypes.message:
+            await self._recognizer.recognize(context)
+        await logic()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--transcripts", default=TRANSCRIPTS)
+    parser.add_argument("--conversations", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--memory", action="store_true", help="track memory growth")
+    parser.add_argument("--max-p99-ms", type=float, default=None)
+    args = parser.parse_args()
+
+    recognizer = LocalFlightBookingRecognizer(DefaultConfig)
+    simulator = DialogSimulator(
+        MainDialog(recognizer, BookingDialog()),
+        MemoryStorage(),
+        concurrency=args.concurrency,
+        middlewares=[LocalRecognizerMiddleware(recognizer)],
+        track_memory=args.memory,
+    )
+    report = asyncio.run(
+        simulator.run(
+            SimulationScript.load_jsonl(args.transcripts), args.conversations
+        )
+    )
+    print(report)
+
+    failed = report.errors or report.mismatches
+    if args.max_p99_ms is not None and report.latency_percentile(99) > args.max_p99_ms:
+        print(f"p99 latency above {args.max_p99_ms} ms")
+        failed = True
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+import sys
+import os
+import aiounittest
+
+current = os.path.dirname(os.path.realpath(__file__))
+parent = os.path.dirname(current)
+sys.path.append(parent)
+
+from helpers.interruption_helper import (
+    GlobalIntents,
+    KeywordMatcher,
+    RecognizerMatcher,
+    RegexMatcher,
+)
+from botbuilder.core import IntentScore, Recognizer, RecognizerResult, TurnContext
+from botbuilder.core.adapters import TestAdapter
+from botbuilder.schema import Activity, ActivityTypes
+
+
+class CountingRecognizer(Recognizer):
+    def __init__(self, intent: str):
+        self.intent = intent
+        self.calls = 0
+
+    async def recognize(self, turn_context: TurnContext) -> RecognizerResult:
+        self.calls += 1
+        return RecognizerResult(
+            text=turn_context.activity.text,
+            intents={self.intent: IntentScore(0.9)},
+        )
+
+
+class TestInterruptionHelper(aiounittest.AsyncTestCase):
+    def create_context(self, text: str, activity_type=ActivityTypes.message):
+        return TurnContext(TestAdapter(), Activity(type=activity_type, text=text))
+
+    def create_global_intents(self, recognizer: Recognizer) -> GlobalIntents:
+        return (
+            GlobalIntents()
+            .register("Help", KeywordMatcher("help", "?"))
+            .register(
+                "goodbye",
+                RegexMatcher(r"^bye\W*$"),
+                RecognizerMatcher(recognizer, "goodbye"),
+            )
+            .register("Cancel", KeywordMatcher("cancel"))
+        )
+
+    async def test_local_matchers_run_before_recognizers(self):
+        recognizer = CountingRecognizer("goodbye")
+        global_intents = self.create_global_intents(recognizer)
+
+        self.assertEqual("Help", await global_intents.evaluate(self.create_context(" HELP ")))
+        self.assertEqual("goodbye", await global_intents.evaluate(self.create_context("Bye!")))
+        # cancel is registered after the remote goodbye matcher but is matched locally
+        self.assertEqual("Cancel", await global_intents.evaluate(self.create_context("cancel")))
+        self.assertEqual(0, recognizer.calls)
+
+        self.assertEqual("goodbye", await global_intents.evaluate(self.create_context("ciao")))
+        self.assertEqual(1, recognizer.calls)
+
+    async def test_evaluated_once_per_turn(self):
+        recognizer = CountingRecognizer("greeting")
+        global_intents = self.create_global_intents(recognizer)
+        context = self.create_context("hello there")
+
+        for _ in range(3):
+            self.assertIsNone(await global_intents.evaluate(context))
+        self.assertEqual(1, recognizer.calls)
+
+        await global_intents.evaluate(self.create_context("hello there"))
+        self.assertEqual(2, recognizer.calls)
+
+    async def test_ignores_other_activities(self):
+        recognizer = CountingRecognizer("goodbye")
+        global_intents = self.create_global_intents(recognizer)
+
+        context = self.create_context(None, ActivityTypes.conversation_update)
+        self.assertIsNone(await global_intents.evaluate(context))
+        self.assertEqual(0, recognizer.calls)